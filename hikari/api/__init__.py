@@ -35,6 +35,7 @@ from hikari.api.entity_factory import *
 from hikari.api.event_factory import *
 from hikari.api.event_manager import *
 from hikari.api.interaction_server import *
+from hikari.api.metrics import *
 from hikari.api.rest import *
 from hikari.api.shard import *
 from hikari.api.special_endpoints import *
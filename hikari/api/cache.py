@@ -47,9 +47,14 @@ _ValueT = typing.TypeVar("_ValueT")
 
 
 class CacheView(typing.Mapping[_KeyT, _ValueT], abc.ABC):
-    """Interface describing an immutable snapshot view of part of a cache.
+    """Interface describing an immutable view of part of a cache.
 
     This can be treated as a normal `typing.Mapping` but with some special methods.
+
+    Views are usually snapshots of the cache taken when they were made, but
+    some implementations may return live views which reflect changes made to
+    the cache after they were made. `CacheView.snapshot` can be used to get
+    a view which won't change in either case.
     """
 
     __slots__: typing.Sequence[str] = ()
@@ -72,6 +77,20 @@ class CacheView(typing.Mapping[_KeyT, _ValueT], abc.ABC):
     def iterator(self) -> iterators.LazyIterator[_ValueT]:
         """Get a lazy iterator of the entities in the view."""
 
+    def snapshot(self) -> CacheView[_KeyT, _ValueT]:
+        """Get a view of the entries currently in this view which won't change.
+
+        Entities are still only built when they're accessed, so this is
+        cheap even for large views.
+
+        Returns
+        -------
+        CacheView[_KeyT, _ValueT]
+            The snapshot view. This is the view itself if it's already a
+            snapshot.
+        """
+        return self
+
 
 class Cache(abc.ABC):
     """Interface describing the operations a cache component should provide.
@@ -855,6 +874,83 @@ class MutableCache(Cache, abc.ABC):
             The object of the guild to add to the cache.
         """
 
+    def replace_guild_snapshot(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        /,
+        *,
+        gateway_guild: typing.Optional[guilds.GatewayGuild] = None,
+        channels: typing.Optional[typing.Iterable[channels.GuildChannel]] = None,
+        emojis: typing.Optional[typing.Iterable[emojis.KnownCustomEmoji]] = None,
+        roles: typing.Optional[typing.Iterable[guilds.Role]] = None,
+        members: typing.Optional[typing.Iterable[guilds.Member]] = None,
+        presences: typing.Optional[typing.Iterable[presences.MemberPresence]] = None,
+        voice_states: typing.Optional[typing.Iterable[voices.VoiceState]] = None,
+    ) -> None:
+        """Replace the cached state of a guild with a full snapshot of it.
+
+        This is used for the guild state received in `GUILD_CREATE` payloads.
+        For each type of entity passed, the entities of that type cached for
+        the guild are cleared before the new ones are added. Entity types
+        which are left as `builtins.None` are not touched.
+
+        The default implementation calls the `clear_*_for_guild` and `set_*`
+        methods for each entity; implementations should override this with
+        a faster alternative where they can.
+
+        Parameters
+        ----------
+        guild : hikari.snowflakes.SnowflakeishOr[hikari.guilds.PartialGuild]
+            Object or ID of the guild to replace the cached state of.
+
+        Other Parameters
+        ----------------
+        gateway_guild : typing.Optional[hikari.guilds.GatewayGuild]
+            The object of the guild to update in the cache.
+        channels : typing.Optional[typing.Iterable[hikari.channels.GuildChannel]]
+            The guild's channels.
+        emojis : typing.Optional[typing.Iterable[hikari.emojis.KnownCustomEmoji]]
+            The guild's emojis.
+        roles : typing.Optional[typing.Iterable[hikari.guilds.Role]]
+            The guild's roles.
+        members : typing.Optional[typing.Iterable[hikari.guilds.Member]]
+            The guild's members.
+        presences : typing.Optional[typing.Iterable[hikari.presences.MemberPresence]]
+            The presences of the guild's members.
+        voice_states : typing.Optional[typing.Iterable[hikari.voices.VoiceState]]
+            The guild's voice states.
+        """
+        if gateway_guild is not None:
+            self.update_guild(gateway_guild)
+
+        if channels is not None:
+            self.clear_guild_channels_for_guild(guild)
+            for channel in channels:
+                self.set_guild_channel(channel)
+
+        if emojis is not None:
+            self.clear_emojis_for_guild(guild)
+            for emoji in emojis:
+                self.set_emoji(emoji)
+
+        if roles is not None:
+            self.clear_roles_for_guild(guild)
+            for role in roles:
+                self.set_role(role)
+
+        if members is not None:
+            self.clear_members_for_guild(guild)
+            self.set_members_bulk(members)
+
+        if presences is not None:
+            self.clear_presences_for_guild(guild)
+            self.set_presences_bulk(presences)
+
+        if voice_states is not None:
+            self.clear_voice_states_for_guild(guild)
+            for voice_state in voice_states:
+                self.set_voice_state(voice_state)
+
     @abc.abstractmethod
     def set_guild_availability(
         self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], is_available: bool, /
@@ -1174,6 +1270,21 @@ class MutableCache(Cache, abc.ABC):
             The object of the member to add to the cache.
         """
 
+    def set_members_bulk(self, members: typing.Iterable[guilds.Member], /) -> None:
+        """Add multiple member objects to the cache.
+
+        The default implementation calls `MutableCache.set_member` for each
+        member; implementations should override this with a faster
+        alternative where they can.
+
+        Parameters
+        ----------
+        members : typing.Iterable[hikari.guilds.Member]
+            The objects of the members to add to the cache.
+        """
+        for member in members:
+            self.set_member(member)
+
     @abc.abstractmethod
     def update_member(
         self, member: guilds.Member, /
@@ -1257,6 +1368,21 @@ class MutableCache(Cache, abc.ABC):
             The object of the presence to add to the cache.
         """
 
+    def set_presences_bulk(self, presences: typing.Iterable[presences.MemberPresence], /) -> None:
+        """Add multiple presence objects to the cache.
+
+        The default implementation calls `MutableCache.set_presence` for each
+        presence; implementations should override this with a faster
+        alternative where they can.
+
+        Parameters
+        ----------
+        presences : typing.Iterable[hikari.presences.MemberPresence]
+            The objects of the presences to add to the cache.
+        """
+        for presence in presences:
+            self.set_presence(presence)
+
     @abc.abstractmethod
     def update_presence(
         self, presence: presences.MemberPresence, /
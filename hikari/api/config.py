@@ -23,7 +23,13 @@
 """Core interface for Hikari's configuration dataclasses."""
 from __future__ import annotations
 
-__all__: typing.Sequence[str] = ("CacheComponents", "CacheSettings", "HTTPSettings", "ProxySettings")
+__all__: typing.Sequence[str] = (
+    "CacheComponents",
+    "CacheEvictionStrategy",
+    "CacheSettings",
+    "HTTPSettings",
+    "ProxySettings",
+)
 
 import abc
 import typing
@@ -89,6 +95,21 @@ class CacheComponents(enums.Flag):
     """Fully enables the cache."""
 
 
+@typing.final
+class CacheEvictionStrategy(str, enums.Enum):
+    """How a cache component picks which entries to evict to make space."""
+
+    LRU = "lru"
+    """Evict the least recently used entries."""
+
+    LFU = "lfu"
+    """Evict the least frequently used entries.
+
+    This is approximated by comparing how often a few of the least recently
+    added entries have been read.
+    """
+
+
 class ProxySettings(abc.ABC):
     """Settings for configuring an HTTP-based proxy."""
 
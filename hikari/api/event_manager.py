@@ -23,7 +23,7 @@
 """Core interface for components that manage events in the library."""
 from __future__ import annotations
 
-__all__: typing.Sequence[str] = ("EventManager", "EventStream")
+__all__: typing.Sequence[str] = ("EventManager", "EventStream", "StreamOverflowPolicy")
 
 import abc
 import asyncio
@@ -31,6 +31,7 @@ import typing
 
 from hikari import iterators
 from hikari.events import base_events
+from hikari.internal import enums
 
 if typing.TYPE_CHECKING:
     import types
@@ -47,6 +48,17 @@ if typing.TYPE_CHECKING:
     _EventStreamT = typing.TypeVar("_EventStreamT")
 
 
+@typing.final
+class StreamOverflowPolicy(str, enums.Enum):
+    """What an event stream does with events received while its buffer is full."""
+
+    DROP_NEWEST = "drop_newest"
+    """Drop the events which are received while the buffer is full."""
+
+    DROP_OLDEST = "drop_oldest"
+    """Drop the oldest buffered event to make space for the new one."""
+
+
 class EventStream(iterators.LazyIterator[base_events.EventT], abc.ABC):
     """A base abstract class for all event streamers.
 
@@ -188,6 +200,27 @@ class EventManager(abc.ABC):
             If there is no consumer for the event.
         """
 
+    def is_raw_event_enabled(self, event_name: str, /) -> bool:
+        """Check whether the payloads of a raw event need to be consumed.
+
+        Shards use this to skip decoding the payloads of events which would
+        be discarded by `EventManager.consume_raw_event` anyway, such as
+        events which nothing is listening to or caching.
+
+        The default implementation always returns `builtins.True`.
+
+        Parameters
+        ----------
+        event_name : str
+            The case-insensitive name of the event.
+
+        Returns
+        -------
+        builtins.bool
+            Whether the payloads of the event need to be consumed.
+        """
+        return True
+
     @abc.abstractmethod
     def dispatch(self, event: base_events.Event) -> asyncio.Future[typing.Any]:
         """Dispatch an event.
@@ -276,7 +309,15 @@ class EventManager(abc.ABC):
     # For the sake of UX, I will check this at runtime instead and let the
     # user use a static type checker.
     @abc.abstractmethod
-    def subscribe(self, event_type: typing.Type[typing.Any], callback: CallbackT[typing.Any]) -> None:
+    def subscribe(
+        self,
+        event_type: typing.Type[typing.Any],
+        callback: CallbackT[typing.Any],
+        *,
+        max_concurrency: typing.Optional[int] = None,
+        ordered_by: typing.Union[str, typing.Callable[[typing.Any], typing.Hashable], None] = None,
+        timeout: typing.Union[float, int, None] = None,
+    ) -> None:
         """Subscribe a given callback to a given event type.
 
         Parameters
@@ -290,6 +331,37 @@ class EventManager(abc.ABC):
             consume an instance of the given event, or an instance of a valid
             subclass if one exists. Any result is discarded.
 
+        Other Parameters
+        ----------------
+        max_concurrency : typing.Optional[builtins.int]
+            The maximum number of calls to the callback which may run at
+            once. Further events wait for a running call to finish first.
+            If `builtins.None` then this is unlimited.
+        ordered_by : typing.Union[builtins.str, typing.Callable[[T], typing.Hashable], builtins.None]
+            If provided, events with the same key are passed to the callback
+            one at a time in the order they were dispatched, while events with
+            different keys may still run concurrently. This can be the name of
+            an event attribute, such as `"guild_id"`, or a callable which
+            returns the key for an event. Events which the key cannot be
+            resolved for are not ordered.
+        timeout : typing.Union[builtins.float, builtins.int, builtins.None]
+            How long each call to the callback may run for before it is
+            cancelled, not including the time spent waiting for
+            `max_concurrency` or `ordered_by`. A cancelled call is reported
+            like any other exception raised by the callback, with an
+            `asyncio.TimeoutError`.
+
+        These apply to the callback as a whole, so the limits are shared
+        between all the event types it's subscribed to, and every
+        subscription of the callback must use the same options. They're
+        removed once the callback is no longer subscribed to anything.
+
+        Raises
+        ------
+        builtins.ValueError
+            If `max_concurrency` is less than 1, `timeout` is not positive or
+            the callback is already subscribed with different options.
+
         Example
         -------
         The following demonstrates subscribing a callback to message creation
@@ -304,6 +376,14 @@ class EventManager(abc.ABC):
         bot.subscribe(MessageCreateEvent, on_message)
         ```
 
+        The following makes sure that message creation events from the same
+        channel are handled in order, while using at most 5 database
+        connections at once.
+
+        ```py
+        bot.subscribe(MessageCreateEvent, log_message, max_concurrency=5, ordered_by="channel_id")
+        ```
+
         See Also
         --------
         Dispatch: `hikari.api.event_manager.EventManager.dispatch`
@@ -387,10 +467,102 @@ class EventManager(abc.ABC):
         Has listener: `hikari.api.event_manager.EventManager.has_listener`
         """
 
+    def subscribe_raw(self, event_name: str, callback: ConsumerT) -> None:
+        """Subscribe a given callback to the raw payloads of a gateway event.
+
+        Raw listeners are given the shard and the decoded payload of the
+        event, without building any entities or events for it. If a gateway
+        event only has raw listeners (and nothing is cached from it), then
+        it is not deserialized at all, which makes this much cheaper than
+        `EventManager.subscribe` for consumers which only need a few fields.
+
+        The default implementation raises `builtins.NotImplementedError`, as
+        raw listeners have to be supported by the event manager.
+
+        !!! note
+            The payload is shared with the rest of the library and must not be
+            modified.
+
+        Parameters
+        ----------
+        event_name : builtins.str
+            The name of the gateway event to listen for, as sent by Discord
+            (e.g. `"MESSAGE_CREATE"`). This is case-insensitive.
+        callback
+            Must be a coroutine function to invoke with the shard which
+            received the event and its payload. Any result is discarded.
+
+        Raises
+        ------
+        builtins.LookupError
+            If the event name is not a gateway event that is known.
+        builtins.TypeError
+            If `callback` is not a coroutine function.
+        builtins.NotImplementedError
+            If the event manager doesn't support raw listeners.
+
+        Example
+        -------
+        The following demonstrates counting messages by channel without
+        building any `hikari.messages.Message` objects.
+
+        ```py
+        async def on_raw_message_create(shard, payload):
+            counter[payload["channel_id"]] += 1
+
+        bot.event_manager.subscribe_raw("MESSAGE_CREATE", on_raw_message_create)
+        ```
+
+        See Also
+        --------
+        Get raw listeners: `hikari.api.event_manager.EventManager.get_raw_listeners`
+        Unsubscribe raw: `hikari.api.event_manager.EventManager.unsubscribe_raw`
+        """
+        raise NotImplementedError(f"{type(self).__name__} doesn't support raw listeners")
+
+    def unsubscribe_raw(self, event_name: str, callback: ConsumerT) -> None:
+        """Unsubscribe a given callback from the raw payloads of a gateway event, if present.
+
+        The default implementation does nothing.
+
+        Parameters
+        ----------
+        event_name : builtins.str
+            The name of the gateway event to unsubscribe from. This is
+            case-insensitive.
+        callback
+            The callback to unsubscribe.
+
+        See Also
+        --------
+        Subscribe raw: `hikari.api.event_manager.EventManager.subscribe_raw`
+        """
+
+    def get_raw_listeners(self, event_name: str, /) -> typing.Collection[ConsumerT]:
+        """Get the raw listeners for a given gateway event, if there are any.
+
+        The default implementation always returns an empty collection.
+
+        Parameters
+        ----------
+        event_name : builtins.str
+            The name of the gateway event. This is case-insensitive.
+
+        Returns
+        -------
+        typing.Collection[typing.Callable[[hikari.api.shard.GatewayShard, hikari.internal.data_binding.JSONObject], typing.Coroutine[typing.Any, typing.Any, builtins.None]]]
+            A copy of the collection of raw listeners for the event. Will
+            return an empty collection if nothing is registered.
+        """  # noqa: E501 - Line too long
+        return ()
+
     @abc.abstractmethod
     def listen(
         self,
         *event_types: typing.Type[base_events.EventT],
+        max_concurrency: typing.Optional[int] = None,
+        ordered_by: typing.Union[str, typing.Callable[[typing.Any], typing.Hashable], None] = None,
+        timeout: typing.Union[float, int, None] = None,
     ) -> typing.Callable[[CallbackT[base_events.EventT]], CallbackT[base_events.EventT]]:
         """Generate a decorator to subscribe a callback to an event type.
 
@@ -405,6 +577,18 @@ class EventManager(abc.ABC):
 
             `T` must be a subclass of `hikari.events.base_events.Event`.
 
+        Other Parameters
+        ----------------
+        max_concurrency : typing.Optional[builtins.int]
+            The maximum number of calls to the callback which may run at once.
+            See `EventManager.subscribe`.
+        ordered_by : typing.Union[builtins.str, typing.Callable[[T], typing.Hashable], builtins.None]
+            The event attribute or key function to order the calls to the
+            callback by. See `EventManager.subscribe`.
+        timeout : typing.Union[builtins.float, builtins.int, builtins.None]
+            How long each call to the callback may run for.
+            See `EventManager.subscribe`.
+
         Returns
         -------
         typing.Callable[[T], T]
@@ -428,6 +612,10 @@ class EventManager(abc.ABC):
         /,
         timeout: typing.Union[float, int, None],
         limit: typing.Optional[int] = None,
+        *,
+        overflow: typing.Union[StreamOverflowPolicy, str] = StreamOverflowPolicy.DROP_NEWEST,
+        high_water_mark: typing.Optional[int] = None,
+        on_high_water_mark: typing.Optional[typing.Callable[[EventStream[base_events.EventT]], None]] = None,
     ) -> EventStream[base_events.EventT]:
         """Return a stream iterator for the given event and sub-events.
 
@@ -442,8 +630,21 @@ class EventManager(abc.ABC):
             until explicitly broken from.
         limit : typing.Optional[builtins.int]
             The limit for how many events this should queue at one time before
-            dropping extra incoming events, leave this as `builtins.None` for
-            the cache size to be unlimited.
+            applying `overflow`, leave this as `builtins.None` for the cache
+            size to be unlimited.
+
+        Other Parameters
+        ----------------
+        overflow : typing.Union[StreamOverflowPolicy, builtins.str]
+            What to do with events received while `limit` events are queued.
+            Defaults to `StreamOverflowPolicy.DROP_NEWEST`.
+        high_water_mark : typing.Optional[builtins.int]
+            The number of queued events at which `on_high_water_mark` should be
+            called.
+        on_high_water_mark : typing.Optional[typing.Callable[[EventStream[hikari.events.base_events.Event]], builtins.None]]
+            Callback which is called with the stream each time the number of
+            queued events reaches `high_water_mark`. This can be used to close
+            or log streams which are not being consumed from fast enough.
 
         Returns
         -------
@@ -452,6 +653,13 @@ class EventManager(abc.ABC):
             with `with stream:` or `stream.open()` before
             asynchronously iterating over it.
 
+        Raises
+        ------
+        builtins.ValueError
+            If `overflow` is not `StreamOverflowPolicy.DROP_NEWEST` and `limit`
+            is `builtins.None`, or if only one of `high_water_mark` and
+            `on_high_water_mark` is passed.
+
         !!! warning
             If you use `stream.open()` to start the stream then you must
             also close it with `stream.close()` otherwise it may queue
@@ -494,6 +702,7 @@ class EventManager(abc.ABC):
         /,
         timeout: typing.Union[float, int, None],
         predicate: typing.Optional[PredicateT[base_events.EventT]] = None,
+        **attrs: typing.Any,
     ) -> base_events.EventT:
         """Wait for a given event to occur once, then return the event.
 
@@ -518,6 +727,21 @@ class EventManager(abc.ABC):
             result in "leaking" of coroutines that never complete if called in
             an uncontrolled way, so is not recommended).
 
+        Other Parameters
+        ----------------
+        **attrs : typing.Any
+            Attribute names mapped to the values they must be equal to for an
+            event to be returned. These are checked before `predicate`.
+
+            Unlike with `predicate`, events are matched to these waiters with
+            a single lookup, which makes this much cheaper when there are many
+            waiters for the same event type, such as menus waiting for the
+            interactions of their own components. Nested attributes are
+            referred to using the `.` operator, e.g.
+            `wait_for(InteractionCreateEvent, 60, **{"interaction.custom_id": "yes"})`.
+
+            Events which do not have these attributes are ignored.
+
         Returns
         -------
         hikari.events.base_events.Event
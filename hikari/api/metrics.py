@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides an interface for collecting metrics about the gateway."""
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("GatewayMetricsCollector",)
+
+import typing
+
+
+class GatewayMetricsCollector:
+    """Base class for a collector of gateway metrics.
+
+    An instance of this can be passed to `hikari.impl.bot.GatewayBot` (or
+    directly to the shards and event manager) to be told about what happens
+    on the gateway. Every method does nothing by default, so only the
+    metrics which are needed have to be overridden.
+
+    When no collector is given, none of these metrics are measured at all.
+
+    !!! warning
+        These are called from the event loop (mostly for every message
+        received), so they should return quickly and must not block.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    def on_frame_received(self, shard_id: int, size: int, /) -> None:
+        """Call when a shard receives a websocket frame.
+
+        Parameters
+        ----------
+        shard_id : builtins.int
+            The ID of the shard which received the frame.
+        size : builtins.int
+            The size of the frame in bytes, before being inflated.
+        """
+
+    def on_payload_inflated(self, shard_id: int, size: int, /) -> None:
+        """Call when a shard finishes inflating a transport-compressed payload.
+
+        Parameters
+        ----------
+        shard_id : builtins.int
+            The ID of the shard which received the payload.
+        size : builtins.int
+            The size of the inflated payload in bytes.
+        """
+
+    def on_payload_decoded(self, shard_id: int, duration: float, /) -> None:
+        """Call when a shard finishes decoding a payload.
+
+        Parameters
+        ----------
+        shard_id : builtins.int
+            The ID of the shard which received the payload.
+        duration : builtins.float
+            How long decoding the payload took in seconds.
+        """
+
+    def on_dispatch_peeked(self, shard_id: int, is_hit: bool, /) -> None:
+        """Call when a shard checks which event a dispatch payload is for before decoding it.
+
+        This is only called when the shard can skip decoding the payloads of
+        events which nothing consumes.
+
+        Parameters
+        ----------
+        shard_id : builtins.int
+            The ID of the shard which received the payload.
+        is_hit : builtins.bool
+            Whether the event name was read from the start of the payload. If
+            `builtins.False`, the payload's fields weren't in the expected
+            order, so it had to be decoded to find the event name.
+        """
+
+    def on_event_dispatched(self, shard_id: int, event_name: str, duration: float, /) -> None:
+        """Call when a raw gateway event has been handled by the event manager.
+
+        This covers deserializing the event, updating the cache and
+        dispatching the event to the listeners. It does not include the time
+        the listeners take to run, as they run in their own tasks.
+
+        Parameters
+        ----------
+        shard_id : builtins.int
+            The ID of the shard which received the event.
+        event_name : builtins.str
+            The name of the raw gateway event (e.g. `"MESSAGE_CREATE"`).
+        duration : builtins.float
+            How long handling the event took in seconds.
+        """
+
+    def on_heartbeat_ack(self, shard_id: int, latency: float, /) -> None:
+        """Call when a shard receives a heartbeat acknowledgement.
+
+        Parameters
+        ----------
+        shard_id : builtins.int
+            The ID of the shard.
+        latency : builtins.float
+            The heartbeat latency in seconds.
+        """
+
+    def on_event_loop_lag(self, shard_id: int, lag: float, /) -> None:
+        """Call when a shard measures how late its heartbeat was woken up.
+
+        This is measured once per heartbeat interval, and shows how busy
+        the event loop is from the point of view of the shard.
+
+        Parameters
+        ----------
+        shard_id : builtins.int
+            The ID of the shard.
+        lag : builtins.float
+            How late the heartbeat was woken up in seconds.
+        """
+
+    def on_reconnect(self, shard_id: int, /) -> None:
+        """Call when a shard is about to reconnect to the gateway.
+
+        Parameters
+        ----------
+        shard_id : builtins.int
+            The ID of the shard.
+        """
+
+    def on_connection_closed(self, shard_id: int, code: int, /) -> None:
+        """Call when the gateway closes the connection of a shard.
+
+        Parameters
+        ----------
+        shard_id : builtins.int
+            The ID of the shard.
+        code : builtins.int
+            The close code sent by the gateway. This may be one of
+            `hikari.errors.ShardCloseCode`, but is not guaranteed to be.
+        """
@@ -23,12 +23,15 @@
 """Provides an interface for gateway shard implementations to conform to."""
 from __future__ import annotations
 
-__all__: typing.Sequence[str] = ("GatewayDataFormat", "GatewayCompression", "GatewayShard")
+__all__: typing.Sequence[str] = ("GatewayDataFormat", "GatewayCompression", "GatewaySessionState", "GatewayShard")
 
 import abc
 import typing
 
+import attr
+
 from hikari import undefined
+from hikari.internal import attr_extensions
 from hikari.internal import enums
 
 if typing.TYPE_CHECKING:
@@ -49,7 +52,12 @@ class GatewayDataFormat(str, enums.Enum):
     JSON = "json"
     """Javascript serialized object notation."""
     ETF = "etf"
-    """Erlang transmission format."""
+    """Erlang transmission format.
+
+    This is decoded in pure Python, which is roughly an order of magnitude
+    slower than decoding JSON with `orjson`, so it only makes sense when
+    bandwidth matters more than CPU time.
+    """
 
 
 @typing.final
@@ -58,10 +66,45 @@ class GatewayCompression(str, enums.Enum):
 
     TRANSPORT_ZLIB_STREAM = "transport_zlib_stream"
     """Transport compression using ZLIB."""
+    TRANSPORT_ZSTD_STREAM = "transport_zstd_stream"
+    """Transport compression using Zstandard.
+
+    This requires the optional `zstandard` dependency, which is included in
+    `hikari[speedups]`.
+    """
     PAYLOAD_ZLIB_STREAM = "payload_zlib_stream"
     """Payload compression using ZLIB."""
 
 
+@attr_extensions.with_copy
+@attr.define(hash=False, kw_only=True, weakref_slot=False)
+class GatewaySessionState:
+    """The state needed to resume a gateway session.
+
+    This can be exported from a shard and handed to a new one (even in a
+    different process) to resume the session instead of identifying again,
+    which skips the identify rate limits and the initial `GUILD_CREATE` flood.
+
+    All fields are plain builtin types, so this can be stored as JSON (or
+    anything else) between restarts.
+    """
+
+    shard_id: int = attr.field(repr=True)
+    """The ID of the shard the session belongs to."""
+
+    shard_count: int = attr.field(repr=True)
+    """The number of shards the session was started with."""
+
+    session_id: str = attr.field(repr=True)
+    """The ID of the session."""
+
+    seq: int = attr.field(repr=True)
+    """The sequence number of the last event received in the session."""
+
+    resume_url: typing.Optional[str] = attr.field(default=None, repr=True)
+    """The URL the session should be resumed on, if one was given."""
+
+
 class GatewayShard(abc.ABC):
     """Interface for a definition of a V8 compatible websocket gateway.
 
@@ -115,6 +158,20 @@ class GatewayShard(abc.ABC):
             `builtins.True` if connected, or `builtins.False` if not.
         """
 
+    @property
+    def session_state(self) -> typing.Optional[GatewaySessionState]:
+        """Return the state needed to resume the shard's current session.
+
+        The default implementation always returns `builtins.None`.
+
+        Returns
+        -------
+        typing.Optional[GatewaySessionState]
+            The session state, or `builtins.None` if the shard has no session
+            that can be resumed.
+        """
+        return None
+
     @property
     @abc.abstractmethod
     def shard_count(self) -> int:
@@ -140,8 +197,20 @@ class GatewayShard(abc.ABC):
         """
 
     @abc.abstractmethod
-    async def close(self) -> None:
-        """Close the websocket if it is connected."""
+    async def close(self, *, keep_session: bool = False) -> None:
+        """Close the websocket if it is connected.
+
+        Other Parameters
+        ----------------
+        keep_session : builtins.bool
+            If `builtins.True`, the connection will be closed in a way that
+            lets Discord keep the session alive for a short while, so that it
+            can be resumed later using `GatewayShard.session_state`.
+            Defaults to `builtins.False`, which ends the session.
+
+            This is only passed when it's `builtins.True`, so implementations
+            which can't keep sessions alive may leave it out.
+        """
 
     @abc.abstractmethod
     async def join(self) -> None:
@@ -48,6 +48,7 @@ __all__: typing.Sequence[str] = (
     "MissingIntentError",
     "BulkDeleteError",
     "VoiceError",
+    "CacheStoreError",
 )
 
 import http
@@ -493,6 +494,17 @@ class VoiceError(HikariError):
     """Error raised when a problem occurs with the voice subsystem."""
 
 
+@attr.define(auto_exc=True, repr=False, slots=False)
+class CacheStoreError(HikariError):
+    """Error raised when a request to an out-of-process cache store fails."""
+
+    reason: str = attr.field()
+    """A string to explain the issue."""
+
+    def __str__(self) -> str:
+        return self.reason
+
+
 @attr.define(auto_exc=True, repr=False, slots=False)
 class MissingIntentError(HikariError, ValueError):
     """Error raised when you try to perform an action without an intent.
@@ -33,6 +33,9 @@ from __future__ import annotations
 from hikari.impl.bot import *
 from hikari.impl.buckets import *
 from hikari.impl.cache import *
+from hikari.impl.cache_store import *
+from hikari.impl.chunker import *
+from hikari.impl.cluster import *
 from hikari.impl.config import *
 from hikari.impl.entity_factory import *
 from hikari.impl.event_manager import *
@@ -41,5 +44,6 @@ from hikari.impl.interaction_server import *
 from hikari.impl.rate_limits import *
 from hikari.impl.rest import *
 from hikari.impl.rest_bot import *
+from hikari.impl.shared_cache import *
 from hikari.impl.special_endpoints import *
 from hikari.impl.voice import *
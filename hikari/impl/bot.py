@@ -45,15 +45,21 @@ from hikari import presences
 from hikari import snowflakes
 from hikari import traits
 from hikari import undefined
+from hikari.api import config as config_api
+from hikari.api import event_manager as event_manager_
+from hikari.api import shard as gateway_shard
 from hikari.impl import cache as cache_impl
+from hikari.impl import chunker as chunker_impl
 from hikari.impl import config as config_impl
 from hikari.impl import entity_factory as entity_factory_impl
 from hikari.impl import event_factory as event_factory_impl
 from hikari.impl import event_manager as event_manager_impl
 from hikari.impl import rest as rest_impl
 from hikari.impl import shard as shard_impl
+from hikari.impl import shared_cache as shared_cache_impl
 from hikari.impl import voice as voice_impl
 from hikari.internal import aio
+from hikari.internal import data_binding
 from hikari.internal import time
 from hikari.internal import ux
 
@@ -66,11 +72,11 @@ if typing.TYPE_CHECKING:
     from hikari.api import cache as cache_
     from hikari.api import entity_factory as entity_factory_
     from hikari.api import event_factory as event_factory_
-    from hikari.api import event_manager as event_manager_
+    from hikari.api import metrics as metrics_
     from hikari.api import rest as rest_
-    from hikari.api import shard as gateway_shard
     from hikari.api import voice as voice_
     from hikari.events import base_events
+    from hikari.impl import cache_store as cache_store_
 
 _LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.bot")
 
@@ -179,6 +185,33 @@ class GatewayBot(traits.GatewayBotAware):
         The package to search for a `banner.txt` in. Defaults to `"hikari"` for
         the `"hikari/banner.txt"` banner.
         Setting this to `builtins.None` will disable the banner being shown.
+    compression : typing.Optional[builtins.str]
+        The transport compression to use for the gateway shards. Defaults to
+        `hikari.api.shard.GatewayCompression.TRANSPORT_ZLIB_STREAM`.
+
+        `hikari.api.shard.GatewayCompression.TRANSPORT_ZSTD_STREAM` may be used
+        instead if the optional `zstandard` dependency is installed (see
+        `hikari[speedups]`), or `builtins.None` to disable compression.
+    coalesce_windows : typing.Optional[typing.Mapping[builtins.str, builtins.float]]
+        Mapping of gateway event names to how long in seconds updates should
+        be coalesced for. Only the latest payload received within the window
+        for the same entity is cached and dispatched, which can considerably
+        reduce the work done for bursts of updates in large guilds.
+
+        This is supported for `"GUILD_MEMBER_UPDATE"` and `"PRESENCE_UPDATE"`,
+        which are grouped by guild and user, and `"TYPING_START"`, which is
+        grouped by channel and user.
+
+        !!! warning
+            Coalesced events are delayed by up to the window, and the
+            payloads they replace are never dispatched, not even to raw
+            listeners.
+
+        Defaults to `builtins.None`, which disables this.
+    dumps : hikari.internal.data_binding.JSONEncoder
+        The JSON encoder to use for the REST client and the gateway shards.
+        Defaults to `hikari.internal.data_binding.default_json_dumps`, which
+        will use `orjson` if it is installed (see `hikari[speedups]`).
     executor : typing.Optional[concurrent.futures.Executor]
         Defaults to `builtins.None`. If non-`builtins.None`, then this executor
         is used instead of the `concurrent.futures.ThreadPoolExecutor` attached
@@ -198,6 +231,15 @@ class GatewayBot(traits.GatewayBotAware):
         override this setting.
     cache_settings : typing.Optional[hikari.impl.config.CacheSettings]
         Optional cache settings. If unspecified, will use the defaults.
+    cache_store : typing.Optional[hikari.impl.cache_store.CacheStoreClient]
+        The client for an out-of-process store to keep the cache in, letting
+        it be shared with other processes (such as the other workers of a
+        `hikari.impl.cluster.ClusterManager`) through a
+        `hikari.impl.shared_cache.SharedCacheImpl`.
+
+        Defaults to `builtins.None`, in which case the cache is kept in memory.
+        A shared cache isn't cleared when the bot closes, as other processes
+        may still be using it, but its queued writes are sent to the store.
     http_settings : typing.Optional[hikari.impl.config.HTTPSettings]
         Optional custom HTTP configuration settings to use. Allows you to
         customise functionality such as whether SSL-verification is enabled,
@@ -220,6 +262,25 @@ class GatewayBot(traits.GatewayBotAware):
             we should also chunk small guilds if the presences are not declared).
         4. The members cache is enabled or there are listeners for the
         `MemberChunkEvent`.
+
+        These requests are queued on `GatewayBot.chunker`, which sends them
+        one at a time per shard (smallest guilds first) and tracks when each
+        guild has been fully chunked.
+    lazy_entities : builtins.bool
+        Defaults to `builtins.False`.
+
+        If `builtins.True`, messages, members and presences will keep the
+        payload they were received with and only deserialize each field the
+        first time it is accessed, which saves a lot of work for handlers
+        that only look at a few fields (such as `content` or `author`).
+
+        !!! note
+            Any entities which get cached will be fully deserialized when
+            they are added to the cache.
+    loads : hikari.internal.data_binding.JSONDecoder
+        The JSON decoder to use for the REST client and the gateway shards.
+        Defaults to `hikari.internal.data_binding.default_json_loads`, which
+        will use `orjson` if it is installed (see `hikari[speedups]`).
     logs : typing.Union[builtins.None, LoggerLevel, typing.Dict[str, typing.Any]]
         Defaults to `"INFO"`.
 
@@ -260,6 +321,30 @@ class GatewayBot(traits.GatewayBotAware):
     max_retries : typing.Optional[builtins.int]
         Maximum number of times a request will be retried if
         it fails with a `5xx` status. Defaults to 3 if set to `builtins.None`.
+    metrics : typing.Optional[hikari.api.metrics.GatewayMetricsCollector]
+        The collector to report gateway metrics to, such as the frames each
+        shard receives, how long decoding payloads and handling events takes,
+        event loop lag, reconnects and close codes.
+
+        Defaults to `builtins.None`, in which case no metrics are measured.
+    offload_member_threshold : typing.Optional[builtins.int]
+        The number of members from which `GUILD_CREATE` payloads will be
+        deserialized in `executor` instead of on the event loop. Other events
+        received by the same shard are held back until the guild has been
+        cached, so they are still dispatched in order.
+
+        Defaults to `builtins.None`, which disables this.
+    offload_threshold : typing.Optional[builtins.int]
+        The size in bytes from which compressed gateway messages will be
+        inflated in `executor` instead of on the event loop, which stops huge
+        payloads from stalling heartbeats and other shards. Payloads are
+        still decoded on the event loop, as decoding doesn't release the GIL.
+
+        Defaults to `builtins.None`, which disables this.
+
+        !!! note
+            When offloading is enabled, `executor` must be a
+            `concurrent.futures.ThreadPoolExecutor` (or left as `builtins.None`).
     proxy_settings : typing.Optional[hikari.impl.config.ProxySettings]
         Custom proxy settings to use with network-layer logic
         in your application to get through an HTTP-proxy.
@@ -305,8 +390,11 @@ class GatewayBot(traits.GatewayBotAware):
 
     __slots__: typing.Sequence[str] = (
         "_cache",
+        "_chunker",
         "_closing_event",
         "_closed_event",
+        "_compression",
+        "_dumps",
         "_entity_factory",
         "_event_manager",
         "_event_factory",
@@ -314,8 +402,12 @@ class GatewayBot(traits.GatewayBotAware):
         "_http_settings",
         "_intents",
         "_is_alive",
+        "_loads",
+        "_metrics",
+        "_offload_threshold",
         "_proxy_settings",
         "_rest",
+        "_resume_state",
         "_shards",
         "_token",
         "_voice",
@@ -328,15 +420,24 @@ class GatewayBot(traits.GatewayBotAware):
         *,
         allow_color: bool = True,
         banner: typing.Optional[str] = "hikari",
+        compression: typing.Optional[str] = gateway_shard.GatewayCompression.TRANSPORT_ZLIB_STREAM,
+        coalesce_windows: typing.Optional[typing.Mapping[str, float]] = None,
+        dumps: data_binding.JSONEncoder = data_binding.default_json_dumps,
         executor: typing.Optional[concurrent.futures.Executor] = None,
         force_color: bool = False,
         cache_settings: typing.Optional[config_impl.CacheSettings] = None,
+        cache_store: typing.Optional[cache_store_.CacheStoreClient] = None,
         http_settings: typing.Optional[config_impl.HTTPSettings] = None,
         intents: intents_.Intents = intents_.Intents.ALL_UNPRIVILEGED,
         auto_chunk_members: bool = True,
+        lazy_entities: bool = False,
+        loads: data_binding.JSONDecoder = data_binding.default_json_loads,
         logs: typing.Union[None, int, str, typing.Dict[str, typing.Any]] = "INFO",
         max_rate_limit: float = 300,
         max_retries: int = 3,
+        metrics: typing.Optional[metrics_.GatewayMetricsCollector] = None,
+        offload_member_threshold: typing.Optional[int] = None,
+        offload_threshold: typing.Optional[int] = None,
         proxy_settings: typing.Optional[config_impl.ProxySettings] = None,
         rest_url: typing.Optional[str] = None,
     ) -> None:
@@ -348,18 +449,30 @@ class GatewayBot(traits.GatewayBotAware):
         self._closing_event: typing.Optional[asyncio.Event] = None
         self._closed_event: typing.Optional[asyncio.Event] = None
         self._is_alive = False
+        self._compression = compression
+        self._dumps = dumps
         self._executor = executor
         self._http_settings = http_settings if http_settings is not None else config_impl.HTTPSettings()
         self._intents = intents
+        self._loads = loads
+        self._metrics = metrics
+        self._offload_threshold = offload_threshold
         self._proxy_settings = proxy_settings if proxy_settings is not None else config_impl.ProxySettings()
         self._token = token.strip()
 
         # Caching
         cache_settings = cache_settings if cache_settings is not None else config_impl.CacheSettings()
-        self._cache = cache_impl.CacheImpl(self, cache_settings)
+        self._cache: cache_.MutableCache
+        if cache_store is None:
+            self._cache = cache_impl.CacheImpl(self, cache_settings)
+        else:
+            self._cache = shared_cache_impl.SharedCacheImpl(self, cache_settings, cache_store)
+
+        # Member chunking
+        self._chunker = chunker_impl.GuildChunker()
 
         # Entity creation
-        self._entity_factory = entity_factory_impl.EntityFactoryImpl(self)
+        self._entity_factory = entity_factory_impl.EntityFactoryImpl(self, lazy_entities=lazy_entities)
 
         # Event creation
         self._event_factory = event_factory_impl.EventFactoryImpl(self)
@@ -371,6 +484,11 @@ class GatewayBot(traits.GatewayBotAware):
             self._intents,
             auto_chunk_members=auto_chunk_members,
             cache=self._cache,
+            chunker=self._chunker,
+            coalesce_windows=coalesce_windows,
+            executor=self._executor,
+            metrics=self._metrics,
+            offload_member_threshold=offload_member_threshold,
         )
 
         # Voice subsystem
@@ -379,9 +497,11 @@ class GatewayBot(traits.GatewayBotAware):
         # RESTful API.
         self._rest = rest_impl.RESTClientImpl(
             cache=self._cache,
+            dumps=self._dumps,
             entity_factory=self._entity_factory,
             executor=self._executor,
             http_settings=self._http_settings,
+            loads=self._loads,
             max_rate_limit=max_rate_limit,
             proxy_settings=self._proxy_settings,
             rest_url=rest_url,
@@ -394,11 +514,28 @@ class GatewayBot(traits.GatewayBotAware):
         # HTTP requests to determine what to put in this mapping.
         self._shards: typing.Dict[int, gateway_shard.GatewayShard] = {}
         self.shards: typing.Mapping[int, gateway_shard.GatewayShard] = types.MappingProxyType(self._shards)
+        self._resume_state: typing.Mapping[int, gateway_shard.GatewaySessionState] = {}
 
     @property
     def cache(self) -> cache_.Cache:
         return self._cache
 
+    @property
+    def chunker(self) -> chunker_impl.GuildChunker:
+        """Guild chunker used to request and track the members of guilds.
+
+        This can be used to check the progress of the automatic member
+        chunking done on guild create or to wait until a guild's members
+        have all been received.
+
+        !!! note
+            Nothing calls `hikari.impl.chunker.GuildChunker.prioritize`
+            automatically, so queued requests are sent smallest guild first
+            unless you prioritise guilds yourself, for example when they see
+            activity.
+        """
+        return self._chunker
+
     @property
     def event_manager(self) -> event_manager_.EventManager:
         return self._event_manager
@@ -436,6 +573,35 @@ class GatewayBot(traits.GatewayBotAware):
     def proxy_settings(self) -> config_impl.ProxySettings:
         return self._proxy_settings
 
+    @property
+    def resume_state(self) -> typing.Mapping[int, gateway_shard.GatewaySessionState]:
+        """Return the state needed to resume the sessions of the shards.
+
+        While the bot is running, this is taken from the running shards. Once
+        the bot has been closed with `keep_sessions=True`, this is the state
+        the shards had when they were closed.
+
+        This can be stored and passed to `GatewayBot.start` or `GatewayBot.run`
+        as `resume_state` to resume the sessions after a restart. Resumed
+        sessions don't receive their guilds again, so after restarting the
+        process this is ignored unless the bot has a `cache_store` or isn't
+        caching guilds.
+
+        Returns
+        -------
+        typing.Mapping[builtins.int, hikari.api.shard.GatewaySessionState]
+            Mapping of shard IDs to the state of their session. Shards without
+            a session that can be resumed are not included.
+        """
+        if not self._shards:
+            return self._resume_state
+
+        return {
+            shard_id: session_state
+            for shard_id, shard in self._shards.items()
+            if (session_state := shard.session_state) is not None
+        }
+
     @property
     def shard_count(self) -> int:
         return next(iter(self._shards.values())).shard_count if self._shards else 0
@@ -459,11 +625,22 @@ class GatewayBot(traits.GatewayBotAware):
     def get_me(self) -> typing.Optional[users_.OwnUser]:
         return self._cache.get_me()
 
-    async def close(self) -> None:
+    async def close(self, *, keep_sessions: bool = False) -> None:
+        """Kill the application by shutting all components down.
+
+        Other Parameters
+        ----------------
+        keep_sessions : builtins.bool
+            If `builtins.True`, the shards will be closed in a way that lets
+            their sessions be resumed later, and their state will be available
+            from `GatewayBot.resume_state`. The cache is not cleared either,
+            as resumed sessions don't receive the guilds again. Defaults to
+            `builtins.False`.
+        """
         self._check_if_alive()
-        await self._close()
+        await self._close(keep_sessions=keep_sessions)
 
-    async def _close(self) -> None:
+    async def _close(self, *, keep_sessions: bool = False) -> None:
         if self._closed_event:  # Closing is in progress from another call, wait for that to complete.
             await self._closed_event.wait()
             return
@@ -501,14 +678,26 @@ class GatewayBot(traits.GatewayBotAware):
         calls = [
             ("rest", self._rest.close()),
             ("voice handler", self._voice.close()),
-            *((f"shard {s.id}", s.close()) for s in self._shards.values()),
+            # keep_session is only passed when needed, as shards which predate it don't accept it.
+            *(
+                (f"shard {s.id}", s.close(keep_session=True) if keep_sessions else s.close())
+                for s in self._shards.values()
+            ),
         ]
 
         for coro in asyncio.as_completed([handle(*pair) for pair in calls]):
             await coro
 
-        # Clear out cache and shard map
-        self._cache.clear()
+        self._resume_state = self.resume_state if keep_sessions else {}
+
+        # Clear out cache, pending chunk requests, coalesced events and shard map. The cache is kept along with the
+        # sessions, as resuming them won't send the guilds again.
+        self._chunker.close()
+        self._event_manager.close()
+        if isinstance(self._cache, shared_cache_impl.SharedCacheImpl):
+            await asyncio.get_running_loop().run_in_executor(self._executor, self._cache.flush)
+        elif not keep_sessions:
+            self._cache.clear()
         self._shards.clear()
         self._is_alive = False
 
@@ -639,6 +828,9 @@ class GatewayBot(traits.GatewayBotAware):
     def listen(
         self,
         *event_types: typing.Type[base_events.EventT],
+        max_concurrency: typing.Optional[int] = None,
+        ordered_by: typing.Union[str, typing.Callable[[typing.Any], typing.Hashable], None] = None,
+        timeout: typing.Union[float, int, None] = None,
     ) -> typing.Callable[[event_manager_.CallbackT[base_events.EventT]], event_manager_.CallbackT[base_events.EventT]]:
         """Generate a decorator to subscribe a callback to an event type.
 
@@ -653,6 +845,18 @@ class GatewayBot(traits.GatewayBotAware):
 
             `EventT` must be a subclass of `hikari.events.base_events.Event`.
 
+        Other Parameters
+        ----------------
+        max_concurrency : typing.Optional[builtins.int]
+            The maximum number of calls to the callback which may run at once.
+            See `hikari.impl.bot.GatewayBot.subscribe`.
+        ordered_by : typing.Union[builtins.str, typing.Callable[[EventT], typing.Hashable], builtins.None]
+            The event attribute or key function to order the calls to the
+            callback by. See `hikari.impl.bot.GatewayBot.subscribe`.
+        timeout : typing.Union[builtins.float, builtins.int, builtins.None]
+            How long each call to the callback may run for.
+            See `hikari.impl.bot.GatewayBot.subscribe`.
+
         Returns
         -------
         typing.Callable[[EventT], EventT]
@@ -668,7 +872,9 @@ class GatewayBot(traits.GatewayBotAware):
         Unsubscribe: `hikari.impl.bot.GatewayBot.unsubscribe`
         Wait_for: `hikari.impl.bot.GatewayBot.wait_for`
         """
-        return self._event_manager.listen(*event_types)
+        return self._event_manager.listen(
+            *event_types, max_concurrency=max_concurrency, ordered_by=ordered_by, timeout=timeout
+        )
 
     @staticmethod
     def print_banner(
@@ -725,11 +931,14 @@ class GatewayBot(traits.GatewayBotAware):
         enable_signal_handlers: typing.Optional[bool] = None,
         idle_since: typing.Optional[datetime.datetime] = None,
         ignore_session_start_limit: bool = False,
+        keep_sessions: bool = False,
         large_threshold: int = 250,
         propagate_interrupts: bool = False,
+        resume_state: typing.Optional[typing.Mapping[int, gateway_shard.GatewaySessionState]] = None,
         status: presences.Status = presences.Status.ONLINE,
         shard_ids: typing.Optional[typing.AbstractSet[int]] = None,
         shard_count: typing.Optional[int] = None,
+        start_window_gate: typing.Optional[typing.Callable[[typing.Sequence[int]], typing.Awaitable[None]]] = None,
     ) -> None:
         """Start the bot, wait for all shards to become ready, and then return.
 
@@ -789,6 +998,11 @@ class GatewayBot(traits.GatewayBotAware):
             will throw a `hikari.errors.GatewayError` rather than going ahead
             and hitting the IDENTIFY limit, which may result in your token
             being reset. Setting to `builtins.True` disables this behavior.
+        keep_sessions : builtins.bool
+            Defaults to `builtins.False`. If `builtins.True`, the bot is closed
+            with `keep_sessions=True` when it shuts down, including when this
+            is caused by an OS signal. The state of the sessions is then
+            available from `GatewayBot.resume_state` once this returns.
         large_threshold : builtins.int
             Threshold for members in a guild before it is treated as being
             "large" and no longer sending member details in the `GUILD CREATE`
@@ -802,6 +1016,9 @@ class GatewayBot(traits.GatewayBotAware):
             determine what kind of interrupt the application received after
             it closes. When `builtins.False`, nothing is raised and the call
             will terminate cleanly and silently where possible instead.
+        resume_state : typing.Optional[typing.Mapping[builtins.int, hikari.api.shard.GatewaySessionState]]
+            The state of previous sessions to resume, as returned by
+            `GatewayBot.resume_state`. See `GatewayBot.start` for more info.
         shard_ids : typing.Optional[typing.AbstractSet[builtins.int]]
             The shard IDs to create shards for. If not `builtins.None`, then
             a non-`None` `shard_count` must ALSO be provided. Defaults to
@@ -811,6 +1028,9 @@ class GatewayBot(traits.GatewayBotAware):
             The number of shards to use in the entire distributed application.
             Defaults to `builtins.None` which results in the count being
             determined dynamically on startup.
+        start_window_gate : typing.Optional[typing.Callable[[typing.Sequence[builtins.int]], typing.Awaitable[builtins.None]]]
+            Called with the shard IDs of each startup window before starting
+            them. See `GatewayBot.start` for more info.
         status : hikari.presences.Status
             The initial status to show for the user presence on startup.
             Defaults to `hikari.presences.Status.ONLINE`.
@@ -878,7 +1098,7 @@ class GatewayBot(traits.GatewayBotAware):
                     "".join(traceback.format_stack(frame)),
                 )
 
-            asyncio.run_coroutine_threadsafe(self._set_close_flag(signame, signum), loop)
+            asyncio.run_coroutine_threadsafe(self._set_close_flag(signame, signum, keep_sessions), loop)
 
         if enable_signal_handlers is None:
             # Signal handlers can only be registered on the main thread so we
@@ -902,8 +1122,10 @@ class GatewayBot(traits.GatewayBotAware):
                     idle_since=idle_since,
                     ignore_session_start_limit=ignore_session_start_limit,
                     large_threshold=large_threshold,
+                    resume_state=resume_state,
                     shard_ids=shard_ids,
                     shard_count=shard_count,
+                    start_window_gate=start_window_gate,
                     status=status,
                 )
             )
@@ -912,7 +1134,7 @@ class GatewayBot(traits.GatewayBotAware):
 
         finally:
             try:
-                loop.run_until_complete(self._close())
+                loop.run_until_complete(self._close(keep_sessions=keep_sessions))
 
                 if close_passed_executor and self._executor is not None:
                     _LOGGER.debug("shutting down executor %s", self._executor)
@@ -945,8 +1167,10 @@ class GatewayBot(traits.GatewayBotAware):
         idle_since: typing.Optional[datetime.datetime] = None,
         ignore_session_start_limit: bool = False,
         large_threshold: int = 250,
+        resume_state: typing.Optional[typing.Mapping[int, gateway_shard.GatewaySessionState]] = None,
         shard_ids: typing.Optional[typing.AbstractSet[int]] = None,
         shard_count: typing.Optional[int] = None,
+        start_window_gate: typing.Optional[typing.Callable[[typing.Sequence[int]], typing.Awaitable[None]]] = None,
         status: presences.Status = presences.Status.ONLINE,
     ) -> None:
         """Start the bot, wait for all shards to become ready, and then return.
@@ -975,6 +1199,24 @@ class GatewayBot(traits.GatewayBotAware):
             Threshold for members in a guild before it is treated as being
             "large" and no longer sending member details in the `GUILD CREATE`
             event. Defaults to `250`.
+        resume_state : typing.Optional[typing.Mapping[builtins.int, hikari.api.shard.GatewaySessionState]]
+            The state of previous sessions to resume, as returned by
+            `GatewayBot.resume_state` after closing with `keep_sessions=True`.
+
+            Shards with a session in here will try to resume it instead of
+            identifying, which skips receiving every guild again. Sessions
+            which can no longer be resumed fall back to identifying, so these
+            shards are still started in their max concurrency window and
+            counted towards the session start limit. States for a different
+            shard count are ignored. Defaults to `builtins.None`.
+
+            !!! warning
+                Resumed sessions don't receive their guilds again, so the
+                cache has to still hold them. When the in-memory cache is
+                caching guilds but is empty, such as after restarting the
+                process, these states are ignored and every shard identifies.
+                Pass a `cache_store` to the bot to keep the cache between
+                restarts.
         shard_ids : typing.Optional[typing.AbstractSet[builtins.int]]
             The shard IDs to create shards for. If not `builtins.None`, then
             a non-`None` `shard_count` must ALSO be provided. Defaults to
@@ -984,6 +1226,13 @@ class GatewayBot(traits.GatewayBotAware):
             The number of shards to use in the entire distributed application.
             Defaults to `builtins.None` which results in the count being
             determined dynamically on startup.
+        start_window_gate : typing.Optional[typing.Callable[[typing.Sequence[builtins.int]], typing.Awaitable[builtins.None]]]
+            Called with the shard IDs of each startup window, which are only
+            started once the returned awaitable completes. This lets multiple
+            processes coordinate starting their shards within the session
+            start limits, like `hikari.impl.cluster.ClusterManager` does, so
+            the 5 second wait between windows is skipped when this is passed.
+            Defaults to `builtins.None`.
         status : hikari.presences.Status
             The initial status to show for the user presence on startup.
             Defaults to `hikari.presences.Status.ONLINE`.
@@ -1023,6 +1272,29 @@ class GatewayBot(traits.GatewayBotAware):
         if shard_ids is None:
             shard_ids = set(range(shard_count))
 
+        resumable: typing.Dict[int, gateway_shard.GatewaySessionState] = {}
+        if resume_state and self._is_cache_missing_guilds():
+            _LOGGER.warning(
+                "ignoring the sessions to resume as the guilds they received aren't in the cache and resuming "
+                "doesn't receive them again, use a cache store to keep the cache between restarts"
+            )
+
+        elif resume_state:
+            for shard_id, session_state in resume_state.items():
+                if shard_id not in shard_ids:
+                    continue
+
+                if session_state.shard_count != shard_count:
+                    _LOGGER.warning(
+                        "ignoring session of shard %s as it was started with %s shards instead of %s",
+                        shard_id,
+                        session_state.shard_count,
+                        shard_count,
+                    )
+                    continue
+
+                resumable[shard_id] = session_state
+
         if requirements.session_start_limit.remaining < len(shard_ids) and not ignore_session_start_limit:
             _LOGGER.critical(
                 "would have started %s session%s, but you only have %s session%s remaining until %s. Starting more "
@@ -1045,6 +1317,9 @@ class GatewayBot(traits.GatewayBotAware):
             "s" if len(shard_ids) != 1 else "",
         )
 
+        if resumable:
+            _LOGGER.info("will try to resume %s session%s", len(resumable), "s" if len(resumable) != 1 else "")
+
         for window_start in range(0, shard_count, requirements.session_start_limit.max_concurrency):
             window = [
                 candidate_shard_id
@@ -1056,7 +1331,20 @@ class GatewayBot(traits.GatewayBotAware):
 
             if not window:
                 continue
-            if self._shards:
+            if start_window_gate is not None:
+                # The gate already spaces out the windows of every process, so waiting 5 seconds as well would only
+                # slow down startup.
+                await aio.first_completed(start_window_gate(window), self._closing_event.wait())
+
+                if self._closing_event.is_set():
+                    _LOGGER.info("requested to shut down during startup of shards")
+                    return
+
+                if any(not s.is_alive for s in self._shards.values()):
+                    _LOGGER.critical("one or more shards shut down unexpectedly during bot startup")
+                    return
+
+            elif self._shards:
                 close_waiter = asyncio.create_task(self._closing_event.wait())
                 shard_joiners = [s.join() for s in self._shards.values()]
 
@@ -1100,6 +1388,7 @@ class GatewayBot(traits.GatewayBotAware):
                         shard_count=shard_count,
                         url=requirements.url,
                         closing_event=self._closing_event,
+                        session_state=resumable.get(candidate_shard_id),
                     )
                     for candidate_shard_id in window
                     if candidate_shard_id in shard_ids
@@ -1116,6 +1405,14 @@ class GatewayBot(traits.GatewayBotAware):
         /,
         timeout: typing.Union[float, int, None],
         limit: typing.Optional[int] = None,
+        *,
+        overflow: typing.Union[
+            event_manager_.StreamOverflowPolicy, str
+        ] = event_manager_.StreamOverflowPolicy.DROP_NEWEST,
+        high_water_mark: typing.Optional[int] = None,
+        on_high_water_mark: typing.Optional[
+            typing.Callable[[event_manager_.EventStream[base_events.EventT]], None]
+        ] = None,
     ) -> event_manager_.EventStream[base_events.EventT]:
         """Return a stream iterator for the given event and sub-events.
 
@@ -1130,8 +1427,20 @@ class GatewayBot(traits.GatewayBotAware):
             until explicitly broken from.
         limit : typing.Optional[builtins.int]
             The limit for how many events this should queue at one time before
-            dropping extra incoming events, leave this as `builtins.None` for
-            the cache size to be unlimited.
+            applying `overflow`, leave this as `builtins.None` for the cache
+            size to be unlimited.
+
+        Other Parameters
+        ----------------
+        overflow : typing.Union[hikari.api.event_manager.StreamOverflowPolicy, builtins.str]
+            What to do with events received while `limit` events are queued.
+            Defaults to `hikari.api.event_manager.StreamOverflowPolicy.DROP_NEWEST`.
+        high_water_mark : typing.Optional[builtins.int]
+            The number of queued events at which `on_high_water_mark` should be
+            called.
+        on_high_water_mark : typing.Optional[typing.Callable[[EventStream[hikari.events.base_events.Event]], builtins.None]]
+            Callback which is called with the stream each time the number of
+            queued events reaches `high_water_mark`.
 
         Returns
         -------
@@ -1140,6 +1449,13 @@ class GatewayBot(traits.GatewayBotAware):
             with `with stream:` or `stream.open()` before
             asynchronously iterating over it.
 
+        Raises
+        ------
+        builtins.ValueError
+            If `overflow` is not `hikari.api.event_manager.StreamOverflowPolicy.DROP_NEWEST`
+            and `limit` is `builtins.None`, or if only one of `high_water_mark`
+            and `on_high_water_mark` is passed.
+
         !!! warning
             If you use `stream.open()` to start the stream then you must
             also close it with `stream.close()` otherwise it may queue
@@ -1175,13 +1491,28 @@ class GatewayBot(traits.GatewayBotAware):
         Wait_for: `hikari.impl.bot.GatewayBot.wait_for`
         """
         self._check_if_alive()
-        return self._event_manager.stream(event_type, timeout=timeout, limit=limit)
+        return self._event_manager.stream(
+            event_type,
+            timeout=timeout,
+            limit=limit,
+            overflow=overflow,
+            high_water_mark=high_water_mark,
+            on_high_water_mark=on_high_water_mark,
+        )
 
     # Yes, this is not generic. The reason for this is MyPy complains about
     # using ABCs that are not concrete in generic types passed to functions.
     # For the sake of UX, I will check this at runtime instead and let the
     # user use a static type checker.
-    def subscribe(self, event_type: typing.Type[typing.Any], callback: event_manager_.CallbackT[typing.Any]) -> None:
+    def subscribe(
+        self,
+        event_type: typing.Type[typing.Any],
+        callback: event_manager_.CallbackT[typing.Any],
+        *,
+        max_concurrency: typing.Optional[int] = None,
+        ordered_by: typing.Union[str, typing.Callable[[typing.Any], typing.Hashable], None] = None,
+        timeout: typing.Union[float, int, None] = None,
+    ) -> None:
         """Subscribe a given callback to a given event type.
 
         Parameters
@@ -1195,6 +1526,37 @@ class GatewayBot(traits.GatewayBotAware):
             consume an instance of the given event, or an instance of a valid
             subclass if one exists. Any result is discarded.
 
+        Other Parameters
+        ----------------
+        max_concurrency : typing.Optional[builtins.int]
+            The maximum number of calls to the callback which may run at
+            once. Further events wait for a running call to finish first.
+            If `builtins.None` then this is unlimited.
+        ordered_by : typing.Union[builtins.str, typing.Callable[[T], typing.Hashable], builtins.None]
+            If provided, events with the same key are passed to the callback
+            one at a time in the order they were dispatched, while events with
+            different keys may still run concurrently. This can be the name of
+            an event attribute, such as `"guild_id"`, or a callable which
+            returns the key for an event. Events which the key cannot be
+            resolved for are not ordered.
+        timeout : typing.Union[builtins.float, builtins.int, builtins.None]
+            How long each call to the callback may run for before it is
+            cancelled, not including the time spent waiting for
+            `max_concurrency` or `ordered_by`. A cancelled call is reported
+            like any other exception raised by the callback, with an
+            `asyncio.TimeoutError`.
+
+        These apply to the callback as a whole, so the limits are shared
+        between all the event types it's subscribed to, and every
+        subscription of the callback must use the same options. They're
+        removed once the callback is no longer subscribed to anything.
+
+        Raises
+        ------
+        builtins.ValueError
+            If `max_concurrency` is less than 1, `timeout` is not positive or
+            the callback is already subscribed with different options.
+
         Example
         -------
         The following demonstrates subscribing a callback to message creation
@@ -1217,7 +1579,9 @@ class GatewayBot(traits.GatewayBotAware):
         Unsubscribe: `hikari.impl.bot.GatewayBot.unsubscribe`
         Wait_for: `hikari.impl.bot.GatewayBot.wait_for`
         """
-        self._event_manager.subscribe(event_type, callback)
+        self._event_manager.subscribe(
+            event_type, callback, max_concurrency=max_concurrency, ordered_by=ordered_by, timeout=timeout
+        )
 
     # Yes, this is not generic. The reason for this is MyPy complains about
     # using ABCs that are not concrete in generic types passed to functions.
@@ -1265,6 +1629,7 @@ class GatewayBot(traits.GatewayBotAware):
         /,
         timeout: typing.Union[float, int, None],
         predicate: typing.Optional[event_manager_.PredicateT[base_events.EventT]] = None,
+        **attrs: typing.Any,
     ) -> base_events.EventT:
         """Wait for a given event to occur once, then return the event.
 
@@ -1289,6 +1654,21 @@ class GatewayBot(traits.GatewayBotAware):
             result in "leaking" of coroutines that never complete if called in
             an uncontrolled way, so is not recommended).
 
+        Other Parameters
+        ----------------
+        **attrs : typing.Any
+            Attribute names mapped to the values they must be equal to for an
+            event to be returned. These are checked before `predicate`.
+
+            Unlike with `predicate`, events are matched to these waiters with
+            a single lookup, which makes this much cheaper when there are many
+            waiters for the same event type, such as menus waiting for the
+            interactions of their own components. Nested attributes are
+            referred to using the `.` operator, e.g.
+            `wait_for(InteractionCreateEvent, 60, **{"interaction.custom_id": "yes"})`.
+
+            Events which do not have these attributes are ignored.
+
         Returns
         -------
         hikari.events.base_events.Event
@@ -1309,7 +1689,7 @@ class GatewayBot(traits.GatewayBotAware):
         Unsubscribe: `hikari.impl.bot.GatewayBot.unsubscribe`
         """
         self._check_if_alive()
-        return await self._event_manager.wait_for(event_type, timeout=timeout, predicate=predicate)
+        return await self._event_manager.wait_for(event_type, timeout=timeout, predicate=predicate, **attrs)
 
     def _get_shard(self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild]) -> gateway_shard.GatewayShard:
         guild = snowflakes.Snowflake(guild)
@@ -1364,7 +1744,86 @@ class GatewayBot(traits.GatewayBotAware):
             guild=guild, include_presences=include_presences, query=query, limit=limit, users=users, nonce=nonce
         )
 
-    async def _set_close_flag(self, signame: str, signum: int) -> None:
+    async def fetch_members(
+        self,
+        members: typing.Mapping[
+            snowflakes.SnowflakeishOr[guilds.PartialGuild], typing.Iterable[snowflakes.SnowflakeishOr[users_.User]]
+        ],
+        /,
+        *,
+        include_presences: bool = False,
+        use_cache: bool = True,
+        timeout: typing.Union[float, int, None] = None,
+    ) -> typing.Mapping[snowflakes.Snowflake, typing.Mapping[snowflakes.Snowflake, guilds.Member]]:
+        """Fetch any number of members from any number of guilds over the gateway.
+
+        This sends request guild members payloads through
+        `GatewayBot.chunker`. It removes duplicate users and packs up to 100
+        users into each request. The guilds are requested from their shards
+        concurrently. For more than a few members, this is much cheaper than
+        calling `hikari.api.rest.RESTClient.fetch_member` for each one.
+
+        Parameters
+        ----------
+        members : typing.Mapping[hikari.snowflakes.SnowflakeishOr[hikari.guilds.PartialGuild], typing.Iterable[hikari.snowflakes.SnowflakeishOr[hikari.users.User]]]
+            Mapping of guilds to the users to fetch the members of.
+
+        Other Parameters
+        ----------------
+        include_presences : builtins.bool
+            Whether to request the presences of the members too. Defaults to
+            `builtins.False`.
+        use_cache : builtins.bool
+            Whether to use members which are already cached instead of
+            requesting them. Defaults to `builtins.True`.
+        timeout : typing.Union[builtins.float, builtins.int, builtins.None]
+            The amount of time to wait for the members of each guild before
+            raising an `asyncio.TimeoutError`. If `builtins.None`, this will
+            wait forever.
+
+        Returns
+        -------
+        typing.Mapping[hikari.snowflakes.Snowflake, typing.Mapping[hikari.snowflakes.Snowflake, hikari.guilds.Member]]
+            Mapping of guild IDs to mappings of user IDs to the members which
+            were found. Users who aren't in a guild are left out.
+
+        Raises
+        ------
+        hikari.errors.ComponentStateConflictError
+            If the bot is not running.
+        hikari.errors.MissingIntentError
+            If the `GUILD_MEMBERS` intent, or the `GUILD_PRESENCES` intent
+            when presences are requested, is not declared.
+        asyncio.TimeoutError
+            If the timeout is reached.
+        """  # noqa: E501 - Line too long
+        self._check_if_alive()
+        guild_ids = [snowflakes.Snowflake(guild) for guild in members]
+        cache = self._cache if use_cache else None
+        results = await asyncio.gather(
+            *(
+                self._chunker.fetch_members(
+                    self._get_shard(guild_id),
+                    guild_id,
+                    guild_users,
+                    cache=cache,
+                    include_presences=include_presences,
+                    timeout=timeout,
+                )
+                for guild_id, guild_users in zip(guild_ids, members.values())
+            )
+        )
+        return dict(zip(guild_ids, results))
+
+    def _is_cache_missing_guilds(self) -> bool:
+        # The in-memory cache only outlives the sessions when the bot is restarted in the same process.
+        return (
+            isinstance(self._cache, cache_impl.CacheImpl)
+            and config_api.CacheComponents.GUILDS in self._cache.settings.components
+            and not self._cache.get_guilds_view()
+        )
+
+    async def _set_close_flag(self, signame: str, signum: int, keep_sessions: bool = False) -> None:
         # This needs to be a coroutine, as the closing event is not threadsafe, so we have no way to set this
         # from a Unix system call handler if we are running on a thread that isn't the main application thread
         # without getting undefined behaviour. We do however have `asyncio.run_coroutine_threadsafe` which can
@@ -1372,7 +1831,7 @@ class GatewayBot(traits.GatewayBotAware):
         # solution.
         _LOGGER.debug("received interrupt %s (%s), will start shutting down shortly", signame, signum)
 
-        await self._close()
+        await self._close(keep_sessions=keep_sessions)
 
     async def _start_one_shard(
         self,
@@ -1385,12 +1844,20 @@ class GatewayBot(traits.GatewayBotAware):
         shard_count: int,
         url: str,
         closing_event: asyncio.Event,
+        session_state: typing.Optional[gateway_shard.GatewaySessionState] = None,
     ) -> shard_impl.GatewayShardImpl:
         new_shard = shard_impl.GatewayShardImpl(
+            compression=self._compression,
             http_settings=self._http_settings,
             proxy_settings=self._proxy_settings,
+            dumps=self._dumps,
             event_manager=self._event_manager,
             event_factory=self._event_factory,
+            executor=self._executor,
+            loads=self._loads,
+            metrics=self._metrics,
+            offload_threshold=self._offload_threshold,
+            session_state=session_state,
             intents=self._intents,
             initial_activity=activity,
             initial_is_afk=afk,
@@ -134,6 +134,25 @@ class CacheImpl(cache.MutableCache):
     def _increment_ref_count(obj: cache_utility.RefCell[typing.Any], increment: int = 1) -> None:
         obj.ref_count += increment
 
+    def _make_view(
+        self,
+        entries: collections.ExtendedMutableMapping[snowflakes.Snowflake, cache_utility.DataT],
+        builder: typing.Callable[[cache_utility.DataT], cache_utility.ValueT],
+        version: typing.Callable[[cache_utility.DataT], typing.Tuple[typing.Any, ...]],
+        /,
+        *,
+        predicate: typing.Optional[typing.Callable[[cache_utility.DataT], bool]] = None,
+    ) -> cache.CacheView[snowflakes.Snowflake, cache_utility.ValueT]:
+        if self._settings.live_views:
+            return cache_utility.LiveCacheMappingView(entries, builder=builder, version=version, predicate=predicate)
+
+        if predicate is None:
+            return cache_utility.CacheMappingView(entries.freeze(), builder=builder)
+
+        return cache_utility.CacheMappingView(
+            {key: entry for key, entry in entries.items() if predicate(entry)}, builder=builder
+        )
+
     def clear(self) -> None:
         if self._settings.components == config_api.CacheComponents.NONE:
             return None
@@ -524,21 +543,9 @@ class CacheImpl(cache.MutableCache):
         if not guild_record or not guild_record.channels:
             return cache_utility.EmptyCacheView()
 
-        cached_channels = {sf: self._guild_channel_entries[sf] for sf in guild_record.channels}
-
-        def sorter(args: typing.Tuple[snowflakes.Snowflake, channels.GuildChannel]) -> typing.Tuple[int, int, int]:
-            channel = args[1]
-            if isinstance(channel, channels.GuildCategory):
-                return channel.position, -1, 0
-
-            parent_position = -1 if channel.parent_id is None else cached_channels[channel.parent_id].position
-
-            if not isinstance(channel, channels.GuildVoiceChannel):
-                return parent_position, 0, channel.position
-
-            return parent_position, 1, channel.position
-
-        cached_channels = dict(sorted(cached_channels.items(), key=sorter))
+        cached_channels = cache_utility.sort_guild_channels(
+            {sf: self._guild_channel_entries[sf] for sf in guild_record.channels}
+        )
         return cache_utility.CacheMappingView(
             cached_channels, builder=cache_utility.copy_guild_channel  # type: ignore[type-var]
         )
@@ -783,12 +790,66 @@ class CacheImpl(cache.MutableCache):
         self.set_me(user)
         return cached_user, self.get_me()
 
+    def _create_member_store(
+        self, guild_id: snowflakes.Snowflake, /
+    ) -> collections.ExtendedMutableMapping[snowflakes.Snowflake, cache_utility.RefCell[cache_utility.MemberData]]:
+        store: collections.ExtendedMutableMapping[
+            snowflakes.Snowflake, cache_utility.RefCell[cache_utility.MemberData]
+        ]
+        if self._settings.columnar_members:
+            store = cache_utility.ColumnarMemberStore(guild_id)
+        else:
+            store = collections.FreezableDict()
+
+        policy = self._settings.eviction_policies.get(config_api.CacheComponents.MEMBERS)
+        if policy is None:
+            return store
+
+        return collections.EvictingCacheMap(
+            store,
+            max_entries=policy.max_entries_per_guild,
+            ttl=policy.ttl,
+            least_frequently_used=policy.strategy is config_api.CacheEvictionStrategy.LFU,
+            on_expire=self._on_member_expire,
+            # Members which are referenced elsewhere in the cache have to stay in it until they're dereferenced.
+            is_pinned=lambda member: member.ref_count > 0,
+        )
+
+    def _on_member_expire(self, member: cache_utility.RefCell[cache_utility.MemberData], /) -> None:
+        self._garbage_collect_user(member.object.user, decrement=1)
+
+    def _create_presence_store(
+        self,
+    ) -> collections.ExtendedMutableMapping[snowflakes.Snowflake, cache_utility.MemberPresenceData]:
+        policy = self._settings.eviction_policies.get(config_api.CacheComponents.PRESENCES)
+        if policy is None:
+            return collections.FreezableDict()
+
+        return collections.EvictingCacheMap(
+            collections.FreezableDict(),
+            max_entries=policy.max_entries_per_guild,
+            ttl=policy.ttl,
+            least_frequently_used=policy.strategy is config_api.CacheEvictionStrategy.LFU,
+            on_expire=self._remove_presence_assets,
+        )
+
     def _build_member(
         self,
         member_data: cache_utility.RefCell[cache_utility.MemberData],
     ) -> guilds.Member:
+        if self._settings.shared_entities:
+            return member_data.object.build_shared_entity(self._app)
+
         return member_data.object.build_entity(self._app)
 
+    @staticmethod
+    def _member_version(member: cache_utility.RefCell[cache_utility.MemberData], /) -> typing.Tuple[typing.Any, ...]:
+        return cache_utility.get_member_version(member)
+
+    @staticmethod
+    def _is_visible_member(member: cache_utility.RefCell[cache_utility.MemberData], /) -> bool:
+        return not member.object.has_been_deleted
+
     @staticmethod
     def _can_remove_member(
         member: cache_utility.RefCell[cache_utility.MemberData],
@@ -804,7 +865,10 @@ class CacheImpl(cache.MutableCache):
         deleting: bool = False,
     ) -> typing.Optional[cache_utility.RefCell[cache_utility.MemberData]]:
         if deleting:
-            member.object.has_been_deleted = True
+            member_data = member.object
+            member_data.has_been_deleted = True
+            # This is reassigned as cells from a columnar store don't keep the data object itself.
+            member.object = member_data
 
         if decrement is not None:
             self._increment_ref_count(member, -decrement)
@@ -904,7 +968,7 @@ class CacheImpl(cache.MutableCache):
             return cache_utility.EmptyCacheView()
 
         views: typing.Mapping[snowflakes.Snowflake, cache.CacheView[snowflakes.Snowflake, guilds.Member]] = {
-            guild_id: cache_utility.CacheMappingView(view.members.freeze(), builder=self._build_member)  # type: ignore[type-var]
+            guild_id: self._make_view(view.members, self._build_member, self._member_version)  # type: ignore[type-var]
             for guild_id, view in self._guild_entries.items()
             if view.members
         }
@@ -921,11 +985,12 @@ class CacheImpl(cache.MutableCache):
         if not guild_record or not guild_record.members:
             return cache_utility.EmptyCacheView()
 
-        cached_members = {
-            user_id: member for user_id, member in guild_record.members.items() if not member.object.has_been_deleted
-        }
-
-        return cache_utility.CacheMappingView(cached_members, builder=self._build_member)  # type: ignore[type-var]
+        return self._make_view(
+            guild_record.members,
+            self._build_member,  # type: ignore[arg-type]
+            self._member_version,  # type: ignore[arg-type]
+            predicate=self._is_visible_member,  # type: ignore[arg-type]
+        )
 
     def set_member(self, member: guilds.Member, /) -> None:
         if not self._is_cache_enabled_for(config_api.CacheComponents.MEMBERS):
@@ -933,6 +998,43 @@ class CacheImpl(cache.MutableCache):
 
         self._set_member(member, is_reference=False)
 
+    def set_members_bulk(self, members: typing.Iterable[guilds.Member], /) -> None:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.MEMBERS):
+            return None
+
+        guild_id: typing.Optional[snowflakes.Snowflake] = None
+        member_entries: collections.ExtendedMutableMapping[
+            snowflakes.Snowflake, cache_utility.RefCell[cache_utility.MemberData]
+        ] = collections.FreezableDict()
+
+        for member in members:
+            # Members are almost always for the same guild, so its record is only looked up when this changes.
+            if member.guild_id != guild_id:
+                guild_id = member.guild_id
+                guild_record = self._get_or_create_guild_record(guild_id)
+                if guild_record.members is None:
+                    guild_record.members = self._create_member_store(guild_id)
+
+                member_entries = guild_record.members
+
+            self._set_member_entry(member_entries, member)
+
+    def _set_member_entry(
+        self,
+        member_entries: collections.ExtendedMutableMapping[
+            snowflakes.Snowflake, cache_utility.RefCell[cache_utility.MemberData]
+        ],
+        member: guilds.Member,
+        /,
+    ) -> None:
+        member_data = cache_utility.MemberData.build_from_entity(member, user=self._set_user(member.user))
+
+        if (cell := member_entries.get(member.id)) is None:
+            self._increment_ref_count(member_data.user)
+            member_entries[member.id] = cache_utility.RefCell(member_data)
+        else:
+            cell.object = member_data
+
     def _set_member(
         self, member: guilds.Member, /, *, is_reference: bool = True
     ) -> cache_utility.RefCell[cache_utility.MemberData]:
@@ -941,7 +1043,7 @@ class CacheImpl(cache.MutableCache):
         member_data = cache_utility.MemberData.build_from_entity(member, user=user)
 
         if guild_record.members is None:  # TODO: test when this is not None
-            guild_record.members = collections.FreezableDict()
+            guild_record.members = self._create_member_store(member.guild_id)
 
         if member.user.id not in guild_record.members:
             self._increment_ref_count(member_data.user)
@@ -973,8 +1075,15 @@ class CacheImpl(cache.MutableCache):
         self,
         presence_data: cache_utility.MemberPresenceData,
     ) -> presences.MemberPresence:
+        if self._settings.shared_entities:
+            return presence_data.build_shared_entity(self._app)
+
         return presence_data.build_entity(self._app)
 
+    @staticmethod
+    def _presence_version(presence_data: cache_utility.MemberPresenceData, /) -> typing.Tuple[typing.Any, ...]:
+        return (presence_data, *presence_data.build_dependencies())
+
     def _garbage_collect_unknown_custom_emoji(
         self, emoji: cache_utility.RefCell[emojis.CustomEmoji], *, decrement: typing.Optional[int] = None
     ) -> None:
@@ -1075,7 +1184,7 @@ class CacheImpl(cache.MutableCache):
             return cache_utility.EmptyCacheView()
 
         views = {
-            guild_id: cache_utility.CacheMappingView(guild_record.presences.freeze(), builder=self._build_presence)
+            guild_id: self._make_view(guild_record.presences, self._build_presence, self._presence_version)
             for guild_id, guild_record in self._guild_entries.items()
             if guild_record.presences
         }
@@ -1091,12 +1200,41 @@ class CacheImpl(cache.MutableCache):
         if not guild_record or not guild_record.presences:
             return cache_utility.EmptyCacheView()
 
-        return cache_utility.CacheMappingView(guild_record.presences.freeze(), builder=self._build_presence)
+        return self._make_view(guild_record.presences, self._build_presence, self._presence_version)
 
     def set_presence(self, presence: presences.MemberPresence, /) -> None:
         if not self._is_cache_enabled_for(config_api.CacheComponents.PRESENCES):
             return None
 
+        presence_data = self._build_presence_data(presence)
+        guild_record = self._get_or_create_guild_record(presence.guild_id)
+        if guild_record.presences is None:
+            guild_record.presences = self._create_presence_store()
+
+        guild_record.presences[presence.user_id] = presence_data
+
+    def set_presences_bulk(self, presences: typing.Iterable[presences.MemberPresence], /) -> None:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.PRESENCES):
+            return None
+
+        guild_id: typing.Optional[snowflakes.Snowflake] = None
+        presence_entries: collections.ExtendedMutableMapping[
+            snowflakes.Snowflake, cache_utility.MemberPresenceData
+        ] = collections.FreezableDict()
+
+        for presence in presences:
+            # Presences are almost always for the same guild, so its record is only looked up when this changes.
+            if presence.guild_id != guild_id:
+                guild_id = presence.guild_id
+                guild_record = self._get_or_create_guild_record(guild_id)
+                if guild_record.presences is None:
+                    guild_record.presences = self._create_presence_store()
+
+                presence_entries = guild_record.presences
+
+            presence_entries[presence.user_id] = self._build_presence_data(presence)
+
+    def _build_presence_data(self, presence: presences.MemberPresence, /) -> cache_utility.MemberPresenceData:
         presence_data = cache_utility.MemberPresenceData.build_from_entity(presence)
         for activity, activity_data in zip(presence.activities, presence_data.activities):
             emoji = activity.emoji
@@ -1114,11 +1252,7 @@ class CacheImpl(cache.MutableCache):
             self._increment_ref_count(emoji_data)
             activity_data.emoji = emoji_data
 
-        guild_record = self._get_or_create_guild_record(presence.guild_id)
-        if guild_record.presences is None:
-            guild_record.presences = collections.FreezableDict()
-
-        guild_record.presences[presence.user_id] = presence_data
+        return presence_data
 
     def update_presence(
         self, presence: presences.MemberPresence, /
@@ -1186,7 +1320,10 @@ class CacheImpl(cache.MutableCache):
             return None
 
         role = self._role_entries.get(snowflakes.Snowflake(role))
-        return copy.copy(role) if role else None
+        if role is None or self._settings.shared_entities:
+            return role
+
+        return copy.copy(role)
 
     def get_roles_view(self) -> cache.CacheView[snowflakes.Snowflake, guilds.Role]:
         if not self._is_cache_enabled_for(config_api.CacheComponents.ROLES):
@@ -1244,7 +1381,10 @@ class CacheImpl(cache.MutableCache):
 
     def get_user(self, user: snowflakes.SnowflakeishOr[users.PartialUser], /) -> typing.Optional[users.User]:
         user = self._user_entries.get(snowflakes.Snowflake(user))
-        return user.copy() if user else None
+        if user is None:
+            return None
+
+        return user.object if self._settings.shared_entities else user.copy()
 
     def get_users_view(self) -> cache.CacheView[snowflakes.Snowflake, users.User]:
         if not self._user_entries:
@@ -1451,6 +1591,9 @@ class CacheImpl(cache.MutableCache):
         return cached_voice_state, self.get_voice_state(voice_state.guild_id, voice_state.user_id)
 
     def _build_message(self, message_data: cache_utility.RefCell[cache_utility.MessageData]) -> messages.Message:
+        if self._settings.shared_entities:
+            return message_data.object.build_shared_entity(self._app)
+
         return message_data.object.build_entity(self._app)
 
     def _can_remove_message(self, message: cache_utility.RefCell[cache_utility.MessageData]) -> bool:
@@ -1638,6 +1781,10 @@ class CacheImpl(cache.MutableCache):
                         if user_id not in mention_user:
                             self._garbage_collect_user(user, decrement=1)
 
-            cached_message_data.object.update(message, mention_users=mention_user)
+            # The data is replaced rather than updated in place so that messages which reference this one can tell
+            # that it's changed.
+            message_data = copy.copy(cached_message_data.object)
+            message_data.update(message, mention_users=mention_user)
+            cached_message_data.object = message_data
 
         return cached_message, self.get_message(message.id)
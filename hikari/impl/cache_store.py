@@ -0,0 +1,767 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Key-value stores used to share a cache between processes.
+
+Both the client and the server speak the Redis serialization protocol (RESP),
+so `CacheStoreClient` can also be pointed at a local Redis server. Only the
+hash, set, key and transaction commands used by
+`hikari.impl.shared_cache.SharedCacheImpl` are supported by `CacheStoreServer`.
+"""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("CacheStoreClient", "CacheStoreServer")
+
+import collections
+import functools
+import itertools
+import logging
+import socket
+import socketserver
+import threading
+import typing
+
+import attr
+
+from hikari import errors
+
+if typing.TYPE_CHECKING:
+    _Argument = typing.Union[bytes, str, int]
+    _Command = typing.Sequence[_Argument]
+    _Reply = typing.Union[None, int, bytes, typing.List[typing.Any], errors.CacheStoreError]
+    _Entry = typing.Union[typing.Dict[bytes, bytes], typing.Set[bytes]]
+    _Write = typing.Union[typing.List[_Command], typing.Callable[[], object]]
+
+_LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.cache_store")
+_CRLF: typing.Final[bytes] = b"\r\n"
+
+
+def _encode_command(command: _Command, buffer: bytearray) -> None:
+    buffer += b"*%d\r\n" % len(command)
+    for argument in command:
+        if isinstance(argument, str):
+            argument = argument.encode()
+        elif isinstance(argument, int):
+            argument = b"%d" % argument
+
+        buffer += b"$%d\r\n" % len(argument)
+        buffer += argument
+        buffer += _CRLF
+
+
+def _encode_reply(reply: _Reply, buffer: bytearray) -> None:
+    if reply is None:
+        buffer += b"$-1\r\n"
+
+    elif isinstance(reply, errors.CacheStoreError):
+        buffer += b"-%s\r\n" % reply.reason.encode()
+
+    elif isinstance(reply, int):
+        buffer += b":%d\r\n" % reply
+
+    elif isinstance(reply, bytes):
+        buffer += b"$%d\r\n" % len(reply)
+        buffer += reply
+        buffer += _CRLF
+
+    else:
+        buffer += b"*%d\r\n" % len(reply)
+        for item in reply:
+            _encode_reply(item, buffer)
+
+
+def _read_reply(stream: typing.BinaryIO) -> _Reply:
+    line = stream.readline()
+    if not line.endswith(_CRLF):
+        raise ConnectionError("Cache store closed the connection")
+
+    kind, body = line[:1], line[1:-2]
+    if kind == b"+":
+        return body
+
+    if kind == b":":
+        return int(body)
+
+    if kind == b"-":
+        # Errors are returned rather than raised so that the rest of a pipeline's replies are still read.
+        return errors.CacheStoreError(body.decode(errors="replace"))
+
+    if kind == b"$":
+        length = int(body)
+        if length < 0:
+            return None
+
+        data = stream.read(length + 2)
+        if len(data) != length + 2:
+            raise ConnectionError("Cache store closed the connection")
+
+        return data[:-2]
+
+    if kind == b"*":
+        length = int(body)
+        return None if length < 0 else [_read_reply(stream) for _ in range(length)]
+
+    raise ConnectionError(f"Unexpected reply type {kind!r} from the cache store")
+
+
+class CacheStoreClient:
+    """Blocking client for a Redis protocol compatible key-value store.
+
+    Requests are made on a single connection which is opened on first use
+    and re-opened after a failure. The client is thread-safe.
+
+    Writes whose replies aren't needed can be submitted with `submit` and
+    `submit_transaction` to be executed in order on a background thread,
+    with consecutive commands sent in a single round trip. Every other
+    request waits for the submitted writes to finish first, so it sees them.
+
+    Parameters
+    ----------
+    host : builtins.str
+        The host of the store. Defaults to `127.0.0.1`.
+    port : builtins.int
+        The port of the store. Defaults to `6379`.
+
+    Other Parameters
+    ----------------
+    timeout : builtins.float
+        How long to wait for the store to reply before giving up, in seconds.
+        Defaults to `5`.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_host",
+        "_lock",
+        "_pending",
+        "_pending_condition",
+        "_port",
+        "_socket",
+        "_stream",
+        "_timeout",
+        "_writer",
+    )
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 6379, *, timeout: float = 5.0) -> None:
+        self._host = host
+        self._lock = threading.Lock()
+        self._pending: typing.Deque[_Write] = collections.deque()
+        self._pending_condition = threading.Condition()
+        self._port = port
+        self._socket: typing.Optional[socket.socket] = None
+        self._stream: typing.Optional[typing.BinaryIO] = None
+        self._timeout = timeout
+        self._writer: typing.Optional[threading.Thread] = None
+
+    def close(self) -> None:
+        """Close the connection to the store.
+
+        This waits for any submitted writes to finish first. A new connection
+        will be opened if the client is used again.
+        """
+        self.flush()
+        with self._lock:
+            self._disconnect()
+
+    def _disconnect(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def execute(self, *command: _Argument) -> typing.Any:
+        """Execute a command on the store.
+
+        Parameters
+        ----------
+        *command : typing.Union[builtins.bytes, builtins.str, builtins.int]
+            The name and arguments of the command.
+
+        Returns
+        -------
+        typing.Any
+            The command's reply. Strings are returned as `builtins.bytes`.
+
+        Raises
+        ------
+        hikari.errors.CacheStoreError
+            If the store couldn't be reached or returned an error.
+        """
+        return self.execute_many((command,))[0]
+
+    def execute_many(self, commands: typing.Sequence[_Command], /) -> typing.List[typing.Any]:
+        """Execute several commands on the store in a single round trip.
+
+        Parameters
+        ----------
+        commands : typing.Sequence[typing.Sequence[typing.Union[builtins.bytes, builtins.str, builtins.int]]]
+            The commands to execute, in order.
+
+        Returns
+        -------
+        typing.List[typing.Any]
+            The reply of each command, in order.
+
+        Raises
+        ------
+        hikari.errors.CacheStoreError
+            If the store couldn't be reached or returned an error for any of
+            the commands. The commands are still all executed in the latter
+            case.
+        """
+        self.flush()
+        return self._execute_many(commands)
+
+    def _execute_many(self, commands: typing.Sequence[_Command], /) -> typing.List[typing.Any]:
+        if not commands:
+            return []
+
+        with self._lock:
+            replies = self._send(commands)
+
+        _raise_errors(replies)
+        return replies
+
+    def transaction(
+        self,
+        keys: typing.Sequence[_Argument],
+        reads: typing.Sequence[_Command],
+        build: typing.Callable[[typing.List[typing.Any]], typing.Sequence[_Command]],
+        /,
+    ) -> typing.List[typing.Any]:
+        """Atomically execute commands which depend on the current state of the store.
+
+        `keys` are watched while `reads` are executed, then the commands
+        returned by `build` are executed in a single `MULTI`/`EXEC`
+        transaction. If any of the watched keys changed in the meantime, the
+        transaction is discarded and everything is retried.
+
+        Parameters
+        ----------
+        keys : typing.Sequence[typing.Union[builtins.bytes, builtins.str, builtins.int]]
+            The keys which the commands depend on.
+        reads : typing.Sequence[typing.Sequence[typing.Union[builtins.bytes, builtins.str, builtins.int]]]
+            The commands to read the current state with.
+        build : typing.Callable[[typing.List[typing.Any]], typing.Sequence[typing.Sequence[typing.Union[builtins.bytes, builtins.str, builtins.int]]]]
+            Called with the replies to `reads` to build the commands to
+            execute. This may be called several times.
+
+        Returns
+        -------
+        typing.List[typing.Any]
+            The reply of each built command, in order.
+
+        Raises
+        ------
+        hikari.errors.CacheStoreError
+            If the store couldn't be reached or returned an error for any of
+            the commands.
+        """  # noqa: E501 - Line too long
+        self.flush()
+        return self._transaction(keys, reads, build)
+
+    def _transaction(
+        self,
+        keys: typing.Sequence[_Argument],
+        reads: typing.Sequence[_Command],
+        build: typing.Callable[[typing.List[typing.Any]], typing.Sequence[_Command]],
+        /,
+    ) -> typing.List[typing.Any]:
+        with self._lock:
+            while True:
+                try:
+                    replies = self._send([("WATCH", *keys), *reads])
+                    _raise_errors(replies)
+                    commands = build(replies[1:])
+                    if not commands:
+                        self._send([("UNWATCH",)])
+                        return []
+
+                    replies = self._send([("MULTI",), *commands, ("EXEC",)])
+                    _raise_errors(replies[:-1])
+
+                except BaseException:
+                    # Reconnecting is the simplest way to make sure nothing is left watched or queued.
+                    self._disconnect()
+                    raise
+
+                if replies[-1] is not None:
+                    _raise_errors(replies[-1])
+                    return typing.cast("typing.List[typing.Any]", replies[-1])
+
+    def submit(self, commands: typing.Sequence[_Command], /) -> None:
+        """Execute several commands on the store in the background.
+
+        This returns immediately. Any errors are logged instead of raised.
+
+        Parameters
+        ----------
+        commands : typing.Sequence[typing.Sequence[typing.Union[builtins.bytes, builtins.str, builtins.int]]]
+            The commands to execute, in order.
+        """
+        if commands:
+            self._submit(list(commands))
+
+    def submit_transaction(
+        self,
+        keys: typing.Sequence[_Argument],
+        reads: typing.Sequence[_Command],
+        build: typing.Callable[[typing.List[typing.Any]], typing.Sequence[_Command]],
+        /,
+    ) -> None:
+        """Execute a transaction in the background.
+
+        This returns immediately. Any errors are logged instead of raised.
+        See `CacheStoreClient.transaction` for the parameters.
+        """
+        self._submit(functools.partial(self._transaction, keys, reads, build))
+
+    def flush(self) -> None:
+        """Wait for all the submitted writes to finish.
+
+        This is called by every other request, so there's only need to call
+        it directly when another client needs to see the writes.
+        """
+        if self._writer is threading.current_thread():
+            return
+
+        with self._pending_condition:
+            self._pending_condition.wait_for(lambda: self._writer is None)
+
+    def _submit(self, write: _Write, /) -> None:
+        with self._pending_condition:
+            self._pending.append(write)
+            # The writer exits once it runs out of writes, so one is only kept around while there's work to do.
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_pending, name="cache store writer", daemon=True)
+                self._writer.start()
+
+    def _write_pending(self) -> None:
+        while True:
+            with self._pending_condition:
+                if not self._pending:
+                    self._writer = None
+                    self._pending_condition.notify_all()
+                    return
+
+                write = self._pending.popleft()
+                if isinstance(write, list):
+                    while self._pending and isinstance(self._pending[0], list):
+                        write.extend(typing.cast("typing.List[_Command]", self._pending.popleft()))
+
+            try:
+                if isinstance(write, list):
+                    self._execute_many(write)
+                else:
+                    write()
+
+            except Exception as ex:
+                _LOGGER.error("failed to write to the cache store", exc_info=ex)
+
+    def _send(self, commands: typing.Sequence[_Command], /) -> typing.List[_Reply]:
+        buffer = bytearray()
+        for command in commands:
+            _encode_command(command, buffer)
+
+        try:
+            if self._socket is None or self._stream is None:
+                self._socket = socket.create_connection((self._host, self._port), timeout=self._timeout)
+                self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self._stream = self._socket.makefile("rb")
+
+            self._socket.sendall(buffer)
+            return [_read_reply(self._stream) for _ in commands]
+
+        except (OSError, ValueError) as ex:
+            self._disconnect()
+            raise errors.CacheStoreError(f"Failed to reach the cache store: {ex}") from ex
+
+
+def _raise_errors(replies: typing.Sequence[_Reply], /) -> None:
+    for reply in replies:
+        if isinstance(reply, errors.CacheStoreError):
+            raise reply
+
+
+class _WrongTypeError(Exception):
+    """Raised when a command is used on a key holding a different type of value."""
+
+
+@attr.define(weakref_slot=False)
+class _Transaction:
+    """State of a connection's transaction."""
+
+    watched: typing.Dict[bytes, int] = attr.field(factory=dict)
+    """Mapping of watched keys to their version when they were watched."""
+
+    commands: typing.Optional[typing.List[typing.Sequence[bytes]]] = attr.field(default=None)
+    """The commands queued since `MULTI`, or `builtins.None` if not in a transaction."""
+
+    is_aborted: bool = attr.field(default=False)
+    """Whether a command failed to be queued, which discards the transaction."""
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: _ThreadingServer
+
+    def handle(self) -> None:
+        transaction = _Transaction()
+        while True:
+            try:
+                command = _read_reply(self.rfile)
+            except (ConnectionError, ValueError):
+                return
+
+            buffer = bytearray()
+            if isinstance(command, list) and command and all(isinstance(argument, bytes) for argument in command):
+                _encode_reply(self.server.store._run_for_connection(transaction, command), buffer)
+            else:
+                _encode_reply(errors.CacheStoreError("ERR commands must be sent as arrays of bulk strings"), buffer)
+
+            self.wfile.write(buffer)
+
+
+class _ThreadingServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, address: typing.Tuple[str, int], store: CacheStoreServer) -> None:
+        self.store = store
+        super().__init__(address, _RequestHandler)
+
+
+class CacheStoreServer:
+    """Minimal in-memory Redis protocol compatible key-value store.
+
+    This supports the hash, set and key commands needed to back a
+    `hikari.impl.shared_cache.SharedCacheImpl`, and can be run in a
+    background thread (for tests or a single process deployment) or as its
+    own process for several bots to connect to with `CacheStoreClient`.
+
+    Parameters
+    ----------
+    host : builtins.str
+        The host to listen on. Defaults to `127.0.0.1`.
+    port : builtins.int
+        The port to listen on. Defaults to `0`, which picks a free port.
+
+    Examples
+    --------
+    ```py
+    server = CacheStoreServer(port=6380)
+    server.serve_forever()
+    ```
+    """
+
+    __slots__: typing.Sequence[str] = ("_data", "_is_serving", "_lock", "_server", "_thread", "_versions", "_writes")
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        self._data: typing.Dict[bytes, _Entry] = {}
+        self._is_serving = False
+        self._lock = threading.Lock()
+        self._server = _ThreadingServer((host, port), self)
+        self._thread: typing.Optional[threading.Thread] = None
+        # The write each key was last changed by, used to tell whether a watched key changed.
+        # Keys are never removed from this, since a key being deleted and re-created still counts as a change.
+        self._versions: typing.Dict[bytes, int] = {}
+        self._writes = itertools.count(1)
+
+    @property
+    def address(self) -> typing.Tuple[str, int]:
+        """Host and port the server is listening on."""
+        host, port = self._server.server_address[:2]
+        return str(host), int(port)
+
+    def start(self) -> None:
+        """Start serving requests in a background thread.
+
+        Raises
+        ------
+        hikari.errors.ComponentStateConflictError
+            If the server is already running.
+        """
+        if self._is_serving or self._thread is not None:
+            raise errors.ComponentStateConflictError("Cache store server is already running")
+
+        self._is_serving = True
+        self._thread = threading.Thread(target=self.serve_forever, name="cache store server", daemon=True)
+        self._thread.start()
+
+    def serve_forever(self) -> None:
+        """Serve requests in the current thread until `CacheStoreServer.close` is called."""
+        self._is_serving = True
+        _LOGGER.debug("cache store server listening on %s:%s", *self.address)
+
+        try:
+            self._server.serve_forever()
+        finally:
+            self._is_serving = False
+
+    def close(self) -> None:
+        """Stop serving requests and close the listening socket."""
+        if self._is_serving:
+            self._server.shutdown()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        self._server.server_close()
+
+    def run(self, command: typing.Sequence[bytes], /) -> _Reply:
+        """Execute a command against the store.
+
+        This is what connections to the server end up calling, and can be used
+        to inspect the store directly. Transaction commands such as `MULTI`
+        and `WATCH` are only supported on connections.
+
+        Parameters
+        ----------
+        command : typing.Sequence[builtins.bytes]
+            The name and arguments of the command.
+
+        Returns
+        -------
+        typing.Union[builtins.None, builtins.int, builtins.bytes, typing.List[typing.Any], hikari.errors.CacheStoreError]
+            The command's reply.
+        """
+        with self._lock:
+            return self._run(command)
+
+    def _run_for_connection(self, transaction: _Transaction, command: typing.Sequence[bytes], /) -> _Reply:
+        name = command[0].upper()
+        if name == b"MULTI":
+            if transaction.commands is not None:
+                return errors.CacheStoreError("ERR MULTI calls can not be nested")
+
+            transaction.commands = []
+            return b"OK"
+
+        if name == b"EXEC":
+            if transaction.commands is None:
+                return errors.CacheStoreError("ERR EXEC without MULTI")
+
+            commands, watched, is_aborted = transaction.commands, transaction.watched, transaction.is_aborted
+            transaction.commands, transaction.watched, transaction.is_aborted = None, {}, False
+            if is_aborted:
+                return errors.CacheStoreError("EXECABORT Transaction discarded because of previous errors.")
+
+            with self._lock:
+                if any(self._versions.get(key, 0) != version for key, version in watched.items()):
+                    return None
+
+                return [self._run(queued) for queued in commands]
+
+        if name == b"DISCARD":
+            if transaction.commands is None:
+                return errors.CacheStoreError("ERR DISCARD without MULTI")
+
+            transaction.commands, transaction.watched, transaction.is_aborted = None, {}, False
+            return b"OK"
+
+        if name == b"WATCH":
+            if transaction.commands is not None:
+                return errors.CacheStoreError("ERR WATCH inside MULTI is not allowed")
+
+            if len(command) < 2:
+                return errors.CacheStoreError("ERR wrong number of arguments for 'WATCH' command")
+
+            with self._lock:
+                for key in command[1:]:
+                    transaction.watched.setdefault(key, self._versions.get(key, 0))
+
+            return b"OK"
+
+        if name == b"UNWATCH" and transaction.commands is None:
+            transaction.watched.clear()
+            return b"OK"
+
+        if transaction.commands is not None:
+            handler = self._get_handler(command)
+            if isinstance(handler, errors.CacheStoreError):
+                transaction.is_aborted = True
+                return handler
+
+            transaction.commands.append(command)
+            return b"QUEUED"
+
+        return self.run(command)
+
+    def _get_handler(
+        self, command: typing.Sequence[bytes], /
+    ) -> typing.Union[typing.Callable[..., _Reply], errors.CacheStoreError]:
+        name = command[0].decode(errors="replace").upper()
+        handler = _COMMANDS.get(name)
+        if handler is None:
+            return errors.CacheStoreError(f"ERR unknown command '{name}'")
+
+        min_arguments, max_arguments, method = handler
+        arguments = len(command) - 1
+        if arguments < min_arguments or (max_arguments is not None and arguments > max_arguments):
+            return errors.CacheStoreError(f"ERR wrong number of arguments for '{name}' command")
+
+        return method
+
+    def _run(self, command: typing.Sequence[bytes], /) -> _Reply:
+        method = self._get_handler(command)
+        if isinstance(method, errors.CacheStoreError):
+            return method
+
+        try:
+            return method(self, *command[1:])
+        except _WrongTypeError:
+            return errors.CacheStoreError("WRONGTYPE Operation against a key holding the wrong kind of value")
+        except ValueError:
+            return errors.CacheStoreError("ERR value is not an integer or out of range")
+
+    def _touch(self, *keys: bytes) -> None:
+        version = next(self._writes)
+        for key in keys:
+            self._versions[key] = version
+
+    def _get_hash(self, key: bytes, *, create: bool = False) -> typing.Dict[bytes, bytes]:
+        entry = self._data.get(key)
+        if entry is None:
+            entry = {}
+            if create:
+                self._data[key] = entry
+
+        elif not isinstance(entry, dict):
+            raise _WrongTypeError
+
+        return entry
+
+    def _get_set(self, key: bytes, *, create: bool = False) -> typing.Set[bytes]:
+        entry = self._data.get(key)
+        if entry is None:
+            entry = set()
+            if create:
+                self._data[key] = entry
+
+        elif not isinstance(entry, set):
+            raise _WrongTypeError
+
+        return entry
+
+    def _drop_if_empty(self, key: bytes) -> None:
+        if key in self._data and not self._data[key]:
+            del self._data[key]
+
+    def _ping(self) -> bytes:
+        return b"PONG"
+
+    def _flushdb(self) -> bytes:
+        self._touch(*self._data)
+        self._data.clear()
+        return b"OK"
+
+    def _delete(self, *keys: bytes) -> int:
+        self._touch(*keys)
+        return sum(self._data.pop(key, None) is not None for key in keys)
+
+    def _hget(self, key: bytes, field: bytes) -> typing.Optional[bytes]:
+        return self._get_hash(key).get(field)
+
+    def _hmget(self, key: bytes, *fields: bytes) -> typing.List[typing.Optional[bytes]]:
+        entry = self._get_hash(key)
+        return [entry.get(field) for field in fields]
+
+    def _hset(self, key: bytes, *pairs: bytes) -> typing.Union[int, errors.CacheStoreError]:
+        if len(pairs) % 2:
+            return errors.CacheStoreError("ERR wrong number of arguments for 'HSET' command")
+
+        entry = self._get_hash(key, create=True)
+        self._touch(key)
+        added = 0
+        for index in range(0, len(pairs), 2):
+            added += pairs[index] not in entry
+            entry[pairs[index]] = pairs[index + 1]
+
+        return added
+
+    def _hdel(self, key: bytes, *fields: bytes) -> int:
+        entry = self._get_hash(key)
+        self._touch(key)
+        removed = sum(entry.pop(field, None) is not None for field in fields)
+        self._drop_if_empty(key)
+        return removed
+
+    def _hexists(self, key: bytes, field: bytes) -> int:
+        return int(field in self._get_hash(key))
+
+    def _hgetall(self, key: bytes) -> typing.List[bytes]:
+        return [item for pair in self._get_hash(key).items() for item in pair]
+
+    def _hkeys(self, key: bytes) -> typing.List[bytes]:
+        return list(self._get_hash(key))
+
+    def _hlen(self, key: bytes) -> int:
+        return len(self._get_hash(key))
+
+    def _hincrby(self, key: bytes, field: bytes, increment: bytes) -> int:
+        entry = self._get_hash(key, create=True)
+        value = int(entry.get(field, b"0")) + int(increment)
+        self._touch(key)
+        entry[field] = b"%d" % value
+        return value
+
+    def _sadd(self, key: bytes, *members: bytes) -> int:
+        entry = self._get_set(key, create=True)
+        self._touch(key)
+        count = len(entry)
+        entry.update(members)
+        return len(entry) - count
+
+    def _srem(self, key: bytes, *members: bytes) -> int:
+        entry = self._get_set(key)
+        self._touch(key)
+        count = len(entry)
+        entry.difference_update(members)
+        self._drop_if_empty(key)
+        return count - len(entry)
+
+    def _smembers(self, key: bytes) -> typing.List[bytes]:
+        return list(self._get_set(key))
+
+
+_COMMANDS: typing.Final[
+    typing.Mapping[str, typing.Tuple[int, typing.Optional[int], typing.Callable[..., _Reply]]]
+] = {
+    "PING": (0, 0, CacheStoreServer._ping),
+    "FLUSHDB": (0, 0, CacheStoreServer._flushdb),
+    "DEL": (1, None, CacheStoreServer._delete),
+    "HGET": (2, 2, CacheStoreServer._hget),
+    "HMGET": (2, None, CacheStoreServer._hmget),
+    "HSET": (3, None, CacheStoreServer._hset),
+    "HDEL": (2, None, CacheStoreServer._hdel),
+    "HEXISTS": (2, 2, CacheStoreServer._hexists),
+    "HGETALL": (1, 1, CacheStoreServer._hgetall),
+    "HKEYS": (1, 1, CacheStoreServer._hkeys),
+    "HLEN": (1, 1, CacheStoreServer._hlen),
+    "HINCRBY": (3, 3, CacheStoreServer._hincrby),
+    "SADD": (2, None, CacheStoreServer._sadd),
+    "SREM": (2, None, CacheStoreServer._srem),
+    "SMEMBERS": (1, 1, CacheStoreServer._smembers),
+}
@@ -0,0 +1,520 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Scheduling and progress tracking for guild member chunk requests."""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("ChunkProgress", "GuildChunker")
+
+import asyncio
+import base64
+import heapq
+import itertools
+import logging
+import random
+import typing
+
+import attr
+
+from hikari import errors
+from hikari import snowflakes
+from hikari.internal import attr_extensions
+from hikari.internal import time
+
+if typing.TYPE_CHECKING:
+    from hikari import guilds
+    from hikari import users
+    from hikari.api import cache as cache_
+    from hikari.api import shard as gateway_shard
+    from hikari.events import shard_events
+
+_LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.chunker")
+
+# Queued requests are ordered by tier first and then by the value within it.
+_PRIORITISED_TIER: typing.Final[int] = 0
+_SIZE_TIER: typing.Final[int] = 1
+_UNKNOWN_SIZE_TIER: typing.Final[int] = 2
+_MAX_USERS_PER_REQUEST: typing.Final[int] = 100
+"""The most user IDs Discord accepts in a single request guild members payload."""
+
+
+def _fixed_size_nonce() -> str:
+    # This generates nonces of length 28 for use in member chunking.
+    head = time.monotonic_ns().to_bytes(8, "big")
+    tail = random.getrandbits(92).to_bytes(12, "big")
+    return base64.b64encode(head + tail).decode("ascii")
+
+
+@attr_extensions.with_copy
+@attr.frozen(kw_only=True, weakref_slot=False)
+class ChunkProgress:
+    """Progress of the most recent member chunk request made for a guild."""
+
+    guild_id: snowflakes.Snowflake = attr.field()
+    """ID of the guild the members are being requested for."""
+
+    shard_id: int = attr.field()
+    """ID of the shard the request is made on."""
+
+    nonce: str = attr.field()
+    """Nonce the request was made with."""
+
+    is_sent: bool = attr.field()
+    """Whether the request has been sent to Discord yet.
+
+    Requests are queued per shard and sent one at a time, so this will be
+    `builtins.False` while the request is still waiting for its turn.
+    """
+
+    chunks_received: int = attr.field()
+    """How many of the chunks for the request have been received so far."""
+
+    chunk_count: typing.Optional[int] = attr.field()
+    """Total number of chunks expected for the request.
+
+    This will be `builtins.None` until the first chunk has been received.
+    """
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether all the chunks for the request have been received."""
+        return self.chunk_count is not None and self.chunks_received >= self.chunk_count
+
+
+@attr.define(weakref_slot=False)
+class _ChunkRequest:
+    shard: gateway_shard.GatewayShard = attr.field()
+    guild_id: snowflakes.Snowflake = attr.field()
+    nonce: str = attr.field()
+    include_presences: bool = attr.field()
+    member_count: typing.Optional[int] = attr.field()
+    is_sent: bool = attr.field(default=False)
+    chunk_count: typing.Optional[int] = attr.field(default=None)
+    received: typing.Set[int] = attr.field(factory=set)
+
+    @property
+    def is_complete(self) -> bool:
+        return self.chunk_count is not None and len(self.received) >= self.chunk_count
+
+
+@attr.define(weakref_slot=False)
+class _ChunkWaiter:
+    event: asyncio.Event = attr.field(factory=asyncio.Event)
+    error: typing.Optional[Exception] = attr.field(default=None)
+
+
+@attr.define(weakref_slot=False)
+class _MemberFetch:
+    future: asyncio.Future[None] = attr.field()
+    members: typing.Dict[snowflakes.Snowflake, guilds.Member] = attr.field(factory=dict)
+    chunk_count: typing.Optional[int] = attr.field(default=None)
+    received: typing.Set[int] = attr.field(factory=set)
+
+
+_QueueEntryT = typing.Tuple[int, int, int, _ChunkRequest]
+
+
+class GuildChunker:
+    """Queues, sends and tracks the member chunk requests for guilds.
+
+    Requests are queued per shard and sent by a single task for each shard,
+    rather than each request needing its own task. Smaller guilds are
+    requested first, since they are the quickest to complete, unless a guild
+    has been marked as active with `GuildChunker.prioritize`.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_counter",
+        "_fetches",
+        "_nonces",
+        "_queues",
+        "_requests",
+        "_waiters",
+        "_workers",
+    )
+
+    def __init__(self) -> None:
+        # Used to break ties in the queues, keeping them first-in-first-out.
+        self._counter = itertools.count()
+        self._fetches: typing.Dict[str, _MemberFetch] = {}
+        self._nonces: typing.Dict[str, _ChunkRequest] = {}
+        self._queues: typing.Dict[int, typing.List[_QueueEntryT]] = {}
+        # The most recent request made for each guild.
+        self._requests: typing.Dict[snowflakes.Snowflake, _ChunkRequest] = {}
+        self._waiters: typing.Dict[snowflakes.Snowflake, _ChunkWaiter] = {}
+        self._workers: typing.Dict[int, asyncio.Task[None]] = {}
+
+    def request(
+        self,
+        shard: gateway_shard.GatewayShard,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        /,
+        *,
+        include_presences: bool,
+        member_count: typing.Optional[int] = None,
+    ) -> str:
+        """Queue a request for the members of a guild.
+
+        Any request for the guild which has not been sent yet is replaced.
+
+        Parameters
+        ----------
+        shard : hikari.api.shard.GatewayShard
+            The shard to make the request on.
+        guild : hikari.snowflakes.SnowflakeishOr[hikari.guilds.PartialGuild]
+            The guild to request the members of.
+
+        Other Parameters
+        ----------------
+        include_presences : builtins.bool
+            Whether to request the presences of the members too.
+        member_count : typing.Optional[builtins.int]
+            The guild's member count, if known. This is used to request
+            smaller guilds first. Guilds with an unknown member count are
+            requested last.
+
+        Returns
+        -------
+        builtins.str
+            The nonce the request will be made with.
+        """
+        guild_id = snowflakes.Snowflake(guild)
+        if (previous := self._requests.get(guild_id)) and not previous.is_complete:
+            self._nonces.pop(previous.nonce, None)
+
+        request = _ChunkRequest(
+            shard=shard,
+            guild_id=guild_id,
+            nonce=f"{shard.id}.{_fixed_size_nonce()}",
+            include_presences=include_presences,
+            member_count=member_count,
+        )
+        self._requests[guild_id] = request
+        self._nonces[request.nonce] = request
+        self._push(request, (_SIZE_TIER, member_count) if member_count is not None else (_UNKNOWN_SIZE_TIER, 0))
+
+        worker = self._workers.get(shard.id)
+        if worker is None or worker.done():
+            self._workers[shard.id] = asyncio.create_task(self._run(shard.id), name=f"{shard.id} guild chunker")
+
+        return request.nonce
+
+    def prioritize(self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /) -> bool:
+        """Move a guild's queued request ahead of the requests ordered by size.
+
+        Prioritised guilds are requested most recently prioritised first, which
+        makes this suitable for guilds which have just seen activity.
+
+        Parameters
+        ----------
+        guild : hikari.snowflakes.SnowflakeishOr[hikari.guilds.PartialGuild]
+            The guild to prioritise.
+
+        Returns
+        -------
+        builtins.bool
+            Whether a request for the guild was still queued.
+        """
+        request = self._requests.get(snowflakes.Snowflake(guild))
+        if request is None or request.is_sent:
+            return False
+
+        # The old queue entry is skipped once this one has been sent.
+        self._push(request, (_PRIORITISED_TIER, -next(self._counter)))
+        return True
+
+    def get_progress(self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /) -> typing.Optional[ChunkProgress]:
+        """Get the progress of the most recent request made for a guild.
+
+        Parameters
+        ----------
+        guild : hikari.snowflakes.SnowflakeishOr[hikari.guilds.PartialGuild]
+            The guild to get the progress for.
+
+        Returns
+        -------
+        typing.Optional[ChunkProgress]
+            The request's progress or `builtins.None` if no request has been
+            made for the guild.
+        """
+        request = self._requests.get(snowflakes.Snowflake(guild))
+        if request is None:
+            return None
+
+        return ChunkProgress(
+            guild_id=request.guild_id,
+            shard_id=request.shard.id,
+            nonce=request.nonce,
+            is_sent=request.is_sent,
+            chunks_received=len(request.received),
+            chunk_count=request.chunk_count,
+        )
+
+    def get_pending_count(self) -> int:
+        """Get the number of requests which have not completed yet."""
+        return len(self._nonces)
+
+    def is_awaiting_chunks(self) -> bool:
+        """Whether any requests or member fetches are still waiting for member chunks.
+
+        Returns
+        -------
+        builtins.bool
+            Whether member chunk events still have to be passed to
+            `GuildChunker.on_chunk`.
+        """
+        return bool(self._nonces or self._fetches)
+
+    async def wait_until_chunked(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        /,
+        *,
+        timeout: typing.Union[float, int, None] = None,
+    ) -> None:
+        """Wait until all the member chunks for a guild have been received.
+
+        If no request has been made for the guild yet then this will wait
+        for the first one to be made and completed.
+
+        Parameters
+        ----------
+        guild : hikari.snowflakes.SnowflakeishOr[hikari.guilds.PartialGuild]
+            The guild to wait for.
+
+        Other Parameters
+        ----------------
+        timeout : typing.Union[builtins.float, builtins.int, builtins.None]
+            The amount of time to wait before raising an `asyncio.TimeoutError`.
+            If `builtins.None`, this will wait forever.
+
+        Raises
+        ------
+        asyncio.TimeoutError
+            If the timeout is reached.
+        hikari.errors.ComponentStateConflictError
+            If the chunker is closed, or the shard shuts down, before the
+            guild's members have been received.
+        builtins.Exception
+            If sending the request for the guild's members failed, the
+            error it failed with.
+        """
+        guild_id = snowflakes.Snowflake(guild)
+        request = self._requests.get(guild_id)
+        if request is not None and request.is_complete:
+            return
+
+        waiter = self._waiters.get(guild_id)
+        if waiter is None:
+            waiter = self._waiters[guild_id] = _ChunkWaiter()
+
+        await asyncio.wait_for(waiter.event.wait(), timeout=timeout)
+        if waiter.error is not None:
+            raise waiter.error
+
+    async def fetch_members(
+        self,
+        shard: gateway_shard.GatewayShard,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        users: typing.Iterable[snowflakes.SnowflakeishOr[users.PartialUser]],
+        /,
+        *,
+        cache: typing.Optional[cache_.Cache] = None,
+        include_presences: bool = False,
+        timeout: typing.Union[float, int, None] = None,
+    ) -> typing.Mapping[snowflakes.Snowflake, guilds.Member]:
+        """Fetch specific members of a guild over the gateway.
+
+        Unlike `hikari.api.shard.GatewayShard.request_guild_members`, this
+        accepts any number of users. Duplicate users are removed and the rest
+        are split into requests of up to 100 users, which are sent under the
+        shard's chunking rate limit. This is much cheaper than fetching each
+        member over REST.
+
+        Parameters
+        ----------
+        shard : hikari.api.shard.GatewayShard
+            The shard to make the requests on. This must be the shard the
+            guild is on.
+        guild : hikari.snowflakes.SnowflakeishOr[hikari.guilds.PartialGuild]
+            The guild to fetch the members from.
+        users : typing.Iterable[hikari.snowflakes.SnowflakeishOr[hikari.users.PartialUser]]
+            The users to fetch the members for.
+
+        Other Parameters
+        ----------------
+        cache : typing.Optional[hikari.api.cache.Cache]
+            If provided, members already in this cache are returned from it
+            instead of being requested.
+        include_presences : builtins.bool
+            Whether to request the presences of the members too. Defaults to
+            `builtins.False`.
+        timeout : typing.Union[builtins.float, builtins.int, builtins.None]
+            The amount of time to wait for all the members before raising an
+            `asyncio.TimeoutError`. If `builtins.None`, this will wait forever.
+
+        Returns
+        -------
+        typing.Mapping[hikari.snowflakes.Snowflake, hikari.guilds.Member]
+            Mapping of user IDs to the members which were found. Users who
+            aren't in the guild are left out.
+
+        Raises
+        ------
+        asyncio.TimeoutError
+            If the timeout is reached.
+        """
+        guild_id = snowflakes.Snowflake(guild)
+        result: typing.Dict[snowflakes.Snowflake, guilds.Member] = {}
+        missing: typing.List[snowflakes.Snowflake] = []
+        # dict.fromkeys removes duplicates while keeping the order.
+        for user_id in dict.fromkeys(snowflakes.Snowflake(user) for user in users):
+            member = cache.get_member(guild_id, user_id) if cache else None
+            if member is None:
+                missing.append(user_id)
+            else:
+                result[user_id] = member
+
+        if not missing:
+            return result
+
+        loop = asyncio.get_running_loop()
+        fetches: typing.Dict[str, _MemberFetch] = {}
+        try:
+            for i in range(0, len(missing), _MAX_USERS_PER_REQUEST):
+                nonce = f"{shard.id}.{_fixed_size_nonce()}"
+                fetches[nonce] = self._fetches[nonce] = _MemberFetch(loop.create_future())
+                await shard.request_guild_members(
+                    guild_id,
+                    include_presences=include_presences,
+                    users=missing[i : i + _MAX_USERS_PER_REQUEST],
+                    nonce=nonce,
+                )
+
+            await asyncio.wait_for(asyncio.gather(*(fetch.future for fetch in fetches.values())), timeout=timeout)
+
+        finally:
+            for nonce in fetches:
+                del self._fetches[nonce]
+
+        for fetch in fetches.values():
+            result.update(fetch.members)
+
+        return result
+
+    def on_chunk(self, event: shard_events.MemberChunkEvent, /) -> None:
+        """Track a received member chunk.
+
+        Parameters
+        ----------
+        event : hikari.events.shard_events.MemberChunkEvent
+            The member chunk event. Chunks for requests which weren't made
+            through this chunker are ignored.
+        """
+        if event.nonce is None:
+            return
+
+        if fetch := self._fetches.get(event.nonce):
+            fetch.members.update(event.members)
+            fetch.chunk_count = event.chunk_count
+            fetch.received.add(event.chunk_index)
+            if len(fetch.received) >= fetch.chunk_count and not fetch.future.done():
+                fetch.future.set_result(None)
+
+            return
+
+        request = self._nonces.get(event.nonce)
+        if request is None:
+            return
+
+        request.chunk_count = event.chunk_count
+        request.received.add(event.chunk_index)
+        if request.is_complete:
+            del self._nonces[request.nonce]
+            if waiter := self._waiters.pop(request.guild_id, None):
+                waiter.event.set()
+
+    def close(self) -> None:
+        """Stop sending queued requests and forget all tracked requests.
+
+        Any calls to `GuildChunker.wait_until_chunked` and
+        `GuildChunker.fetch_members` which are still waiting will raise
+        `hikari.errors.ComponentStateConflictError`.
+        """
+        for worker in self._workers.values():
+            worker.cancel()
+
+        for fetch in self._fetches.values():
+            if not fetch.future.done():
+                fetch.future.set_exception(errors.ComponentStateConflictError("guild chunker was closed"))
+
+        for waiter in self._waiters.values():
+            waiter.error = errors.ComponentStateConflictError("guild chunker was closed")
+            waiter.event.set()
+
+        self._nonces.clear()
+        self._queues.clear()
+        self._requests.clear()
+        self._waiters.clear()
+        self._workers.clear()
+
+    def _push(self, request: _ChunkRequest, priority: typing.Tuple[int, int], /) -> None:
+        queue = self._queues.setdefault(request.shard.id, [])
+        heapq.heappush(queue, (*priority, next(self._counter), request))
+
+    def _forget(self, request: _ChunkRequest, error: Exception, /) -> None:
+        if self._requests.get(request.guild_id) is request:
+            del self._requests[request.guild_id]
+
+            # The request will never complete, so anything waiting on it has to be failed.
+            if waiter := self._waiters.pop(request.guild_id, None):
+                waiter.error = error
+                waiter.event.set()
+
+        self._nonces.pop(request.nonce, None)
+
+    async def _run(self, shard_id: int, /) -> None:
+        queue = self._queues.get(shard_id)
+        while queue:
+            request = heapq.heappop(queue)[-1]
+            # Skip requests which were replaced or already sent through an earlier entry.
+            if request.is_sent or self._requests.get(request.guild_id) is not request:
+                continue
+
+            request.is_sent = True
+            try:
+                await request.shard.request_guild_members(
+                    request.guild_id, include_presences=request.include_presences, nonce=request.nonce
+                )
+
+            # The shard is shutting down, so none of its other queued requests can be sent either.
+            except errors.ComponentStateConflictError as ex:
+                for entry in queue:
+                    self._forget(entry[-1], ex)
+
+                self._forget(request, ex)
+                queue.clear()
+
+            except Exception as ex:
+                _LOGGER.error("failed to request members for guild %s", request.guild_id, exc_info=ex)
+                self._forget(request, ex)
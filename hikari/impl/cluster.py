@@ -0,0 +1,366 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Multi-process cluster manager for running a `GatewayBot` across many cores."""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("ClusterManager",)
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import typing
+
+from hikari import applications
+from hikari import errors
+from hikari.impl import config as config_impl
+from hikari.impl import rest as rest_impl
+from hikari.internal import aio
+from hikari.internal import data_binding
+from hikari.internal import time
+from hikari.internal import ux
+
+if typing.TYPE_CHECKING:
+    import multiprocessing.process
+
+    from hikari import sessions
+    from hikari.impl import bot as bot_impl
+
+_LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.cluster")
+_IDENTIFY_INTERVAL: typing.Final[float] = 5.0
+"""How often each rate limit bucket may start a new session, in seconds."""
+_WORKER_CHECK_INTERVAL: typing.Final[float] = 0.5
+_WORKER_SHUTDOWN_TIMEOUT: typing.Final[float] = 30.0
+
+
+def _split_shard_ids(shard_count: int, worker_count: int) -> typing.List[range]:
+    base, extra = divmod(shard_count, worker_count)
+    ranges: typing.List[range] = []
+    start = 0
+
+    for i in range(worker_count):
+        end = start + base + (i < extra)
+        ranges.append(range(start, end))
+        start = end
+
+    return ranges
+
+
+class _IdentifyCoordinator:
+    """Parent side of the shard startup coordination.
+
+    Discord allows each `shard_id % max_concurrency` bucket to start one
+    session every 5 seconds. Workers request permission for each startup
+    window they own over a local socket, and only get a reply once every
+    shard in the window is allowed to identify.
+    """
+
+    __slots__: typing.Sequence[str] = ("_locks", "_max_concurrency", "_next_allowed")
+
+    def __init__(self, max_concurrency: int) -> None:
+        self._locks: typing.Dict[int, asyncio.Lock] = {}
+        self._max_concurrency = max_concurrency
+        self._next_allowed: typing.Dict[int, float] = {}
+
+    async def acquire(self, shard_id: int) -> None:
+        bucket = shard_id % self._max_concurrency
+
+        if (lock := self._locks.get(bucket)) is None:
+            lock = self._locks[bucket] = asyncio.Lock()
+
+        async with lock:
+            if (delay := self._next_allowed.get(bucket, 0) - time.monotonic()) > 0:
+                await asyncio.sleep(delay)
+
+            self._next_allowed[bucket] = time.monotonic() + _IDENTIFY_INTERVAL
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while line := await reader.readline():
+                shard_ids: typing.List[int] = data_binding.default_json_loads(line)["shard_ids"]
+                await aio.all_of(*(self.acquire(shard_id) for shard_id in shard_ids))
+                writer.write(data_binding.default_json_dumps({"shard_ids": shard_ids}) + b"\n")
+                await writer.drain()
+
+        except ConnectionError:
+            _LOGGER.debug("worker disconnected while waiting for a startup window")
+
+        finally:
+            writer.close()
+
+
+class _WindowGate:
+    """Worker side of the shard startup coordination."""
+
+    __slots__: typing.Sequence[str] = ("_host", "_port")
+
+    def __init__(self, host: str, port: int) -> None:
+        self._host = host
+        self._port = port
+
+    async def __call__(self, window: typing.Sequence[int]) -> None:
+        reader, writer = await asyncio.open_connection(self._host, self._port)
+
+        try:
+            writer.write(data_binding.default_json_dumps({"shard_ids": list(window)}) + b"\n")
+            await writer.drain()
+
+            if not await reader.readline():
+                raise errors.GatewayError("Cluster manager closed the connection before allowing shards to start")
+
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+
+def _run_worker(
+    bot_factory: typing.Callable[[], bot_impl.GatewayBot],
+    host: str,
+    port: int,
+    shard_ids: range,
+    shard_count: int,
+    run_kwargs: typing.Dict[str, typing.Any],
+) -> None:
+    bot = bot_factory()
+    bot.run(shard_ids=set(shard_ids), shard_count=shard_count, start_window_gate=_WindowGate(host, port), **run_kwargs)
+
+
+def _stop_workers(processes: typing.Sequence[multiprocessing.process.BaseProcess]) -> None:
+    for process in processes:
+        if process.is_alive():
+            _LOGGER.debug("asking %s to shut down", process.name)
+            # GatewayBot.run handles SIGTERM by closing the bot gracefully.
+            process.terminate()
+
+    for process in processes:
+        process.join(_WORKER_SHUTDOWN_TIMEOUT)
+
+        if process.is_alive():
+            _LOGGER.warning("%s did not shut down in time, killing it", process.name)
+            process.kill()
+            process.join()
+
+
+class ClusterManager:
+    """Run a `hikari.impl.bot.GatewayBot` across multiple worker processes.
+
+    Each worker process owns a contiguous range of shards and runs its own
+    `hikari.impl.bot.GatewayBot`, created by calling `bot_factory`. This
+    process acts as the coordinator, ensuring that the workers together
+    respect the `max_concurrency` session start limit of the application.
+
+    Parameters
+    ----------
+    token : builtins.str
+        The bot token to sign in with. This is used to fetch the recommended
+        shard count and the session start limits.
+    bot_factory : typing.Callable[[], hikari.impl.bot.GatewayBot]
+        The function used to create the bot in each worker, which should
+        also register any listeners.
+
+        Worker processes are started using the `spawn` method, so this must
+        be picklable (for example, a function defined at the top level of a
+        module).
+
+    Other Parameters
+    ----------------
+    worker_count : typing.Optional[builtins.int]
+        The number of worker processes to start. Defaults to
+        `builtins.None`, which will use the number of CPUs on the host.
+
+        This will be capped at the number of shards.
+    shard_count : typing.Optional[builtins.int]
+        The number of shards to use in the entire distributed application.
+        Defaults to `builtins.None` which results in the count being
+        determined dynamically on startup.
+    http_settings : typing.Optional[hikari.impl.config.HTTPSettings]
+        Optional custom HTTP configuration settings to use when fetching
+        the gateway information.
+    proxy_settings : typing.Optional[hikari.impl.config.ProxySettings]
+        Custom proxy settings to use when fetching the gateway information.
+    rest_url : typing.Optional[builtins.str]
+        Defaults to the Discord REST API URL if `builtins.None`. Can be
+        overridden if you are attempting to point to an unofficial endpoint,
+        or if you are attempting to mock/stub the Discord API for any reason.
+    logs : typing.Union[builtins.None, LoggerLevel, typing.Dict[str, typing.Any]]
+        The logging configuration of this process. Defaults to `"INFO"`.
+        See `hikari.impl.bot.GatewayBot` for the accepted values.
+
+    Example
+    -------
+    ```py
+    import hikari
+    from hikari.impl import cluster
+
+    def make_bot():
+        bot = hikari.GatewayBot("...", banner=None)
+        bot.subscribe(hikari.MessageCreateEvent, on_message)
+        return bot
+
+    if __name__ == "__main__":
+        cluster.ClusterManager("...", make_bot, worker_count=4).run()
+    ```
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_bot_factory",
+        "_http_settings",
+        "_proxy_settings",
+        "_rest_url",
+        "_shard_count",
+        "_token",
+        "_worker_count",
+    )
+
+    def __init__(
+        self,
+        token: str,
+        bot_factory: typing.Callable[[], bot_impl.GatewayBot],
+        *,
+        worker_count: typing.Optional[int] = None,
+        shard_count: typing.Optional[int] = None,
+        http_settings: typing.Optional[config_impl.HTTPSettings] = None,
+        proxy_settings: typing.Optional[config_impl.ProxySettings] = None,
+        rest_url: typing.Optional[str] = None,
+        logs: typing.Union[None, int, str, typing.Dict[str, typing.Any]] = "INFO",
+    ) -> None:
+        if worker_count is not None and worker_count < 1:
+            raise ValueError("'worker_count' must be greater than 0")
+
+        ux.init_logging(logs, True, False)
+
+        self._bot_factory = bot_factory
+        self._http_settings = http_settings if http_settings is not None else config_impl.HTTPSettings()
+        self._proxy_settings = proxy_settings if proxy_settings is not None else config_impl.ProxySettings()
+        self._rest_url = rest_url
+        self._shard_count = shard_count
+        self._token = token.strip()
+        self._worker_count = worker_count if worker_count is not None else (os.cpu_count() or 1)
+
+    def run(self, *, ignore_session_start_limit: bool = False, **run_kwargs: typing.Any) -> None:
+        """Start the workers and block until all of them shut down.
+
+        If any worker exits with an error, the remaining workers will be
+        shut down.
+
+        Other Parameters
+        ----------------
+        ignore_session_start_limit : builtins.bool
+            Defaults to `builtins.False`. If `builtins.False`, then attempting
+            to start more sessions than you are allowed in a 24 hour window
+            will throw a `hikari.errors.GatewayError` rather than going ahead
+            and hitting the IDENTIFY limit, which may result in your token
+            being reset. Setting to `builtins.True` disables this behavior.
+        **run_kwargs : typing.Any
+            Any other arguments to pass to `hikari.impl.bot.GatewayBot.run`
+            in each worker. `shard_ids`, `shard_count` and
+            `start_window_gate` are chosen by the cluster manager and may not
+            be passed.
+
+        Raises
+        ------
+        builtins.TypeError
+            If `shard_ids`, `shard_count` or `start_window_gate` are passed.
+        hikari.errors.GatewayError
+            If starting the shards would exceed the session start limit.
+        """
+        if not run_kwargs.keys().isdisjoint(("shard_ids", "shard_count", "start_window_gate")):
+            raise TypeError("'shard_ids', 'shard_count' and 'start_window_gate' are chosen by the cluster manager")
+
+        run_kwargs["ignore_session_start_limit"] = ignore_session_start_limit
+        processes: typing.List[multiprocessing.process.BaseProcess] = []
+        loop = aio.get_or_make_loop()
+
+        try:
+            loop.run_until_complete(self._run(processes, run_kwargs))
+
+        except KeyboardInterrupt:
+            _LOGGER.info("received interrupt, shutting down workers")
+
+        finally:
+            _stop_workers(processes)
+
+    async def _fetch_gateway_bot_info(self) -> sessions.GatewayBotInfo:
+        rest_app = rest_impl.RESTApp(
+            http_settings=self._http_settings, proxy_settings=self._proxy_settings, url=self._rest_url
+        )
+
+        async with rest_app.acquire(self._token, applications.TokenType.BOT) as rest:
+            return await rest.fetch_gateway_bot_info()
+
+    async def _run(
+        self,
+        processes: typing.List[multiprocessing.process.BaseProcess],
+        run_kwargs: typing.Dict[str, typing.Any],
+    ) -> None:
+        requirements = await self._fetch_gateway_bot_info()
+        shard_count = self._shard_count if self._shard_count is not None else requirements.shard_count
+        session_start_limit = requirements.session_start_limit
+
+        if session_start_limit.remaining < shard_count and not run_kwargs["ignore_session_start_limit"]:
+            _LOGGER.critical(
+                "would have started %s sessions, but you only have %s sessions remaining until %s. Starting more "
+                "sessions than you are allowed to start may result in your token being reset. To skip this message, "
+                "use cluster.run(..., ignore_session_start_limit=True)",
+                shard_count,
+                session_start_limit.remaining,
+                session_start_limit.reset_at,
+            )
+            raise errors.GatewayError("Attempted to start more sessions than were allowed in the given time-window")
+
+        coordinator = _IdentifyCoordinator(session_start_limit.max_concurrency)
+        server = await asyncio.start_server(coordinator.handle_connection, host="127.0.0.1", port=0)
+
+        async with server:
+            host, port = server.sockets[0].getsockname()[:2]
+            context = multiprocessing.get_context("spawn")
+
+            for worker_id, shard_ids in enumerate(_split_shard_ids(shard_count, min(self._worker_count, shard_count))):
+                process = context.Process(
+                    target=_run_worker,
+                    args=(self._bot_factory, host, port, shard_ids, shard_count, run_kwargs),
+                    name=f"hikari cluster worker {worker_id}",
+                )
+                process.start()
+                processes.append(process)
+                _LOGGER.info(
+                    "started %s (pid %s) for shards %s to %s",
+                    process.name,
+                    process.pid,
+                    shard_ids.start,
+                    shard_ids.stop - 1,
+                )
+
+            while any(process.is_alive() for process in processes):
+                if failed := [process for process in processes if process.exitcode]:
+                    _LOGGER.critical(
+                        "%s exited unexpectedly with code %s, shutting down the cluster",
+                        failed[0].name,
+                        failed[0].exitcode,
+                    )
+                    return
+
+                await asyncio.sleep(_WORKER_CHECK_INTERVAL)
+
+        _LOGGER.info("all workers have shut down")
@@ -29,6 +29,7 @@ __all__: typing.Sequence[str] = (
     "ProxySettings",
     "HTTPTimeoutSettings",
     "HTTPSettings",
+    "CacheEvictionPolicy",
     "CacheSettings",
 )
 
@@ -380,6 +381,71 @@ class HTTPSettings(config.HTTPSettings):
     """
 
 
+_EVICTABLE_COMPONENTS: typing.Final[typing.Sequence[config.CacheComponents]] = (
+    config.CacheComponents.MEMBERS,
+    config.CacheComponents.PRESENCES,
+)
+
+
+@attr_extensions.with_copy
+@attr.define(kw_only=True, weakref_slot=False)
+class CacheEvictionPolicy:
+    """Settings to control when entries are evicted from a cache component.
+
+    The policy is applied to the entries of each guild separately, so the
+    total number of entries cached for the component can grow with the
+    number of guilds.
+
+    At least one of `max_entries_per_guild` and `ttl` must be set.
+    """
+
+    strategy: config.CacheEvictionStrategy = attr.field(
+        converter=config.CacheEvictionStrategy, default=config.CacheEvictionStrategy.LRU
+    )
+    """How to pick the entries to evict when making space for new ones.
+
+    Defaults to `hikari.api.config.CacheEvictionStrategy.LRU`.
+    """
+
+    max_entries_per_guild: typing.Optional[int] = attr.field(default=None)
+    """The maximum number of entries to keep for each guild.
+
+    This isn't a limit on the whole component, which can hold up to this
+    many entries for every guild the bot is in.
+
+    Defaults to `builtins.None`, which means no limit.
+    """
+
+    ttl: typing.Optional[float] = attr.field(default=None)
+    """How many seconds an entry may go unused for before it is evicted.
+
+    An entry is used whenever it is set, which happens each time a
+    gateway event updates it or (for members) comes with it. With the
+    `hikari.api.config.CacheEvictionStrategy.LRU` strategy, getting an
+    entry from the cache also counts as using it.
+
+    Expired entries are evicted when new entries are added for the same
+    guild.
+
+    Defaults to `builtins.None`, which means entries never expire.
+    """
+
+    @max_entries_per_guild.validator
+    def _validate_max_entries_per_guild(
+        self, _: attr.Attribute[typing.Optional[int]], value: typing.Optional[int]
+    ) -> None:
+        if value is not None and value <= 0:
+            raise ValueError("CacheEvictionPolicy.max_entries_per_guild must be None or greater than 0")
+
+    @ttl.validator
+    def _validate_ttl(self, _: attr.Attribute[typing.Optional[float]], value: typing.Optional[float]) -> None:
+        if value is not None and value <= 0:
+            raise ValueError("CacheEvictionPolicy.ttl must be None or greater than 0")
+
+        if value is None and self.max_entries_per_guild is None:
+            raise ValueError("CacheEvictionPolicy needs at least one of max_entries_per_guild and ttl to be set")
+
+
 @attr_extensions.with_copy
 @attr.define(kw_only=True, weakref_slot=False)
 class CacheSettings(config.CacheSettings):
@@ -408,3 +474,81 @@ class CacheSettings(config.CacheSettings):
 
     Defaults to `50`.
     """
+
+    columnar_members: bool = attr.field(default=False)
+    """Whether to store cached members in compact per-guild columns.
+
+    This keeps each member's fields in arrays shared by the whole guild
+    instead of in a separate object per member, which greatly reduces the
+    memory used by large member caches. Members take slightly longer to
+    get from the cache in exchange, since their data has to be rebuilt from
+    the columns.
+
+    This will have no effect if the members cache is not enabled.
+
+    Defaults to `builtins.False`.
+    """
+
+    live_views: bool = attr.field(default=False)
+    """Whether member and presence views should read from the cache as they're used.
+
+    By default, the entries a view covers are copied when the view is made.
+    With this set, views read straight from the cache instead, so making
+    them is free, they reflect changes made to the cache after they were
+    made and they reuse the entities they've built until those entities'
+    entries change.
+
+    Iterating over a live view while the cache is being modified (for
+    example across an `await`) may raise `builtins.RuntimeError`, so
+    `hikari.api.cache.CacheView.snapshot` should be used to get a view
+    which won't change in that case.
+
+    Defaults to `builtins.False`.
+    """
+
+    shared_entities: bool = attr.field(default=False)
+    """Whether the cache should return the same entity objects to every caller.
+
+    By default, a new copy of an entity is built each time it's read from
+    the cache, so that callers can't modify the cache's state. With this set,
+    members, presences and messages are built once and reused until their
+    cached data changes, and roles and users are returned without being
+    copied, so repeated reads of the same entities are much cheaper.
+
+    !!! warning
+        Entities returned by the cache must then be treated as immutable,
+        as modifying them would modify the cache's state and every other
+        caller's copy.
+
+    Members aren't reused when `CacheSettings.columnar_members` is set, as
+    their data is rebuilt from the columns on each read.
+
+    Defaults to `builtins.False`.
+    """
+
+    eviction_policies: typing.Mapping[config.CacheComponents, CacheEvictionPolicy] = attr.field(factory=dict)
+    """Mapping of cache components to the policies for evicting their entries.
+
+    This lets the cache keep only the entries that are in use, for example
+    the members which have been active recently, rather than every entry it
+    has ever seen. Only the `hikari.api.config.CacheComponents.MEMBERS` and
+    `hikari.api.config.CacheComponents.PRESENCES` components can currently
+    be given an eviction policy, which is applied to each guild's entries
+    separately rather than to the whole component.
+
+    Members which are still referenced by other cached entities, such as
+    messages or voice states, are not evicted until they stop being
+    referenced.
+
+    Defaults to an empty mapping, which means no entries are evicted.
+    """
+
+    @eviction_policies.validator
+    def _validate_eviction_policies(
+        self,
+        _: attr.Attribute[typing.Mapping[config.CacheComponents, CacheEvictionPolicy]],
+        value: typing.Mapping[config.CacheComponents, CacheEvictionPolicy],
+    ) -> None:
+        for component in value:
+            if component not in _EVICTABLE_COMPONENTS:
+                raise ValueError(f"{component!r} can't be given an eviction policy")
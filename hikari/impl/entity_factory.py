@@ -103,6 +103,21 @@ def _deserialize_max_age(seconds: int) -> typing.Optional[datetime.timedelta]:
     return datetime.timedelta(seconds=seconds) if seconds > 0 else None
 
 
+def _deserialize_optional_datetime(date_string: typing.Optional[str]) -> typing.Optional[datetime.datetime]:
+    return time.iso8601_datetime_string_to_datetime(date_string) if date_string else None
+
+
+def _deserialize_member_role_ids(
+    payload: data_binding.JSONObject, guild_id: snowflakes.Snowflake
+) -> typing.List[snowflakes.Snowflake]:
+    role_ids = [snowflakes.Snowflake(role_id) for role_id in payload["roles"]]
+    # If Discord ever does start including this here without warning we don't want to duplicate the entry.
+    if guild_id not in role_ids:
+        role_ids.append(guild_id)
+
+    return role_ids
+
+
 @attr_extensions.with_copy
 @attr.define(kw_only=True, repr=False, weakref_slot=False)
 class _GuildChannelFields:
@@ -385,6 +400,214 @@ class _GatewayGuildDefinition(entity_factory.GatewayGuildDefinition):
         return self._voice_states
 
 
+class _LazyEntity:
+    """Mixin for models which deserialize their fields from a payload on first access.
+
+    Fields which are not set when the model is created are left as empty
+    slots, so accessing one falls through to `__getattr__`, which deserializes
+    it with the matching `_lazy_<field>` method and stores the result in the
+    slot. Every field is therefore only deserialized once, and the model acts
+    like an eagerly deserialized one afterwards (including when copied).
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    _entity_factory: EntityFactoryImpl
+    _model: typing.ClassVar[typing.Type[typing.Any]]
+    _payload: data_binding.JSONObject
+
+    # The attrs generated __eq__ only compares models of the exact same class, so the same fields are compared
+    # here to let lazy models equal eagerly deserialized ones.
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, self._model):
+            return NotImplemented
+
+        names = [field.name for field in attr.fields(self._model) if field.eq]
+        return tuple(getattr(self, name) for name in names) == tuple(getattr(other, name) for name in names)
+
+    def __getattr__(self, name: str) -> typing.Any:
+        deserialize = getattr(type(self), "_lazy_" + name, None)
+        if deserialize is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+        value = deserialize(self)
+        setattr(self, name, value)
+        return value
+
+
+class _LazyMessage(_LazyEntity, message_models.Message):
+    __slots__: typing.Sequence[str] = ("_entity_factory", "_payload")
+
+    _model = message_models.Message
+
+    @classmethod
+    def wrap(cls, entity_factory: EntityFactoryImpl, payload: data_binding.JSONObject) -> _LazyMessage:
+        # The attrs generated init would need every field, so only the cheap ones are set here.
+        self = cls.__new__(cls)
+        self._entity_factory = entity_factory
+        self._payload = payload
+        self.app = entity_factory.app
+        self.id = snowflakes.Snowflake(payload["id"])
+        self.channel_id = snowflakes.Snowflake(payload["channel_id"])
+        self.guild_id = snowflakes.Snowflake(payload["guild_id"]) if "guild_id" in payload else None
+        self.content = payload["content"] or None
+        self.is_tts = payload["tts"]
+        self.is_pinned = payload["pinned"]
+        self.nonce = payload.get("nonce")
+        return self
+
+    __hash__ = message_models.Message.__hash__
+
+    def _lazy_author(self) -> user_models.User:
+        return self._entity_factory.deserialize_user(self._payload["author"])
+
+    def _lazy_member(self) -> typing.Optional[guild_models.Member]:
+        if self.guild_id is None or not (member_payload := self._payload.get("member")):
+            return None
+
+        return self._entity_factory.deserialize_member(member_payload, user=self.author, guild_id=self.guild_id)
+
+    def _lazy_timestamp(self) -> datetime.datetime:
+        return time.iso8601_datetime_string_to_datetime(self._payload["timestamp"])
+
+    def _lazy_edited_timestamp(self) -> typing.Optional[datetime.datetime]:
+        return _deserialize_optional_datetime(self._payload["edited_timestamp"])
+
+    def _lazy_mentions(self) -> message_models.Mentions:
+        return self._entity_factory._deserialize_message_mentions(self._payload, self)
+
+    def _lazy_attachments(self) -> typing.List[message_models.Attachment]:
+        return [self._entity_factory._deserialize_message_attachment(a) for a in self._payload["attachments"]]
+
+    def _lazy_embeds(self) -> typing.List[embed_models.Embed]:
+        return [self._entity_factory.deserialize_embed(embed) for embed in self._payload["embeds"]]
+
+    def _lazy_reactions(self) -> typing.List[message_models.Reaction]:
+        return [self._entity_factory._deserialize_message_reaction(r) for r in self._payload.get("reactions", ())]
+
+    def _lazy_webhook_id(self) -> typing.Optional[snowflakes.Snowflake]:
+        return snowflakes.Snowflake(self._payload["webhook_id"]) if "webhook_id" in self._payload else None
+
+    def _lazy_type(self) -> typing.Union[message_models.MessageType, int]:
+        return message_models.MessageType(self._payload["type"])
+
+    def _lazy_activity(self) -> typing.Optional[message_models.MessageActivity]:
+        if "activity" not in self._payload:
+            return None
+
+        return self._entity_factory._deserialize_message_activity(self._payload["activity"])
+
+    def _lazy_application(self) -> typing.Optional[message_models.MessageApplication]:
+        if "application" not in self._payload:
+            return None
+
+        return self._entity_factory._deserialize_message_application(self._payload["application"])
+
+    def _lazy_message_reference(self) -> typing.Optional[message_models.MessageReference]:
+        if "message_reference" not in self._payload:
+            return None
+
+        return self._entity_factory._deserialize_message_reference(self._payload["message_reference"])
+
+    def _lazy_referenced_message(self) -> typing.Optional[message_models.Message]:
+        if referenced_message_payload := self._payload.get("referenced_message"):
+            return self._entity_factory.deserialize_message(referenced_message_payload)
+
+        return None
+
+    def _lazy_flags(self) -> message_models.MessageFlag:
+        return message_models.MessageFlag(self._payload["flags"])
+
+    def _lazy_stickers(self) -> typing.List[sticker_models.PartialSticker]:
+        return self._entity_factory._deserialize_message_stickers(self._payload)
+
+    def _lazy_application_id(self) -> typing.Optional[snowflakes.Snowflake]:
+        return snowflakes.Snowflake(self._payload["application_id"]) if "application_id" in self._payload else None
+
+    def _lazy_interaction(self) -> typing.Optional[message_models.MessageInteraction]:
+        if interaction_payload := self._payload.get("interaction"):
+            return self._entity_factory._deserialize_message_interaction(interaction_payload)
+
+        return None
+
+    def _lazy_components(self) -> typing.List[message_models.PartialComponent]:
+        return self._entity_factory._deserialize_message_components(self._payload)
+
+
+class _LazyMember(_LazyEntity, guild_models.Member):
+    __slots__: typing.Sequence[str] = ("_entity_factory", "_payload")
+
+    _model = guild_models.Member
+    __hash__ = guild_models.Member.__hash__
+
+    @classmethod
+    def wrap(
+        cls,
+        entity_factory: EntityFactoryImpl,
+        payload: data_binding.JSONObject,
+        *,
+        user: undefined.UndefinedOr[user_models.User],
+        guild_id: snowflakes.Snowflake,
+    ) -> _LazyMember:
+        self = cls.__new__(cls)
+        self._entity_factory = entity_factory
+        self._payload = payload
+        if user is not undefined.UNDEFINED:
+            self.user = user
+
+        self.guild_id = guild_id
+        self.nickname = payload.get("nick")
+        self.guild_avatar_hash = payload.get("avatar")
+        self.is_deaf = payload.get("deaf", undefined.UNDEFINED)
+        self.is_mute = payload.get("mute", undefined.UNDEFINED)
+        self.is_pending = payload.get("pending", undefined.UNDEFINED)
+        return self
+
+    def _lazy_user(self) -> user_models.User:
+        return self._entity_factory.deserialize_user(self._payload["user"])
+
+    def _lazy_role_ids(self) -> typing.List[snowflakes.Snowflake]:
+        return _deserialize_member_role_ids(self._payload, self.guild_id)
+
+    def _lazy_joined_at(self) -> datetime.datetime:
+        return time.iso8601_datetime_string_to_datetime(self._payload["joined_at"])
+
+    def _lazy_premium_since(self) -> typing.Optional[datetime.datetime]:
+        return _deserialize_optional_datetime(self._payload.get("premium_since"))
+
+    def _lazy_raw_communication_disabled_until(self) -> typing.Optional[datetime.datetime]:
+        return _deserialize_optional_datetime(self._payload.get("communication_disabled_until"))
+
+
+class _LazyMemberPresence(_LazyEntity, presence_models.MemberPresence):
+    __slots__: typing.Sequence[str] = ("_entity_factory", "_payload")
+
+    _model = presence_models.MemberPresence
+
+    @classmethod
+    def wrap(
+        cls, entity_factory: EntityFactoryImpl, payload: data_binding.JSONObject, *, guild_id: snowflakes.Snowflake
+    ) -> _LazyMemberPresence:
+        self = cls.__new__(cls)
+        self._entity_factory = entity_factory
+        self._payload = payload
+        self.app = entity_factory.app
+        self.user_id = snowflakes.Snowflake(payload["user"]["id"])
+        self.guild_id = guild_id
+        return self
+
+    __hash__ = presence_models.MemberPresence.__hash__
+
+    def _lazy_visible_status(self) -> typing.Union[presence_models.Status, str]:
+        return presence_models.Status(self._payload["status"])
+
+    def _lazy_activities(self) -> typing.List[presence_models.RichActivity]:
+        return [self._entity_factory._deserialize_rich_activity(a) for a in self._payload["activities"]]
+
+    def _lazy_client_status(self) -> presence_models.ClientStatus:
+        return self._entity_factory._deserialize_client_status(self._payload["client_status"])
+
+
 class EntityFactoryImpl(entity_factory.EntityFactory):
     """Standard implementation for a serializer/deserializer.
 
@@ -400,12 +623,14 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
         "_dm_channel_type_mapping",
         "_guild_channel_type_mapping",
         "_interaction_type_mapping",
+        "_lazy_entities",
         "_scheduled_event_type_mapping",
         "_webhook_type_mapping",
     )
 
-    def __init__(self, app: traits.RESTAware) -> None:
+    def __init__(self, app: traits.RESTAware, *, lazy_entities: bool = False) -> None:
         self._app = app
+        self._lazy_entities = lazy_entities
         self._audit_log_entry_converters: typing.Dict[str, typing.Callable[[typing.Any], typing.Any]] = {
             audit_log_models.AuditLogChangeKey.OWNER_ID: snowflakes.Snowflake,
             audit_log_models.AuditLogChangeKey.AFK_CHANNEL_ID: snowflakes.Snowflake,
@@ -1358,40 +1583,29 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
         user: undefined.UndefinedOr[user_models.User] = undefined.UNDEFINED,
         guild_id: undefined.UndefinedOr[snowflakes.Snowflake] = undefined.UNDEFINED,
     ) -> guild_models.Member:
-        if user is undefined.UNDEFINED:
-            user = self.deserialize_user(payload["user"])
-
         if guild_id is undefined.UNDEFINED:
             guild_id = snowflakes.Snowflake(payload["guild_id"])
 
-        role_ids = [snowflakes.Snowflake(role_id) for role_id in payload["roles"]]
-        # If Discord ever does start including this here without warning we don't want to duplicate the entry.
-        if guild_id not in role_ids:
-            role_ids.append(guild_id)
-
-        joined_at = time.iso8601_datetime_string_to_datetime(payload["joined_at"])
+        if self._lazy_entities:
+            return _LazyMember.wrap(self, payload, user=user, guild_id=guild_id)
 
-        raw_premium_since = payload.get("premium_since")
-        premium_since = (
-            time.iso8601_datetime_string_to_datetime(raw_premium_since) if raw_premium_since is not None else None
-        )
-
-        communication_disabled_until: typing.Optional[datetime.datetime] = None
-        if raw_communication_disabled_until := payload.get("communication_disabled_until"):
-            communication_disabled_until = time.iso8601_datetime_string_to_datetime(raw_communication_disabled_until)
+        if user is undefined.UNDEFINED:
+            user = self.deserialize_user(payload["user"])
 
         return guild_models.Member(
             user=user,
             guild_id=guild_id,
-            role_ids=role_ids,
-            joined_at=joined_at,
+            role_ids=_deserialize_member_role_ids(payload, guild_id),
+            joined_at=time.iso8601_datetime_string_to_datetime(payload["joined_at"]),
             nickname=payload.get("nick"),
             guild_avatar_hash=payload.get("avatar"),
-            premium_since=premium_since,
+            premium_since=_deserialize_optional_datetime(payload.get("premium_since")),
             is_deaf=payload.get("deaf", undefined.UNDEFINED),
             is_mute=payload.get("mute", undefined.UNDEFINED),
             is_pending=payload.get("pending", undefined.UNDEFINED),
-            raw_communication_disabled_until=communication_disabled_until,
+            raw_communication_disabled_until=_deserialize_optional_datetime(
+                payload.get("communication_disabled_until")
+            ),
         )
 
     def deserialize_role(
@@ -2337,6 +2551,60 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
             user=self.deserialize_user(payload["user"]),
         )
 
+    def _deserialize_message_stickers(
+        self, payload: data_binding.JSONObject
+    ) -> typing.List[sticker_models.PartialSticker]:
+        if "sticker_items" in payload:
+            return [self.deserialize_partial_sticker(sticker) for sticker in payload["sticker_items"]]
+
+        if "stickers" in payload:
+            return [self.deserialize_partial_sticker(sticker) for sticker in payload["stickers"]]
+
+        return []
+
+    def _deserialize_message_components(
+        self, payload: data_binding.JSONObject
+    ) -> typing.List[message_models.PartialComponent]:
+        components: typing.List[message_models.PartialComponent] = []
+        if component_payloads := payload.get("components"):
+            for component_payload in component_payloads:
+                try:
+                    components.append(self._deserialize_component(component_payload))
+
+                except errors.UnrecognisedEntityError:
+                    pass
+
+        return components
+
+    def _deserialize_message_mentions(
+        self, payload: data_binding.JSONObject, message: message_models.Message
+    ) -> message_models.Mentions:
+        if raw_channels := payload.get("mention_channels"):
+            channels = {c.id: c for c in map(self.deserialize_partial_channel, raw_channels)}
+
+        else:
+            channels = {}
+
+        if raw_users := payload.get("mentions"):
+            users = {u.id: u for u in map(self.deserialize_user, raw_users)}
+
+        else:
+            users = {}
+
+        if raw_role_ids := payload.get("mention_roles"):
+            role_ids = [snowflakes.Snowflake(i) for i in raw_role_ids]
+
+        else:
+            role_ids = []
+
+        return message_models.Mentions(
+            message=message,
+            users=users,
+            role_ids=role_ids,
+            channels=channels,
+            everyone=payload.get("mention_everyone", False),
+        )
+
     def deserialize_partial_message(  # noqa CFQ001 - Function too long
         self, payload: data_binding.JSONObject
     ) -> message_models.PartialMessage:
@@ -2487,6 +2755,9 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
     def deserialize_message(
         self, payload: data_binding.JSONObject
     ) -> message_models.Message:  # noqa CFQ001 - Function too long
+        if self._lazy_entities:
+            return _LazyMessage.wrap(self, payload)
+
         author = self.deserialize_user(payload["author"])
 
         guild_id: typing.Optional[snowflakes.Snowflake] = None
@@ -2526,26 +2797,10 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
         if "application" in payload:
             application = self._deserialize_message_application(payload["application"])
 
-        if "sticker_items" in payload:
-            stickers = [self.deserialize_partial_sticker(sticker) for sticker in payload["sticker_items"]]
-        elif "stickers" in payload:
-            stickers = [self.deserialize_partial_sticker(sticker) for sticker in payload["stickers"]]
-        else:
-            stickers = []
-
         interaction: typing.Optional[message_models.MessageInteraction] = None
         if interaction_payload := payload.get("interaction"):
             interaction = self._deserialize_message_interaction(interaction_payload)
 
-        components: typing.List[message_models.PartialComponent] = []
-        if component_payloads := payload.get("components"):
-            for component_payload in component_payloads:
-                try:
-                    components.append(self._deserialize_component(component_payload))
-
-                except errors.UnrecognisedEntityError:
-                    pass
-
         message = message_models.Message(
             app=self._app,
             id=snowflakes.Snowflake(payload["id"]),
@@ -2568,159 +2823,135 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
             message_reference=message_reference,
             referenced_message=referenced_message,
             flags=message_models.MessageFlag(payload["flags"]),
-            stickers=stickers,
+            stickers=self._deserialize_message_stickers(payload),
             nonce=payload.get("nonce"),
             application_id=snowflakes.Snowflake(payload["application_id"]) if "application_id" in payload else None,
             interaction=interaction,
-            components=components,
+            components=self._deserialize_message_components(payload),
             # We initialize these next.
             mentions=NotImplemented,
         )
-
-        if raw_channels := payload.get("mention_channels"):
-            channels = {c.id: c for c in map(self.deserialize_partial_channel, raw_channels)}
-
-        else:
-            channels = {}
-
-        if raw_users := payload.get("mentions"):
-            users = {u.id: u for u in map(self.deserialize_user, raw_users)}
-
-        else:
-            users = {}
-
-        if raw_role_ids := payload.get("mention_roles"):
-            role_ids = [snowflakes.Snowflake(i) for i in raw_role_ids]
-
-        else:
-            role_ids = []
-
-        everyone = payload.get("mention_everyone", False)
-
-        message.mentions = message_models.Mentions(
-            message=message,
-            users=users,
-            role_ids=role_ids,
-            channels=channels,
-            everyone=everyone,
-        )
-
+        message.mentions = self._deserialize_message_mentions(payload, message)
         return message
 
     ###################
     # PRESENCE MODELS #
     ###################
 
-    def deserialize_member_presence(  # noqa: CFQ001 - Max function length
-        self,
-        payload: data_binding.JSONObject,
-        *,
-        guild_id: undefined.UndefinedOr[snowflakes.Snowflake] = undefined.UNDEFINED,
-    ) -> presence_models.MemberPresence:
-        activities: typing.List[presence_models.RichActivity] = []
-        for activity_payload in payload["activities"]:
-            timestamps: typing.Optional[presence_models.ActivityTimestamps] = None
-            if "timestamps" in activity_payload:
-                timestamps_payload = activity_payload["timestamps"]
-                start = (
-                    time.unix_epoch_to_datetime(timestamps_payload["start"]) if "start" in timestamps_payload else None
-                )
-                end = time.unix_epoch_to_datetime(timestamps_payload["end"]) if "end" in timestamps_payload else None
-                timestamps = presence_models.ActivityTimestamps(start=start, end=end)
-
-            application_id = (
-                snowflakes.Snowflake(activity_payload["application_id"])
-                if "application_id" in activity_payload
-                else None
+    def _deserialize_rich_activity(self, payload: data_binding.JSONObject) -> presence_models.RichActivity:
+        timestamps: typing.Optional[presence_models.ActivityTimestamps] = None
+        if "timestamps" in payload:
+            timestamps_payload = payload["timestamps"]
+            start = (
+                time.unix_epoch_to_datetime(timestamps_payload["start"]) if "start" in timestamps_payload else None
             )
+            end = time.unix_epoch_to_datetime(timestamps_payload["end"]) if "end" in timestamps_payload else None
+            timestamps = presence_models.ActivityTimestamps(start=start, end=end)
 
-            party: typing.Optional[presence_models.ActivityParty] = None
-            if "party" in activity_payload:
-                party_payload = activity_payload["party"]
-
-                current_size: typing.Optional[int]
-                max_size: typing.Optional[int]
-                if "size" in party_payload:
-                    raw_current_size, raw_max_size = party_payload["size"]
-                    current_size = int(raw_current_size)
-                    max_size = int(raw_max_size)
-                else:
-                    current_size = max_size = None
+        application_id = (
+            snowflakes.Snowflake(payload["application_id"])
+            if "application_id" in payload
+            else None
+        )
 
-                party = presence_models.ActivityParty(
-                    id=party_payload.get("id"), current_size=current_size, max_size=max_size
-                )
+        party: typing.Optional[presence_models.ActivityParty] = None
+        if "party" in payload:
+            party_payload = payload["party"]
 
-            assets: typing.Optional[presence_models.ActivityAssets] = None
-            if "assets" in activity_payload:
-                assets_payload = activity_payload["assets"]
-                assets = presence_models.ActivityAssets(
-                    application_id=application_id,
-                    large_image=assets_payload.get("large_image"),
-                    large_text=assets_payload.get("large_text"),
-                    small_image=assets_payload.get("small_image"),
-                    small_text=assets_payload.get("small_text"),
-                )
+            current_size: typing.Optional[int]
+            max_size: typing.Optional[int]
+            if "size" in party_payload:
+                raw_current_size, raw_max_size = party_payload["size"]
+                current_size = int(raw_current_size)
+                max_size = int(raw_max_size)
+            else:
+                current_size = max_size = None
 
-            secrets: typing.Optional[presence_models.ActivitySecret] = None
-            if "secrets" in activity_payload:
-                secrets_payload = activity_payload["secrets"]
-                secrets = presence_models.ActivitySecret(
-                    join=secrets_payload.get("join"),
-                    spectate=secrets_payload.get("spectate"),
-                    match=secrets_payload.get("match"),
-                )
+            party = presence_models.ActivityParty(
+                id=party_payload.get("id"), current_size=current_size, max_size=max_size
+            )
 
-            emoji: typing.Optional[emoji_models.Emoji] = None
-            raw_emoji = activity_payload.get("emoji")
-            if raw_emoji is not None:
-                emoji = self.deserialize_emoji(raw_emoji)
-
-            activity = presence_models.RichActivity(
-                name=activity_payload["name"],
-                # RichActivity's generated init already declares a converter for the "type" field
-                type=activity_payload["type"],
-                url=activity_payload.get("url"),
-                created_at=time.unix_epoch_to_datetime(activity_payload["created_at"]),
-                timestamps=timestamps,
+        assets: typing.Optional[presence_models.ActivityAssets] = None
+        if "assets" in payload:
+            assets_payload = payload["assets"]
+            assets = presence_models.ActivityAssets(
                 application_id=application_id,
-                details=activity_payload.get("details"),
-                state=activity_payload.get("state"),
-                emoji=emoji,
-                party=party,
-                assets=assets,
-                secrets=secrets,
-                is_instance=activity_payload.get("instance"),  # TODO: can we safely default this to False?
-                flags=presence_models.ActivityFlag(activity_payload["flags"]) if "flags" in activity_payload else None,
-                buttons=activity_payload.get("buttons") or [],
+                large_image=assets_payload.get("large_image"),
+                large_text=assets_payload.get("large_text"),
+                small_image=assets_payload.get("small_image"),
+                small_text=assets_payload.get("small_text"),
             )
-            activities.append(activity)
 
-        client_status_payload = payload["client_status"]
+        secrets: typing.Optional[presence_models.ActivitySecret] = None
+        if "secrets" in payload:
+            secrets_payload = payload["secrets"]
+            secrets = presence_models.ActivitySecret(
+                join=secrets_payload.get("join"),
+                spectate=secrets_payload.get("spectate"),
+                match=secrets_payload.get("match"),
+            )
+
+        emoji: typing.Optional[emoji_models.Emoji] = None
+        raw_emoji = payload.get("emoji")
+        if raw_emoji is not None:
+            emoji = self.deserialize_emoji(raw_emoji)
+
+        return presence_models.RichActivity(
+            name=payload["name"],
+            # RichActivity's generated init already declares a converter for the "type" field
+            type=payload["type"],
+            url=payload.get("url"),
+            created_at=time.unix_epoch_to_datetime(payload["created_at"]),
+            timestamps=timestamps,
+            application_id=application_id,
+            details=payload.get("details"),
+            state=payload.get("state"),
+            emoji=emoji,
+            party=party,
+            assets=assets,
+            secrets=secrets,
+            is_instance=payload.get("instance"),  # TODO: can we safely default this to False?
+            flags=presence_models.ActivityFlag(payload["flags"]) if "flags" in payload else None,
+            buttons=payload.get("buttons") or [],
+        )
+
+    def _deserialize_client_status(self, payload: data_binding.JSONObject) -> presence_models.ClientStatus:
         desktop = (
-            presence_models.Status(client_status_payload["desktop"])
-            if "desktop" in client_status_payload
+            presence_models.Status(payload["desktop"])
+            if "desktop" in payload
             else presence_models.Status.OFFLINE
         )
         mobile = (
-            presence_models.Status(client_status_payload["mobile"])
-            if "mobile" in client_status_payload
+            presence_models.Status(payload["mobile"])
+            if "mobile" in payload
             else presence_models.Status.OFFLINE
         )
         web = (
-            presence_models.Status(client_status_payload["web"])
-            if "web" in client_status_payload
+            presence_models.Status(payload["web"])
+            if "web" in payload
             else presence_models.Status.OFFLINE
         )
-        client_status = presence_models.ClientStatus(desktop=desktop, mobile=mobile, web=web)
+        return presence_models.ClientStatus(desktop=desktop, mobile=mobile, web=web)
+
+    def deserialize_member_presence(
+        self,
+        payload: data_binding.JSONObject,
+        *,
+        guild_id: undefined.UndefinedOr[snowflakes.Snowflake] = undefined.UNDEFINED,
+    ) -> presence_models.MemberPresence:
+        if guild_id is undefined.UNDEFINED:
+            guild_id = snowflakes.Snowflake(payload["guild_id"])
+
+        if self._lazy_entities:
+            return _LazyMemberPresence.wrap(self, payload, guild_id=guild_id)
 
         return presence_models.MemberPresence(
             app=self._app,
             user_id=snowflakes.Snowflake(payload["user"]["id"]),
-            guild_id=guild_id if guild_id is not undefined.UNDEFINED else snowflakes.Snowflake(payload["guild_id"]),
+            guild_id=guild_id,
             visible_status=presence_models.Status(payload["status"]),
-            activities=activities,
-            client_status=client_status,
+            activities=[self._deserialize_rich_activity(activity) for activity in payload["activities"]],
+            client_status=self._deserialize_client_status(payload["client_status"]),
         )
 
     ##########################
@@ -27,9 +27,7 @@ from __future__ import annotations
 __all__: typing.Sequence[str] = ("EventManagerImpl",)
 
 import asyncio
-import base64
 import logging
-import random
 import typing
 
 from hikari import errors
@@ -49,17 +47,21 @@ from hikari.events import shard_events
 from hikari.events import typing_events
 from hikari.events import user_events
 from hikari.events import voice_events
+from hikari.impl import chunker as chunker_
 from hikari.impl import event_manager_base
 from hikari.internal import time
 from hikari.internal import ux
 
 if typing.TYPE_CHECKING:
+    import concurrent.futures
+
     from hikari import guilds
     from hikari import invites
     from hikari import voices
     from hikari.api import cache as cache_
     from hikari.api import entity_factory as entity_factory_
     from hikari.api import event_factory as event_factory_
+    from hikari.api import metrics as metrics_
     from hikari.api import shard as gateway_shard
     from hikari.internal import data_binding
 
@@ -67,32 +69,40 @@ if typing.TYPE_CHECKING:
 _LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.event_manager")
 
 
-def _fixed_size_nonce() -> str:
-    # This generates nonces of length 28 for use in member chunking.
-    head = time.monotonic_ns().to_bytes(8, "big")
-    tail = random.getrandbits(92).to_bytes(12, "big")
-    return base64.b64encode(head + tail).decode("ascii")
+def _member_coalesce_key(payload: data_binding.JSONObject, /) -> typing.Hashable:
+    return payload["guild_id"], payload["user"]["id"]
+
 
+def _typing_coalesce_key(payload: data_binding.JSONObject, /) -> typing.Hashable:
+    return payload["channel_id"], payload["user_id"]
 
-async def _request_guild_members(
-    shard: gateway_shard.GatewayShard,
-    guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
-    *,
-    include_presences: bool,
-    nonce: str,
-) -> None:
-    try:
-        await shard.request_guild_members(guild, include_presences=include_presences, nonce=nonce)
 
-    # Ignore errors raised by a shard shutting down
-    except errors.ComponentStateConflictError:
-        pass
+_COALESCE_KEY_GETTERS: typing.Final[
+    typing.Mapping[str, typing.Callable[[data_binding.JSONObject], typing.Hashable]]
+] = {
+    "GUILD_MEMBER_UPDATE": _member_coalesce_key,
+    "PRESENCE_UPDATE": _member_coalesce_key,
+    "TYPING_START": _typing_coalesce_key,
+}
+"""Getters for the key which payloads of each event which can be coalesced are grouped by."""
+
+_MEMBER_COALESCED_EVENTS: typing.Final[typing.FrozenSet[str]] = frozenset(("GUILD_MEMBER_UPDATE", "PRESENCE_UPDATE"))
+"""Events which are coalesced by `_member_coalesce_key`."""
 
 
 class EventManagerImpl(event_manager_base.EventManagerBase):
     """Provides event handling logic for Discord events."""
 
-    __slots__: typing.Sequence[str] = ("_cache", "_entity_factory", "_auto_chunk_members")
+    __slots__: typing.Sequence[str] = (
+        "_cache",
+        "_chunker",
+        "_coalesce_windows",
+        "_coalesced",
+        "_entity_factory",
+        "_auto_chunk_members",
+        "_executor",
+        "_offload_member_threshold",
+    )
 
     def __init__(
         self,
@@ -103,16 +113,51 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
         *,
         auto_chunk_members: bool = True,
         cache: typing.Optional[cache_.MutableCache] = None,
+        chunker: typing.Optional[chunker_.GuildChunker] = None,
+        coalesce_windows: typing.Optional[typing.Mapping[str, float]] = None,
+        executor: typing.Optional[concurrent.futures.Executor] = None,
+        metrics: typing.Optional[metrics_.GatewayMetricsCollector] = None,
+        offload_member_threshold: typing.Optional[int] = None,
     ) -> None:
+        self._coalesce_windows: typing.Dict[str, float] = {}
+        for event_name, window in (coalesce_windows or {}).items():
+            event_name = event_name.upper()
+            if event_name not in _COALESCE_KEY_GETTERS:
+                raise ValueError(f"{event_name} events cannot be coalesced")
+
+            if window <= 0:
+                raise ValueError("Coalescing windows must be greater than 0")
+
+            self._coalesce_windows[event_name] = window
+
         self._cache = cache
+        self._chunker = chunker if chunker is not None else chunker_.GuildChunker()
+        # Mapping of (event name, shard ID, key) to the timer which ends the current window and the latest payload
+        # received for it in the window.
+        self._coalesced: typing.Dict[
+            typing.Tuple[str, int, typing.Hashable],
+            typing.Tuple[asyncio.TimerHandle, gateway_shard.GatewayShard, data_binding.JSONObject],
+        ] = {}
         self._auto_chunk_members = auto_chunk_members
         self._entity_factory = entity_factory
+        self._executor = executor
+        self._offload_member_threshold = offload_member_threshold
         components = cache.settings.components if cache else config.CacheComponents.NONE
-        super().__init__(event_factory=event_factory, intents=intents, cache_components=components)
+        super().__init__(
+            event_factory=event_factory,
+            intents=intents,
+            cache_components=components,
+            metrics=metrics,
+        )
 
     def _cache_enabled_for(self, components: config.CacheComponents, /) -> bool:
         return self._cache is not None and (self._cache.settings.components & components) == components
 
+    def _is_consumer_required(self, consumer: event_manager_base._Consumer, /) -> bool:
+        # The chunker relies on member chunks to track its requests and fetches, even when
+        # nothing is listening for them and the members cache is disabled.
+        return consumer.callback == self.on_guild_members_chunk and self._chunker.is_awaiting_chunks()
+
     @event_manager_base.filtered(shard_events.ShardReadyEvent, config.CacheComponents.ME)
     async def on_ready(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#ready for more info."""
@@ -166,19 +211,179 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
         # TODO: we need a method for this specifically
         await self.dispatch(self._event_factory.deserialize_channel_pins_update_event(shard, payload))
 
-    # Internal granularity is preferred for GUILD_CREATE over decorator based filtering due to its large scope.
-    async def on_guild_create(  # noqa: C901 - Function too complex
-        self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject
+    def _is_guild_create_event_enabled(self, payload: data_binding.JSONObject, /) -> bool:
+        if "unavailable" in payload:
+            return self._enabled_for_event(guild_events.GuildAvailableEvent)
+
+        return self._enabled_for_event(guild_events.GuildJoinEvent)
+
+    def _deserialize_guild_create(
+        self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject, is_event_enabled: bool
+    ) -> typing.Tuple[
+        typing.Union[guild_events.GuildAvailableEvent, guild_events.GuildJoinEvent, None],
+        typing.Optional[entity_factory_.GatewayGuildDefinition],
+    ]:
+        # This does all the expensive work for GUILD_CREATE and may run outside the event loop, so whether the event
+        # is enabled has to be checked beforehand, as that fills the dispatch tables.
+        if is_event_enabled and "unavailable" in payload:
+            return self._event_factory.deserialize_guild_available_event(shard, payload), None
+
+        if is_event_enabled:
+            return self._event_factory.deserialize_guild_join_event(shard, payload), None
+
+        if not self._cache:
+            return None, None
+
+        gd = self._entity_factory.deserialize_gateway_guild(payload)
+        # The definition caches what it deserializes, so build the parts we will need now.
+        for component, method in (
+            (config.CacheComponents.GUILD_CHANNELS, gd.channels),
+            (config.CacheComponents.EMOJIS, gd.emojis),
+            (config.CacheComponents.GUILDS, gd.guild),
+            (config.CacheComponents.MEMBERS, gd.members),
+            (config.CacheComponents.PRESENCES, gd.presences),
+            (config.CacheComponents.ROLES, gd.roles),
+            (config.CacheComponents.VOICE_STATES, gd.voice_states),
+        ):
+            if self._cache_enabled_for(component):
+                method()
+
+        return None, gd
+
+    async def _offload_guild_create(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
+        start = time.monotonic()
+        try:
+            try:
+                if (consumer := self._consumers["guild_create"]).raw_listeners:
+                    await self._invoke_raw_listeners(consumer, shard, payload)
+
+                # Deserializing runs Python code, which gives up the GIL regularly, so this still keeps the event
+                # loop (and so the heartbeats) running while large guilds are deserialized.
+                deserialized = await asyncio.get_running_loop().run_in_executor(
+                    self._executor,
+                    self._deserialize_guild_create,
+                    shard,
+                    payload,
+                    self._is_guild_create_event_enabled(payload),
+                )
+                await self._handle_guild_create(shard, payload, deserialized)
+            finally:
+                # This has to wait until the guild has been cached, so the held back events see it.
+                self._resume_dispatches(shard)
+
+            if self._metrics is not None:
+                self._metrics.on_event_dispatched(shard.id, "GUILD_CREATE", time.monotonic() - start)
+
+        except asyncio.CancelledError:
+            # Skip cancelled errors, likely caused by the event loop being shut down.
+            pass
+        except errors.UnrecognisedEntityError:
+            _LOGGER.debug("Event referenced an unrecognised entity, discarding")
+        except BaseException as ex:
+            asyncio.get_running_loop().call_exception_handler(
+                {
+                    "message": "Exception occurred in raw event dispatch conduit",
+                    "exception": ex,
+                    "task": asyncio.current_task(),
+                }
+            )
+
+    def _coalesce(
+        self, event_name: str, window: float, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject
     ) -> None:
-        """See https://discord.com/developers/docs/topics/gateway#guild-create for more info."""
-        event: typing.Union[guild_events.GuildAvailableEvent, guild_events.GuildJoinEvent, None]
+        try:
+            key = (event_name, shard.id, _COALESCE_KEY_GETTERS[event_name](payload))
+            pending = self._coalesced.get(key)
+        except (KeyError, TypeError):
+            # Not enough information to group this payload by, so it can't be coalesced.
+            super().consume_raw_event(event_name, shard, payload)
+            return
 
-        if "unavailable" in payload and self._enabled_for_event(guild_events.GuildAvailableEvent):
-            event = self._event_factory.deserialize_guild_available_event(shard, payload)
-        elif "unavailable" not in payload and self._enabled_for_event(guild_events.GuildJoinEvent):
-            event = self._event_factory.deserialize_guild_join_event(shard, payload)
+        if pending is None:
+            timer = asyncio.get_running_loop().call_later(window, self._flush_coalesced, key)
         else:
-            event = None
+            timer = pending[0]
+
+        self._coalesced[key] = (timer, shard, payload)
+
+    def _flush_coalesced(self, key: typing.Tuple[str, int, typing.Hashable], /) -> None:
+        _, shard, payload = self._coalesced.pop(key)
+        super().consume_raw_event(key[0], shard, payload)
+
+    def _discard_coalesced(
+        self, predicate: typing.Callable[[typing.Tuple[str, int, typing.Hashable]], bool], /
+    ) -> None:
+        for key in [key for key in self._coalesced if predicate(key)]:
+            timer, _, _ = self._coalesced.pop(key)
+            timer.cancel()
+
+    def _discard_stale_coalesced(self, event_name: str, payload: data_binding.JSONObject, /) -> None:
+        # Pending member updates would otherwise be flushed after the member or guild is gone, putting the member
+        # back in the cache.
+        try:
+            if event_name == "GUILD_MEMBER_REMOVE":
+                member_key = _member_coalesce_key(payload)
+                self._discard_coalesced(lambda key: key[0] in _MEMBER_COALESCED_EVENTS and key[2] == member_key)
+
+            elif event_name == "GUILD_DELETE" and not payload.get("unavailable"):
+                guild_id = payload["id"]
+                self._discard_coalesced(
+                    lambda key: key[0] in _MEMBER_COALESCED_EVENTS
+                    and typing.cast("typing.Tuple[str, str]", key[2])[0] == guild_id
+                )
+
+        except (KeyError, TypeError):
+            pass
+
+    def close(self) -> None:
+        """Discard any payloads which are waiting to be coalesced."""
+        self._discard_coalesced(lambda _: True)
+
+    def consume_raw_event(
+        self, event_name: str, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject
+    ) -> None:
+        if self._coalesce_windows:
+            if (window := self._coalesce_windows.get(event_name)) is not None:
+                # Only the latest payload received for each key within the window is consumed.
+                self._coalesce(event_name, window, shard, payload)
+                return
+
+            if self._coalesced:
+                self._discard_stale_coalesced(event_name, payload)
+
+        if (
+            self._offload_member_threshold is not None
+            and event_name == "GUILD_CREATE"
+            and shard.id not in self._deferred_dispatches
+            and len(payload.get("members", ())) >= self._offload_member_threshold
+            and self._consumers["guild_create"].is_deserializing
+        ):
+            if self._enabled_for_event(shard_events.ShardPayloadEvent):
+                self.dispatch(self._event_factory.deserialize_shard_payload_event(shard, payload, name=event_name))
+
+            # Hold back any other events for this shard until the guild is in the cache.
+            self._defer_dispatches(shard)
+            asyncio.create_task(self._offload_guild_create(shard, payload), name=f"dispatch {event_name}")
+            return
+
+        super().consume_raw_event(event_name, shard, payload)
+
+    # Internal granularity is preferred for GUILD_CREATE over decorator based filtering due to its large scope.
+    async def on_guild_create(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
+        """See https://discord.com/developers/docs/topics/gateway#guild-create for more info."""
+        deserialized = self._deserialize_guild_create(shard, payload, self._is_guild_create_event_enabled(payload))
+        await self._handle_guild_create(shard, payload, deserialized)
+
+    async def _handle_guild_create(  # noqa: C901 - Function too complex
+        self,
+        shard: gateway_shard.GatewayShard,
+        payload: data_binding.JSONObject,
+        deserialized: typing.Tuple[
+            typing.Union[guild_events.GuildAvailableEvent, guild_events.GuildJoinEvent, None],
+            typing.Optional[entity_factory_.GatewayGuildDefinition],
+        ],
+    ) -> None:
+        event, gd = deserialized
 
         if event:
             # We also filter here to prevent iterating over them and calling a function that won't do anything
@@ -191,9 +396,8 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
             roles = event.roles if self._cache_enabled_for(config.CacheComponents.ROLES) else None
             voice_states = event.voice_states if self._cache_enabled_for(config.CacheComponents.VOICE_STATES) else None
 
-        elif self._cache:
+        elif gd:
             _LOGGER.log(ux.TRACE, "Skipping on_guild_create dispatch due to lack of any registered listeners")
-            gd = self._entity_factory.deserialize_gateway_guild(payload)
 
             channels = gd.channels() if self._cache_enabled_for(config.CacheComponents.GUILD_CHANNELS) else None
             emojis = gd.emojis() if self._cache_enabled_for(config.CacheComponents.EMOJIS) else None
@@ -219,39 +423,17 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
             voice_states = None
 
         if self._cache:
-            if guild:
-                self._cache.update_guild(guild)
-
-            if channels:
-                self._cache.clear_guild_channels_for_guild(guild_id)
-                for channel in channels.values():
-                    self._cache.set_guild_channel(channel)
-
-            if emojis:
-                self._cache.clear_emojis_for_guild(guild_id)
-                for emoji in emojis.values():
-                    self._cache.set_emoji(emoji)
-
-            if roles:
-                self._cache.clear_roles_for_guild(guild_id)
-                for role in roles.values():
-                    self._cache.set_role(role)
-
-            if members:
-                # TODO: do we really want to invalidate these all after an outage.
-                self._cache.clear_members_for_guild(guild_id)
-                for member in members.values():
-                    self._cache.set_member(member)
-
-            if presences:
-                self._cache.clear_presences_for_guild(guild_id)
-                for presence in presences.values():
-                    self._cache.set_presence(presence)
-
-            if voice_states:
-                self._cache.clear_voice_states_for_guild(guild_id)
-                for voice_state in voice_states.values():
-                    self._cache.set_voice_state(voice_state)
+            # TODO: do we really want to invalidate all the members after an outage.
+            self._cache.replace_guild_snapshot(
+                guild_id,
+                gateway_guild=guild,
+                channels=channels.values() if channels else None,
+                emojis=emojis.values() if emojis else None,
+                roles=roles.values() if roles else None,
+                members=members.values() if members else None,
+                presences=presences.values() if presences else None,
+                voice_states=voice_states.values() if voice_states else None,
+            )
 
         presences_declared = self._intents & intents_.Intents.GUILD_PRESENCES
 
@@ -267,15 +449,17 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
                 or self._enabled_for_event(shard_events.MemberChunkEvent)
             )
         ):
-            # We create a task here instead of awaiting the result to avoid any rate-limits from delaying dispatch.
-            nonce = f"{shard.id}.{_fixed_size_nonce()}"
+            # The request is queued instead of awaited to avoid any rate-limits from delaying dispatch.
+            nonce = self._chunker.request(
+                shard,
+                guild_id,
+                include_presences=bool(presences_declared),
+                member_count=payload.get("member_count"),
+            )
 
             if event:
                 event.chunk_nonce = nonce
 
-            coroutine = _request_guild_members(shard, guild_id, include_presences=bool(presences_declared), nonce=nonce)
-            asyncio.create_task(coroutine, name=f"{shard.id}:{guild_id} guild create members request")
-
         if event:
             await self.dispatch(event)
 
@@ -451,13 +635,11 @@ class EventManagerImpl(event_manager_base.EventManagerBase):
     async def on_guild_members_chunk(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway#guild-members-chunk for more info."""
         event = self._event_factory.deserialize_guild_member_chunk_event(shard, payload)
+        self._chunker.on_chunk(event)
 
         if self._cache:
-            for member in event.members.values():
-                self._cache.set_member(member)
-
-            for presence in event.presences.values():
-                self._cache.set_presence(presence)
+            self._cache.set_members_bulk(event.members.values())
+            self._cache.set_presences_bulk(event.presences.values())
 
         await self.dispatch(event)
 
@@ -27,9 +27,11 @@ from __future__ import annotations
 __all__: typing.Sequence[str] = ("filtered", "EventManagerBase", "EventStream")
 
 import asyncio
+import collections
 import inspect
 import itertools
 import logging
+import operator
 import sys
 import types
 import typing
@@ -47,11 +49,13 @@ from hikari.events import shard_events
 from hikari.internal import aio
 from hikari.internal import fast_protocol
 from hikari.internal import reflect
+from hikari.internal import time
 from hikari.internal import ux
 
 if typing.TYPE_CHECKING:
     from hikari import intents as intents_
     from hikari.api import event_factory as event_factory_
+    from hikari.api import metrics as metrics_
     from hikari.api import shard as gateway_shard
     from hikari.internal import data_binding
 
@@ -66,6 +70,14 @@ if typing.TYPE_CHECKING:
         typing.Optional[event_manager_.PredicateT[base_events.EventT]], "asyncio.Future[base_events.EventT]"
     ]
     _WaiterMapT = typing.Dict[typing.Type[base_events.EventT], typing.Set[_WaiterT[base_events.EventT]]]
+    _KeyedWaiterMapT = typing.Dict[typing.Type[base_events.Event], typing.Dict[typing.Tuple[str, ...], "_WaiterIndex"]]
+    _DispatchTableT = typing.Tuple[
+        typing.Tuple[typing.Tuple[event_manager_.CallbackT[typing.Any], typing.Optional["_ListenerLimiter"]], ...],
+        typing.Tuple[typing.Tuple[typing.Type[base_events.Event], typing.Set[_WaiterT[typing.Any]]], ...],
+        typing.Tuple[
+            typing.Tuple[typing.Type[base_events.Event], typing.Dict[typing.Tuple[str, ...], "_WaiterIndex"]], ...
+        ],
+    ]
 
     _EventManagerBaseT = typing.TypeVar("_EventManagerBaseT", bound="EventManagerBase")
     _UnboundMethodT = typing.Callable[
@@ -74,6 +86,7 @@ if typing.TYPE_CHECKING:
     ]
 
     _EventStreamT = typing.TypeVar("_EventStreamT", bound="EventStream[typing.Any]")
+    _T = typing.TypeVar("_T")
 
 
 if sys.version_info >= (3, 10):
@@ -133,7 +146,11 @@ class EventStream(event_manager_.EventStream[base_events.EventT]):
         "_event_manager",
         "_event_type",
         "_filters",
+        "_high_water_mark",
+        "_is_above_high_water_mark",
         "_limit",
+        "_on_high_water_mark",
+        "_overflow",
         "_queue",
         "_registered_listener",
         "_timeout",
@@ -148,14 +165,37 @@ class EventStream(event_manager_.EventStream[base_events.EventT]):
         *,
         timeout: typing.Union[float, int, None],
         limit: typing.Optional[int] = None,
+        overflow: typing.Union[
+            event_manager_.StreamOverflowPolicy, str
+        ] = event_manager_.StreamOverflowPolicy.DROP_NEWEST,
+        high_water_mark: typing.Optional[int] = None,
+        on_high_water_mark: typing.Optional[
+            typing.Callable[[event_manager_.EventStream[base_events.EventT]], None]
+        ] = None,
     ) -> None:
+        # Set before validating the arguments, as __del__ still runs if we raise.
         self._active = False
+
+        overflow = event_manager_.StreamOverflowPolicy(overflow)
+        if not isinstance(overflow, event_manager_.StreamOverflowPolicy):
+            raise ValueError(f"{overflow!r} is not a valid overflow policy")
+
+        if limit is None and overflow is not event_manager_.StreamOverflowPolicy.DROP_NEWEST:
+            raise ValueError(f"A limit must be set to use the {overflow.name} overflow policy")
+
+        if (high_water_mark is None) != (on_high_water_mark is None):
+            raise ValueError("high_water_mark and on_high_water_mark must be passed together")
+
         self._event: typing.Optional[asyncio.Event] = None
         self._event_manager = event_manager
         self._event_type = event_type
         self._filters: iterators.All[base_events.EventT] = iterators.All(())
+        self._high_water_mark = high_water_mark
+        self._is_above_high_water_mark = False
         self._limit = limit
-        self._queue: typing.List[base_events.EventT] = []
+        self._on_high_water_mark = on_high_water_mark
+        self._overflow = overflow
+        self._queue: typing.Deque[base_events.EventT] = collections.deque()
         self._registered_listener: typing.Optional[
             typing.Callable[[base_events.EventT], typing.Coroutine[typing.Any, typing.Any, None]]
         ] = None
@@ -212,7 +252,11 @@ class EventStream(event_manager_.EventStream[base_events.EventT]):
 
             self._event.clear()
 
-        return self._queue.pop(0)
+        event = self._queue.popleft()
+        if self._is_above_high_water_mark and len(self._queue) < typing.cast(int, self._high_water_mark):
+            self._is_above_high_water_mark = False
+
+        return event
 
     def __await__(self) -> typing.Generator[None, None, typing.Sequence[base_events.EventT]]:
         return self._await_all().__await__()
@@ -233,13 +277,28 @@ class EventStream(event_manager_.EventStream[base_events.EventT]):
         return result
 
     async def _listener(self, event: base_events.EventT) -> None:
-        if not self._filters(event) or (self._limit is not None and len(self._queue) >= self._limit):
+        if not self._filters(event):
             return
 
+        if self._limit is not None and len(self._queue) >= self._limit:
+            if self._overflow is event_manager_.StreamOverflowPolicy.DROP_OLDEST:
+                self._queue.popleft()
+
+            else:
+                return
+
         self._queue.append(event)
         if self._event:
             self._event.set()
 
+        if (
+            self._on_high_water_mark is not None
+            and not self._is_above_high_water_mark
+            and len(self._queue) >= typing.cast(int, self._high_water_mark)
+        ):
+            self._is_above_high_water_mark = True
+            self._on_high_water_mark(self)
+
     def close(self) -> None:
         if self._active and self._registered_listener is not None:
             try:
@@ -258,7 +317,7 @@ class EventStream(event_manager_.EventStream[base_events.EventT]):
     ) -> _EventStreamT:
         filter_ = self._map_predicates_and_attr_getters("filter", *predicates, **attrs)
         if self._active:
-            self._queue = [entry for entry in self._queue if filter_(entry)]
+            self._queue = collections.deque(entry for entry in self._queue if filter_(entry))
 
         self._filters |= filter_
         return self
@@ -341,10 +400,105 @@ class _Consumer:
     waiter_group_count: int = attr.field(init=False, default=0)
     """The number of waiters groups registered to this consumer."""
 
+    raw_listeners: typing.List[_ConsumerT] = attr.field(init=False, factory=list)
+    """The raw listeners registered to this consumer."""
+
     @property
-    def is_enabled(self) -> bool:
+    def is_deserializing(self) -> bool:
         return self.is_caching or self.listener_group_count > 0 or self.waiter_group_count > 0
 
+    @property
+    def is_enabled(self) -> bool:
+        return self.is_deserializing or bool(self.raw_listeners)
+
+
+@attr.define(weakref_slot=False)
+class _WaiterIndex:
+    """Waiters which are keyed by the values of a set of event attributes."""
+
+    getter: typing.Callable[[typing.Any], typing.Any] = attr.field()
+    """Getter for the key of an event."""
+
+    waiters: typing.Dict[typing.Any, typing.Set[_WaiterT[typing.Any]]] = attr.field(init=False, factory=dict)
+    """Mapping of keys to the waiters for events with that key."""
+
+
+@attr.define(weakref_slot=False)
+class _ListenerLimiter:
+    """Enforces the execution options a listener was subscribed with."""
+
+    max_concurrency: typing.Optional[int] = attr.field()
+    """The maximum number of calls to the listener which may run at once."""
+
+    ordered_by: typing.Union[str, typing.Callable[[typing.Any], typing.Hashable], None] = attr.field()
+    """The event attribute or key function to order calls to the listener by."""
+
+    timeout: typing.Union[float, int, None] = attr.field()
+    """How long each call to the listener may run for."""
+
+    key_getter: typing.Optional[typing.Callable[[typing.Any], typing.Hashable]] = attr.field(init=False)
+    """Getter for the key to order calls to the listener by."""
+
+    @key_getter.default
+    def _make_key_getter(self) -> typing.Optional[typing.Callable[[typing.Any], typing.Hashable]]:
+        return operator.attrgetter(self.ordered_by) if isinstance(self.ordered_by, str) else self.ordered_by
+
+    semaphore: typing.Optional[asyncio.Semaphore] = attr.field(init=False, default=None)
+    """Semaphore used to enforce `max_concurrency`.
+
+    This is only created once the listener is first called, so that it is bound
+    to the running event loop.
+    """
+
+    key_locks: typing.Dict[typing.Hashable, typing.Tuple[asyncio.Lock, int]] = attr.field(init=False, factory=dict)
+    """Mapping of ordering keys to their lock and the number of calls using it."""
+
+    async def __call__(self, callback: event_manager_.CallbackT[typing.Any], event: base_events.Event, /) -> None:
+        if self.key_getter is None:
+            await self._acquire_and_call(callback, event)
+            return
+
+        try:
+            key = self.key_getter(event)
+            lock, users = self.key_locks.get(key) or (asyncio.Lock(), 0)
+        # The attributes may only be present on some subclasses, or hold unhashable values.
+        except (AttributeError, TypeError):
+            await self._acquire_and_call(callback, event)
+            return
+
+        # asyncio.Lock wakes up its waiters in FIFO order, so calls for the same key
+        # run in the order they were dispatched.
+        self.key_locks[key] = (lock, users + 1)
+        try:
+            async with lock:
+                await self._acquire_and_call(callback, event)
+
+        finally:
+            lock, users = self.key_locks[key]
+            if users == 1:
+                del self.key_locks[key]
+            else:
+                self.key_locks[key] = (lock, users - 1)
+
+    async def _acquire_and_call(
+        self, callback: event_manager_.CallbackT[typing.Any], event: base_events.Event, /
+    ) -> None:
+        if self.max_concurrency is None:
+            await self._call(callback, event)
+            return
+
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with self.semaphore:
+            await self._call(callback, event)
+
+    async def _call(self, callback: event_manager_.CallbackT[typing.Any], event: base_events.Event, /) -> None:
+        if self.timeout is None:
+            await callback(event)
+        else:
+            await asyncio.wait_for(callback(event), timeout=self.timeout)
+
 
 class EventManagerBase(event_manager_.EventManager):
     """Provides functionality to consume and dispatch events.
@@ -355,9 +509,14 @@ class EventManagerBase(event_manager_.EventManager):
 
     __slots__: typing.Sequence[str] = (
         "_consumers",
+        "_deferred_dispatches",
+        "_dispatch_tables",
         "_event_factory",
         "_intents",
+        "_keyed_waiters",
+        "_listener_limiters",
         "_listeners",
+        "_metrics",
         "_waiters",
     )
 
@@ -367,11 +526,18 @@ class EventManagerBase(event_manager_.EventManager):
         intents: intents_.Intents,
         *,
         cache_components: config.CacheComponents = config.CacheComponents.NONE,
+        metrics: typing.Optional[metrics_.GatewayMetricsCollector] = None,
     ) -> None:
         self._consumers: typing.Dict[str, _Consumer] = {}
+        self._deferred_dispatches: typing.Dict[int, typing.List[typing.Tuple[str, data_binding.JSONObject]]] = {}
+        # Flattened listeners and waiter sets for each event type, this is cleared whenever either change.
+        self._dispatch_tables: typing.Dict[typing.Type[base_events.Event], _DispatchTableT] = {}
         self._event_factory = event_factory
         self._intents = intents
+        self._keyed_waiters: _KeyedWaiterMapT = {}
+        self._listener_limiters: typing.Dict[event_manager_.CallbackT[typing.Any], _ListenerLimiter] = {}
         self._listeners: _ListenerMapT[base_events.Event] = {}
+        self._metrics = metrics
         self._waiters: _WaiterMapT[base_events.Event] = {}
 
         for name, member in inspect.getmembers(self):
@@ -396,17 +562,44 @@ class EventManagerBase(event_manager_.EventManager):
     def _increment_waiter_group_count(
         self, event_type: typing.Type[base_events.Event], count: typing.Literal[-1, 1]
     ) -> None:
+        self._dispatch_tables.clear()
         event_bitmask = event_type.bitmask()
         for consumer in self._consumers.values():
             if (consumer.events_bitmask & event_bitmask) == event_bitmask:
                 consumer.waiter_group_count += count
 
-    def _enabled_for_event(self, event_type: typing.Type[base_events.Event], /) -> bool:
-        for cls in event_type.dispatches():
-            if cls in self._listeners or cls in self._waiters:
-                return True
+    def _get_dispatch_table(self, event_type: typing.Type[base_events.Event], /) -> _DispatchTableT:
+        try:
+            return self._dispatch_tables[event_type]
 
-        return False
+        except KeyError:
+            listeners: typing.List[
+                typing.Tuple[event_manager_.CallbackT[typing.Any], typing.Optional[_ListenerLimiter]]
+            ] = []
+            waiters: typing.List[typing.Tuple[typing.Type[base_events.Event], typing.Set[_WaiterT[typing.Any]]]] = []
+            keyed_waiters: typing.List[
+                typing.Tuple[typing.Type[base_events.Event], typing.Dict[typing.Tuple[str, ...], _WaiterIndex]]
+            ] = []
+
+            for cls in event_type.dispatches():
+                if subscribed_listeners := self._listeners.get(cls):
+                    # The limiter is resolved here so dispatching does not need to look it up for every event.
+                    listeners.extend(
+                        (callback, self._listener_limiters.get(callback)) for callback in subscribed_listeners
+                    )
+
+                if waiter_set := self._waiters.get(cls):
+                    waiters.append((cls, waiter_set))
+
+                if indexes := self._keyed_waiters.get(cls):
+                    keyed_waiters.append((cls, indexes))
+
+            table = self._dispatch_tables[event_type] = (tuple(listeners), tuple(waiters), tuple(keyed_waiters))
+            return table
+
+    def _enabled_for_event(self, event_type: typing.Type[base_events.Event], /) -> bool:
+        listeners, waiters, keyed_waiters = self._get_dispatch_table(event_type)
+        return bool(listeners or waiters or keyed_waiters)
 
     def _check_event(self, event_type: typing.Type[typing.Any], nested: int) -> None:
         try:
@@ -438,11 +631,56 @@ class EventManagerBase(event_manager_.EventManager):
     def consume_raw_event(
         self, event_name: str, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject
     ) -> None:
+        if self._deferred_dispatches and (deferred := self._deferred_dispatches.get(shard.id)) is not None:
+            deferred.append((event_name, payload))
+            return
+
         if self._enabled_for_event(shard_events.ShardPayloadEvent):
             payload_event = self._event_factory.deserialize_shard_payload_event(shard, payload, name=event_name)
             self.dispatch(payload_event)
         consumer = self._consumers[event_name.lower()]
-        asyncio.create_task(self._handle_dispatch(consumer, shard, payload), name=f"dispatch {event_name}")
+
+        if self._metrics is None:
+            asyncio.create_task(self._handle_dispatch(consumer, shard, payload), name=f"dispatch {event_name}")
+        else:
+            asyncio.create_task(
+                self._handle_timed_dispatch(event_name, consumer, shard, payload), name=f"dispatch {event_name}"
+            )
+
+    def is_raw_event_enabled(self, event_name: str, /) -> bool:
+        if (consumer := self._consumers.get(event_name.lower())) is None:
+            # Unknown events are still consumed so that they get logged.
+            return True
+
+        return (
+            consumer.is_enabled
+            or self._is_consumer_required(consumer)
+            or self._enabled_for_event(shard_events.ShardPayloadEvent)
+        )
+
+    def _is_consumer_required(self, consumer: _Consumer, /) -> bool:
+        """Whether a consumer has to run even when nothing is listening for or caching its events.
+
+        Subclasses can override this to keep consumers enabled while internal
+        components still rely on the events they handle.
+        """
+        return False
+
+    def _defer_dispatches(self, shard: gateway_shard.GatewayShard, /) -> None:
+        """Hold back the raw events received by a shard.
+
+        This is used while a payload is being processed outside of the event
+        loop, to keep the events dispatched in the order they were received.
+        """
+        self._deferred_dispatches[shard.id] = []
+
+    def _resume_dispatches(self, shard: gateway_shard.GatewayShard, /) -> None:
+        """Consume the raw events held back for a shard in order."""
+        for event_name, payload in self._deferred_dispatches.pop(shard.id, ()):
+            try:
+                self.consume_raw_event(event_name, shard, payload)
+            except LookupError:
+                _LOGGER.debug("ignoring unknown event %s:\n    %r", event_name, payload)
 
     # Yes, this is not generic. The reason for this is MyPy complains about
     # using ABCs that are not concrete in generic types passed to functions.
@@ -453,11 +691,20 @@ class EventManagerBase(event_manager_.EventManager):
         event_type: typing.Type[typing.Any],
         callback: event_manager_.CallbackT[typing.Any],
         *,
+        max_concurrency: typing.Optional[int] = None,
+        ordered_by: typing.Union[str, typing.Callable[[typing.Any], typing.Hashable], None] = None,
+        timeout: typing.Union[float, int, None] = None,
         _nested: int = 0,
     ) -> None:
         if not inspect.iscoroutinefunction(callback):
             raise TypeError("Cannot subscribe a non-coroutine function callback")
 
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than or equal to 1")
+
+        if timeout is not None and timeout <= 0:
+            raise ValueError("timeout must be greater than 0")
+
         # `_nested` is used to show the correct source code snippet if an intent
         # warning is triggered.
         self._check_event(event_type, _nested)
@@ -470,12 +717,57 @@ class EventManagerBase(event_manager_.EventManager):
             event_type.__qualname__,
         )
 
+        # The execution options are shared between every subscription of the callback, so the limits hold no
+        # matter which of the event types it's subscribed to (or which subclasses of them) are dispatched.
+        options = (max_concurrency, ordered_by, timeout)
+        limiter = self._listener_limiters.get(callback)
+        if limiter is not None:
+            if (limiter.max_concurrency, limiter.ordered_by, limiter.timeout) != options:
+                raise ValueError("The callback is already subscribed with different execution options")
+
+        elif options != (None, None, None):
+            if self._is_subscribed(callback):
+                raise ValueError("The callback is already subscribed without execution options")
+
+            self._listener_limiters[callback] = _ListenerLimiter(max_concurrency, ordered_by, timeout)
+
+        self._dispatch_tables.clear()
         try:
             self._listeners[event_type].append(callback)
         except KeyError:
             self._listeners[event_type] = [callback]
             self._increment_listener_group_count(event_type, 1)
 
+    def subscribe_raw(self, event_name: str, callback: event_manager_.ConsumerT) -> None:
+        consumer = self._consumers[event_name.lower()]
+
+        if not inspect.iscoroutinefunction(callback):
+            raise TypeError("Cannot subscribe a non-coroutine function callback")
+
+        _LOGGER.debug(
+            "subscribing callback 'async def %s%s' to raw event %s",
+            getattr(callback, "__name__", "<anon>"),
+            inspect.signature(callback),
+            event_name.upper(),
+        )
+        consumer.raw_listeners.append(callback)
+
+    def unsubscribe_raw(self, event_name: str, callback: event_manager_.ConsumerT) -> None:
+        if (consumer := self._consumers.get(event_name.lower())) and callback in consumer.raw_listeners:
+            _LOGGER.debug(
+                "unsubscribing callback %s%s from raw event %s",
+                getattr(callback, "__name__", "<anon>"),
+                inspect.signature(callback),
+                event_name.upper(),
+            )
+            consumer.raw_listeners.remove(callback)
+
+    def get_raw_listeners(self, event_name: str, /) -> typing.Collection[event_manager_.ConsumerT]:
+        if consumer := self._consumers.get(event_name.lower()):
+            return consumer.raw_listeners.copy()
+
+        return []
+
     def get_listeners(
         self,
         event_type: typing.Type[base_events.EventT],
@@ -484,12 +776,7 @@ class EventManagerBase(event_manager_.EventManager):
         polymorphic: bool = True,
     ) -> typing.Collection[event_manager_.CallbackT[base_events.EventT]]:
         if polymorphic:
-            listeners: typing.List[event_manager_.CallbackT[base_events.EventT]] = []
-            for event in event_type.dispatches():
-                if subscribed_listeners := self._listeners.get(event):
-                    listeners.extend(subscribed_listeners)
-
-            return listeners
+            return [callback for callback, _ in self._get_dispatch_table(event_type)[0]]
 
         if items := self._listeners.get(event_type):
             return items.copy()
@@ -513,14 +800,24 @@ class EventManagerBase(event_manager_.EventManager):
                 event_type.__module__,
                 event_type.__qualname__,
             )
+            self._dispatch_tables.clear()
             listeners.remove(callback)
             if not listeners:
                 del self._listeners[event_type]
                 self._increment_listener_group_count(event_type, -1)
 
+            if not self._is_subscribed(callback):
+                self._listener_limiters.pop(callback, None)
+
+    def _is_subscribed(self, callback: event_manager_.CallbackT[typing.Any], /) -> bool:
+        return any(callback in listeners for listeners in self._listeners.values())
+
     def listen(
         self,
         *event_types: typing.Type[base_events.EventT],
+        max_concurrency: typing.Optional[int] = None,
+        ordered_by: typing.Union[str, typing.Callable[[typing.Any], typing.Hashable], None] = None,
+        timeout: typing.Union[float, int, None] = None,
     ) -> typing.Callable[[event_manager_.CallbackT[base_events.EventT]], event_manager_.CallbackT[base_events.EventT]]:
         def decorator(
             callback: event_manager_.CallbackT[base_events.EventT],
@@ -549,42 +846,83 @@ class EventManagerBase(event_manager_.EventManager):
                     resolved_types = (annotation,)
 
             for resolved_type in resolved_types:
-                self.subscribe(resolved_type, callback, _nested=1)
+                self.subscribe(
+                    resolved_type,
+                    callback,
+                    max_concurrency=max_concurrency,
+                    ordered_by=ordered_by,
+                    timeout=timeout,
+                    _nested=1,
+                )
 
             return callback
 
         return decorator
 
+    @staticmethod
+    def _notify_waiters(event: base_events.Event, waiter_set: typing.Set[_WaiterT[typing.Any]], /) -> None:
+        for waiter in tuple(waiter_set):
+            predicate, future = waiter
+            if not future.done():
+                try:
+                    if predicate and not predicate(event):
+                        continue
+                except Exception as ex:
+                    future.set_exception(ex)
+                else:
+                    future.set_result(event)
+
+            waiter_set.remove(waiter)
+
+    def _discard_keyed_waiters(
+        self, event_type: typing.Type[base_events.Event], names: typing.Tuple[str, ...], key: typing.Any, /
+    ) -> None:
+        indexes = self._keyed_waiters[event_type]
+        index = indexes[names]
+        del index.waiters[key]
+
+        if not index.waiters:
+            del indexes[names]
+
+            if not indexes:
+                del self._keyed_waiters[event_type]
+                self._increment_waiter_group_count(event_type, -1)
+
     def dispatch(self, event: base_events.Event) -> asyncio.Future[typing.Any]:
-        tasks: typing.List[typing.Coroutine[None, typing.Any, None]] = []
-
-        for cls in event.dispatches():
-            if listeners := self._listeners.get(cls):
-                for callback in listeners:
-                    tasks.append(self._invoke_callback(callback, event))
-
-            if cls not in self._waiters:
-                continue
-
-            waiter_set = self._waiters[cls]
-            for waiter in tuple(waiter_set):
-                predicate, future = waiter
-                if not future.done():
-                    try:
-                        if predicate and not predicate(event):
-                            continue
-                    except Exception as ex:
-                        future.set_exception(ex)
-                    else:
-                        future.set_result(event)
-
-                waiter_set.remove(waiter)
+        listeners, waiters, keyed_waiters = self._get_dispatch_table(type(event))
+
+        for cls, waiter_set in waiters:
+            self._notify_waiters(event, waiter_set)
 
             if not waiter_set:
                 del self._waiters[cls]
                 self._increment_waiter_group_count(cls, -1)
 
-        return asyncio.gather(*tasks) if tasks else aio.completed_future()
+        for cls, indexes in keyed_waiters:
+            for names, index in tuple(indexes.items()):
+                try:
+                    key = index.getter(event)
+                    waiter_set = index.waiters.get(key)
+                # The attributes may only be present on some subclasses, or hold unhashable values.
+                except (AttributeError, TypeError):
+                    continue
+
+                if waiter_set:
+                    self._notify_waiters(event, waiter_set)
+
+                    if not waiter_set:
+                        self._discard_keyed_waiters(cls, names, key)
+
+        if not listeners:
+            return aio.completed_future()
+
+        # Most events only have one listener, in which case its task can be awaited directly.
+        if len(listeners) == 1:
+            return asyncio.create_task(self._invoke_callback(*listeners[0], event))
+
+        return asyncio.gather(
+            *(asyncio.create_task(self._invoke_callback(callback, limiter, event)) for callback, limiter in listeners)
+        )
 
     def stream(
         self,
@@ -592,9 +930,25 @@ class EventManagerBase(event_manager_.EventManager):
         /,
         timeout: typing.Union[float, int, None],
         limit: typing.Optional[int] = None,
+        *,
+        overflow: typing.Union[
+            event_manager_.StreamOverflowPolicy, str
+        ] = event_manager_.StreamOverflowPolicy.DROP_NEWEST,
+        high_water_mark: typing.Optional[int] = None,
+        on_high_water_mark: typing.Optional[
+            typing.Callable[[event_manager_.EventStream[base_events.EventT]], None]
+        ] = None,
     ) -> event_manager_.EventStream[base_events.EventT]:
         self._check_event(event_type, 1)
-        return EventStream(self, event_type, timeout=timeout, limit=limit)
+        return EventStream(
+            self,
+            event_type,
+            timeout=timeout,
+            limit=limit,
+            overflow=overflow,
+            high_water_mark=high_water_mark,
+            on_high_water_mark=on_high_water_mark,
+        )
 
     async def wait_for(
         self,
@@ -602,12 +956,16 @@ class EventManagerBase(event_manager_.EventManager):
         /,
         timeout: typing.Union[float, int, None],
         predicate: typing.Optional[event_manager_.PredicateT[base_events.EventT]] = None,
+        **attrs: typing.Any,
     ) -> base_events.EventT:
         if not inspect.isclass(event_type) or not issubclass(event_type, base_events.Event):
             raise TypeError("Cannot wait for a non-Event type")
 
         self._check_event(event_type, 1)
 
+        if attrs:
+            return await self._wait_for_keyed(event_type, timeout, predicate, attrs)
+
         future: asyncio.Future[base_events.EventT] = asyncio.get_running_loop().create_future()
 
         waiter_set: typing.MutableSet[_WaiterT[base_events.Event]]
@@ -631,19 +989,100 @@ class EventManagerBase(event_manager_.EventManager):
 
             raise
 
+    async def _wait_for_keyed(
+        self,
+        event_type: typing.Type[base_events.EventT],
+        timeout: typing.Union[float, int, None],
+        predicate: typing.Optional[event_manager_.PredicateT[base_events.EventT]],
+        attrs: typing.Mapping[str, typing.Any],
+    ) -> base_events.EventT:
+        names = tuple(sorted(attrs))
+        # attrgetter returns a tuple when given more than one name, so the key has to match that.
+        key = tuple(attrs[name] for name in names) if len(names) > 1 else attrs[names[0]]
+
+        future: asyncio.Future[base_events.EventT] = asyncio.get_running_loop().create_future()
+
+        try:
+            indexes = self._keyed_waiters[event_type]
+        except KeyError:
+            indexes = self._keyed_waiters[event_type] = {}
+            self._increment_waiter_group_count(event_type, 1)
+
+        try:
+            index = indexes[names]
+        except KeyError:
+            index = indexes[names] = _WaiterIndex(operator.attrgetter(*names))
+
+        try:
+            waiter_set = index.waiters[key]
+        except KeyError:
+            waiter_set = index.waiters[key] = set()
+
+        pair = (predicate, future)
+
+        waiter_set.add(pair)  # type: ignore[arg-type]
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            waiter_set.remove(pair)  # type: ignore[arg-type]
+            if not waiter_set:
+                self._discard_keyed_waiters(event_type, names, key)
+
+            raise
+
+    async def _handle_timed_dispatch(
+        self,
+        event_name: str,
+        consumer: _Consumer,
+        shard: gateway_shard.GatewayShard,
+        payload: data_binding.JSONObject,
+    ) -> None:
+        assert self._metrics is not None
+        start = time.monotonic()
+        await self._handle_dispatch(consumer, shard, payload)
+        self._metrics.on_event_dispatched(shard.id, event_name, time.monotonic() - start)
+
+    @staticmethod
+    async def _invoke_raw_listeners(
+        consumer: _Consumer, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject
+    ) -> None:
+        # These are run one after the other instead of in their own tasks, as
+        # raw listeners are meant to be cheap.
+        for callback in tuple(consumer.raw_listeners):
+            try:
+                await callback(shard, payload)
+            except asyncio.CancelledError:
+                # Skip cancelled errors, likely caused by the event loop being shut down.
+                pass
+            except Exception as ex:
+                asyncio.get_running_loop().call_exception_handler(
+                    {
+                        "message": "Exception occurred in raw event listener",
+                        "exception": ex,
+                        "task": asyncio.current_task(),
+                    }
+                )
+
     async def _handle_dispatch(
         self,
         consumer: _Consumer,
         shard: gateway_shard.GatewayShard,
         payload: data_binding.JSONObject,
     ) -> None:
-        if not consumer.is_enabled:
+        is_required = self._is_consumer_required(consumer)
+        if not consumer.is_enabled and not is_required:
             name = consumer.callback.__name__
             _LOGGER.log(
                 ux.TRACE, "Skipping raw dispatch for %s due to lack of any registered listeners or cache need", name
             )
             return
 
+        if consumer.raw_listeners:
+            await self._invoke_raw_listeners(consumer, shard, payload)
+
+            if not consumer.is_deserializing and not is_required:
+                return
+
         try:
             await consumer.callback(shard, payload)
         except asyncio.CancelledError:
@@ -661,10 +1100,16 @@ class EventManagerBase(event_manager_.EventManager):
             )
 
     async def _invoke_callback(
-        self, callback: event_manager_.CallbackT[base_events.EventT], event: base_events.EventT
+        self,
+        callback: event_manager_.CallbackT[base_events.EventT],
+        limiter: typing.Optional[_ListenerLimiter],
+        event: base_events.EventT,
     ) -> None:
         try:
-            await callback(event)
+            if limiter is not None:
+                await limiter(callback, event)
+            else:
+                await callback(event)
         except Exception as ex:
             # Skip the first frame in logs, we don't care for it.
             trio = type(ex), ex, ex.__traceback__.tb_next if ex.__traceback__ is not None else None
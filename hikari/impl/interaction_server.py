@@ -134,7 +134,7 @@ class _Response:
 
 # Constant response
 _PONG_RESPONSE: typing.Final[_Response] = _Response(
-    _OK_STATUS, data_binding.dump_json({"type": _PONG_RESPONSE_TYPE}).encode(), content_type=_JSON_TYPE_WITH_CHARSET
+    _OK_STATUS, data_binding.default_json_dumps({"type": _PONG_RESPONSE_TYPE}), content_type=_JSON_TYPE_WITH_CHARSET
 )
 
 
@@ -169,10 +169,13 @@ class InteractionServer(interaction_server.InteractionServer):
 
     Other Parameters
     ----------------
-    dumps : aiohttp.typedefs.JSONEncoder
-        The JSON encoder this server should use. Defaults to `json.dumps`.
-    loads : aiohttp.typedefs.JSONDecoder
-        The JSON decoder this server should use. Defaults to `json.loads`.
+    dumps : typing.Union[hikari.internal.data_binding.JSONEncoder, aiohttp.typedefs.JSONEncoder]
+        The JSON encoder this server should use. This may return either
+        `builtins.bytes` or `builtins.str`. Defaults to
+        `hikari.internal.data_binding.default_json_dumps`.
+    loads : hikari.internal.data_binding.JSONDecoder
+        The JSON decoder this server should use. Defaults to
+        `hikari.internal.data_binding.default_json_loads`.
     public_key : builtins.bytes
         The public key this server should use for verifying request payloads from
         Discord. If left as `builtins.None` then the client will try to work this
@@ -199,10 +202,10 @@ class InteractionServer(interaction_server.InteractionServer):
     def __init__(
         self,
         *,
-        dumps: aiohttp.typedefs.JSONEncoder = data_binding.dump_json,
+        dumps: typing.Union[data_binding.JSONEncoder, aiohttp.typedefs.JSONEncoder] = data_binding.default_json_dumps,
         entity_factory: entity_factory_api.EntityFactory,
         executor: typing.Optional[concurrent.futures.Executor] = None,
-        loads: aiohttp.typedefs.JSONDecoder = data_binding.load_json,
+        loads: data_binding.JSONDecoder = data_binding.default_json_loads,
         rest_client: rest_api.RESTClient,
         public_key: typing.Optional[bytes] = None,
     ) -> None:
@@ -406,7 +409,7 @@ class InteractionServer(interaction_server.InteractionServer):
             return _Response(_BAD_REQUEST_STATUS, b"Invalid request signature")
 
         try:
-            payload = self._loads(body.decode("utf-8"))
+            payload = self._loads(body)
             interaction_type = int(payload["type"])
 
         except (data_binding.JSONDecodeError, ValueError, TypeError) as exc:
@@ -440,6 +443,9 @@ class InteractionServer(interaction_server.InteractionServer):
                 result = await listener(interaction)
                 raw_payload, files = result.build(self._entity_factory)
                 payload = self._dumps(raw_payload)
+                # Encoders such as json.dumps return strings.
+                if isinstance(payload, str):
+                    payload = payload.encode()
 
             except Exception as exc:
                 asyncio.get_running_loop().call_exception_handler(
@@ -447,7 +453,7 @@ class InteractionServer(interaction_server.InteractionServer):
                 )
                 return _Response(_INTERNAL_SERVER_ERROR_STATUS, b"Exception occurred during interaction dispatch")
 
-            return _Response(_OK_STATUS, payload.encode(), files=files, content_type=_JSON_TYPE_WITH_CHARSET)
+            return _Response(_OK_STATUS, payload, files=files, content_type=_JSON_TYPE_WITH_CHARSET)
 
         _LOGGER.debug(
             "Ignoring interaction %s of type %s without registered listener", interaction.id, interaction.type
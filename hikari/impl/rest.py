@@ -269,6 +269,9 @@ class RESTApp(traits.ExecutorAware):
 
     Parameters
     ----------
+    dumps : hikari.internal.data_binding.JSONEncoder
+        The JSON encoder the REST clients should use. Defaults to
+        `hikari.internal.data_binding.default_json_dumps`.
     executor : typing.Optional[concurrent.futures.Executor]
         The executor to use for blocking file IO operations. If `builtins.None`
         is passed, then the default `concurrent.futures.ThreadPoolExecutor` for
@@ -276,6 +279,9 @@ class RESTApp(traits.ExecutorAware):
     http_settings : typing.Optional[hikari.impl.config.HTTPSettings]
         HTTP settings to use. Sane defaults are used if this is
         `builtins.None`.
+    loads : hikari.internal.data_binding.JSONDecoder
+        The JSON decoder the REST clients should use. Defaults to
+        `hikari.internal.data_binding.default_json_loads`.
     max_rate_limit : builtins.float
         Maximum number of seconds to sleep for when rate limited. If a rate
         limit occurs that is longer than this value, then a
@@ -301,8 +307,10 @@ class RESTApp(traits.ExecutorAware):
     """
 
     __slots__: typing.Sequence[str] = (
+        "_dumps",
         "_executor",
         "_http_settings",
+        "_loads",
         "_max_rate_limit",
         "_max_retries",
         "_proxy_settings",
@@ -312,8 +320,10 @@ class RESTApp(traits.ExecutorAware):
     def __init__(
         self,
         *,
+        dumps: data_binding.JSONEncoder = data_binding.default_json_dumps,
         executor: typing.Optional[concurrent.futures.Executor] = None,
         http_settings: typing.Optional[config_impl.HTTPSettings] = None,
+        loads: data_binding.JSONDecoder = data_binding.default_json_loads,
         max_rate_limit: float = 300,
         max_retries: int = 3,
         proxy_settings: typing.Optional[config_impl.ProxySettings] = None,
@@ -321,7 +331,9 @@ class RESTApp(traits.ExecutorAware):
     ) -> None:
         self._http_settings = config_impl.HTTPSettings() if http_settings is None else http_settings
         self._proxy_settings = config_impl.ProxySettings() if proxy_settings is None else proxy_settings
+        self._dumps = dumps
         self._executor = executor
+        self._loads = loads
         self._max_rate_limit = max_rate_limit
         self._max_retries = max_retries
         self._url = url
@@ -411,9 +423,11 @@ class RESTApp(traits.ExecutorAware):
 
         rest_client = RESTClientImpl(
             cache=None,
+            dumps=self._dumps,
             entity_factory=entity_factory,
             executor=self._executor,
             http_settings=self._http_settings,
+            loads=self._loads,
             max_rate_limit=self._max_rate_limit,
             max_retries=self._max_retries,
             proxy_settings=self._proxy_settings,
@@ -504,11 +518,17 @@ class RESTClientImpl(rest_api.RESTClient):
 
     Parameters
     ----------
+    dumps : hikari.internal.data_binding.JSONEncoder
+        The JSON encoder this client should use. Defaults to
+        `hikari.internal.data_binding.default_json_dumps`.
     entity_factory : hikari.api.entity_factory.EntityFactory
         The entity factory to use.
     executor : typing.Optional[concurrent.futures.Executor]
         The executor to use for blocking IO. Defaults to the `asyncio` thread
         pool if set to `builtins.None`.
+    loads : hikari.internal.data_binding.JSONDecoder
+        The JSON decoder this client should use. Defaults to
+        `hikari.internal.data_binding.default_json_loads`.
     max_rate_limit : builtins.float
         Maximum number of seconds to sleep for when rate limited. If a rate
         limit occurs that is longer than this value, then a
@@ -543,10 +563,12 @@ class RESTClientImpl(rest_api.RESTClient):
 
     __slots__: typing.Sequence[str] = (
         "_cache",
+        "_dumps",
         "_entity_factory",
         "_executor",
         "_http_settings",
         "_live_attributes",
+        "_loads",
         "_max_rate_limit",
         "_max_retries",
         "_proxy_settings",
@@ -559,9 +581,11 @@ class RESTClientImpl(rest_api.RESTClient):
         self,
         *,
         cache: typing.Optional[cache_api.MutableCache],
+        dumps: data_binding.JSONEncoder = data_binding.default_json_dumps,
         entity_factory: entity_factory_.EntityFactory,
         executor: typing.Optional[concurrent.futures.Executor],
         http_settings: config_impl.HTTPSettings,
+        loads: data_binding.JSONDecoder = data_binding.default_json_loads,
         max_rate_limit: float,
         max_retries: int = 3,
         proxy_settings: config_impl.ProxySettings,
@@ -573,10 +597,12 @@ class RESTClientImpl(rest_api.RESTClient):
             raise ValueError("'max_retries' must be below or equal to 5")
 
         self._cache = cache
+        self._dumps = dumps
         self._entity_factory = entity_factory
         self._executor = executor
         self._http_settings = http_settings
         self._live_attributes: typing.Optional[_LiveAttributes] = None
+        self._loads = loads
         self._max_rate_limit = max_rate_limit
         self._max_retries = max_retries
         self._proxy_settings = proxy_settings
@@ -725,7 +751,11 @@ class RESTClientImpl(rest_api.RESTClient):
             try:
                 uuid = time.uuid()
                 async with stack:
-                    form = await form_builder.build(stack) if form_builder else None
+                    data: typing.Union[aiohttp.FormData, aiohttp.BytesPayload, None] = None
+                    if form_builder:
+                        data = await form_builder.build(stack)
+                    elif json is not None:
+                        data = aiohttp.BytesPayload(self._dumps(json), content_type=_APPLICATION_JSON)
 
                     await stack.enter_async_context(live_attributes.still_alive().buckets.acquire(compiled_route))
                     # Buckets not using authentication still have a global
@@ -750,8 +780,7 @@ class RESTClientImpl(rest_api.RESTClient):
                         url,
                         headers=headers,
                         params=query,
-                        json=json,
-                        data=form,
+                        data=data,
                         allow_redirects=self._http_settings.max_redirects is not None,
                         max_redirects=self._http_settings.max_redirects,
                         proxy=self._proxy_settings.url,
@@ -782,7 +811,7 @@ class RESTClientImpl(rest_api.RESTClient):
                 if 200 <= response.status < 300:
                     if response.content_type == _APPLICATION_JSON:
                         # Only deserializing here stops Cloudflare shenanigans messing us around.
-                        return data_binding.load_json(await response.read())
+                        return self._loads(await response.read())
 
                     real_url = str(response.real_url)
                     raise errors.HTTPError(f"Expected JSON [{response.content_type=}, {real_url=}]")
@@ -1361,7 +1390,7 @@ class RESTClientImpl(rest_api.RESTClient):
         body.put("message_reference", reply, conversion=lambda m: {"message_id": str(int(m))})
 
         if form_builder is not None:
-            form_builder.add_field("payload_json", data_binding.dump_json(body), content_type=_APPLICATION_JSON)
+            form_builder.add_field("payload_json", self._dumps(body), content_type=_APPLICATION_JSON)
             response = await self._request(route, form_builder=form_builder)
         else:
             response = await self._request(route, json=body)
@@ -1425,7 +1454,7 @@ class RESTClientImpl(rest_api.RESTClient):
         )
 
         if form_builder is not None:
-            form_builder.add_field("payload_json", data_binding.dump_json(body), content_type=_APPLICATION_JSON)
+            form_builder.add_field("payload_json", self._dumps(body), content_type=_APPLICATION_JSON)
             response = await self._request(route, form_builder=form_builder)
         else:
             response = await self._request(route, json=body)
@@ -1754,7 +1783,7 @@ class RESTClientImpl(rest_api.RESTClient):
         body.put("avatar_url", avatar_url, conversion=str)
 
         if form_builder is not None:
-            form_builder.add_field("payload_json", data_binding.dump_json(body), content_type=_APPLICATION_JSON)
+            form_builder.add_field("payload_json", self._dumps(body), content_type=_APPLICATION_JSON)
             response = await self._request(route, form_builder=form_builder, query=query, no_auth=True)
         else:
             response = await self._request(route, json=body, query=query, no_auth=True)
@@ -1819,7 +1848,7 @@ class RESTClientImpl(rest_api.RESTClient):
         )
 
         if form_builder is not None:
-            form_builder.add_field("payload_json", data_binding.dump_json(body), content_type=_APPLICATION_JSON)
+            form_builder.add_field("payload_json", self._dumps(body), content_type=_APPLICATION_JSON)
             response = await self._request(route, form_builder=form_builder, no_auth=True)
         else:
             response = await self._request(route, json=body, no_auth=True)
@@ -3446,7 +3475,7 @@ class RESTClientImpl(rest_api.RESTClient):
         body.put("data", data)
 
         if form is not None:
-            form.add_field("payload_json", data_binding.dump_json(body), content_type=_APPLICATION_JSON)
+            form.add_field("payload_json", self._dumps(body), content_type=_APPLICATION_JSON)
             await self._request(route, form_builder=form, no_auth=True)
         else:
             await self._request(route, json=body, no_auth=True)
@@ -3492,7 +3521,7 @@ class RESTClientImpl(rest_api.RESTClient):
         )
 
         if form_builder is not None:
-            form_builder.add_field("payload_json", data_binding.dump_json(body), content_type=_APPLICATION_JSON)
+            form_builder.add_field("payload_json", self._dumps(body), content_type=_APPLICATION_JSON)
             response = await self._request(route, form_builder=form_builder, no_auth=True)
         else:
             response = await self._request(route, json=body, no_auth=True)
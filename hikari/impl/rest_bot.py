@@ -38,6 +38,7 @@ from hikari.impl import entity_factory as entity_factory_impl
 from hikari.impl import interaction_server as interaction_server_impl
 from hikari.impl import rest as rest_impl
 from hikari.internal import aio
+from hikari.internal import data_binding
 from hikari.internal import ux
 
 if typing.TYPE_CHECKING:
@@ -93,6 +94,10 @@ class RESTBot(traits.RESTBotAware, interaction_server_.InteractionServer):
         The package to search for a `banner.txt` in. Defaults to `"hikari"` for
         the `"hikari/banner.txt"` banner.
         Setting this to `builtins.None` will disable the banner being shown.
+    dumps : hikari.internal.data_binding.JSONEncoder
+        The JSON encoder to use for the REST client and the interaction server.
+        Defaults to `hikari.internal.data_binding.default_json_dumps`, which
+        will use `orjson` if it is installed (see `hikari[speedups]`).
     executor : typing.Optional[concurrent.futures.Executor]
         Defaults to `builtins.None`. If non-`builtins.None`, then this executor
         is used instead of the `concurrent.futures.ThreadPoolExecutor` attached
@@ -115,6 +120,10 @@ class RESTBot(traits.RESTBotAware, interaction_server_.InteractionServer):
         customise functionality such as whether SSL-verification is enabled,
         what timeouts `aiohttp` should expect to use for requests, and behavior
         regarding HTTP-redirects.
+    loads : hikari.internal.data_binding.JSONDecoder
+        The JSON decoder to use for the REST client and the interaction server.
+        Defaults to `hikari.internal.data_binding.default_json_loads`, which
+        will use `orjson` if it is installed (see `hikari[speedups]`).
     logs : typing.Union[builtins.None, LoggerLevel, typing.Dict[str, typing.Any]]
         Defaults to `"INFO"`.
 
@@ -198,9 +207,11 @@ class RESTBot(traits.RESTBotAware, interaction_server_.InteractionServer):
         public_key: typing.Union[bytes, str, None] = None,
         allow_color: bool = True,
         banner: typing.Optional[str] = "hikari",
+        dumps: data_binding.JSONEncoder = data_binding.default_json_dumps,
         executor: typing.Optional[concurrent.futures.Executor] = None,
         force_color: bool = False,
         http_settings: typing.Optional[config_impl.HTTPSettings] = None,
+        loads: data_binding.JSONDecoder = data_binding.default_json_loads,
         logs: typing.Union[None, int, str, typing.Dict[str, typing.Any]] = "INFO",
         max_rate_limit: float = 300.0,
         max_retries: int = 3,
@@ -218,9 +229,11 @@ class RESTBot(traits.RESTBotAware, interaction_server_.InteractionServer):
         *,
         allow_color: bool = True,
         banner: typing.Optional[str] = "hikari",
+        dumps: data_binding.JSONEncoder = data_binding.default_json_dumps,
         executor: typing.Optional[concurrent.futures.Executor] = None,
         force_color: bool = False,
         http_settings: typing.Optional[config_impl.HTTPSettings] = None,
+        loads: data_binding.JSONDecoder = data_binding.default_json_loads,
         logs: typing.Union[None, int, str, typing.Dict[str, typing.Any]] = "INFO",
         max_rate_limit: float = 300.0,
         max_retries: int = 3,
@@ -237,9 +250,11 @@ class RESTBot(traits.RESTBotAware, interaction_server_.InteractionServer):
         *,
         allow_color: bool = True,
         banner: typing.Optional[str] = "hikari",
+        dumps: data_binding.JSONEncoder = data_binding.default_json_dumps,
         executor: typing.Optional[concurrent.futures.Executor] = None,
         force_color: bool = False,
         http_settings: typing.Optional[config_impl.HTTPSettings] = None,
+        loads: data_binding.JSONDecoder = data_binding.default_json_loads,
         logs: typing.Union[None, int, str, typing.Dict[str, typing.Any]] = "INFO",
         max_rate_limit: float = 300.0,
         max_retries: int = 3,
@@ -269,9 +284,11 @@ class RESTBot(traits.RESTBotAware, interaction_server_.InteractionServer):
         # RESTful API.
         self._rest = rest_impl.RESTClientImpl(
             cache=None,
+            dumps=dumps,
             entity_factory=self._entity_factory,
             executor=self._executor,
             http_settings=self._http_settings,
+            loads=loads,
             max_rate_limit=max_rate_limit,
             max_retries=max_retries,
             proxy_settings=self._proxy_settings,
@@ -282,7 +299,9 @@ class RESTBot(traits.RESTBotAware, interaction_server_.InteractionServer):
 
         # IntegrationServer
         self._server = interaction_server_impl.InteractionServer(
+            dumps=dumps,
             entity_factory=self._entity_factory,
+            loads=loads,
             public_key=public_key,
             rest_client=self._rest,
         )
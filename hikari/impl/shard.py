@@ -26,16 +26,19 @@ from __future__ import annotations
 
 __all__: typing.Sequence[str] = ("GatewayShardImpl",)
 
+import abc
 import asyncio
 import contextlib
 import logging
 import platform
+import re
 import sys
 import typing
 import urllib.parse
 import zlib
 
 import aiohttp
+import attr
 
 from hikari import _about as about
 from hikari import errors
@@ -46,21 +49,23 @@ from hikari import undefined
 from hikari.api import shard
 from hikari.impl import rate_limits
 from hikari.internal import data_binding
+from hikari.internal import etf
 from hikari.internal import net
 from hikari.internal import time
 from hikari.internal import ux
 
 if typing.TYPE_CHECKING:
+    import concurrent.futures
     import datetime
 
     import aiohttp.http_websocket
-    import aiohttp.typedefs
 
     from hikari import channels
     from hikari import guilds
     from hikari import users as users_
     from hikari.api import event_factory as event_factory_
     from hikari.api import event_manager as event_manager_
+    from hikari.api import metrics as metrics_
     from hikari.impl import config
 
 # Important attributes
@@ -100,6 +105,13 @@ _CHUNKING_RATELIMIT: typing.Final[typing.Tuple[float, int]] = (60.0, 60)
 _VERSION: int = 8
 # Used to identify the end of a ZLIB payload
 _ZLIB_SUFFIX: typing.Final[bytes] = b"\x00\x00\xff\xff"
+# Matches the start of dispatch payloads, as Discord sends them, to get the event name and sequence without decoding.
+_DISPATCH_PREFIX_PATTERN: typing.Final[typing.Pattern[str]] = re.compile(r'\{"t":"([A-Z0-9_]+)","s":(\d+),"op":0[,}]')
+_DISPATCH_PREFIX_BYTES_PATTERN: typing.Final[typing.Pattern[bytes]] = re.compile(
+    _DISPATCH_PREFIX_PATTERN.pattern.encode("ascii")
+)
+# Events which the shard itself needs the payloads of.
+_HANDSHAKE_EVENTS: typing.Final[typing.FrozenSet[str]] = frozenset(("READY", "RESUMED"))
 # Close codes which don't invalidate the current session.
 _RECONNECTABLE_CLOSE_CODES: typing.FrozenSet[errors.ShardCloseCode] = frozenset(
     (
@@ -119,9 +131,137 @@ def _log_filterer(token: str) -> typing.Callable[[str], str]:
     return filterer
 
 
-if typing.TYPE_CHECKING:
-    # noinspection PyProtectedMember,PyUnresolvedReferences
-    _ZlibDecompressor = zlib._Decompress
+class _TransportDecompressor(abc.ABC):
+    """Interface for inflating transport-compressed gateway messages.
+
+    A new decompressor must be used for each connection, as the compression
+    context is shared between all the messages received in it.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    @abc.abstractmethod
+    def feed(self, data: bytes, /) -> typing.Optional[bytes]:
+        """Feed a binary websocket message into the decompressor.
+
+        Parameters
+        ----------
+        data : builtins.bytes
+            The compressed data received.
+
+        Returns
+        -------
+        typing.Optional[builtins.bytes]
+            The inflated payload if `data` completed one, otherwise
+            `builtins.None` if more messages are required.
+        """
+
+
+@typing.final
+class _ZlibStreamDecompressor(_TransportDecompressor):
+    """Decompressor for the `zlib-stream` transport compression.
+
+    Payloads may be split over several messages, with the last one ending
+    with `_ZLIB_SUFFIX`.
+    """
+
+    __slots__: typing.Sequence[str] = ("_chunks", "_tail", "_zlib")
+
+    def __init__(self) -> None:
+        self._chunks: typing.List[bytes] = []
+        self._tail = b""
+        self._zlib = zlib.decompressobj()
+
+    def feed(self, data: bytes, /) -> typing.Optional[bytes]:
+        # Each fragment is fed into the decompressor as soon as it arrives, rather than
+        # being joined into one big compressed buffer first. This spreads the inflate
+        # cost over the time spent waiting for the remaining fragments and means we
+        # never hold the compressed and inflated copies of a large payload at once.
+        self._chunks.append(self._zlib.decompress(data))
+
+        # The suffix may be split between two fragments, so keep the tail around.
+        tail = self._tail + data[-len(_ZLIB_SUFFIX) :]
+        if not tail.endswith(_ZLIB_SUFFIX):
+            self._tail = tail[-len(_ZLIB_SUFFIX) :]
+            return None
+
+        chunks = self._chunks
+        self._chunks = []
+        self._tail = b""
+
+        if len(chunks) == 1:
+            return chunks[0]
+
+        return b"".join(chunks)
+
+
+@typing.final
+class _ZstdStreamDecompressor(_TransportDecompressor):
+    """Decompressor for the `zstd-stream` transport compression.
+
+    Every message is flushed by Discord, so each message holds a complete
+    payload.
+    """
+
+    __slots__: typing.Sequence[str] = ("_zstd",)
+
+    def __init__(self) -> None:
+        # This is kept inline as zstandard is an optional dependency.
+        import zstandard
+
+        self._zstd = zstandard.ZstdDecompressor().decompressobj()
+
+    def feed(self, data: bytes, /) -> typing.Optional[bytes]:
+        return self._zstd.decompress(data)
+
+
+@typing.final
+class _PassthroughDecompressor(_TransportDecompressor):
+    """Decompressor used when transport compression is disabled.
+
+    Binary messages will only be received when using ETF, in which case each
+    message holds a complete payload.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    def feed(self, data: bytes, /) -> typing.Optional[bytes]:
+        return data
+
+
+def _create_decompressor(compression: typing.Optional[str]) -> _TransportDecompressor:
+    if compression == shard.GatewayCompression.TRANSPORT_ZLIB_STREAM:
+        return _ZlibStreamDecompressor()
+
+    if compression == shard.GatewayCompression.TRANSPORT_ZSTD_STREAM:
+        return _ZstdStreamDecompressor()
+
+    return _PassthroughDecompressor()
+
+
+@typing.final
+@attr.frozen(weakref_slot=False)
+class _SkippedDispatch:
+    """A dispatch payload which was not decoded, as its event is not consumed."""
+
+    name: str = attr.field()
+    """The name of the event."""
+
+    seq: int = attr.field()
+    """The sequence number of the payload."""
+
+
+def _peek_dispatch(pl: typing.Union[str, bytes], /) -> typing.Optional[typing.Tuple[str, int]]:
+    if isinstance(pl, str):
+        if (match := _DISPATCH_PREFIX_PATTERN.match(pl)) is None:
+            return None
+
+        return match.group(1), int(match.group(2))
+
+    if (bytes_match := _DISPATCH_PREFIX_BYTES_PATTERN.match(pl)) is None:
+        return None
+
+    return bytes_match.group(1).decode("ascii"), int(bytes_match.group(2))
 
 
 # aiohttp.ClientWebSocketResponse isn't slotted
@@ -130,7 +270,7 @@ class _GatewayTransport(aiohttp.ClientWebSocketResponse):
     """Internal component to handle lower-level communication logic.
 
     This includes translating aiohttp error conditions to hikari ones,
-    handling inbound zlib packets, creating the websocket and client session,
+    handling inbound compressed packets, creating the websocket and client session,
     and ensuring all resources are freed deterministically where possible.
 
     Payload logging is also performed here.
@@ -138,13 +278,18 @@ class _GatewayTransport(aiohttp.ClientWebSocketResponse):
 
     def __init__(self, *args: typing.Any, **kwargs: typing.Any) -> None:
         super().__init__(*args, **kwargs)
-        self.zlib: _ZlibDecompressor = zlib.decompressobj()
         self.sent_close = False
 
         # Initialized from `connect'
         # These are type-hinted here instead of above to prevent MyPy from misinterpreting typing.Callable as a method
+        self.data_format: str
+        self.decompressor: _TransportDecompressor
+        self.executor: typing.Optional[concurrent.futures.Executor]
         self.logger: logging.Logger
         self.log_filterer: typing.Callable[[str], str]
+        self.metrics: typing.Optional[metrics_.GatewayMetricsCollector]
+        self.offload_threshold: typing.Optional[int]
+        self.shard_id: int
 
     async def send_close(self, *, code: int = 1000, message: bytes = b"") -> None:
         # aiohttp may close the socket by invoking close() internally. By giving
@@ -166,23 +311,65 @@ class _GatewayTransport(aiohttp.ClientWebSocketResponse):
     async def receive_json(
         self,
         *,
-        loads: aiohttp.typedefs.JSONDecoder = data_binding.load_json,
+        loads: data_binding.JSONDecoder = data_binding.default_json_loads,
         timeout: typing.Optional[float] = None,
+        event_filter: typing.Optional[typing.Callable[[str], bool]] = None,
     ) -> typing.Any:
         pl = await self._receive_and_check(timeout)
-        if self.logger.isEnabledFor(ux.TRACE):
-            filtered = self.log_filterer(pl)
+        is_etf = self.data_format == shard.GatewayDataFormat.ETF
+
+        if not is_etf and self.logger.isEnabledFor(ux.TRACE):
+            filtered = self.log_filterer(pl if isinstance(pl, str) else pl.decode("utf-8"))
             self.logger.log(ux.TRACE, "received payload with size %s\n    %s", len(pl), filtered)
-        return loads(pl)
+
+        # ETF maps are not ordered, so the event name can't be found without decoding them.
+        is_unpeeked = False
+        if event_filter is not None and not is_etf:
+            peeked = _peek_dispatch(pl)
+            is_unpeeked = peeked is None
+            if peeked is not None:
+                if self.metrics is not None:
+                    self.metrics.on_dispatch_peeked(self.shard_id, True)
+
+                name, seq = peeked
+                if not event_filter(name):
+                    return _SkippedDispatch(name, seq)
+
+        # Decoding is left on the event loop even for large payloads, as neither decoder releases the GIL, so doing
+        # it in a thread would only add overhead.
+        if self.metrics is None:
+            payload = loads(pl)
+        else:
+            start = time.monotonic()
+            payload = loads(pl)
+            self.metrics.on_payload_decoded(self.shard_id, time.monotonic() - start)
+
+            # Other payloads aren't expected to match, so only dispatches which didn't are misses.
+            if is_unpeeked and payload.get(_OP) == _DISPATCH:
+                self.metrics.on_dispatch_peeked(self.shard_id, False)
+
+        if is_etf and self.logger.isEnabledFor(ux.TRACE):
+            filtered = self.log_filterer(data_binding.dump_json(payload))
+            self.logger.log(ux.TRACE, "received payload with size %s\n    %s", len(pl), filtered)
+
+        return payload
 
     async def send_json(
         self,
         data: data_binding.JSONObject,
         compress: typing.Optional[int] = None,
         *,
-        dumps: aiohttp.typedefs.JSONEncoder = data_binding.dump_json,
+        dumps: data_binding.JSONEncoder = data_binding.default_json_dumps,
     ) -> None:
-        pl = dumps(data)
+        if self.data_format == shard.GatewayDataFormat.ETF:
+            raw_pl = dumps(data)
+            if self.logger.isEnabledFor(ux.TRACE):
+                filtered = self.log_filterer(data_binding.dump_json(data))
+                self.logger.log(ux.TRACE, "sending payload with size %s\n    %s", len(raw_pl), filtered)
+            await self.send_bytes(raw_pl, compress)
+            return
+
+        pl = dumps(data).decode("utf-8")
         if self.logger.isEnabledFor(ux.TRACE):
             filtered = self.log_filterer(pl)
             self.logger.log(ux.TRACE, "sending payload with size %s\n    %s", len(pl), filtered)
@@ -211,31 +398,52 @@ class _GatewayTransport(aiohttp.ClientWebSocketResponse):
         )
         raise errors.GatewayError("Unexpected websocket exception from gateway") from ex
 
-    async def _receive_and_check(self, timeout: typing.Optional[float], /) -> str:
+    def _should_offload(self, size: int, /) -> bool:
+        return self.offload_threshold is not None and size >= self.offload_threshold
+
+    async def _feed(self, data: bytes, /) -> typing.Optional[bytes]:
+        if self.metrics is not None:
+            self.metrics.on_frame_received(self.shard_id, len(data))
+
+        if self._should_offload(len(data)):
+            # zlib and zstandard release the GIL while inflating, so this can
+            # run in parallel to the event loop.
+            payload = await asyncio.get_running_loop().run_in_executor(self.executor, self.decompressor.feed, data)
+        else:
+            payload = self.decompressor.feed(data)
+
+        if payload is not None and self.metrics is not None:
+            self.metrics.on_payload_inflated(self.shard_id, len(payload))
+
+        return payload
+
+    async def _receive_and_check(self, timeout: typing.Optional[float], /) -> typing.Union[str, bytes]:
         message = await self.receive(timeout)
 
         if message.type == aiohttp.WSMsgType.TEXT:
             assert isinstance(message.data, str)
+            if self.metrics is not None:
+                self.metrics.on_frame_received(self.shard_id, len(message.data))
             return message.data
 
         if message.type == aiohttp.WSMsgType.BINARY:
-            if message.data.endswith(_ZLIB_SUFFIX):
-                return self.zlib.decompress(message.data).decode("utf-8")
+            # The inflated bytes are handed straight to the JSON decoder, which
+            # saves decoding (and copying) the whole payload into a str first.
+            if (payload := await self._feed(message.data)) is not None:
+                return payload
 
-            return await self._receive_and_check_complete_zlib_package(message.data, timeout)
+            return await self._receive_and_check_complete_package(timeout)
 
         self._handle_other_message(message)
 
-    async def _receive_and_check_complete_zlib_package(
-        self, initial_data: bytes, timeout: typing.Optional[float], /
-    ) -> str:
-        buff = bytearray(initial_data)
-
-        while not buff.endswith(_ZLIB_SUFFIX):
+    async def _receive_and_check_complete_package(self, timeout: typing.Optional[float], /) -> bytes:
+        while True:
             message = await self.receive(timeout)
 
             if message.type == aiohttp.WSMsgType.BINARY:
-                buff.extend(message.data)
+                if (payload := await self._feed(message.data)) is not None:
+                    return payload
+
                 continue
 
             if message.type == aiohttp.WSMsgType.TEXT:
@@ -243,17 +451,21 @@ class _GatewayTransport(aiohttp.ClientWebSocketResponse):
 
             self._handle_other_message(message)
 
-        return self.zlib.decompress(buff).decode("utf-8")
-
     @classmethod
     @contextlib.asynccontextmanager
     async def connect(
         cls,
         *,
+        compression: typing.Optional[str],
+        data_format: str,
+        executor: typing.Optional[concurrent.futures.Executor],
         http_settings: config.HTTPSettings,
         logger: logging.Logger,
+        metrics: typing.Optional[metrics_.GatewayMetricsCollector],
+        offload_threshold: typing.Optional[int],
         proxy_settings: config.ProxySettings,
         log_filterer: typing.Callable[[str], str],
+        shard_id: int,
         url: str,
     ) -> typing.AsyncGenerator[_GatewayTransport, None]:
         """Generate a single-use websocket connection.
@@ -285,7 +497,13 @@ class _GatewayTransport(aiohttp.ClientWebSocketResponse):
             )
             assert isinstance(web_socket, cls)
 
+            web_socket.data_format = data_format
+            web_socket.decompressor = _create_decompressor(compression)
+            web_socket.executor = executor
             web_socket.logger = logger
+            web_socket.metrics = metrics
+            web_socket.offload_threshold = offload_threshold
+            web_socket.shard_id = shard_id
             # We store this so we can remove it from debug logs
             # which enables people to send logs in issues safely.
             web_socket.log_filterer = log_filterer
@@ -366,7 +584,11 @@ class GatewayShardImpl(shard.GatewayShard):
     ----------------
     compression : typing.Optional[builtins.str]
         Compression format to use for the shard. Only supported values are
-        `"transport_zlib_stream"` or `builtins.None` to disable it.
+        `"transport_zlib_stream"`, `"transport_zstd_stream"` or `builtins.None`
+        to disable it.
+
+        `"transport_zstd_stream"` requires the optional `zstandard` dependency,
+        which is included in `hikari[speedups]`.
     initial_activity : typing.Optional[hikari.presences.Activity]
         The initial activity to appear to have for this shard, or
         `builtins.None` if no activity should be set initially. This is the
@@ -393,8 +615,49 @@ class GatewayShardImpl(shard.GatewayShard):
     proxy_settings : hikari.impl.config.ProxySettings
         The proxy settings to use while negotiating a websocket.
     data_format : builtins.str
-        Data format to use for inbound data. Only supported format is
-        `"json"`.
+        Data format to use for the gateway payloads. Supported formats are
+        `"json"` and `"etf"`.
+
+        !!! warning
+            `"etf"` is experimental and may change or be removed without
+            notice. ETF is decoded in pure Python, which is roughly an order
+            of magnitude slower than decoding JSON with `orjson` (see
+            `scripts/etf_benchmark.py`).
+    dumps : hikari.internal.data_binding.JSONEncoder
+        The JSON encoder this shard should use. Defaults to
+        `hikari.internal.data_binding.default_json_dumps`.
+
+        This is ignored when `data_format` is `"etf"`.
+    executor : typing.Optional[concurrent.futures.Executor]
+        The executor to inflate large payloads in when
+        `offload_threshold` is set. Defaults to `builtins.None`, which will use
+        the default executor of the event loop.
+
+        This must be a `concurrent.futures.ThreadPoolExecutor`, as the
+        decompression context is shared with the event loop.
+    loads : hikari.internal.data_binding.JSONDecoder
+        The JSON decoder this shard should use. Defaults to
+        `hikari.internal.data_binding.default_json_loads`.
+
+        This is ignored when `data_format` is `"etf"`.
+    metrics : typing.Optional[hikari.api.metrics.GatewayMetricsCollector]
+        The collector to report metrics about this shard to. Defaults to
+        `builtins.None`, in which case no metrics are measured.
+    offload_threshold : typing.Optional[builtins.int]
+        The size in bytes from which received messages will be inflated in
+        `executor` instead of on the event loop. This keeps huge compressed
+        payloads (such as `GUILD_CREATE` for large guilds) from stalling
+        heartbeats and other shards, as inflating releases the GIL. Payloads
+        are still decoded on the event loop, as decoding doesn't release the
+        GIL, and are handled in the order they are received.
+
+        This only has an effect when `compression` is set.
+
+        Defaults to `builtins.None`, which disables offloading.
+    session_state : typing.Optional[hikari.api.shard.GatewaySessionState]
+        The state of a previous session to resume when first connecting,
+        instead of identifying. If the session can no longer be resumed, the
+        shard will identify as normal. Defaults to `builtins.None`.
 
     !!! note
         If all four of `initial_activity`, `initial_idle_since`,
@@ -413,19 +676,28 @@ class GatewayShardImpl(shard.GatewayShard):
         "_closed_event",
         "_closing_event",
         "_chunking_rate_limit",
+        "_compression",
+        "_data_format",
+        "_dumps",
         "_event_manager",
         "_event_factory",
+        "_executor",
         "_handshake_completed",
         "_heartbeat_latency",
         "_http_settings",
         "_idle_since",
         "_intents",
         "_is_afk",
+        "_keep_session",
         "_large_threshold",
         "_last_heartbeat_ack_received",
         "_last_heartbeat_sent",
+        "_loads",
         "_logger",
+        "_metrics",
+        "_offload_threshold",
         "_proxy_settings",
+        "_resume_gateway_url",
         "_run_task",
         "_seq",
         "_session_id",
@@ -454,13 +726,22 @@ class GatewayShardImpl(shard.GatewayShard):
         http_settings: config.HTTPSettings,
         proxy_settings: config.ProxySettings,
         data_format: str = shard.GatewayDataFormat.JSON,
+        dumps: data_binding.JSONEncoder = data_binding.default_json_dumps,
         event_manager: event_manager_.EventManager,
         event_factory: event_factory_.EventFactory,
+        executor: typing.Optional[concurrent.futures.Executor] = None,
+        loads: data_binding.JSONDecoder = data_binding.default_json_loads,
+        metrics: typing.Optional[metrics_.GatewayMetricsCollector] = None,
+        offload_threshold: typing.Optional[int] = None,
+        session_state: typing.Optional[shard.GatewaySessionState] = None,
         token: str,
         url: str,
     ) -> None:
 
-        if data_format != shard.GatewayDataFormat.JSON:
+        if data_format == shard.GatewayDataFormat.ETF:
+            dumps = etf.dumps
+            loads = etf.loads
+        elif data_format != shard.GatewayDataFormat.JSON:
             raise NotImplementedError(f"Unsupported gateway data format: {data_format}")
 
         query = {"v": _VERSION, "encoding": str(data_format)}
@@ -468,6 +749,16 @@ class GatewayShardImpl(shard.GatewayShard):
         if compression is not None:
             if compression == shard.GatewayCompression.TRANSPORT_ZLIB_STREAM:
                 query["compress"] = "zlib-stream"
+            elif compression == shard.GatewayCompression.TRANSPORT_ZSTD_STREAM:
+                # This is kept inline as zstandard is an optional dependency.
+                try:
+                    import zstandard  # noqa: F401 - Unused import
+                except ModuleNotFoundError as exc:
+                    raise RuntimeError(
+                        "You must install the optional `hikari[speedups]` dependencies to use zstd compression."
+                    ) from exc
+
+                query["compress"] = "zstd-stream"
             else:
                 raise NotImplementedError(f"Unsupported compression format {compression}")
 
@@ -481,19 +772,28 @@ class GatewayShardImpl(shard.GatewayShard):
             f"shard {shard_id} chunking rate limit",
             *_CHUNKING_RATELIMIT,
         )
+        self._compression = compression
+        self._data_format = data_format
+        self._dumps = dumps
         self._event_manager = event_manager
         self._event_factory = event_factory
+        self._executor = executor
         self._handshake_completed = asyncio.Event()
         self._heartbeat_latency = float("nan")
         self._http_settings = http_settings
         self._idle_since = initial_idle_since
         self._intents = intents
         self._is_afk = initial_is_afk
+        self._keep_session = False
         self._large_threshold = large_threshold
         self._last_heartbeat_ack_received = float("nan")
         self._last_heartbeat_sent = float("nan")
+        self._loads = loads
         self._logger = logging.getLogger(f"hikari.gateway.{shard_id}")
+        self._metrics = metrics
+        self._offload_threshold = offload_threshold
         self._proxy_settings = proxy_settings
+        self._resume_gateway_url: typing.Optional[str] = None
         self._run_task: typing.Optional[asyncio.Task[None]] = None
         self._seq: typing.Optional[int] = None
         self._session_id: typing.Optional[str] = None
@@ -509,6 +809,17 @@ class GatewayShardImpl(shard.GatewayShard):
         self._user_id: typing.Optional[snowflakes.Snowflake] = None
         self._ws: typing.Optional[_GatewayTransport] = None
 
+        if session_state is not None:
+            if session_state.shard_id != shard_id or session_state.shard_count != shard_count:
+                raise ValueError(
+                    f"Session state for shard {session_state.shard_id} (of {session_state.shard_count}) "
+                    f"cannot be used by shard {shard_id} (of {shard_count})"
+                )
+
+            self._resume_gateway_url = session_state.resume_url
+            self._seq = session_state.seq
+            self._session_id = session_state.session_id
+
     @property
     def heartbeat_latency(self) -> float:
         return self._heartbeat_latency
@@ -525,20 +836,33 @@ class GatewayShardImpl(shard.GatewayShard):
     def is_alive(self) -> bool:
         return self._ws is not None and not self._ws.sent_close
 
+    @property
+    def session_state(self) -> typing.Optional[shard.GatewaySessionState]:
+        if self._session_id is None or self._seq is None:
+            return None
+
+        return shard.GatewaySessionState(
+            shard_id=self._shard_id,
+            shard_count=self._shard_count,
+            session_id=self._session_id,
+            seq=self._seq,
+            resume_url=self._resume_gateway_url,
+        )
+
     @property
     def shard_count(self) -> int:
         return self._shard_count
 
-    async def close(self) -> None:
+    async def close(self, *, keep_session: bool = False) -> None:
         self._check_if_alive()
         if not self._closing_event.is_set():
+            self._keep_session = keep_session
             try:
                 if self._ws is not None:
                     self._logger.debug(
-                        "shard.close() was called and the websocket was still alive -- "
-                        "disconnecting immediately with GOING AWAY"
+                        "shard.close() was called and the websocket was still alive -- disconnecting immediately"
                     )
-                    await self._ws.send_close(code=errors.ShardCloseCode.GOING_AWAY, message=b"shard disconnecting")
+                    await self._send_close()
                 self._closing_event.set()
             finally:
                 self._chunking_rate_limit.close()
@@ -567,12 +891,10 @@ class GatewayShardImpl(shard.GatewayShard):
         self,
         data: data_binding.JSONObject,
         compress: typing.Optional[int] = None,
-        *,
-        dumps: aiohttp.typedefs.JSONEncoder = data_binding.dump_json,
     ) -> None:
         await self._total_rate_limit.acquire()
 
-        await self._get_ws().send_json(data=data, compress=compress, dumps=dumps)
+        await self._get_ws().send_json(data=data, compress=compress, dumps=self._dumps)
 
     def _check_if_alive(self) -> None:
         if not self.is_alive:
@@ -683,6 +1005,7 @@ class GatewayShardImpl(shard.GatewayShard):
 
         if name == "READY":
             self._session_id = data["session_id"]
+            self._resume_gateway_url = data.get("resume_gateway_url")
             user_pl = data["user"]
             user_id = user_pl["id"]
             self._user_id = snowflakes.Snowflake(user_id)
@@ -699,7 +1022,7 @@ class GatewayShardImpl(shard.GatewayShard):
             )
             self._handshake_completed.set()
 
-        elif name == "RESUME":
+        elif name == "RESUMED":
             self._logger.info("shard has resumed [session:%s, seq:%s]", self._session_id, self._seq)
             self._handshake_completed.set()
 
@@ -751,6 +1074,7 @@ class GatewayShardImpl(shard.GatewayShard):
             )
 
             await self._send_heartbeat()
+            wake_up_at = time.monotonic() + heartbeat_interval
 
             try:
                 await asyncio.wait_for(self._closing_event.wait(), timeout=heartbeat_interval)
@@ -758,13 +1082,26 @@ class GatewayShardImpl(shard.GatewayShard):
                 break
             except asyncio.TimeoutError:
                 # We should continue
+                if self._metrics is not None:
+                    self._metrics.on_event_loop_lag(self._shard_id, max(0.0, time.monotonic() - wake_up_at))
                 continue
 
         self._logger.debug("heartbeat task is finishing now")
         return False
 
+    def _is_dispatch_wanted(self, name: str, /) -> bool:
+        return name in _HANDSHAKE_EVENTS or self._event_manager.is_raw_event_enabled(name)
+
     async def _poll_events(self) -> typing.Optional[bool]:
-        payload = await self._get_ws().receive_json(timeout=5)
+        payload = await self._get_ws().receive_json(
+            loads=self._loads, timeout=5, event_filter=self._is_dispatch_wanted
+        )
+
+        if isinstance(payload, _SkippedDispatch):
+            # Nothing consumes this event, so only its sequence number is needed.
+            self._seq = payload.seq
+            self._logger.log(ux.TRACE, "skipped decoding %s with seq %s", payload.name, payload.seq)
+            return None
 
         op = payload[_OP]  # opcode int
         d = payload[_D]  # data/payload. Usually a dict or a bool for INVALID_SESSION
@@ -781,6 +1118,8 @@ class GatewayShardImpl(shard.GatewayShard):
             now = time.monotonic()
             self._last_heartbeat_ack_received = now
             self._heartbeat_latency = now - self._last_heartbeat_sent
+            if self._metrics is not None:
+                self._metrics.on_heartbeat_ack(self._shard_id, self._heartbeat_latency)
             self._logger.log(ux.TRACE, "received HEARTBEAT ACK in %.1fms", self._heartbeat_latency * 1_000)
         elif op == _RECONNECT:
             # We should be able to resume...
@@ -790,6 +1129,7 @@ class GatewayShardImpl(shard.GatewayShard):
             # We can resume if the payload was `true`.
             if not d:
                 self._logger.info("received invalid session, will need to start a new session")
+                self._resume_gateway_url = None
                 self._seq = None
                 self._session_id = None
             else:
@@ -812,6 +1152,7 @@ class GatewayShardImpl(shard.GatewayShard):
         self._closed_event.clear()
         self._closing_event.clear()
         last_started_at = -float("inf")
+        reconnecting = False
 
         backoff = rate_limits.ExponentialBackOff(
             base=_BACKOFF_BASE,
@@ -834,6 +1175,10 @@ class GatewayShardImpl(shard.GatewayShard):
                         pass
 
                 try:
+                    if reconnecting and self._metrics is not None:
+                        self._metrics.on_reconnect(self._shard_id)
+
+                    reconnecting = True
                     last_started_at = time.monotonic()
                     should_restart = await self._run_once()
 
@@ -850,6 +1195,9 @@ class GatewayShardImpl(shard.GatewayShard):
                     )
 
                 except errors.GatewayServerClosedConnectionError as ex:
+                    if self._metrics is not None:
+                        self._metrics.on_connection_closed(self._shard_id, ex.code)
+
                     if not ex.can_reconnect:
                         raise
 
@@ -884,11 +1232,17 @@ class GatewayShardImpl(shard.GatewayShard):
 
         self._ws = await exit_stack.enter_async_context(
             _GatewayTransport.connect(
+                compression=self._compression,
+                data_format=self._data_format,
+                executor=self._executor,
                 http_settings=self._http_settings,
                 log_filterer=_log_filterer(self._token),
                 logger=self._logger,
+                metrics=self._metrics,
+                offload_threshold=self._offload_threshold,
                 proxy_settings=self._proxy_settings,
-                url=self._url,
+                shard_id=self._shard_id,
+                url=self._get_connect_url(),
             )
         )
 
@@ -912,9 +1266,7 @@ class GatewayShardImpl(shard.GatewayShard):
                         "closing flag was set during handshake, disconnecting with GOING AWAY "
                         "(_run_once => do not reconnect)"
                     )
-                    await self._get_ws().send_close(
-                        code=errors.ShardCloseCode.GOING_AWAY, message=b"shard disconnecting"
-                    )
+                    await self._send_close()
                     return False
 
                 # Event polling.
@@ -944,10 +1296,7 @@ class GatewayShardImpl(shard.GatewayShard):
                     "shard has requested graceful termination, so will not attempt to reconnect "
                     "(_run_once => do not reconnect)"
                 )
-                await self._get_ws().send_close(
-                    code=errors.ShardCloseCode.GOING_AWAY,
-                    message=b"shard disconnecting",
-                )
+                await self._send_close()
                 return False
 
             finally:
@@ -975,6 +1324,21 @@ class GatewayShardImpl(shard.GatewayShard):
             if exception is None and not ws.sent_close:  # type: ignore[union-attr]
                 return True
 
+    def _get_connect_url(self) -> str:
+        if self._seq is None or self._resume_gateway_url is None:
+            return self._url
+
+        # Discord only tells us which host to resume on, so the path and query are kept
+        scheme, netloc, *_ = urllib.parse.urlparse(self._resume_gateway_url)
+        return urllib.parse.urlparse(self._url)._replace(scheme=scheme, netloc=netloc).geturl()
+
+    async def _send_close(self) -> None:
+        if self._keep_session:
+            # Closing with GOING AWAY would make Discord invalidate the session.
+            await self._get_ws().send_close(code=_RESUME_CLOSE_CODE, message=b"shard restarting")
+        else:
+            await self._get_ws().send_close(code=errors.ShardCloseCode.GOING_AWAY, message=b"shard disconnecting")
+
     async def _send_heartbeat(self) -> None:
         await self._send_json({_OP: _HEARTBEAT, _D: self._seq})
         self._last_heartbeat_sent = time.monotonic()
@@ -1035,7 +1399,7 @@ class GatewayShardImpl(shard.GatewayShard):
 
     async def _wait_for_hello(self) -> asyncio.Task[bool]:
         # Expect HELLO.
-        payload = await self._get_ws().receive_json()
+        payload = await self._get_ws().receive_json(loads=self._loads)
         if payload[_OP] != _HELLO:
             self._logger.debug(
                 "expected HELLO opcode, received %s which makes no sense, closing with PROTOCOL ERROR ",
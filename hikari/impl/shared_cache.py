@@ -0,0 +1,1413 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Cache implementation backed by a key-value store shared between processes."""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("SharedCacheImpl",)
+
+import copy
+import datetime
+import importlib
+import io
+import pickle
+import typing
+
+import attr
+
+from hikari import colors
+from hikari import errors
+from hikari import files
+from hikari import messages
+from hikari import snowflakes
+from hikari import undefined
+from hikari.api import cache
+from hikari.api import config as config_api
+from hikari.internal import cache as cache_utility
+from hikari.internal import enums
+
+if typing.TYPE_CHECKING:
+    from hikari import channels
+    from hikari import emojis
+    from hikari import guilds
+    from hikari import invites
+    from hikari import presences
+    from hikari import traits
+    from hikari import users
+    from hikari import voices
+    from hikari.impl import cache_store
+    from hikari.impl import config as config_impl
+
+    _Command = typing.Sequence[typing.Union[bytes, str, int]]
+    _Entries = typing.Dict[bytes, bytes]
+
+_APP_PERSISTENT_ID: typing.Final[str] = "app"
+# Only attrs classes, enums and flags defined in these modules can be loaded, along with the globals below.
+_ALLOWED_MODULES: typing.Final[typing.FrozenSet[str]] = frozenset(
+    (
+        "hikari.applications",
+        "hikari.channels",
+        "hikari.embeds",
+        "hikari.emojis",
+        "hikari.files",
+        "hikari.guilds",
+        "hikari.interactions.base_interactions",
+        "hikari.interactions.command_interactions",
+        "hikari.interactions.component_interactions",
+        "hikari.internal.cache",
+        "hikari.invites",
+        "hikari.locales",
+        "hikari.messages",
+        "hikari.permissions",
+        "hikari.presences",
+        "hikari.scheduled_events",
+        "hikari.snowflakes",
+        "hikari.stickers",
+        "hikari.users",
+        "hikari.voices",
+        "hikari.webhooks",
+    )
+)
+_ALLOWED_GLOBALS: typing.Final[typing.Mapping[typing.Tuple[str, str], typing.Any]] = {
+    ("builtins", "frozenset"): frozenset,
+    ("builtins", "set"): set,
+    ("datetime", "datetime"): datetime.datetime,
+    ("datetime", "timedelta"): datetime.timedelta,
+    ("datetime", "timezone"): datetime.timezone,
+    ("hikari.colors", "Color"): colors.Color,
+    ("hikari.files", "URL"): files.URL,
+    ("hikari.snowflakes", "Snowflake"): snowflakes.Snowflake,
+    ("hikari.undefined", "UNDEFINED"): undefined.UNDEFINED,
+}
+# Guild values are prefixed with their availability so it can be checked without loading the guild.
+_AVAILABLE: typing.Final[bytes] = b"\x01"
+_UNAVAILABLE: typing.Final[bytes] = b"\x00"
+# Members are stored without their user, which is shared between guilds in a separate hash.
+_DETACHED_USER: typing.Final[cache_utility.RefCell[typing.Any]] = cache_utility.RefCell(None)
+
+
+class _EntityPickler(pickle.Pickler):
+    def __init__(self, file: typing.BinaryIO, app: traits.RESTAware) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._app = app
+
+    # The app can't be pickled, so it's replaced by the app of whoever loads the entity.
+    def persistent_id(self, obj: typing.Any) -> typing.Optional[str]:
+        return _APP_PERSISTENT_ID if obj is self._app else None
+
+
+class _EntityUnpickler(pickle.Unpickler):
+    def __init__(self, file: typing.BinaryIO, app: traits.RESTAware) -> None:
+        super().__init__(file)
+        self._app = app
+
+    def persistent_load(self, pid: typing.Any) -> typing.Any:
+        if pid == _APP_PERSISTENT_ID:
+            return self._app
+
+        raise pickle.UnpicklingError(f"Unknown persistent ID {pid!r}")
+
+    def find_class(self, module: str, name: str) -> typing.Any:
+        # Anything in the store may have been written by another process, so only the data types which make up
+        # entities can be loaded. Names are looked up directly, as the default lookup follows dotted names which
+        # can reach any module imported by an allowed one.
+        if (obj := _ALLOWED_GLOBALS.get((module, name))) is not None:
+            return obj
+
+        if module in _ALLOWED_MODULES and "." not in name:
+            obj = importlib.import_module(module).__dict__.get(name)
+            if (
+                isinstance(obj, type)
+                and obj.__module__ == module
+                and obj.__qualname__ == name
+                and (attr.has(obj) or issubclass(obj, (enums.Enum, enums.Flag)))
+            ):
+                return obj
+
+        raise pickle.UnpicklingError(f"{module}.{name} can't be loaded from the cache store")
+
+
+ValueT = typing.TypeVar("ValueT")
+
+
+def _as_dict(flat_pairs: typing.Sequence[bytes], /) -> _Entries:
+    iterator = iter(flat_pairs)
+    return dict(zip(iterator, iterator))
+
+
+def _snowflake_keys(entries: typing.Mapping[bytes, ValueT], /) -> typing.Dict[snowflakes.Snowflake, ValueT]:
+    return {snowflakes.Snowflake(int(key)): value for key, value in entries.items()}
+
+
+def _load_snowflake(data: bytes, /) -> snowflakes.Snowflake:
+    return snowflakes.Snowflake(int(data))
+
+
+class SharedCacheImpl(cache.MutableCache):
+    """Cache implementation which keeps its state in an out-of-process store.
+
+    This lets several processes (such as the workers of a
+    `hikari.impl.cluster.ClusterManager` and REST-only workers) share a
+    single cache instead of each holding their own copy of it. Entities are
+    stored as pickled `hikari.internal.cache` data objects in the hashes and
+    sets of a Redis protocol compatible store, with users stored once and
+    shared between all the guilds they're a member of.
+
+    !!! warning
+        Reads (including the reads of the `update_*`, `delete_*` and
+        `clear_*` methods) are blocking network requests made on the calling
+        thread, which is usually the event loop, so the store should be local
+        to keep them fast. Views of all the entities of a kind, such as
+        `get_users_view`, fetch every one of them from the store. Writes which
+        don't return anything are instead queued and sent in batches from a
+        background thread, with any errors logged rather than raised, and
+        reads wait for the queued writes first so they always see them.
+
+        Only point this at a trusted store, as entities are loaded with
+        `pickle`. Loading is restricted to hikari's entity data types, but
+        anyone who can write to the store can still change what the cache
+        returns.
+
+    !!! note
+        Unlike `hikari.impl.cache.CacheImpl`, users are only cached while they
+        have a cached member, messages are evicted oldest first and
+        `hikari.impl.config.CacheSettings.max_dm_channel_ids`, the eviction
+        settings and the live view and shared entity settings don't apply.
+
+    Parameters
+    ----------
+    app : hikari.traits.RESTAware
+        The object of the REST aware app this is bound to.
+    settings : hikari.impl.config.CacheSettings
+        The cache settings to use.
+    store : hikari.impl.cache_store.CacheStoreClient
+        The client for the store to keep the cache in.
+
+    Other Parameters
+    ----------------
+    prefix : builtins.str
+        The prefix for the keys of this cache in the store. Caches with the
+        same prefix share their state. Defaults to `hikari`.
+    """
+
+    __slots__: typing.Sequence[str] = ("_app", "_prefix", "_settings", "_store")
+
+    def __init__(
+        self,
+        app: traits.RESTAware,
+        settings: config_impl.CacheSettings,
+        store: cache_store.CacheStoreClient,
+        *,
+        prefix: str = "hikari",
+    ) -> None:
+        self._app = app
+        self._prefix = prefix
+        self._settings = settings
+        self._store = store
+
+    @property
+    def settings(self) -> config_impl.CacheSettings:
+        return self._settings
+
+    def flush(self) -> None:
+        """Wait for all the queued writes to be sent to the store.
+
+        This blocks, so should be run in an executor when called from the
+        event loop.
+        """
+        self._store.flush()
+
+    def _is_cache_enabled_for(self, required_flag: config_api.CacheComponents) -> bool:
+        return (self._settings.components & required_flag) == required_flag
+
+    def _key(self, *parts: typing.Union[str, int, bytes]) -> str:
+        return ":".join((self._prefix, *(part.decode() if isinstance(part, bytes) else str(part) for part in parts)))
+
+    def _dump(self, obj: typing.Any, /) -> bytes:
+        buffer = io.BytesIO()
+        _EntityPickler(buffer, self._app).dump(obj)
+        return buffer.getvalue()
+
+    def _load(self, data: bytes, /) -> typing.Any:
+        return _EntityUnpickler(io.BytesIO(data), self._app).load()
+
+    def _build(self, data: bytes, /) -> typing.Any:
+        return self._load(data).build_entity(self._app)
+
+    def _view(
+        self, entries: typing.Mapping[snowflakes.Snowflake, bytes], builder: typing.Callable[[bytes], ValueT], /
+    ) -> cache.CacheView[snowflakes.Snowflake, ValueT]:
+        if not entries:
+            return cache_utility.EmptyCacheView()
+
+        return cache_utility.CacheMappingView(entries, builder=builder)
+
+    # Entities with globally unique keys (such as roles) are kept in one hash, with a set of keys for each guild.
+
+    def _indexed_set_commands(
+        self, name: str, key: typing.Union[str, int], guild_id: typing.Optional[int], data: bytes, /
+    ) -> typing.List[_Command]:
+        commands: typing.List[_Command] = [("HSET", self._key(name), key, data)]
+        if guild_id is not None:
+            commands.append(("SADD", self._key(name, guild_id), key))
+            commands.append(("SADD", self._key(name, "guilds"), guild_id))
+
+        return commands
+
+    def _indexed_clear(self, name: str, /) -> _Entries:
+        guild_ids = self._store.execute("SMEMBERS", self._key(name, "guilds"))
+        keys = (self._key(name, guild_id) for guild_id in guild_ids)
+        entries, _ = self._store.execute_many(
+            (("HGETALL", self._key(name)), ("DEL", self._key(name), self._key(name, "guilds"), *keys))
+        )
+        return _as_dict(entries)
+
+    def _indexed_get_for_guild(self, name: str, guild_id: int, /) -> _Entries:
+        keys = self._store.execute("SMEMBERS", self._key(name, guild_id))
+        if not keys:
+            return {}
+
+        values = self._store.execute("HMGET", self._key(name), *keys)
+        return {key: value for key, value in zip(keys, values) if value is not None}
+
+    def _indexed_clear_for_guild(self, name: str, guild_id: int, /) -> _Entries:
+        keys = self._store.execute("SMEMBERS", self._key(name, guild_id))
+        if not keys:
+            return {}
+
+        values, *_ = self._store.execute_many(
+            (
+                ("HMGET", self._key(name), *keys),
+                ("HDEL", self._key(name), *keys),
+                ("DEL", self._key(name, guild_id)),
+                ("SREM", self._key(name, "guilds"), guild_id),
+            )
+        )
+        return {key: value for key, value in zip(keys, values) if value is not None}
+
+    def _indexed_delete(self, name: str, key: typing.Union[str, int], /) -> typing.Optional[bytes]:
+        data, _ = self._store.execute_many((("HGET", self._key(name), key), ("HDEL", self._key(name), key)))
+        return data
+
+    def _unindex(self, name: str, key: typing.Union[str, int], guild_id: typing.Optional[int], /) -> None:
+        if guild_id is not None:
+            self._store.execute("SREM", self._key(name, guild_id), key)
+
+    # Entities which are only unique within a guild (such as members) are kept in a hash for each guild.
+
+    def _guild_hash_get_all(self, name: str, /) -> typing.Dict[snowflakes.Snowflake, _Entries]:
+        guild_ids = self._store.execute("SMEMBERS", self._key(name, "guilds"))
+        replies = self._store.execute_many([("HGETALL", self._key(name, guild_id)) for guild_id in guild_ids])
+        results = {snowflakes.Snowflake(int(guild_id)): _as_dict(reply) for guild_id, reply in zip(guild_ids, replies)}
+        return {guild_id: entries for guild_id, entries in results.items() if entries}
+
+    def _guild_hash_clear(self, name: str, guild_id: int, /) -> _Entries:
+        entries, *_ = self._store.execute_many(
+            (
+                ("HGETALL", self._key(name, guild_id)),
+                ("DEL", self._key(name, guild_id)),
+                ("SREM", self._key(name, "guilds"), guild_id),
+            )
+        )
+        return _as_dict(entries)
+
+    def _guild_hash_delete(self, name: str, guild_id: int, key: int, /) -> typing.Optional[bytes]:
+        data, _ = self._store.execute_many(
+            (("HGET", self._key(name, guild_id), key), ("HDEL", self._key(name, guild_id), key))
+        )
+        return data
+
+    def clear(self) -> None:
+        if self._settings.components == config_api.CacheComponents.NONE:
+            return None
+
+        names = ("channels", "emojis", "invites", "members", "presences", "roles", "voice_states")
+        replies = self._store.execute_many([("SMEMBERS", self._key(name, "guilds")) for name in names])
+        keys = [self._key(name, guild_id) for name, guild_ids in zip(names, replies) for guild_id in guild_ids]
+        keys.extend(self._key(name, "guilds") for name in names)
+        keys.extend(
+            self._key(name)
+            for name in (
+                "channels",
+                "dm_channels",
+                "emojis",
+                "guilds",
+                "invites",
+                "me",
+                "messages",
+                "roles",
+                "user_refs",
+                "users",
+            )
+        )
+        self._store.execute("DEL", *keys)
+
+    def clear_dm_channel_ids(self) -> cache.CacheView[snowflakes.Snowflake, snowflakes.Snowflake]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.DM_CHANNEL_IDS):
+            return cache_utility.EmptyCacheView()
+
+        entries, _ = self._store.execute_many(
+            (("HGETALL", self._key("dm_channels")), ("DEL", self._key("dm_channels")))
+        )
+        return self._view(_snowflake_keys(_as_dict(entries)), _load_snowflake)
+
+    def delete_dm_channel_id(
+        self, user: snowflakes.SnowflakeishOr[users.PartialUser], /
+    ) -> typing.Optional[snowflakes.Snowflake]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.DM_CHANNEL_IDS):
+            return None
+
+        channel_id = self._indexed_delete("dm_channels", int(user))
+        return _load_snowflake(channel_id) if channel_id is not None else None
+
+    def get_dm_channel_id(
+        self, user: snowflakes.SnowflakeishOr[users.PartialUser], /
+    ) -> typing.Optional[snowflakes.Snowflake]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.DM_CHANNEL_IDS):
+            return None
+
+        channel_id = self._store.execute("HGET", self._key("dm_channels"), int(user))
+        return _load_snowflake(channel_id) if channel_id is not None else None
+
+    def get_dm_channel_ids_view(self) -> cache.CacheView[snowflakes.Snowflake, snowflakes.Snowflake]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.DM_CHANNEL_IDS):
+            return cache_utility.EmptyCacheView()
+
+        entries = _as_dict(self._store.execute("HGETALL", self._key("dm_channels")))
+        return self._view(_snowflake_keys(entries), _load_snowflake)
+
+    def set_dm_channel_id(
+        self,
+        user: snowflakes.SnowflakeishOr[users.PartialUser],
+        channel: snowflakes.SnowflakeishOr[channels.PartialChannel],
+        /,
+    ) -> None:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.DM_CHANNEL_IDS):
+            return None
+
+        self._store.submit((("HSET", self._key("dm_channels"), int(user), int(channel)),))
+
+    def clear_emojis(self) -> cache.CacheView[snowflakes.Snowflake, emojis.KnownCustomEmoji]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.EMOJIS):
+            return cache_utility.EmptyCacheView()
+
+        return self._view(_snowflake_keys(self._indexed_clear("emojis")), self._build)
+
+    def clear_emojis_for_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> cache.CacheView[snowflakes.Snowflake, emojis.KnownCustomEmoji]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.EMOJIS):
+            return cache_utility.EmptyCacheView()
+
+        return self._view(_snowflake_keys(self._indexed_clear_for_guild("emojis", int(guild))), self._build)
+
+    def delete_emoji(
+        self, emoji: snowflakes.SnowflakeishOr[emojis.CustomEmoji], /
+    ) -> typing.Optional[emojis.KnownCustomEmoji]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.EMOJIS):
+            return None
+
+        data = self._indexed_delete("emojis", int(emoji))
+        if data is None:
+            return None
+
+        emoji_data: cache_utility.KnownCustomEmojiData = self._load(data)
+        self._unindex("emojis", emoji_data.id, emoji_data.guild_id)
+        return emoji_data.build_entity(self._app)
+
+    def get_emoji(
+        self, emoji: snowflakes.SnowflakeishOr[emojis.CustomEmoji], /
+    ) -> typing.Optional[emojis.KnownCustomEmoji]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.EMOJIS):
+            return None
+
+        data = self._store.execute("HGET", self._key("emojis"), int(emoji))
+        return self._build(data) if data is not None else None
+
+    def get_emojis_view(self) -> cache.CacheView[snowflakes.Snowflake, emojis.KnownCustomEmoji]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.EMOJIS):
+            return cache_utility.EmptyCacheView()
+
+        entries = _as_dict(self._store.execute("HGETALL", self._key("emojis")))
+        return self._view(_snowflake_keys(entries), self._build)
+
+    def get_emojis_view_for_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> cache.CacheView[snowflakes.Snowflake, emojis.KnownCustomEmoji]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.EMOJIS):
+            return cache_utility.EmptyCacheView()
+
+        return self._view(_snowflake_keys(self._indexed_get_for_guild("emojis", int(guild))), self._build)
+
+    def set_emoji(self, emoji: emojis.KnownCustomEmoji, /) -> None:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.EMOJIS):
+            return None
+
+        data = self._dump(cache_utility.KnownCustomEmojiData.build_from_entity(emoji))
+        self._store.submit(self._indexed_set_commands("emojis", emoji.id, emoji.guild_id, data))
+
+    def update_emoji(
+        self, emoji: emojis.KnownCustomEmoji, /
+    ) -> typing.Tuple[typing.Optional[emojis.KnownCustomEmoji], typing.Optional[emojis.KnownCustomEmoji]]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.EMOJIS):
+            return None, None
+
+        data = self._dump(cache_utility.KnownCustomEmojiData.build_from_entity(emoji))
+        old, *_ = self._store.execute_many(
+            (("HGET", self._key("emojis"), emoji.id), *self._indexed_set_commands("emojis", emoji.id, emoji.guild_id, data))
+        )
+        return self._build(old) if old is not None else None, self._build(data)
+
+    def _dump_guild(self, guild: guilds.GatewayGuild, is_available: bool, /) -> bytes:
+        return (_AVAILABLE if is_available else _UNAVAILABLE) + self._dump(guild)
+
+    def _load_guild(self, data: bytes, /) -> guilds.GatewayGuild:
+        guild: guilds.GatewayGuild = self._load(data[1:])
+        return guild
+
+    def _get_guilds_view(
+        self, *, availability: typing.Optional[bool] = None
+    ) -> cache.CacheView[snowflakes.Snowflake, guilds.GatewayGuild]:
+        entries = _as_dict(self._store.execute("HGETALL", self._key("guilds")))
+        if availability is not None:
+            flag = _AVAILABLE if availability else _UNAVAILABLE
+            entries = {guild_id: data for guild_id, data in entries.items() if data[:1] == flag}
+
+        return self._view(_snowflake_keys(entries), self._load_guild)
+
+    def clear_guilds(self) -> cache.CacheView[snowflakes.Snowflake, guilds.GatewayGuild]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.GUILDS):
+            return cache_utility.EmptyCacheView()
+
+        entries, _ = self._store.execute_many((("HGETALL", self._key("guilds")), ("DEL", self._key("guilds"))))
+        return self._view(_snowflake_keys(_as_dict(entries)), self._load_guild)
+
+    def delete_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> typing.Optional[guilds.GatewayGuild]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.GUILDS):
+            return None
+
+        data = self._indexed_delete("guilds", int(guild))
+        return self._load_guild(data) if data is not None else None
+
+    def _get_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /, *, availability: typing.Optional[bool] = None
+    ) -> typing.Optional[guilds.GatewayGuild]:
+        data = self._store.execute("HGET", self._key("guilds"), int(guild))
+        if data is None or (availability is not None and data[:1] != (_AVAILABLE if availability else _UNAVAILABLE)):
+            return None
+
+        return self._load_guild(data)
+
+    def get_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> typing.Optional[guilds.GatewayGuild]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.GUILDS):
+            return None
+
+        return self._get_guild(guild)
+
+    def get_available_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> typing.Optional[guilds.GatewayGuild]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.GUILDS):
+            return None
+
+        return self._get_guild(guild, availability=True)
+
+    def get_unavailable_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> typing.Optional[guilds.GatewayGuild]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.GUILDS):
+            return None
+
+        return self._get_guild(guild, availability=False)
+
+    def get_guilds_view(self) -> cache.CacheView[snowflakes.Snowflake, guilds.GatewayGuild]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.GUILDS):
+            return cache_utility.EmptyCacheView()
+
+        return self._get_guilds_view()
+
+    def get_available_guilds_view(self) -> cache.CacheView[snowflakes.Snowflake, guilds.GatewayGuild]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.GUILDS):
+            return cache_utility.EmptyCacheView()
+
+        return self._get_guilds_view(availability=True)
+
+    def get_unavailable_guilds_view(self) -> cache.CacheView[snowflakes.Snowflake, guilds.GatewayGuild]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.GUILDS):
+            return cache_utility.EmptyCacheView()
+
+        return self._get_guilds_view(availability=False)
+
+    def set_guild(self, guild: guilds.GatewayGuild, /) -> None:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.GUILDS):
+            return None
+
+        self._store.submit((("HSET", self._key("guilds"), guild.id, self._dump_guild(guild, True)),))
+
+    def set_guild_availability(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], is_available: bool, /
+    ) -> None:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.GUILDS):
+            return None
+
+        data = self._store.execute("HGET", self._key("guilds"), int(guild))
+        if data is not None:
+            flag = _AVAILABLE if is_available else _UNAVAILABLE
+            self._store.submit((("HSET", self._key("guilds"), int(guild), flag + data[1:]),))
+
+    def update_guild(
+        self, guild: guilds.GatewayGuild, /
+    ) -> typing.Tuple[typing.Optional[guilds.GatewayGuild], typing.Optional[guilds.GatewayGuild]]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.GUILDS):
+            return None, None
+
+        guild = copy.copy(guild)
+        cached_guild = self._get_guild(guild.id)
+
+        # We have to manually update these because Inconsistency is Discord's middle name.
+        if cached_guild:
+            guild.member_count = cached_guild.member_count
+            guild.joined_at = cached_guild.joined_at
+            guild.is_large = cached_guild.is_large
+
+        self._store.submit((("HSET", self._key("guilds"), guild.id, self._dump_guild(guild, True)),))
+        return cached_guild, copy.copy(guild)
+
+    def clear_guild_channels(self) -> cache.CacheView[snowflakes.Snowflake, channels.GuildChannel]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.GUILD_CHANNELS):
+            return cache_utility.EmptyCacheView()
+
+        return self._view(_snowflake_keys(self._indexed_clear("channels")), self._load)
+
+    def clear_guild_channels_for_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> cache.CacheView[snowflakes.Snowflake, channels.GuildChannel]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.GUILD_CHANNELS):
+            return cache_utility.EmptyCacheView()
+
+        return self._view(_snowflake_keys(self._indexed_clear_for_guild("channels", int(guild))), self._load)
+
+    def delete_guild_channel(
+        self, channel: snowflakes.SnowflakeishOr[channels.PartialChannel], /
+    ) -> typing.Optional[channels.GuildChannel]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.GUILD_CHANNELS):
+            return None
+
+        data = self._indexed_delete("channels", int(channel))
+        if data is None:
+            return None
+
+        cached_channel: channels.GuildChannel = self._load(data)
+        self._unindex("channels", cached_channel.id, cached_channel.guild_id)
+        return cached_channel
+
+    def get_guild_channel(
+        self, channel: snowflakes.SnowflakeishOr[channels.PartialChannel], /
+    ) -> typing.Optional[channels.GuildChannel]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.GUILD_CHANNELS):
+            return None
+
+        data = self._store.execute("HGET", self._key("channels"), int(channel))
+        return self._load(data) if data is not None else None
+
+    def get_guild_channels_view(self) -> cache.CacheView[snowflakes.Snowflake, channels.GuildChannel]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.GUILD_CHANNELS):
+            return cache_utility.EmptyCacheView()
+
+        entries = _as_dict(self._store.execute("HGETALL", self._key("channels")))
+        return self._view(_snowflake_keys(entries), self._load)
+
+    def get_guild_channels_view_for_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> cache.CacheView[snowflakes.Snowflake, channels.GuildChannel]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.GUILD_CHANNELS):
+            return cache_utility.EmptyCacheView()
+
+        entries = self._indexed_get_for_guild("channels", int(guild))
+        if not entries:
+            return cache_utility.EmptyCacheView()
+
+        # The channels have to be loaded to be sorted, so they're copied out of the view like CacheImpl's.
+        cached_channels: typing.Dict[snowflakes.Snowflake, channels.GuildChannel] = {
+            snowflakes.Snowflake(int(channel_id)): self._load(data) for channel_id, data in entries.items()
+        }
+        return cache_utility.CacheMappingView(
+            cache_utility.sort_guild_channels(cached_channels),
+            builder=cache_utility.copy_guild_channel,  # type: ignore[type-var]
+        )
+
+    def set_guild_channel(self, channel: channels.GuildChannel, /) -> None:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.GUILD_CHANNELS):
+            return None
+
+        data = self._dump(channel)
+        self._store.submit(self._indexed_set_commands("channels", channel.id, channel.guild_id, data))
+
+    def update_guild_channel(
+        self, channel: channels.GuildChannel, /
+    ) -> typing.Tuple[typing.Optional[channels.GuildChannel], typing.Optional[channels.GuildChannel]]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.GUILD_CHANNELS):
+            return None, None
+
+        data = self._dump(channel)
+        old, *_ = self._store.execute_many(
+            (
+                ("HGET", self._key("channels"), channel.id),
+                *self._indexed_set_commands("channels", channel.id, channel.guild_id, data),
+            )
+        )
+        return self._load(old) if old is not None else None, self._load(data)
+
+    def _invite_view(self, entries: _Entries, /) -> cache.CacheView[str, invites.InviteWithMetadata]:
+        if not entries:
+            return cache_utility.EmptyCacheView()
+
+        return cache_utility.CacheMappingView({code.decode(): data for code, data in entries.items()}, builder=self._build)
+
+    def clear_invites(self) -> cache.CacheView[str, invites.InviteWithMetadata]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.INVITES):
+            return cache_utility.EmptyCacheView()
+
+        return self._invite_view(self._indexed_clear("invites"))
+
+    def clear_invites_for_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> cache.CacheView[str, invites.InviteWithMetadata]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.INVITES):
+            return cache_utility.EmptyCacheView()
+
+        return self._invite_view(self._indexed_clear_for_guild("invites", int(guild)))
+
+    def clear_invites_for_channel(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        channel: snowflakes.SnowflakeishOr[channels.PartialChannel],
+        /,
+    ) -> cache.CacheView[str, invites.InviteWithMetadata]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.INVITES):
+            return cache_utility.EmptyCacheView()
+
+        guild_id = int(guild)
+        channel_id = int(channel)
+        entries = {
+            code: data
+            for code, data in self._indexed_get_for_guild("invites", guild_id).items()
+            if self._load(data).channel_id == channel_id
+        }
+        if entries:
+            self._store.submit(
+                (("HDEL", self._key("invites"), *entries), ("SREM", self._key("invites", guild_id), *entries))
+            )
+
+        return self._invite_view(entries)
+
+    def delete_invite(
+        self, code: typing.Union[invites.InviteCode, str], /
+    ) -> typing.Optional[invites.InviteWithMetadata]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.INVITES):
+            return None
+
+        code = code if isinstance(code, str) else code.code
+        data = self._indexed_delete("invites", code)
+        if data is None:
+            return None
+
+        invite_data: cache_utility.InviteData = self._load(data)
+        self._unindex("invites", code, invite_data.guild_id)
+        return invite_data.build_entity(self._app)
+
+    def get_invite(self, code: typing.Union[invites.InviteCode, str], /) -> typing.Optional[invites.InviteWithMetadata]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.INVITES):
+            return None
+
+        code = code if isinstance(code, str) else code.code
+        data = self._store.execute("HGET", self._key("invites"), code)
+        return self._build(data) if data is not None else None
+
+    def get_invites_view(self) -> cache.CacheView[str, invites.InviteWithMetadata]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.INVITES):
+            return cache_utility.EmptyCacheView()
+
+        return self._invite_view(_as_dict(self._store.execute("HGETALL", self._key("invites"))))
+
+    def get_invites_view_for_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> cache.CacheView[str, invites.InviteWithMetadata]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.INVITES):
+            return cache_utility.EmptyCacheView()
+
+        return self._invite_view(self._indexed_get_for_guild("invites", int(guild)))
+
+    def get_invites_view_for_channel(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        channel: snowflakes.SnowflakeishOr[channels.PartialChannel],
+        /,
+    ) -> cache.CacheView[str, invites.InviteWithMetadata]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.INVITES):
+            return cache_utility.EmptyCacheView()
+
+        channel_id = int(channel)
+        entries = self._indexed_get_for_guild("invites", int(guild))
+        return self._invite_view(
+            {code: data for code, data in entries.items() if self._load(data).channel_id == channel_id}
+        )
+
+    def set_invite(self, invite: invites.InviteWithMetadata, /) -> None:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.INVITES):
+            return None
+
+        data = self._dump(cache_utility.InviteData.build_from_entity(invite))
+        self._store.submit(self._indexed_set_commands("invites", invite.code, invite.guild_id, data))
+
+    def update_invite(
+        self, invite: invites.InviteWithMetadata, /
+    ) -> typing.Tuple[typing.Optional[invites.InviteWithMetadata], typing.Optional[invites.InviteWithMetadata]]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.INVITES):
+            return None, None
+
+        data = self._dump(cache_utility.InviteData.build_from_entity(invite))
+        old, *_ = self._store.execute_many(
+            (
+                ("HGET", self._key("invites"), invite.code),
+                *self._indexed_set_commands("invites", invite.code, invite.guild_id, data),
+            )
+        )
+        return self._build(old) if old is not None else None, self._build(data)
+
+    def delete_me(self) -> typing.Optional[users.OwnUser]:
+        data = self._indexed_delete("me", "user")
+        return self._load(data) if data is not None else None
+
+    def get_me(self) -> typing.Optional[users.OwnUser]:
+        data = self._store.execute("HGET", self._key("me"), "user")
+        return self._load(data) if data is not None else None
+
+    def set_me(self, user: users.OwnUser, /) -> None:
+        if self._is_cache_enabled_for(config_api.CacheComponents.ME):
+            self._store.submit((("HSET", self._key("me"), "user", self._dump(user)),))
+
+    def update_me(
+        self, user: users.OwnUser, /
+    ) -> typing.Tuple[typing.Optional[users.OwnUser], typing.Optional[users.OwnUser]]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.ME):
+            return None, None
+
+        data = self._dump(user)
+        old, _ = self._store.execute_many(
+            (("HGET", self._key("me"), "user"), ("HSET", self._key("me"), "user", data))
+        )
+        return self._load(old) if old is not None else None, self._load(data)
+
+    def _dump_member(self, member: guilds.Member, /) -> bytes:
+        return self._dump(cache_utility.MemberData.build_from_entity(member, user=_DETACHED_USER))
+
+    def _build_member(self, entry: typing.Tuple[bytes, bytes], /) -> guilds.Member:
+        data, user = entry
+        member_data: cache_utility.MemberData = self._load(data)
+        member_data.user = cache_utility.RefCell(self._load(user))
+        return member_data.build_entity(self._app)
+
+    def _member_view(
+        self, entries: _Entries, users_entries: typing.Sequence[typing.Optional[bytes]], /
+    ) -> cache.CacheView[snowflakes.Snowflake, guilds.Member]:
+        pairs: typing.Dict[snowflakes.Snowflake, typing.Tuple[bytes, bytes]] = {}
+        for (user_id, data), user in zip(entries.items(), users_entries):
+            # Users are only removed once none of their members are cached, so this means the store is corrupt.
+            if user is None:
+                raise errors.CacheStoreError(f"The user of cached member {user_id.decode()} is missing from the store")
+
+            pairs[snowflakes.Snowflake(int(user_id))] = (data, user)
+
+        return self._view(pairs, self._build_member)
+
+    def _get_member_entries(
+        self, guild_ids: typing.Sequence[bytes], /
+    ) -> typing.Tuple[typing.List[_Entries], typing.Dict[bytes, typing.Optional[bytes]]]:
+        if not guild_ids:
+            return [], {}
+
+        # The members are watched while their users are fetched, so that a user can't be removed in between.
+        keys = [self._key("members", guild_id) for guild_id in guild_ids]
+        guild_entries: typing.List[_Entries] = []
+        user_ids: typing.List[bytes] = []
+
+        def build(replies: typing.List[typing.Any]) -> typing.List[_Command]:
+            guild_entries[:] = [_as_dict(reply) for reply in replies]
+            user_ids[:] = {user_id: None for entries in guild_entries for user_id in entries}
+            return [("HMGET", self._key("users"), *user_ids)] if user_ids else []
+
+        replies = self._store.transaction(keys, [("HGETALL", key) for key in keys], build)
+        return guild_entries, dict(zip(user_ids, replies[0])) if replies else {}
+
+    def _release_users(self, user_ids: typing.Sequence[bytes], /) -> None:
+        # Users are shared between guilds, so they're only removed once they don't have any cached members left.
+        # This is done in a transaction so that a concurrent change can't leave unused users behind or remove
+        # users which are still referenced.
+        refs_key = self._key("user_refs")
+
+        def build(replies: typing.List[typing.Any]) -> typing.List[_Command]:
+            commands: typing.List[_Command] = []
+            unused: typing.List[bytes] = []
+            for user_id, ref_count in zip(user_ids, replies[0]):
+                if ref_count is None or int(ref_count) <= 1:
+                    unused.append(user_id)
+                else:
+                    commands.append(("HINCRBY", refs_key, user_id, -1))
+
+            if unused:
+                commands.append(("HDEL", self._key("users"), *unused))
+                commands.append(("HDEL", refs_key, *unused))
+
+            return commands
+
+        self._store.transaction((refs_key,), (("HMGET", refs_key, *user_ids),), build)
+
+    def clear_members(
+        self,
+    ) -> cache.CacheView[snowflakes.Snowflake, cache.CacheView[snowflakes.Snowflake, guilds.Member]]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.MEMBERS):
+            return cache_utility.EmptyCacheView()
+
+        guild_ids = self._store.execute("SMEMBERS", self._key("members", "guilds"))
+        views = ((snowflakes.Snowflake(int(guild_id)), self.clear_members_for_guild(int(guild_id))) for guild_id in guild_ids)
+        return cache_utility.CacheMappingView({guild_id: view for guild_id, view in views if view})
+
+    def clear_members_for_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> cache.CacheView[snowflakes.Snowflake, guilds.Member]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.MEMBERS):
+            return cache_utility.EmptyCacheView()
+
+        entries = self._guild_hash_clear("members", int(guild))
+        if not entries:
+            return cache_utility.EmptyCacheView()
+
+        users_entries = self._store.execute("HMGET", self._key("users"), *entries)
+        self._release_users(list(entries))
+        return self._member_view(entries, users_entries)
+
+    def delete_member(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        user: snowflakes.SnowflakeishOr[users.PartialUser],
+        /,
+    ) -> typing.Optional[guilds.Member]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.MEMBERS):
+            return None
+
+        user_id = int(user)
+        data, user_data, removed = self._store.execute_many(
+            (
+                ("HGET", self._key("members", int(guild)), user_id),
+                ("HGET", self._key("users"), user_id),
+                ("HDEL", self._key("members", int(guild)), user_id),
+            )
+        )
+        if not removed:
+            return None
+
+        self._release_users((b"%d" % user_id,))
+        return self._build_member((data, user_data)) if user_data is not None else None
+
+    def get_member(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        user: snowflakes.SnowflakeishOr[users.PartialUser],
+        /,
+    ) -> typing.Optional[guilds.Member]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.MEMBERS):
+            return None
+
+        user_id = int(user)
+        data, user_data = self._store.execute_many(
+            (("HGET", self._key("members", int(guild)), user_id), ("HGET", self._key("users"), user_id))
+        )
+        return self._build_member((data, user_data)) if data is not None and user_data is not None else None
+
+    def get_members_view(
+        self,
+    ) -> cache.CacheView[snowflakes.Snowflake, cache.CacheView[snowflakes.Snowflake, guilds.Member]]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.MEMBERS):
+            return cache_utility.EmptyCacheView()
+
+        guild_ids = self._store.execute("SMEMBERS", self._key("members", "guilds"))
+        guild_entries, users_entries = self._get_member_entries(guild_ids)
+        if not users_entries:
+            return cache_utility.EmptyCacheView()
+
+        views = {
+            snowflakes.Snowflake(int(guild_id)): self._member_view(
+                entries, [users_entries[user_id] for user_id in entries]
+            )
+            for guild_id, entries in zip(guild_ids, guild_entries)
+            if entries
+        }
+        return cache_utility.Cache3DMappingView(views)
+
+    def get_members_view_for_guild(
+        self, guild_id: snowflakes.Snowflakeish, /
+    ) -> cache.CacheView[snowflakes.Snowflake, guilds.Member]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.MEMBERS):
+            return cache_utility.EmptyCacheView()
+
+        (entries,), users_entries = self._get_member_entries((b"%d" % int(guild_id),))
+        if not entries:
+            return cache_utility.EmptyCacheView()
+
+        return self._member_view(entries, [users_entries[user_id] for user_id in entries])
+
+    def _set_members_commands(
+        self, members: typing.Sequence[guilds.Member], is_new: typing.Sequence[bool], /
+    ) -> typing.List[_Command]:
+        commands: typing.List[_Command] = []
+        for member, new in zip(members, is_new):
+            commands.append(("HSET", self._key("members", member.guild_id), member.id, self._dump_member(member)))
+            commands.append(("HSET", self._key("users"), member.id, self._dump(member.user)))
+            if new:
+                commands.append(("HINCRBY", self._key("user_refs"), member.id, 1))
+
+        for guild_id in {member.guild_id for member in members}:
+            commands.append(("SADD", self._key("members", "guilds"), guild_id))
+
+        return commands
+
+    def set_member(self, member: guilds.Member, /) -> None:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.MEMBERS):
+            return None
+
+        self.set_members_bulk((member,))
+
+    def set_members_bulk(self, members: typing.Iterable[guilds.Member], /) -> None:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.MEMBERS):
+            return None
+
+        # Only the last of any duplicates is kept, as each new member adds a reference to its user.
+        members = list({(member.guild_id, member.id): member for member in members}.values())
+        if not members:
+            return None
+
+        # New members need their user's reference count incrementing, so the members are watched while which
+        # are new is checked to make sure another process can't add or remove them in between.
+        keys = list({self._key("members", member.guild_id): None for member in members})
+        self._store.submit_transaction(
+            keys,
+            [("HEXISTS", self._key("members", member.guild_id), member.id) for member in members],
+            lambda exists: self._set_members_commands(members, [not exist for exist in exists]),
+        )
+
+    def update_member(
+        self, member: guilds.Member, /
+    ) -> typing.Tuple[typing.Optional[guilds.Member], typing.Optional[guilds.Member]]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.MEMBERS):
+            return None, None
+
+        cached_member = self.get_member(member.guild_id, member.id)
+        self.set_members_bulk((member,))
+        return cached_member, self.get_member(member.guild_id, member.id)
+
+    def clear_presences(
+        self,
+    ) -> cache.CacheView[snowflakes.Snowflake, cache.CacheView[snowflakes.Snowflake, presences.MemberPresence]]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.PRESENCES):
+            return cache_utility.EmptyCacheView()
+
+        guild_ids = self._store.execute("SMEMBERS", self._key("presences", "guilds"))
+        views = (
+            (snowflakes.Snowflake(int(guild_id)), self.clear_presences_for_guild(int(guild_id))) for guild_id in guild_ids
+        )
+        return cache_utility.CacheMappingView({guild_id: view for guild_id, view in views if view})
+
+    def clear_presences_for_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> cache.CacheView[snowflakes.Snowflake, presences.MemberPresence]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.PRESENCES):
+            return cache_utility.EmptyCacheView()
+
+        return self._view(_snowflake_keys(self._guild_hash_clear("presences", int(guild))), self._build)
+
+    def delete_presence(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        user: snowflakes.SnowflakeishOr[users.PartialUser],
+        /,
+    ) -> typing.Optional[presences.MemberPresence]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.PRESENCES):
+            return None
+
+        data = self._guild_hash_delete("presences", int(guild), int(user))
+        return self._build(data) if data is not None else None
+
+    def get_presence(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        user: snowflakes.SnowflakeishOr[users.PartialUser],
+        /,
+    ) -> typing.Optional[presences.MemberPresence]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.PRESENCES):
+            return None
+
+        data = self._store.execute("HGET", self._key("presences", int(guild)), int(user))
+        return self._build(data) if data is not None else None
+
+    def get_presences_view(
+        self,
+    ) -> cache.CacheView[snowflakes.Snowflake, cache.CacheView[snowflakes.Snowflake, presences.MemberPresence]]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.PRESENCES):
+            return cache_utility.EmptyCacheView()
+
+        views = {
+            guild_id: self._view(_snowflake_keys(entries), self._build)
+            for guild_id, entries in self._guild_hash_get_all("presences").items()
+        }
+        return cache_utility.Cache3DMappingView(views)
+
+    def get_presences_view_for_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> cache.CacheView[snowflakes.Snowflake, presences.MemberPresence]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.PRESENCES):
+            return cache_utility.EmptyCacheView()
+
+        entries = _as_dict(self._store.execute("HGETALL", self._key("presences", int(guild))))
+        return self._view(_snowflake_keys(entries), self._build)
+
+    def _set_presences_commands(self, presences: typing.Iterable[presences.MemberPresence], /) -> typing.List[_Command]:
+        commands: typing.List[_Command] = []
+        guild_ids: typing.Set[snowflakes.Snowflake] = set()
+        for presence in presences:
+            data = self._dump(cache_utility.MemberPresenceData.build_from_entity(presence))
+            commands.append(("HSET", self._key("presences", presence.guild_id), presence.user_id, data))
+            guild_ids.add(presence.guild_id)
+
+        for guild_id in guild_ids:
+            commands.append(("SADD", self._key("presences", "guilds"), guild_id))
+
+        return commands
+
+    def set_presence(self, presence: presences.MemberPresence, /) -> None:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.PRESENCES):
+            return None
+
+        self._store.submit(self._set_presences_commands((presence,)))
+
+    def set_presences_bulk(self, presences: typing.Iterable[presences.MemberPresence], /) -> None:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.PRESENCES):
+            return None
+
+        self._store.submit(self._set_presences_commands(presences))
+
+    def update_presence(
+        self, presence: presences.MemberPresence, /
+    ) -> typing.Tuple[typing.Optional[presences.MemberPresence], typing.Optional[presences.MemberPresence]]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.PRESENCES):
+            return None, None
+
+        data = self._dump(cache_utility.MemberPresenceData.build_from_entity(presence))
+        old, *_ = self._store.execute_many(
+            (
+                ("HGET", self._key("presences", presence.guild_id), presence.user_id),
+                ("HSET", self._key("presences", presence.guild_id), presence.user_id, data),
+                ("SADD", self._key("presences", "guilds"), presence.guild_id),
+            )
+        )
+        return self._build(old) if old is not None else None, self._build(data)
+
+    def clear_roles(self) -> cache.CacheView[snowflakes.Snowflake, guilds.Role]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.ROLES):
+            return cache_utility.EmptyCacheView()
+
+        return self._view(_snowflake_keys(self._indexed_clear("roles")), self._load)
+
+    def clear_roles_for_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> cache.CacheView[snowflakes.Snowflake, guilds.Role]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.ROLES):
+            return cache_utility.EmptyCacheView()
+
+        return self._view(_snowflake_keys(self._indexed_clear_for_guild("roles", int(guild))), self._load)
+
+    def delete_role(self, role: snowflakes.SnowflakeishOr[guilds.PartialRole], /) -> typing.Optional[guilds.Role]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.ROLES):
+            return None
+
+        data = self._indexed_delete("roles", int(role))
+        if data is None:
+            return None
+
+        cached_role: guilds.Role = self._load(data)
+        self._unindex("roles", cached_role.id, cached_role.guild_id)
+        return cached_role
+
+    def get_role(self, role: snowflakes.SnowflakeishOr[guilds.PartialRole], /) -> typing.Optional[guilds.Role]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.ROLES):
+            return None
+
+        data = self._store.execute("HGET", self._key("roles"), int(role))
+        return self._load(data) if data is not None else None
+
+    def get_roles_view(self) -> cache.CacheView[snowflakes.Snowflake, guilds.Role]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.ROLES):
+            return cache_utility.EmptyCacheView()
+
+        entries = _as_dict(self._store.execute("HGETALL", self._key("roles")))
+        return self._view(_snowflake_keys(entries), self._load)
+
+    def get_roles_view_for_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> cache.CacheView[snowflakes.Snowflake, guilds.Role]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.ROLES):
+            return cache_utility.EmptyCacheView()
+
+        return self._view(_snowflake_keys(self._indexed_get_for_guild("roles", int(guild))), self._load)
+
+    def set_role(self, role: guilds.Role, /) -> None:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.ROLES):
+            return None
+
+        self._store.submit(self._indexed_set_commands("roles", role.id, role.guild_id, self._dump(role)))
+
+    def update_role(
+        self, role: guilds.Role, /
+    ) -> typing.Tuple[typing.Optional[guilds.Role], typing.Optional[guilds.Role]]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.ROLES):
+            return None, None
+
+        data = self._dump(role)
+        old, *_ = self._store.execute_many(
+            (("HGET", self._key("roles"), role.id), *self._indexed_set_commands("roles", role.id, role.guild_id, data))
+        )
+        return self._load(old) if old is not None else None, self._load(data)
+
+    def get_user(self, user: snowflakes.SnowflakeishOr[users.PartialUser], /) -> typing.Optional[users.User]:
+        data = self._store.execute("HGET", self._key("users"), int(user))
+        return self._load(data) if data is not None else None
+
+    def get_users_view(self) -> cache.CacheView[snowflakes.Snowflake, users.User]:
+        entries = _as_dict(self._store.execute("HGETALL", self._key("users")))
+        return self._view(_snowflake_keys(entries), self._load)
+
+    def clear_voice_states(
+        self,
+    ) -> cache.CacheView[snowflakes.Snowflake, cache.CacheView[snowflakes.Snowflake, voices.VoiceState]]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.VOICE_STATES):
+            return cache_utility.EmptyCacheView()
+
+        guild_ids = self._store.execute("SMEMBERS", self._key("voice_states", "guilds"))
+        views = (
+            (snowflakes.Snowflake(int(guild_id)), self.clear_voice_states_for_guild(int(guild_id)))
+            for guild_id in guild_ids
+        )
+        return cache_utility.CacheMappingView({guild_id: view for guild_id, view in views if view})
+
+    def _voice_states_in_channel(self, guild_id: int, channel_id: int, /) -> _Entries:
+        entries = _as_dict(self._store.execute("HGETALL", self._key("voice_states", guild_id)))
+        return {user_id: data for user_id, data in entries.items() if self._load(data).channel_id == channel_id}
+
+    def clear_voice_states_for_channel(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        channel: snowflakes.SnowflakeishOr[channels.PartialChannel],
+        /,
+    ) -> cache.CacheView[snowflakes.Snowflake, voices.VoiceState]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.VOICE_STATES):
+            return cache_utility.EmptyCacheView()
+
+        entries = self._voice_states_in_channel(int(guild), int(channel))
+        if entries:
+            self._store.execute("HDEL", self._key("voice_states", int(guild)), *entries)
+
+        return self._view(_snowflake_keys(entries), self._build)
+
+    def clear_voice_states_for_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> cache.CacheView[snowflakes.Snowflake, voices.VoiceState]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.VOICE_STATES):
+            return cache_utility.EmptyCacheView()
+
+        return self._view(_snowflake_keys(self._guild_hash_clear("voice_states", int(guild))), self._build)
+
+    def delete_voice_state(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        user: snowflakes.SnowflakeishOr[users.PartialUser],
+        /,
+    ) -> typing.Optional[voices.VoiceState]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.VOICE_STATES):
+            return None
+
+        data = self._guild_hash_delete("voice_states", int(guild), int(user))
+        return self._build(data) if data is not None else None
+
+    def get_voice_state(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        user: snowflakes.SnowflakeishOr[users.PartialUser],
+        /,
+    ) -> typing.Optional[voices.VoiceState]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.VOICE_STATES):
+            return None
+
+        data = self._store.execute("HGET", self._key("voice_states", int(guild)), int(user))
+        return self._build(data) if data is not None else None
+
+    def get_voice_states_view(
+        self,
+    ) -> cache.CacheView[snowflakes.Snowflake, cache.CacheView[snowflakes.Snowflake, voices.VoiceState]]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.VOICE_STATES):
+            return cache_utility.EmptyCacheView()
+
+        views = {
+            guild_id: self._view(_snowflake_keys(entries), self._build)
+            for guild_id, entries in self._guild_hash_get_all("voice_states").items()
+        }
+        return cache_utility.Cache3DMappingView(views)
+
+    def get_voice_states_view_for_channel(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        channel: snowflakes.SnowflakeishOr[channels.PartialChannel],
+        /,
+    ) -> cache.CacheView[snowflakes.Snowflake, voices.VoiceState]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.VOICE_STATES):
+            return cache_utility.EmptyCacheView()
+
+        return self._view(_snowflake_keys(self._voice_states_in_channel(int(guild), int(channel))), self._build)
+
+    def get_voice_states_view_for_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> cache.CacheView[snowflakes.Snowflake, voices.VoiceState]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.VOICE_STATES):
+            return cache_utility.EmptyCacheView()
+
+        entries = _as_dict(self._store.execute("HGETALL", self._key("voice_states", int(guild))))
+        return self._view(_snowflake_keys(entries), self._build)
+
+    def _set_voice_state_commands(self, voice_state: voices.VoiceState, data: bytes, /) -> typing.List[_Command]:
+        return [
+            ("HSET", self._key("voice_states", voice_state.guild_id), voice_state.user_id, data),
+            ("SADD", self._key("voice_states", "guilds"), voice_state.guild_id),
+        ]
+
+    def set_voice_state(self, voice_state: voices.VoiceState, /) -> None:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.VOICE_STATES):
+            return None
+
+        data = self._dump(cache_utility.VoiceStateData.build_from_entity(voice_state))
+        self._store.submit(self._set_voice_state_commands(voice_state, data))
+
+    def update_voice_state(
+        self, voice_state: voices.VoiceState, /
+    ) -> typing.Tuple[typing.Optional[voices.VoiceState], typing.Optional[voices.VoiceState]]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.VOICE_STATES):
+            return None, None
+
+        data = self._dump(cache_utility.VoiceStateData.build_from_entity(voice_state))
+        old, *_ = self._store.execute_many(
+            (
+                ("HGET", self._key("voice_states", voice_state.guild_id), voice_state.user_id),
+                *self._set_voice_state_commands(voice_state, data),
+            )
+        )
+        return self._build(old) if old is not None else None, self._build(data)
+
+    def clear_messages(self) -> cache.CacheView[snowflakes.Snowflake, messages.Message]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.MESSAGES):
+            return cache_utility.EmptyCacheView()
+
+        entries, _ = self._store.execute_many((("HGETALL", self._key("messages")), ("DEL", self._key("messages"))))
+        return self._view(_snowflake_keys(_as_dict(entries)), self._build)
+
+    def delete_message(
+        self, message: snowflakes.SnowflakeishOr[messages.PartialMessage], /
+    ) -> typing.Optional[messages.Message]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.MESSAGES):
+            return None
+
+        data = self._indexed_delete("messages", int(message))
+        return self._build(data) if data is not None else None
+
+    def get_message(
+        self, message: snowflakes.SnowflakeishOr[messages.PartialMessage], /
+    ) -> typing.Optional[messages.Message]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.MESSAGES):
+            return None
+
+        data = self._store.execute("HGET", self._key("messages"), int(message))
+        return self._build(data) if data is not None else None
+
+    def get_messages_view(self) -> cache.CacheView[snowflakes.Snowflake, messages.Message]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.MESSAGES):
+            return cache_utility.EmptyCacheView()
+
+        entries = _as_dict(self._store.execute("HGETALL", self._key("messages")))
+        return self._view(_snowflake_keys(entries), self._build)
+
+    def _store_message(self, message_id: snowflakes.Snowflake, data: bytes, /) -> None:
+        _, message_count = self._store.execute_many(
+            (("HSET", self._key("messages"), message_id, data), ("HLEN", self._key("messages")))
+        )
+        if message_count <= self._settings.max_messages:
+            return
+
+        # Message IDs increase over time, so the lowest IDs are the oldest messages.
+        message_ids = sorted(map(int, self._store.execute("HKEYS", self._key("messages"))))
+        self._store.execute("HDEL", self._key("messages"), *message_ids[: message_count - self._settings.max_messages])
+
+    def set_message(self, message: messages.Message, /) -> None:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.MESSAGES):
+            return None
+
+        self._store_message(message.id, self._dump(cache_utility.MessageData.build_from_entity(message)))
+
+    def update_message(
+        self, message: typing.Union[messages.PartialMessage, messages.Message], /
+    ) -> typing.Tuple[typing.Optional[messages.Message], typing.Optional[messages.Message]]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.MESSAGES):
+            return None, None
+
+        old = self._store.execute("HGET", self._key("messages"), message.id)
+        if isinstance(message, messages.Message):
+            message_data = cache_utility.MessageData.build_from_entity(message)
+
+        elif old is not None:
+            message_data = self._load(old)
+            mention_users: undefined.UndefinedOr[
+                typing.Mapping[snowflakes.Snowflake, cache_utility.RefCell[users.User]]
+            ] = undefined.UNDEFINED
+            if message.mentions.users is not undefined.UNDEFINED:
+                mention_users = {
+                    user_id: cache_utility.RefCell(copy.copy(user)) for user_id, user in message.mentions.users.items()
+                }
+
+            message_data.update(message, mention_users=mention_users)
+
+        else:
+            return None, None
+
+        data = self._dump(message_data)
+        self._store_message(message.id, data)
+        return self._build(old) if old is not None else None, self._build(data)
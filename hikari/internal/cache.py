@@ -26,8 +26,10 @@ from __future__ import annotations
 __all__: typing.Sequence[str] = (
     "CacheMappingView",
     "EmptyCacheView",
+    "LiveCacheMappingView",
     "GuildRecord",
     "BaseData",
+    "MemoisedData",
     "InviteData",
     "MemberData",
     "KnownCustomEmojiData",
@@ -40,19 +42,26 @@ __all__: typing.Sequence[str] = (
     "RefCell",
     "unwrap_ref_cell",
     "copy_guild_channel",
+    "sort_guild_channels",
     "Cache3DMappingView",
+    "ColumnarMemberStore",
+    "get_member_version",
     "DataT",
     "KeyT",
     "ValueT",
 )
 
 import abc
+import array
 import copy
 import datetime
+import operator
 import typing
+import weakref
 
 import attr
 
+from hikari import channels as channels_
 from hikari import embeds as embeds_
 from hikari import emojis
 from hikari import guilds
@@ -69,7 +78,6 @@ from hikari.internal import collections
 
 if typing.TYPE_CHECKING:
     from hikari import applications
-    from hikari import channels as channels_
     from hikari import stickers as stickers_
     from hikari import traits
     from hikari import users as users_
@@ -184,6 +192,116 @@ class EmptyCacheView(cache.CacheView[typing.Any, typing.Any]):
         return iterators.FlatLazyIterator(())
 
 
+def _is_same(left: typing.Sequence[typing.Any], right: typing.Sequence[typing.Any], /) -> bool:
+    # Identity is checked as entities compare equal by ID even when their other fields have changed.
+    return len(left) == len(right) and all(map(operator.is_, left, right))
+
+
+class LiveCacheMappingView(cache.CacheView[KeyT, ValueT]):
+    """A cache mapping view which reads from the underlying store as it's used.
+
+    Unlike `CacheMappingView`, the store isn't copied when the view is made,
+    so making a view is free and the view reflects changes made to the store
+    after it was made. Entities are built when they're first accessed and
+    are then reused until the store's entry for them changes.
+
+    !!! warning
+        As the store isn't copied, iterating over this view while the store
+        is being modified (for example across an `await`) may raise
+        `builtins.RuntimeError`. `LiveCacheMappingView.snapshot` should be
+        used to get a view which won't change.
+
+    Parameters
+    ----------
+    items : typing.Mapping[KeyT, DataT]
+        The store to read entries from.
+    builder : typing.Callable[[DataT], ValueT]
+        The callable used to build entities from the store's entries.
+    version : typing.Callable[[DataT], typing.Tuple[typing.Any, ...]]
+        The callable used to get the objects an entry's entity is built from.
+        A built entity is reused for as long as these are the same objects.
+
+    Other Parameters
+    ----------------
+    predicate : typing.Optional[typing.Callable[[DataT], builtins.bool]]
+        If provided, only the entries this returns `builtins.True` for are
+        included in the view.
+    """
+
+    __slots__: typing.Sequence[str] = ("_builder", "_built", "_data", "_predicate", "_version")
+
+    def __init__(
+        self,
+        items: typing.Mapping[KeyT, DataT],
+        *,
+        builder: typing.Callable[[DataT], ValueT],
+        version: typing.Callable[[DataT], typing.Tuple[typing.Any, ...]],
+        predicate: typing.Optional[typing.Callable[[DataT], bool]] = None,
+    ) -> None:
+        self._builder = builder
+        self._built: typing.Dict[KeyT, typing.Tuple[typing.Tuple[typing.Any, ...], ValueT]] = {}
+        self._data = items
+        self._predicate = predicate
+        self._version = version
+
+    def __contains__(self, key: typing.Any) -> bool:
+        if self._predicate is None:
+            return key in self._data
+
+        entry = self._data.get(key)
+        return entry is not None and self._predicate(entry)
+
+    def __getitem__(self, key: KeyT) -> ValueT:
+        entry = self._data[key]
+        if self._predicate is not None and not self._predicate(entry):
+            raise KeyError(key)
+
+        version = self._version(entry)
+        if (built := self._built.get(key)) is not None and _is_same(built[0], version):
+            return built[1]
+
+        value = self._builder(entry)
+        self._built[key] = (version, value)
+        return value
+
+    def __iter__(self) -> typing.Iterator[KeyT]:
+        if self._predicate is None:
+            return iter(self._data)
+
+        predicate = self._predicate
+        return (key for key, entry in self._data.items() if predicate(entry))
+
+    def __len__(self) -> int:
+        if self._predicate is None:
+            return len(self._data)
+
+        return sum(1 for _ in self)
+
+    @typing.overload
+    def get_item_at(self, index: int, /) -> ValueT:
+        ...
+
+    @typing.overload
+    def get_item_at(self, index: slice, /) -> typing.Sequence[ValueT]:
+        ...
+
+    def get_item_at(self, index: typing.Union[slice, int], /) -> typing.Union[ValueT, typing.Sequence[ValueT]]:
+        return collections.get_index_or_slice(self, index)
+
+    def iterator(self) -> iterators.LazyIterator[ValueT]:
+        return iterators.FlatLazyIterator(self.values())
+
+    def snapshot(self) -> cache.CacheView[KeyT, ValueT]:
+        if self._predicate is None:
+            entries = dict(self._data.items())
+
+        else:
+            predicate = self._predicate
+            entries = {key: entry for key, entry in self._data.items() if predicate(entry)}
+
+        return CacheMappingView(entries, builder=self._builder)
+
+
 @attr_extensions.with_copy
 @attr.define(repr=False, hash=False, weakref_slot=False)
 class GuildRecord:
@@ -326,6 +444,57 @@ class BaseData(abc.ABC, typing.Generic[ValueT]):
         """
 
 
+@attr.define(kw_only=True, repr=False, hash=False, weakref_slot=False)
+class MemoisedData(BaseData[ValueT], abc.ABC):
+    """A data class which keeps the last entity it built so it can be reused.
+
+    The built entity is reused until any of the objects returned by
+    `MemoisedData.build_dependencies` are replaced or the data object is
+    updated in place.
+    """
+
+    _built: typing.Optional[typing.Tuple[typing.Tuple[typing.Any, ...], ValueT]] = attr.field(
+        default=None, init=False, eq=False
+    )
+
+    def build_dependencies(self) -> typing.Tuple[typing.Any, ...]:
+        """Get the objects outside of this data object which its entity is built from.
+
+        These are compared by identity, so these objects must be replaced
+        rather than modified in place when they change.
+
+        Returns
+        -------
+        typing.Tuple[typing.Any, ...]
+            The objects the built entity depends on.
+        """
+        return ()
+
+    def build_shared_entity(self, app: traits.RESTAware, /) -> ValueT:
+        """Build an entity object from this data object, reusing the last one built if it's still current.
+
+        !!! warning
+            The returned entity may be shared with other callers, so must not
+            be modified.
+
+        Parameters
+        ----------
+        app : hikari.traits.RESTAware
+            The hikari application the built object should be bound to.
+
+        Returns
+        -------
+        The initialised entity object.
+        """
+        dependencies = self.build_dependencies()
+        if self._built is not None and _is_same(self._built[0], dependencies):
+            return self._built[1]
+
+        entity = self.build_entity(app)
+        self._built = (dependencies, entity)
+        return entity
+
+
 @attr_extensions.with_copy
 @attr.define(kw_only=True, repr=False, hash=False, weakref_slot=False)
 class InviteData(BaseData[invites.InviteWithMetadata]):
@@ -399,7 +568,7 @@ class InviteData(BaseData[invites.InviteWithMetadata]):
 
 @attr_extensions.with_copy
 @attr.define(kw_only=True, repr=False, hash=False, weakref_slot=False)
-class MemberData(BaseData[guilds.Member]):
+class MemberData(MemoisedData[guilds.Member]):
     """A data model for storing member data in an in-memory cache."""
 
     user: RefCell[users_.User] = attr.field()
@@ -435,6 +604,9 @@ class MemberData(BaseData[guilds.Member]):
             role_ids=tuple(member.role_ids),
         )
 
+    def build_dependencies(self) -> typing.Tuple[typing.Any, ...]:
+        return (self.user.object,)
+
     def build_entity(self, _: traits.RESTAware, /) -> guilds.Member:
         return guilds.Member(
             guild_id=self.guild_id,
@@ -594,7 +766,7 @@ class RichActivityData(BaseData[presences.RichActivity]):
 
 @attr_extensions.with_copy
 @attr.define(kw_only=True, repr=False, hash=False, weakref_slot=False)
-class MemberPresenceData(BaseData[presences.MemberPresence]):
+class MemberPresenceData(MemoisedData[presences.MemberPresence]):
     """A data model for storing presence data in an in-memory cache."""
 
     user_id: snowflakes.Snowflake = attr.field()
@@ -615,6 +787,10 @@ class MemberPresenceData(BaseData[presences.MemberPresence]):
             client_status=copy.copy(presence.client_status),
         )
 
+    def build_dependencies(self) -> typing.Tuple[typing.Any, ...]:
+        # The custom emojis in activities are shared between presences, so can change without the presence changing.
+        return tuple(activity.emoji.object for activity in self.activities if isinstance(activity.emoji, RefCell))
+
     def build_entity(self, app: traits.RESTAware, /) -> presences.MemberPresence:
         return presences.MemberPresence(
             user_id=self.user_id,
@@ -750,7 +926,7 @@ def _copy_embed(embed: embeds_.Embed) -> embeds_.Embed:
 
 @attr_extensions.with_copy
 @attr.define(kw_only=True, repr=False, hash=False, weakref_slot=False)
-class MessageData(BaseData[messages.Message]):
+class MessageData(MemoisedData[messages.Message]):
     """A model for storing message data in an in-memory cache."""
 
     id: snowflakes.Snowflake = attr.field()
@@ -833,6 +1009,23 @@ class MessageData(BaseData[messages.Message]):
             components=tuple(message.components),
         )
 
+    def build_dependencies(self) -> typing.Tuple[typing.Any, ...]:
+        dependencies: typing.List[typing.Any] = [self.author.object]
+        if self.member:
+            dependencies.extend(get_member_version(self.member))
+
+        if self.mentions.users is not undefined.UNDEFINED:
+            dependencies.extend(user.object for user in self.mentions.users.values())
+
+        if self.referenced_message:
+            dependencies.append(self.referenced_message.object)
+            dependencies.extend(self.referenced_message.object.build_dependencies())
+
+        if self.interaction:
+            dependencies.append(self.interaction.user.object)
+
+        return tuple(dependencies)
+
     def build_entity(self, app: traits.RESTAware, /) -> messages.Message:
         referenced_message: typing.Optional[messages.Message] = None
         if self.referenced_message:
@@ -879,6 +1072,7 @@ class MessageData(BaseData[messages.Message]):
             typing.Mapping[snowflakes.Snowflake, RefCell[users_.User]]
         ] = undefined.UNDEFINED,
     ) -> None:
+        self._built = None
         if message.content is not undefined.UNDEFINED:
             self.content = message.content
 
@@ -1004,6 +1198,298 @@ class RefCell(typing.Generic[ValueT]):
         return copy.copy(self.object)
 
 
+_EPOCH: typing.Final[datetime.datetime] = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_ONE_MICROSECOND: typing.Final[datetime.timedelta] = datetime.timedelta(microseconds=1)
+_NO_TIMESTAMP: typing.Final[int] = -(2**63)
+
+# Each of the member's tri-state (UNDEFINED, False or True) flags is packed into 2 bits.
+_DEAF_SHIFT: typing.Final[int] = 0
+_MUTE_SHIFT: typing.Final[int] = 2
+_PENDING_SHIFT: typing.Final[int] = 4
+_DELETED_FLAG: typing.Final[int] = 1 << 6
+_TRI_STATE_MASK: typing.Final[int] = 0b11
+
+
+def _pack_timestamp(value: typing.Optional[datetime.datetime], /) -> int:
+    if value is None:
+        return _NO_TIMESTAMP
+
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+
+    return (value - _EPOCH) // _ONE_MICROSECOND
+
+
+def _unpack_timestamp(value: int, /) -> typing.Optional[datetime.datetime]:
+    return None if value == _NO_TIMESTAMP else _EPOCH + datetime.timedelta(microseconds=value)
+
+
+def _pack_tri_state(value: undefined.UndefinedOr[bool], shift: int, /) -> int:
+    return (0 if value is undefined.UNDEFINED else value + 1) << shift
+
+
+def _unpack_tri_state(flags: int, shift: int, /) -> undefined.UndefinedOr[bool]:
+    value = (flags >> shift) & _TRI_STATE_MASK
+    return undefined.UNDEFINED if value == 0 else value == 2
+
+
+class _ColumnarMemberCell(RefCell[MemberData]):
+    """A reference cell backed by a row in a `ColumnarMemberStore`.
+
+    Reading `object` builds a new `MemberData` from the row and assigning it
+    writes the data back to the row, so changes made to the data object
+    itself must be reassigned to be kept. Once the row is removed, the cell
+    keeps a copy of its last contents.
+
+    As a new data object is built on each read, `get_member_version` versions
+    these cells by a token which is replaced whenever their row is written.
+    """
+
+    __slots__: typing.Sequence[str] = ("_detached", "_store", "_user_id", "__weakref__")
+
+    def __init__(self, store: ColumnarMemberStore, user_id: snowflakes.Snowflake, /) -> None:
+        self._detached: typing.Optional[RefCell[MemberData]] = None
+        self._store = store
+        self._user_id = user_id
+
+    @property  # type: ignore[override]
+    def object(self) -> MemberData:
+        if self._detached is not None:
+            return self._detached.object
+
+        return self._store._build_data(self._store._rows[self._user_id])
+
+    @object.setter
+    def object(self, data: MemberData) -> None:
+        if self._detached is not None:
+            self._detached.object = data
+
+        else:
+            self._store._write(self._store._rows[self._user_id], data)
+
+    @property  # type: ignore[override]
+    def ref_count(self) -> int:
+        if self._detached is not None:
+            return self._detached.ref_count
+
+        return self._store._ref_counts[self._store._rows[self._user_id]]
+
+    @ref_count.setter
+    def ref_count(self, value: int) -> None:
+        if self._detached is not None:
+            self._detached.ref_count = value
+
+        else:
+            self._store._ref_counts[self._store._rows[self._user_id]] = value
+
+    def get_version(self) -> typing.Tuple[typing.Any, ...]:
+        if self._detached is not None:
+            return get_member_version(self._detached)
+
+        store = self._store
+        row = store._rows[self._user_id]
+        token = store._version_tokens[row]
+        if token is None:
+            token = store._version_tokens[row] = object()
+
+        return (token, store._users[row].object)
+
+    def __repr__(self) -> str:
+        return f"_ColumnarMemberCell(user_id={self._user_id!r}, ref_count={self.ref_count!r})"
+
+
+class ColumnarMemberStore(collections.ExtendedMutableMapping[snowflakes.Snowflake, RefCell[MemberData]]):
+    """A compact mapping of user IDs to the members cached for a single guild.
+
+    Rather than keeping a `RefCell` and `MemberData` object (along with their
+    datetimes and role ID lists) alive for every member, each field is stored
+    in its own column. Timestamps and flags are packed into arrays of ints,
+    role ID tuples are shared between all members with the same roles and a
+    member's data is only built when it is accessed.
+
+    Values are returned as reference cells which read from and write to the
+    member's row, so they can be used like any other `RefCell`. The same cell
+    is returned for a member for as long as it is in use. Cells which are
+    assigned into this mapping have their contents copied into it.
+
+    Parameters
+    ----------
+    guild_id : hikari.snowflakes.Snowflake
+        ID of the guild the members are cached for.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_avatar_hashes",
+        "_cells",
+        "_flags",
+        "_guild_id",
+        "_joined_at",
+        "_nicknames",
+        "_premium_since",
+        "_ref_counts",
+        "_role_ids",
+        "_role_sets",
+        "_rows",
+        "_timeouts",
+        "_user_ids",
+        "_users",
+        "_version_tokens",
+    )
+
+    def __init__(self, guild_id: snowflakes.Snowflake, /) -> None:
+        self._guild_id = guild_id
+        # The cells which are currently in use, so that they can be detached when their row is removed.
+        self._cells: weakref.WeakValueDictionary[snowflakes.Snowflake, _ColumnarMemberCell] = (
+            weakref.WeakValueDictionary()
+        )
+        self._rows: typing.Dict[snowflakes.Snowflake, int] = {}
+        self._role_sets: typing.Dict[
+            typing.Tuple[snowflakes.Snowflake, ...], typing.Tuple[snowflakes.Snowflake, ...]
+        ] = {}
+        self._user_ids: typing.List[snowflakes.Snowflake] = []
+        self._users: typing.List[RefCell[users_.User]] = []
+        self._nicknames: typing.List[typing.Optional[str]] = []
+        self._avatar_hashes: typing.List[typing.Optional[str]] = []
+        self._role_ids: typing.List[typing.Tuple[snowflakes.Snowflake, ...]] = []
+        self._joined_at = array.array("q")
+        self._premium_since = array.array("q")
+        self._timeouts = array.array("q")
+        self._flags = array.array("B")
+        self._ref_counts = array.array("q")
+        # Tokens are only made when a row's version is asked for, and are cleared whenever the row is written.
+        self._version_tokens: typing.List[typing.Optional[object]] = []
+
+    def _columns(self) -> typing.Sequence[typing.MutableSequence[typing.Any]]:
+        return (
+            self._user_ids,
+            self._users,
+            self._nicknames,
+            self._avatar_hashes,
+            self._role_ids,
+            self._joined_at,
+            self._premium_since,
+            self._timeouts,
+            self._flags,
+            self._ref_counts,
+            self._version_tokens,
+        )
+
+    def _build_data(self, row: int, /) -> MemberData:
+        flags = self._flags[row]
+        return MemberData(
+            user=self._users[row],
+            guild_id=self._guild_id,
+            nickname=self._nicknames[row],
+            guild_avatar_hash=self._avatar_hashes[row],
+            role_ids=self._role_ids[row],
+            joined_at=_EPOCH + datetime.timedelta(microseconds=self._joined_at[row]),
+            premium_since=_unpack_timestamp(self._premium_since[row]),
+            is_deaf=_unpack_tri_state(flags, _DEAF_SHIFT),
+            is_mute=_unpack_tri_state(flags, _MUTE_SHIFT),
+            is_pending=_unpack_tri_state(flags, _PENDING_SHIFT),
+            raw_communication_disabled_until=_unpack_timestamp(self._timeouts[row]),
+            has_been_deleted=bool(flags & _DELETED_FLAG),
+        )
+
+    def _write(self, row: int, data: MemberData, /) -> None:
+        role_ids = tuple(data.role_ids)
+        self._users[row] = data.user
+        self._nicknames[row] = data.nickname
+        self._avatar_hashes[row] = data.guild_avatar_hash
+        self._role_ids[row] = self._role_sets.setdefault(role_ids, role_ids)
+        self._joined_at[row] = _pack_timestamp(data.joined_at)
+        self._premium_since[row] = _pack_timestamp(data.premium_since)
+        self._timeouts[row] = _pack_timestamp(data.raw_communication_disabled_until)
+        self._flags[row] = (
+            _pack_tri_state(data.is_deaf, _DEAF_SHIFT)
+            | _pack_tri_state(data.is_mute, _MUTE_SHIFT)
+            | _pack_tri_state(data.is_pending, _PENDING_SHIFT)
+            | (_DELETED_FLAG if data.has_been_deleted else 0)
+        )
+        self._version_tokens[row] = None
+
+    def _detach(self, user_id: snowflakes.Snowflake, row: int, /) -> None:
+        if cell := self._cells.pop(user_id, None):
+            cell._detached = RefCell(self._build_data(row), ref_count=self._ref_counts[row])
+
+    def clear(self) -> None:
+        for user_id, row in self._rows.items():
+            self._detach(user_id, row)
+
+        self._rows.clear()
+        self._role_sets.clear()
+        for column in self._columns():
+            del column[:]
+
+    def copy(self) -> ColumnarMemberStore:
+        store = ColumnarMemberStore(self._guild_id)
+        store._rows = self._rows.copy()
+        store._role_sets = self._role_sets.copy()
+        store._user_ids = self._user_ids.copy()
+        store._users = self._users.copy()
+        store._nicknames = self._nicknames.copy()
+        store._avatar_hashes = self._avatar_hashes.copy()
+        store._role_ids = self._role_ids.copy()
+        store._joined_at = self._joined_at[:]
+        store._premium_since = self._premium_since[:]
+        store._timeouts = self._timeouts[:]
+        store._flags = self._flags[:]
+        store._ref_counts = self._ref_counts[:]
+        store._version_tokens = self._version_tokens.copy()
+        return store
+
+    def freeze(self) -> typing.Dict[snowflakes.Snowflake, RefCell[MemberData]]:
+        return {user_id: self[user_id] for user_id in self._rows}
+
+    def __delitem__(self, user_id: snowflakes.Snowflake) -> None:
+        row = self._rows.pop(user_id)
+        self._detach(user_id, row)
+        last_row = len(self._user_ids) - 1
+        columns = self._columns()
+        # Fill the gap with the last row so that the columns stay contiguous.
+        if row != last_row:
+            for column in columns:
+                column[row] = column[last_row]
+
+            self._rows[self._user_ids[row]] = row
+
+        for column in columns:
+            column.pop()
+
+    def __getitem__(self, user_id: snowflakes.Snowflake) -> RefCell[MemberData]:
+        cell = self._cells.get(user_id)
+        if cell is None:
+            if user_id not in self._rows:
+                raise KeyError(user_id)
+
+            cell = self._cells[user_id] = _ColumnarMemberCell(self, user_id)
+
+        return cell
+
+    def __iter__(self) -> typing.Iterator[snowflakes.Snowflake]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __setitem__(self, user_id: snowflakes.Snowflake, cell: RefCell[MemberData]) -> None:
+        if self._cells.get(user_id) is cell:
+            return
+
+        data = cell.object
+        ref_count = cell.ref_count
+        row = self._rows.get(user_id)
+        if row is None:
+            row = self._rows[user_id] = len(self._user_ids)
+            self._user_ids.append(user_id)
+            for column in self._columns()[1:]:
+                # Placeholders which are overwritten by _write and the ref count below.
+                column.append(0 if isinstance(column, array.array) else None)
+
+        self._write(row, data)
+        self._ref_counts[row] = ref_count
+
+
 def unwrap_ref_cell(cell: RefCell[ValueT]) -> ValueT:
     """Unwrap a `RefCell` instance to it's contents.
 
@@ -1020,6 +1506,30 @@ def unwrap_ref_cell(cell: RefCell[ValueT]) -> ValueT:
     return cell.copy()
 
 
+def get_member_version(member: RefCell[MemberData], /) -> typing.Tuple[typing.Any, ...]:
+    """Get the objects a member's entity is built from.
+
+    These are compared by identity to tell whether a member has changed.
+    Members from a `ColumnarMemberStore` are rebuilt on each read, so they're
+    versioned by their row instead, without building their data.
+
+    Parameters
+    ----------
+    member : RefCell[MemberData]
+        The reference cell of the member.
+
+    Returns
+    -------
+    typing.Tuple[typing.Any, ...]
+        The objects the member's entity is built from.
+    """
+    if isinstance(member, _ColumnarMemberCell):
+        return member.get_version()
+
+    data = member.object
+    return (data, *data.build_dependencies())
+
+
 def copy_guild_channel(channel: ChannelT) -> ChannelT:
     """Logic for handling the copying of guild channel objects.
 
@@ -1033,6 +1543,40 @@ def copy_guild_channel(channel: ChannelT) -> ChannelT:
     return channel
 
 
+def sort_guild_channels(
+    guild_channels: typing.Mapping[snowflakes.Snowflake, ChannelT], /
+) -> typing.Dict[snowflakes.Snowflake, ChannelT]:
+    """Sort a guild's channels in the order they're shown in the client.
+
+    Categories are ordered by position, with each category's text channels
+    followed by its voice channels placed after it.
+
+    Parameters
+    ----------
+    guild_channels : typing.Mapping[hikari.snowflakes.Snowflake, hikari.channels.GuildChannel]
+        Mapping of IDs to all the channels in the guild.
+
+    Returns
+    -------
+    typing.Dict[hikari.snowflakes.Snowflake, hikari.channels.GuildChannel]
+        The sorted channels.
+    """
+
+    def sorter(args: typing.Tuple[snowflakes.Snowflake, ChannelT]) -> typing.Tuple[int, int, int]:
+        channel = args[1]
+        if isinstance(channel, channels_.GuildCategory):
+            return channel.position, -1, 0
+
+        parent_position = -1 if channel.parent_id is None else guild_channels[channel.parent_id].position
+
+        if not isinstance(channel, channels_.GuildVoiceChannel):
+            return parent_position, 0, channel.position
+
+        return parent_position, 1, channel.position
+
+    return dict(sorted(guild_channels.items(), key=sorter))
+
+
 class Cache3DMappingView(CacheMappingView[snowflakes.Snowflake, cache.CacheView[KeyT, ValueT]]):
     """A special case of the Mapping View which avoids copying the immutable values contained within it."""
 
@@ -1041,3 +1585,6 @@ class Cache3DMappingView(CacheMappingView[snowflakes.Snowflake, cache.CacheView[
     @staticmethod
     def _copy(value: cache.CacheView[KeyT, ValueT]) -> cache.CacheView[KeyT, ValueT]:
         return value
+
+    def snapshot(self) -> cache.CacheView[snowflakes.Snowflake, cache.CacheView[KeyT, ValueT]]:
+        return Cache3DMappingView({key: view.snapshot() for key, view in self._data.items()})
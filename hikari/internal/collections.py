@@ -29,6 +29,7 @@ __all__: typing.Sequence[str] = (
     "ValueT",
     "SnowflakeSet",
     "ExtendedMutableMapping",
+    "EvictingCacheMap",
     "FreezableDict",
     "LimitedCapacityCacheMap",
     "get_index_or_slice",
@@ -42,6 +43,7 @@ import sys
 import typing
 
 from hikari import snowflakes
+from hikari.internal import time
 
 ExtendedMapT = typing.TypeVar("ExtendedMapT", bound="ExtendedMutableMapping[typing.Any, typing.Any]")
 """Type-hint A type hint used for mapped collection objects."""
@@ -51,6 +53,8 @@ ValueT = typing.TypeVar("ValueT")
 """Type-hint A type hint used for the type of a mapping's value."""
 
 _LONG_LONG_UNSIGNED: typing.Final[str] = sys.intern("Q")
+_LFU_SAMPLE_SIZE: typing.Final[int] = 5
+"""How many of the least recently added entries are compared when picking one to evict by frequency."""
 
 
 class ExtendedMutableMapping(typing.MutableMapping[KeyT, ValueT], abc.ABC):
@@ -206,6 +210,181 @@ class LimitedCapacityCacheMap(ExtendedMutableMapping[KeyT, ValueT]):
         self._garbage_collect()
 
 
+class EvictingCacheMap(ExtendedMutableMapping[KeyT, ValueT]):
+    """A mapping which evicts entries based on their use.
+
+    This wraps another mapped collection, which is what the entries are
+    actually stored in, and keeps track of when each entry was last used.
+
+    Entries are evicted when new entries are added, either because they
+    haven't been used for `ttl` seconds or to keep the mapping's size within
+    `max_entries`. When making space, the least recently used entry is evicted
+    or, if `least_frequently_used` is set, the least frequently read of the
+    few least recently added entries is.
+
+    Parameters
+    ----------
+    data : ExtendedMutableMapping[KeyT, ValueT]
+        The mapped collection to store the entries in.
+
+    Other Parameters
+    ----------------
+    max_entries : typing.Optional[builtins.int]
+        The maximum number of entries to keep, if any.
+    ttl : typing.Optional[builtins.float]
+        How many seconds an entry may go unused for before it is evicted, if
+        any. Entries are used when they are set or, unless
+        `least_frequently_used` is set, read.
+    least_frequently_used : builtins.bool
+        Whether to evict the least frequently used entries instead of the
+        least recently used ones when making space. Defaults to
+        `builtins.False`.
+    on_expire : typing.Optional[typing.Callable[[ValueT], None]]
+        A function to call with each value after it has been evicted.
+    is_pinned : typing.Optional[typing.Callable[[ValueT], builtins.bool]]
+        A function which returns whether a value must not be evicted yet.
+        Pinned entries are treated as having just been used instead.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_data",
+        "_hits",
+        "_is_pinned",
+        "_least_frequently_used",
+        "_max_entries",
+        "_on_expire",
+        "_used_at",
+        "_ttl",
+    )
+
+    def __init__(
+        self,
+        data: ExtendedMutableMapping[KeyT, ValueT],
+        /,
+        *,
+        max_entries: typing.Optional[int] = None,
+        ttl: typing.Optional[float] = None,
+        least_frequently_used: bool = False,
+        on_expire: typing.Optional[typing.Callable[[ValueT], None]] = None,
+        is_pinned: typing.Optional[typing.Callable[[ValueT], bool]] = None,
+    ) -> None:
+        self._data = data
+        self._hits: typing.Dict[KeyT, int] = {}
+        self._is_pinned = is_pinned
+        self._least_frequently_used = least_frequently_used
+        self._max_entries = max_entries
+        self._on_expire = on_expire
+        self._ttl = ttl
+        # Ordered from the least to the most recently used. The times are only tracked when there's a TTL.
+        self._used_at: typing.Dict[KeyT, typing.Optional[float]] = dict.fromkeys(data)
+
+    def _use(self, key: KeyT, /) -> None:
+        self._used_at.pop(key, None)
+        self._used_at[key] = time.monotonic() if self._ttl is not None else None
+
+    def _evict(self, key: KeyT, /) -> bool:
+        value = self._data[key]
+        if self._is_pinned and self._is_pinned(value):
+            self._use(key)
+            return False
+
+        del self[key]
+        if self._on_expire:
+            self._on_expire(value)
+
+        return True
+
+    def _pick_victim(self, new_key: KeyT, /) -> typing.Optional[KeyT]:
+        # The entry which was just added is never picked, as it'd otherwise always be the least frequently used.
+        keys = (key for key in self._used_at if key != new_key)
+        if not self._least_frequently_used:
+            return next(keys, None)
+
+        # min returns the first of equal items, so ties go to the least recently added entry.
+        candidates = itertools.islice(keys, _LFU_SAMPLE_SIZE)
+        return min(candidates, key=lambda key: self._hits.get(key, 0), default=None)
+
+    def _garbage_collect(self, new_key: KeyT, /) -> None:
+        if self._ttl is not None:
+            expire_before = time.monotonic() - self._ttl
+            # Entries which are pinned get moved to the end, so this will always finish.
+            while self._used_at:
+                key, used_at = next(iter(self._used_at.items()))
+                if used_at is None or used_at > expire_before:
+                    break
+
+                self._evict(key)
+
+        if self._max_entries is not None:
+            # Limit the attempts so that a mapping full of pinned entries can't loop forever.
+            attempts = len(self._used_at)
+            while len(self._used_at) > self._max_entries and attempts:
+                attempts -= 1
+                victim = self._pick_victim(new_key)
+                if victim is None:
+                    break
+
+                self._evict(victim)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._hits.clear()
+        self._used_at.clear()
+
+    def copy(self) -> EvictingCacheMap[KeyT, ValueT]:
+        result = EvictingCacheMap(
+            self._data.copy(),
+            max_entries=self._max_entries,
+            ttl=self._ttl,
+            least_frequently_used=self._least_frequently_used,
+            on_expire=self._on_expire,
+            is_pinned=self._is_pinned,
+        )
+        result._hits = self._hits.copy()
+        result._used_at = self._used_at.copy()
+        return result
+
+    def freeze(self) -> typing.MutableMapping[KeyT, ValueT]:
+        return self._data.freeze()
+
+    def __contains__(self, key: typing.Any) -> bool:
+        return key in self._used_at
+
+    def __delitem__(self, key: KeyT) -> None:
+        del self._data[key]
+        del self._used_at[key]
+        self._hits.pop(key, None)
+
+    def __getitem__(self, key: KeyT) -> ValueT:
+        value = self._data[key]
+        if self._least_frequently_used:
+            self._hits[key] = self._hits.get(key, 0) + 1
+
+        else:
+            self._use(key)
+
+        return value
+
+    # Iterating over this mapping doesn't count as using its entries, which also means
+    # that the use order doesn't change while it's iterated over.
+    def items(self) -> typing.ItemsView[KeyT, ValueT]:
+        return self._data.items()
+
+    def values(self) -> typing.ValuesView[ValueT]:
+        return self._data.values()
+
+    def __iter__(self) -> typing.Iterator[KeyT]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._used_at)
+
+    def __setitem__(self, key: KeyT, value: ValueT) -> None:
+        self._data[key] = value
+        self._use(key)
+        self._garbage_collect(key)
+
+
 # TODO: can this be immutable?
 class SnowflakeSet(typing.MutableSet[snowflakes.Snowflake]):
     r"""Set of `hikari.snowflakes.Snowflake` objects.
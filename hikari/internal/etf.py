@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Encoder and decoder for the Erlang external term format (ETF).
+
+Only the subset of the format used by Discord's gateway is supported. Terms
+are mapped to the same structures that the JSON decoder would produce:
+
+* maps become `builtins.dict`, with atom and binary keys as `builtins.str`.
+* lists and tuples become `builtins.list`.
+* binaries and atoms become `builtins.str`.
+* the `true`, `false` and `nil` atoms become `builtins.True`,
+    `builtins.False` and `builtins.None` respectively.
+
+Integers are kept as `builtins.int`, which means that snowflakes sent by
+Discord as integers do not need to be parsed from their string form.
+"""
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("ETFDecodeError", "dumps", "loads")
+
+import struct
+import typing
+import zlib
+
+if typing.TYPE_CHECKING:
+    from hikari.internal import data_binding
+
+_FORMAT_VERSION: typing.Final[int] = 131
+
+_NEW_FLOAT_EXT: typing.Final[int] = 70
+_COMPRESSED: typing.Final[int] = 80
+_SMALL_INTEGER_EXT: typing.Final[int] = 97
+_INTEGER_EXT: typing.Final[int] = 98
+_FLOAT_EXT: typing.Final[int] = 99
+_ATOM_EXT: typing.Final[int] = 100
+_SMALL_TUPLE_EXT: typing.Final[int] = 104
+_LARGE_TUPLE_EXT: typing.Final[int] = 105
+_NIL_EXT: typing.Final[int] = 106
+_STRING_EXT: typing.Final[int] = 107
+_LIST_EXT: typing.Final[int] = 108
+_BINARY_EXT: typing.Final[int] = 109
+_SMALL_BIG_EXT: typing.Final[int] = 110
+_LARGE_BIG_EXT: typing.Final[int] = 111
+_SMALL_ATOM_EXT: typing.Final[int] = 115
+_MAP_EXT: typing.Final[int] = 116
+_ATOM_UTF8_EXT: typing.Final[int] = 118
+_SMALL_ATOM_UTF8_EXT: typing.Final[int] = 119
+
+_UINT16: typing.Final[struct.Struct] = struct.Struct(">H")
+_UINT32: typing.Final[struct.Struct] = struct.Struct(">I")
+_INT32: typing.Final[struct.Struct] = struct.Struct(">i")
+_DOUBLE: typing.Final[struct.Struct] = struct.Struct(">d")
+
+_ATOMS: typing.Final[typing.Mapping[str, typing.Any]] = {"true": True, "false": False, "nil": None, "null": None}
+
+_Decoded = typing.Tuple[typing.Any, int]
+
+
+class ETFDecodeError(ValueError):
+    """Raised when a payload is not a valid ETF term."""
+
+    __slots__: typing.Sequence[str] = ()
+
+
+def _decode_atom(data: bytes, size: int, offset: int) -> _Decoded:
+    end = offset + size
+    name = data[offset:end].decode("utf-8")
+    return _ATOMS.get(name, name), end
+
+
+def _decode(data: bytes, offset: int) -> _Decoded:
+    tag = data[offset]
+    offset += 1
+
+    if tag == _BINARY_EXT:
+        end = offset + 4 + _UINT32.unpack_from(data, offset)[0]
+        return data[offset + 4 : end].decode("utf-8"), end
+
+    if tag == _MAP_EXT:
+        arity = _UINT32.unpack_from(data, offset)[0]
+        offset += 4
+        result: typing.Dict[typing.Any, typing.Any] = {}
+        for _ in range(arity):
+            key, offset = _decode(data, offset)
+            result[key], offset = _decode(data, offset)
+        return result, offset
+
+    if tag == _SMALL_INTEGER_EXT:
+        return data[offset], offset + 1
+
+    if tag == _INTEGER_EXT:
+        return _INT32.unpack_from(data, offset)[0], offset + 4
+
+    if tag == _SMALL_BIG_EXT or tag == _LARGE_BIG_EXT:
+        if tag == _SMALL_BIG_EXT:
+            size = data[offset]
+            offset += 1
+        else:
+            size = _UINT32.unpack_from(data, offset)[0]
+            offset += 4
+
+        sign = data[offset]
+        end = offset + 1 + size
+        value = int.from_bytes(data[offset + 1 : end], "little")
+        return -value if sign else value, end
+
+    if tag == _SMALL_ATOM_UTF8_EXT or tag == _SMALL_ATOM_EXT:
+        return _decode_atom(data, data[offset], offset + 1)
+
+    if tag == _ATOM_UTF8_EXT or tag == _ATOM_EXT:
+        return _decode_atom(data, _UINT16.unpack_from(data, offset)[0], offset + 2)
+
+    if tag == _LIST_EXT or tag == _SMALL_TUPLE_EXT or tag == _LARGE_TUPLE_EXT:
+        if tag == _SMALL_TUPLE_EXT:
+            length = data[offset]
+            offset += 1
+        else:
+            length = _UINT32.unpack_from(data, offset)[0]
+            offset += 4
+
+        items: typing.List[typing.Any] = []
+        for _ in range(length):
+            item, offset = _decode(data, offset)
+            items.append(item)
+
+        if tag == _LIST_EXT:
+            # Proper lists are terminated by NIL_EXT, which is all Discord sends.
+            tail, offset = _decode(data, offset)
+            if tail != []:
+                items.append(tail)
+
+        return items, offset
+
+    if tag == _NIL_EXT:
+        return [], offset
+
+    if tag == _STRING_EXT:
+        end = offset + 2 + _UINT16.unpack_from(data, offset)[0]
+        return list(data[offset + 2 : end]), end
+
+    if tag == _NEW_FLOAT_EXT:
+        return _DOUBLE.unpack_from(data, offset)[0], offset + 8
+
+    if tag == _FLOAT_EXT:
+        return float(data[offset : offset + 31].rstrip(b"\x00")), offset + 31
+
+    raise ETFDecodeError(f"Unsupported ETF tag {tag} at position {offset - 1}")
+
+
+def loads(data: typing.Union[str, bytes], /) -> typing.Any:
+    """Decode an ETF payload.
+
+    This has the same signature as `hikari.internal.data_binding.JSONDecoder`.
+
+    Parameters
+    ----------
+    data : typing.Union[builtins.str, builtins.bytes]
+        The payload to decode.
+
+    Returns
+    -------
+    typing.Any
+        The decoded term.
+
+    Raises
+    ------
+    ETFDecodeError
+        If the payload is not a valid ETF term.
+    """
+    if isinstance(data, str):
+        raise ETFDecodeError("ETF payloads must be bytes")
+
+    if not data or data[0] != _FORMAT_VERSION:
+        raise ETFDecodeError("Missing ETF version header")
+
+    try:
+        if data[1] == _COMPRESSED:
+            data = zlib.decompress(data[6:])
+            offset = 0
+        else:
+            offset = 1
+
+        result, offset = _decode(data, offset)
+
+    except (IndexError, struct.error, UnicodeDecodeError, zlib.error) as ex:
+        raise ETFDecodeError(f"Malformed ETF payload: {ex}") from ex
+
+    if offset != len(data):
+        raise ETFDecodeError("Unexpected trailing data after ETF term")
+
+    return result
+
+
+def _encode_atom(name: str, buffer: bytearray) -> None:
+    encoded = name.encode("utf-8")
+    buffer.append(_SMALL_ATOM_UTF8_EXT)
+    buffer.append(len(encoded))
+    buffer += encoded
+
+
+def _encode(obj: typing.Any, buffer: bytearray) -> None:
+    if obj is None:
+        _encode_atom("nil", buffer)
+
+    elif obj is True:
+        _encode_atom("true", buffer)
+
+    elif obj is False:
+        _encode_atom("false", buffer)
+
+    elif isinstance(obj, int):
+        if 0 <= obj <= 0xFF:
+            buffer.append(_SMALL_INTEGER_EXT)
+            buffer.append(obj)
+        elif -0x80000000 <= obj <= 0x7FFFFFFF:
+            buffer.append(_INTEGER_EXT)
+            buffer += _INT32.pack(obj)
+        else:
+            magnitude = abs(obj)
+            encoded = magnitude.to_bytes((magnitude.bit_length() + 7) // 8, "little")
+            if len(encoded) <= 0xFF:
+                buffer.append(_SMALL_BIG_EXT)
+                buffer.append(len(encoded))
+            else:
+                buffer.append(_LARGE_BIG_EXT)
+                buffer += _UINT32.pack(len(encoded))
+            buffer.append(obj < 0)
+            buffer += encoded
+
+    elif isinstance(obj, float):
+        buffer.append(_NEW_FLOAT_EXT)
+        buffer += _DOUBLE.pack(obj)
+
+    elif isinstance(obj, (str, bytes)):
+        encoded = obj.encode("utf-8") if isinstance(obj, str) else obj
+        buffer.append(_BINARY_EXT)
+        buffer += _UINT32.pack(len(encoded))
+        buffer += encoded
+
+    elif isinstance(obj, typing.Mapping):
+        buffer.append(_MAP_EXT)
+        buffer += _UINT32.pack(len(obj))
+        for key, value in obj.items():
+            _encode(key, buffer)
+            _encode(value, buffer)
+
+    elif isinstance(obj, (list, tuple)):
+        if obj:
+            buffer.append(_LIST_EXT)
+            buffer += _UINT32.pack(len(obj))
+            for item in obj:
+                _encode(item, buffer)
+
+        buffer.append(_NIL_EXT)
+
+    else:
+        raise TypeError(f"Cannot encode object of type {type(obj).__name__} as ETF")
+
+
+def dumps(obj: typing.Union[data_binding.JSONArray, data_binding.JSONObject], /) -> bytes:
+    """Encode an object as an ETF payload.
+
+    This has the same signature as `hikari.internal.data_binding.JSONEncoder`.
+    Strings are encoded as binaries and `builtins.None` as the `nil` atom,
+    which is what Discord expects.
+
+    Parameters
+    ----------
+    obj : typing.Union[hikari.internal.data_binding.JSONArray, hikari.internal.data_binding.JSONObject]
+        The object to encode.
+
+    Returns
+    -------
+    builtins.bytes
+        The encoded payload.
+
+    Raises
+    ------
+    builtins.TypeError
+        If the object contains a type which cannot be encoded.
+    """
+    buffer = bytearray((_FORMAT_VERSION,))
+    _encode(obj, buffer)
+    return bytes(buffer)
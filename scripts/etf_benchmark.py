@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Compare decoding gateway payloads as ETF against decoding them as JSON.
+
+Run with `python scripts/etf_benchmark.py`. This reuses the payloads from
+`json_benchmark.py` and compares `hikari.internal.etf` against the JSON
+backend that `hikari` picked automatically. The ETF decoder is pure Python,
+so expect it to be considerably slower than `orjson`.
+
+The payloads keep snowflakes as strings, while Discord sends them as integers
+over ETF, so the ETF payload sizes shown here are slightly pessimistic.
+"""
+import timeit
+
+import json_benchmark
+
+from hikari.internal import data_binding
+from hikari.internal import etf
+
+
+def main():
+    payloads = {
+        "MESSAGE_CREATE": (json_benchmark.message_create(), 5_000),
+        "GUILD_CREATE (1k members)": (json_benchmark.guild_create(1_000), 10),
+        "GUILD_CREATE (25k members)": (json_benchmark.guild_create(25_000), 1),
+    }
+    json_name = "json (%s)" % data_binding.default_json_loads.__module__
+    formats = {
+        json_name: (data_binding.default_json_dumps, data_binding.default_json_loads),
+        "etf": (etf.dumps, etf.loads),
+    }
+
+    for payload_name, (payload, number) in payloads.items():
+        print("\n%s (%s iterations)" % (payload_name, number))
+
+        for format_name, (dumps, loads) in formats.items():
+            raw = dumps(payload)
+            load_time = timeit.timeit(lambda: loads(raw), number=number) / number
+            print("    %-16s %8.1f KiB    loads: %10.1f µs" % (format_name, len(raw) / 1024, load_time * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -19,8 +19,10 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import json
 import logging
 import time
+import zlib
 
 from aiohttp import web
 
@@ -93,16 +95,37 @@ def v8_get_my_user(_):
 async def gateway_v8(req):
     res = web.WebSocketResponse()
     await res.prepare(req)
-    await GatewayV8(res).run()
+    await GatewayV8(res, req.query.get("compress")).run()
     return res
 
 
 class GatewayV8:
-    def __init__(self, ws: web.WebSocketResponse):
+    def __init__(self, ws: web.WebSocketResponse, compress=None):
         self.ws = ws
         self.last_heartbeat = float("nan")
         self.seq = 0
 
+        if compress == "zlib-stream":
+            zlib_compressor = zlib.compressobj()
+            self.compress = lambda data: zlib_compressor.compress(data) + zlib_compressor.flush(zlib.Z_SYNC_FLUSH)
+        elif compress == "zstd-stream":
+            import zstandard
+
+            zstd_compressor = zstandard.ZstdCompressor().compressobj()
+            self.compress = lambda data: zstd_compressor.compress(data) + zstd_compressor.flush(
+                zstandard.COMPRESSOBJ_FLUSH_BLOCK
+            )
+        else:
+            self.compress = None
+
+        print("Using transport compression", compress)
+
+    async def send_json(self, payload):
+        if self.compress is None:
+            await self.ws.send_json(payload)
+        else:
+            await self.ws.send_bytes(self.compress(json.dumps(payload).encode("utf-8")))
+
     async def run(self):
         await self.send_hello()
         await self.receive_identify()
@@ -111,7 +134,7 @@ class GatewayV8:
         print("Closed")
 
     async def send_hello(self):
-        await self.ws.send_json({"op": 10, "d": {"heartbeat_interval": heartbeat_interval}})
+        await self.send_json({"op": 10, "d": {"heartbeat_interval": heartbeat_interval}})
 
     async def receive_identify(self):
         payload = await self.poll_messages()
@@ -130,7 +153,7 @@ class GatewayV8:
                 print("Recv heartbeat, seq =", payload["d"])
                 self.last_heartbeat = time.perf_counter()
                 print("Sending heartbeat ack")
-                await self.ws.send_json({"op": 11, "d": None})
+                await self.send_json({"op": 11, "d": None})
                 continue
 
             if op == 11:
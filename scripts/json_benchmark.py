@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark the available JSON backends on realistic gateway payloads.
+
+Run with `python scripts/json_benchmark.py`. Any of `orjson` and `ujson` that are
+installed will be compared against the standard library `json` module and the
+backend that `hikari` picked automatically.
+"""
+import importlib
+import json
+import random
+import timeit
+
+from hikari.internal import data_binding
+
+random.seed(69420)
+
+
+def snowflake():
+    return str(random.randint(175928847299117063, 999999999999999999))
+
+
+def timestamp():
+    return "2022-06-%02dT%02d:%02d:%02d.%06d+00:00" % (
+        random.randint(1, 28),
+        random.randint(0, 23),
+        random.randint(0, 59),
+        random.randint(0, 59),
+        random.randint(0, 999999),
+    )
+
+
+def user():
+    return {
+        "id": snowflake(),
+        "username": "user" + str(random.randint(0, 100_000)),
+        "discriminator": "%04d" % random.randint(1, 9999),
+        "avatar": "%032x" % random.getrandbits(128),
+        "public_flags": random.choice((0, 64, 128, 256)),
+        "bot": False,
+    }
+
+
+def member(role_ids):
+    return {
+        "user": user(),
+        "nick": random.choice((None, "a nickname ✨")),
+        "roles": random.sample(role_ids, k=random.randint(0, min(len(role_ids), 6))),
+        "joined_at": timestamp(),
+        "premium_since": None,
+        "deaf": False,
+        "mute": False,
+        "pending": False,
+        "communication_disabled_until": None,
+    }
+
+
+def presence(user_id):
+    return {
+        "user": {"id": user_id},
+        "status": random.choice(("online", "idle", "dnd")),
+        "client_status": {"desktop": "online"},
+        "activities": [
+            {
+                "id": "custom",
+                "name": "Custom Status",
+                "type": 4,
+                "state": "just vibing 🎶",
+                "created_at": random.randint(1_600_000_000_000, 1_700_000_000_000),
+            }
+        ],
+    }
+
+
+def guild_create(member_count):
+    roles = [
+        {
+            "id": snowflake(),
+            "name": "role %s" % i,
+            "color": random.randint(0, 0xFFFFFF),
+            "hoist": bool(i % 2),
+            "position": i,
+            "permissions": str(random.getrandbits(40)),
+            "managed": False,
+            "mentionable": True,
+        }
+        for i in range(50)
+    ]
+    role_ids = [role["id"] for role in roles]
+    members = [member(role_ids) for _ in range(member_count)]
+    channels = [
+        {
+            "id": snowflake(),
+            "type": random.choice((0, 2, 4, 5)),
+            "name": "channel-%s" % i,
+            "position": i,
+            "parent_id": None,
+            "topic": "A topic for channel %s" % i,
+            "nsfw": False,
+            "rate_limit_per_user": 0,
+            "permission_overwrites": [
+                {"id": random.choice(role_ids), "type": 0, "allow": "1024", "deny": "2048"} for _ in range(3)
+            ],
+        }
+        for i in range(100)
+    ]
+    return {
+        "op": 0,
+        "s": 2,
+        "t": "GUILD_CREATE",
+        "d": {
+            "id": snowflake(),
+            "name": "A very large guild",
+            "icon": "%032x" % random.getrandbits(128),
+            "owner_id": snowflake(),
+            "member_count": member_count,
+            "large": True,
+            "joined_at": timestamp(),
+            "features": ["COMMUNITY", "NEWS", "ANIMATED_ICON"],
+            "roles": roles,
+            "emojis": [],
+            "channels": channels,
+            "threads": [],
+            "members": members,
+            "presences": [presence(m["user"]["id"]) for m in members],
+            "voice_states": [],
+        },
+    }
+
+
+def message_create():
+    author = user()
+    return {
+        "op": 0,
+        "s": 1234,
+        "t": "MESSAGE_CREATE",
+        "d": {
+            "id": snowflake(),
+            "type": 0,
+            "channel_id": snowflake(),
+            "guild_id": snowflake(),
+            "author": author,
+            "member": {"roles": [snowflake()], "joined_at": timestamp(), "deaf": False, "mute": False},
+            "content": "Hello there <@%s>! Here is some text with unicode: héllo wörld 🐍" % snowflake(),
+            "timestamp": timestamp(),
+            "edited_timestamp": None,
+            "tts": False,
+            "mention_everyone": False,
+            "mentions": [user()],
+            "mention_roles": [],
+            "attachments": [],
+            "embeds": [
+                {
+                    "type": "rich",
+                    "title": "An embed",
+                    "description": "Some description " * 10,
+                    "fields": [{"name": "name %s" % i, "value": "value %s" % i, "inline": True} for i in range(5)],
+                }
+            ],
+            "pinned": False,
+            "flags": 0,
+            "nonce": snowflake(),
+        },
+    }
+
+
+def available_backends():
+    backends = {"json (stdlib)": (lambda obj: json.dumps(obj).encode("utf-8"), json.loads)}
+
+    for name in ("orjson", "ujson"):
+        try:
+            module = importlib.import_module(name)
+        except ModuleNotFoundError:
+            print("%s is not installed, skipping it" % name)
+            continue
+
+        if name == "ujson":
+            backends[name] = (lambda obj, dumps=module.dumps: dumps(obj).encode("utf-8"), module.loads)
+        else:
+            backends[name] = (module.dumps, module.loads)
+
+    backends["hikari default"] = (data_binding.default_json_dumps, data_binding.default_json_loads)
+    return backends
+
+
+def main():
+    payloads = {
+        "MESSAGE_CREATE": (message_create(), 20_000),
+        "GUILD_CREATE (1k members)": (guild_create(1_000), 50),
+        "GUILD_CREATE (25k members)": (guild_create(25_000), 3),
+    }
+
+    backends = available_backends()
+
+    for payload_name, (payload, number) in payloads.items():
+        raw = json.dumps(payload).encode("utf-8")
+        print("\n%s (%.1f KiB, %s iterations)" % (payload_name, len(raw) / 1024, number))
+
+        for backend_name, (dumps, loads) in backends.items():
+            load_time = timeit.timeit(lambda: loads(raw), number=number) / number
+            dump_time = timeit.timeit(lambda: dumps(payload), number=number) / number
+            print("    %-16s loads: %10.1f µs    dumps: %10.1f µs" % (backend_name, load_time * 1e6, dump_time * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -33,14 +33,18 @@ from hikari import errors
 from hikari import presences
 from hikari import snowflakes
 from hikari import undefined
+from hikari.api import config as config_api
+from hikari.api import event_manager as event_manager_
 from hikari.impl import bot as bot_impl
 from hikari.impl import cache as cache_impl
+from hikari.impl import chunker as chunker_impl
 from hikari.impl import config
 from hikari.impl import entity_factory as entity_factory_impl
 from hikari.impl import event_factory as event_factory_impl
 from hikari.impl import event_manager as event_manager_impl
 from hikari.impl import rest as rest_impl
 from hikari.impl import shard as shard_impl
+from hikari.impl import shared_cache as shared_cache_impl
 from hikari.impl import voice as voice_impl
 from hikari.internal import aio
 from hikari.internal import ux
@@ -169,6 +173,7 @@ class TestGatewayBot:
     def test_init(self):
         stack = contextlib.ExitStack()
         cache = stack.enter_context(mock.patch.object(cache_impl, "CacheImpl"))
+        chunker = stack.enter_context(mock.patch.object(chunker_impl, "GuildChunker"))
         entity_factory = stack.enter_context(mock.patch.object(entity_factory_impl, "EntityFactoryImpl"))
         event_factory = stack.enter_context(mock.patch.object(event_factory_impl, "EventFactoryImpl"))
         event_manager = stack.enter_context(mock.patch.object(event_manager_impl, "EventManagerImpl"))
@@ -181,29 +186,47 @@ class TestGatewayBot:
         http_settings = object()
         proxy_settings = object()
         intents = object()
+        dumps = object()
+        loads = object()
+        metrics = object()
 
         with stack:
             bot = bot_impl.GatewayBot(
                 "token",
                 allow_color=False,
                 banner="testing",
+                compression="transport_zstd_stream",
+                coalesce_windows={"PRESENCE_UPDATE": 0.5},
+                dumps=dumps,
                 executor=executor,
                 force_color=True,
                 cache_settings=cache_settings,
                 http_settings=http_settings,
                 intents=intents,
                 auto_chunk_members=False,
+                lazy_entities=True,
+                loads=loads,
                 logs="DEBUG",
                 max_rate_limit=200,
                 max_retries=0,
+                metrics=metrics,
+                offload_member_threshold=1000,
+                offload_threshold=65536,
                 proxy_settings=proxy_settings,
                 rest_url="somewhere.com",
             )
 
         assert bot._http_settings is http_settings
         assert bot._proxy_settings is proxy_settings
+        assert bot._compression == "transport_zstd_stream"
+        assert bot._dumps is dumps
+        assert bot._loads is loads
+        assert bot._metrics is metrics
+        assert bot._offload_threshold == 65536
         assert bot._cache is cache.return_value
         cache.assert_called_once_with(bot, cache_settings)
+        assert bot._chunker is chunker.return_value
+        chunker.assert_called_once_with()
         assert bot._event_manager is event_manager.return_value
         event_manager.assert_called_once_with(
             entity_factory.return_value,
@@ -211,9 +234,14 @@ class TestGatewayBot:
             intents,
             auto_chunk_members=False,
             cache=cache.return_value,
+            chunker=chunker.return_value,
+            coalesce_windows={"PRESENCE_UPDATE": 0.5},
+            executor=executor,
+            metrics=metrics,
+            offload_member_threshold=1000,
         )
         assert bot._entity_factory is entity_factory.return_value
-        entity_factory.assert_called_once_with(bot)
+        entity_factory.assert_called_once_with(bot, lazy_entities=True)
         assert bot._event_factory is event_factory.return_value
         event_factory.assert_called_once_with(bot)
         assert bot._voice is voice.return_value
@@ -221,9 +249,11 @@ class TestGatewayBot:
         assert bot._rest is rest.return_value
         rest.assert_called_once_with(
             cache=bot._cache,
+            dumps=dumps,
             entity_factory=bot._entity_factory,
             executor=executor,
             http_settings=bot._http_settings,
+            loads=loads,
             max_rate_limit=200,
             max_retries=0,
             proxy_settings=bot._proxy_settings,
@@ -259,6 +289,27 @@ class TestGatewayBot:
         cache.assert_called_once_with(bot, cache_settings.return_value)
         cache_settings.assert_called_once_with()
 
+    def test_init_with_cache_store(self):
+        stack = contextlib.ExitStack()
+        cache = stack.enter_context(mock.patch.object(cache_impl, "CacheImpl"))
+        shared_cache = stack.enter_context(mock.patch.object(shared_cache_impl, "SharedCacheImpl"))
+        stack.enter_context(mock.patch.object(entity_factory_impl, "EntityFactoryImpl"))
+        stack.enter_context(mock.patch.object(event_factory_impl, "EventFactoryImpl"))
+        stack.enter_context(mock.patch.object(event_manager_impl, "EventManagerImpl"))
+        stack.enter_context(mock.patch.object(voice_impl, "VoiceComponentImpl"))
+        stack.enter_context(mock.patch.object(rest_impl, "RESTClientImpl"))
+        stack.enter_context(mock.patch.object(ux, "init_logging"))
+        stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "print_banner"))
+        cache_settings = object()
+        cache_store = object()
+
+        with stack:
+            bot = bot_impl.GatewayBot("token", cache_settings=cache_settings, cache_store=cache_store)
+
+        assert bot._cache is shared_cache.return_value
+        shared_cache.assert_called_once_with(bot, cache_settings, cache_store)
+        cache.assert_not_called()
+
     def test_init_strips_token(self):
         stack = contextlib.ExitStack()
         stack.enter_context(mock.patch.object(ux, "init_logging"))
@@ -274,6 +325,11 @@ class TestGatewayBot:
     def test_cache(self, bot, cache):
         assert bot.cache is cache
 
+    def test_chunker(self, bot):
+        bot._chunker = object()
+
+        assert bot.chunker is bot._chunker
+
     def test_event_manager(self, bot, event_manager):
         assert bot.event_manager is event_manager
 
@@ -355,7 +411,7 @@ class TestGatewayBot:
                 await bot.close()
 
         check_if_alive.assert_called_once_with()
-        internal_close.assert_awaited_once_with()
+        internal_close.assert_awaited_once_with(keep_sessions=False)
 
     @pytest.mark.asyncio()
     async def test__close_when_already_closed(self, bot):
@@ -398,12 +454,13 @@ class TestGatewayBot:
                 if self._error:
                     raise self._error
 
-            def __call__(self):
+            def __call__(self, **kwargs):
                 return self
 
             def assert_awaited_once(self):
                 assert self._awaited_count == 1
 
+        bot._chunker = mock.Mock()
         stack = contextlib.ExitStack()
         stack.enter_context(mock.patch.object(asyncio, "as_completed", side_effect=null_call))
         ensure_future = stack.enter_context(mock.patch.object(asyncio, "ensure_future", side_effect=null_call))
@@ -463,7 +520,10 @@ class TestGatewayBot:
 
         # Clear out maps
         assert bot._shards == {}
+        assert bot._resume_state == {}
         cache.clear.assert_called_once_with()
+        bot._chunker.close.assert_called_once_with()
+        event_manager.close.assert_called_once_with()
 
         if is_alive:
             # Dispatching events in the right order
@@ -476,6 +536,51 @@ class TestGatewayBot:
         else:
             event_manager.dispatch.assert_not_called()
 
+    @pytest.mark.asyncio()
+    async def test__close_when_keeping_sessions(self, bot, event_manager, rest, voice):
+        session_state = object()
+        event_manager.dispatch = mock.AsyncMock()
+        rest.close = mock.AsyncMock()
+        voice.close = mock.AsyncMock()
+        bot._closing_event = mock.Mock()
+        bot._closed_event = None
+        bot._is_alive = True
+        shard0 = mock.Mock(id=0, close=mock.AsyncMock(), session_state=session_state)
+        shard1 = mock.Mock(id=1, close=mock.AsyncMock(), session_state=None)
+        bot._shards = {0: shard0, 1: shard1}
+
+        await bot._close(keep_sessions=True)
+
+        shard0.close.assert_awaited_once_with(keep_session=True)
+        shard1.close.assert_awaited_once_with(keep_session=True)
+        assert bot._shards == {}
+        assert bot.resume_state == {0: session_state}
+        bot._cache.clear.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test__close_when_using_shared_cache(self, bot, event_manager, rest, voice):
+        event_manager.dispatch = mock.AsyncMock()
+        rest.close = mock.AsyncMock()
+        voice.close = mock.AsyncMock()
+        bot._cache = mock.Mock(shared_cache_impl.SharedCacheImpl)
+        bot._executor = None
+        bot._closing_event = mock.Mock()
+        bot._closed_event = None
+        bot._is_alive = True
+        bot._shards = {}
+
+        await bot._close()
+
+        bot._cache.clear.assert_not_called()
+        bot._cache.flush.assert_called_once_with()
+
+    def test_resume_state_when_running(self, bot):
+        session_state = object()
+        bot._resume_state = {2: object()}
+        bot._shards = {0: mock.Mock(session_state=session_state), 1: mock.Mock(session_state=None)}
+
+        assert bot.resume_state == {0: session_state}
+
     def test_dispatch(self, bot, event_manager):
         event = object()
 
@@ -531,9 +636,9 @@ class TestGatewayBot:
     def test_listen(self, bot, event_manager):
         event = object()
 
-        assert bot.listen(event) is event_manager.listen.return_value
+        assert bot.listen(event, max_concurrency=2) is event_manager.listen.return_value
 
-        event_manager.listen.assert_called_once_with(event)
+        event_manager.listen.assert_called_once_with(event, max_concurrency=2, ordered_by=None, timeout=None)
 
     def test_print_banner(self, bot):
         with mock.patch.object(ux, "print_banner") as print_banner:
@@ -619,7 +724,25 @@ class TestGatewayBot:
                 bot.run(close_loop=False, propagate_interrupts=True)
 
         run_coroutine_threadsafe.assert_called_once_with(set_close_flag.return_value, loop)
-        set_close_flag.assert_called_once_with(signal.strsignal(signal.Signals.SIGTERM), 15)
+        set_close_flag.assert_called_once_with(signal.strsignal(signal.Signals.SIGTERM), 15, False)
+
+    def test_run_with_keep_sessions(self, bot):
+        def raise_signal(*args, **kwargs):
+            signal.raise_signal(signal.Signals.SIGTERM)
+
+        stack = contextlib.ExitStack()
+        stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "start", new=mock.Mock()))
+        stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "join", new=raise_signal))
+        close = stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "_close", new=mock.Mock()))
+        stack.enter_context(mock.patch.object(aio, "get_or_make_loop"))
+        set_close_flag = stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "_set_close_flag", new=mock.Mock()))
+        stack.enter_context(mock.patch.object(asyncio, "run_coroutine_threadsafe"))
+
+        with stack:
+            bot.run(close_loop=False, enable_signal_handlers=True, keep_sessions=True)
+
+        set_close_flag.assert_called_once_with(signal.strsignal(signal.Signals.SIGTERM), 15, True)
+        close.assert_called_once_with(keep_sessions=True)
 
     def test_run_with_close_passed_executor(self, bot):
         stack = contextlib.ExitStack()
@@ -655,9 +778,12 @@ class TestGatewayBot:
         check_for_updates = object()
         idle_since = object()
         ignore_session_start_limit = object()
+        keep_sessions = object()
         large_threshold = object()
+        resume_state = object()
         shard_ids = object()
         shard_count = object()
+        start_window_gate = object()
         status = object()
 
         stack = contextlib.ExitStack()
@@ -678,10 +804,13 @@ class TestGatewayBot:
                 enable_signal_handlers=False,
                 idle_since=idle_since,
                 ignore_session_start_limit=ignore_session_start_limit,
+                keep_sessions=keep_sessions,
                 large_threshold=large_threshold,
                 propagate_interrupts=False,
+                resume_state=resume_state,
                 shard_ids=shard_ids,
                 shard_count=shard_count,
+                start_window_gate=start_window_gate,
                 status=status,
             )
 
@@ -692,6 +821,7 @@ class TestGatewayBot:
                 mock.call(close_function.return_value),
             ]
         )
+        close_function.assert_called_once_with(keep_sessions=keep_sessions)
         start_function.assert_called_once_with(
             activity=activity,
             afk=afk,
@@ -699,8 +829,10 @@ class TestGatewayBot:
             idle_since=idle_since,
             ignore_session_start_limit=ignore_session_start_limit,
             large_threshold=large_threshold,
+            resume_state=resume_state,
             shard_ids=shard_ids,
             shard_count=shard_count,
+            start_window_gate=start_window_gate,
             status=status,
         )
 
@@ -720,6 +852,136 @@ class TestGatewayBot:
     def test_start(self, bot):
         ...
 
+    @pytest.mark.asyncio()
+    async def test_start_resumes_sessions_in_their_window(self, bot, rest, event_manager):
+        order = []
+        rest.fetch_gateway_bot_info = mock.AsyncMock(
+            return_value=mock.Mock(
+                shard_count=4, url="wss://some.url", session_start_limit=mock.Mock(remaining=4, max_concurrency=2)
+            )
+        )
+        start_window_gate = mock.AsyncMock(side_effect=lambda window: order.append(("gate", window)))
+        event_manager.dispatch = mock.AsyncMock()
+        session_state_1 = mock.Mock(shard_count=4)
+        session_state_3 = mock.Mock(shard_count=4)
+        resume_state = {
+            0: mock.Mock(shard_count=8),
+            1: session_state_1,
+            3: session_state_3,
+            5: mock.Mock(shard_count=4),
+        }
+
+        async def start_one_shard(*, shard_id, session_state=None, **kwargs):
+            order.append((shard_id, session_state))
+
+        with mock.patch.object(bot_impl.GatewayBot, "_start_one_shard", side_effect=start_one_shard):
+            await bot.start(check_for_updates=False, resume_state=resume_state, start_window_gate=start_window_gate)
+
+        assert order == [
+            ("gate", [0, 1]),
+            (0, None),
+            (1, session_state_1),
+            ("gate", [2, 3]),
+            (2, None),
+            (3, session_state_3),
+        ]
+
+    @pytest.mark.asyncio()
+    async def test_start_ignores_sessions_when_in_memory_cache_is_missing_guilds(self, bot, rest, event_manager):
+        rest.fetch_gateway_bot_info = mock.AsyncMock(
+            return_value=mock.Mock(
+                shard_count=1, url="wss://some.url", session_start_limit=mock.Mock(remaining=1, max_concurrency=1)
+            )
+        )
+        event_manager.dispatch = mock.AsyncMock()
+        bot._cache = cache_impl.CacheImpl(mock.Mock(), config.CacheSettings())
+
+        with mock.patch.object(bot_impl.GatewayBot, "_start_one_shard") as start_one_shard:
+            await bot.start(check_for_updates=False, resume_state={0: mock.Mock(shard_count=1)})
+
+        start_one_shard.assert_awaited_once()
+        assert start_one_shard.call_args.kwargs["session_state"] is None
+
+    @pytest.mark.asyncio()
+    async def test_start_resumes_sessions_when_in_memory_cache_is_not_caching_guilds(self, bot, rest, event_manager):
+        rest.fetch_gateway_bot_info = mock.AsyncMock(
+            return_value=mock.Mock(
+                shard_count=1, url="wss://some.url", session_start_limit=mock.Mock(remaining=1, max_concurrency=1)
+            )
+        )
+        event_manager.dispatch = mock.AsyncMock()
+        bot._cache = cache_impl.CacheImpl(
+            mock.Mock(), config.CacheSettings(components=config_api.CacheComponents.MEMBERS)
+        )
+        session_state = mock.Mock(shard_count=1)
+
+        with mock.patch.object(bot_impl.GatewayBot, "_start_one_shard") as start_one_shard:
+            await bot.start(check_for_updates=False, resume_state={0: session_state})
+
+        assert start_one_shard.call_args.kwargs["session_state"] is session_state
+
+    @pytest.mark.asyncio()
+    async def test_start_counts_resumed_sessions_towards_session_start_limit(self, bot, rest, event_manager):
+        rest.fetch_gateway_bot_info = mock.AsyncMock(
+            return_value=mock.Mock(
+                shard_count=2, url="wss://some.url", session_start_limit=mock.Mock(remaining=1, max_concurrency=1)
+            )
+        )
+        event_manager.dispatch = mock.AsyncMock()
+        resume_state = {0: mock.Mock(shard_count=2)}
+
+        with mock.patch.object(bot_impl.GatewayBot, "_start_one_shard") as start_one_shard:
+            with pytest.raises(errors.GatewayError):
+                await bot.start(check_for_updates=False, resume_state=resume_state)
+
+        start_one_shard.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_start_waits_for_start_window_gate(self, bot, rest, event_manager):
+        order = []
+        rest.fetch_gateway_bot_info = mock.AsyncMock(
+            return_value=mock.Mock(
+                shard_count=4, url="wss://some.url", session_start_limit=mock.Mock(remaining=10, max_concurrency=2)
+            )
+        )
+        event_manager.dispatch = mock.AsyncMock()
+        start_window_gate = mock.AsyncMock(side_effect=lambda window: order.append(("gate", window)))
+
+        async def start_one_shard(*, shard_id, **kwargs):
+            order.append(("start", shard_id))
+            bot._shards[shard_id] = mock.Mock(is_alive=True)
+
+        with mock.patch.object(bot_impl.GatewayBot, "_start_one_shard", side_effect=start_one_shard):
+            with mock.patch.object(aio, "all_of", wraps=aio.all_of) as all_of:
+                await bot.start(
+                    check_for_updates=False, shard_ids={1, 2, 3}, shard_count=4, start_window_gate=start_window_gate
+                )
+
+        assert order == [("gate", [1]), ("start", 1), ("gate", [2, 3]), ("start", 2), ("start", 3)]
+        # The local wait for the next window is skipped.
+        for call in all_of.call_args_list:
+            assert "timeout" not in call.kwargs
+
+    @pytest.mark.asyncio()
+    async def test_start_when_shard_dies_while_waiting_for_start_window_gate(self, bot, rest, event_manager):
+        rest.fetch_gateway_bot_info = mock.AsyncMock(
+            return_value=mock.Mock(
+                shard_count=2, url="wss://some.url", session_start_limit=mock.Mock(remaining=10, max_concurrency=1)
+            )
+        )
+        event_manager.dispatch = mock.AsyncMock()
+        started = []
+
+        async def start_one_shard(*, shard_id, **kwargs):
+            started.append(shard_id)
+            bot._shards[shard_id] = mock.Mock(is_alive=False)
+
+        with mock.patch.object(bot_impl.GatewayBot, "_start_one_shard", side_effect=start_one_shard):
+            await bot.start(check_for_updates=False, start_window_gate=mock.AsyncMock())
+
+        assert started == [0]
+        event_manager.dispatch.assert_awaited_once()
+
     def test_stream(self, bot):
         event_type = object()
 
@@ -727,15 +989,24 @@ class TestGatewayBot:
             bot.stream(event_type, timeout=100, limit=400)
 
         check_if_alive.assert_called_once_with()
-        bot._event_manager.stream.assert_called_once_with(event_type, timeout=100, limit=400)
+        bot._event_manager.stream.assert_called_once_with(
+            event_type,
+            timeout=100,
+            limit=400,
+            overflow=event_manager_.StreamOverflowPolicy.DROP_NEWEST,
+            high_water_mark=None,
+            on_high_water_mark=None,
+        )
 
     def test_subscribe(self, bot):
         event_type = object()
         callback = object()
 
-        bot.subscribe(event_type, callback)
+        bot.subscribe(event_type, callback, ordered_by="guild_id", timeout=10)
 
-        bot._event_manager.subscribe.assert_called_once_with(event_type, callback)
+        bot._event_manager.subscribe.assert_called_once_with(
+            event_type, callback, max_concurrency=None, ordered_by="guild_id", timeout=10
+        )
 
     def test_unsubscribe(self, bot):
         event_type = object()
@@ -752,10 +1023,12 @@ class TestGatewayBot:
         bot._event_manager.wait_for = mock.AsyncMock()
 
         with mock.patch.object(bot_impl.GatewayBot, "_check_if_alive") as check_if_alive:
-            await bot.wait_for(event_type, timeout=100, predicate=predicate)
+            await bot.wait_for(event_type, timeout=100, predicate=predicate, channel_id=123)
 
         check_if_alive.assert_called_once_with()
-        bot._event_manager.wait_for.assert_awaited_once_with(event_type, timeout=100, predicate=predicate)
+        bot._event_manager.wait_for.assert_awaited_once_with(
+            event_type, timeout=100, predicate=predicate, channel_id=123
+        )
 
     def test_get_shard_when_not_present(self, bot):
         shard = mock.Mock(shard_count=96)
@@ -848,12 +1121,36 @@ class TestGatewayBot:
             nonce="NONCE",
         )
 
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize("use_cache", [True, False])
+    async def test_fetch_members(self, bot, cache, use_cache):
+        shard_1 = object()
+        shard_2 = object()
+        bot._chunker = mock.Mock(fetch_members=mock.AsyncMock(side_effect=[{1: "member1"}, {}]))
+
+        with mock.patch.object(bot_impl.GatewayBot, "_get_shard", side_effect=[shard_1, shard_2]) as get_shard:
+            with mock.patch.object(bot_impl.GatewayBot, "_check_if_alive") as check_if_alive:
+                result = await bot.fetch_members(
+                    {123: [1, 2], 456: [3]}, include_presences=True, use_cache=use_cache, timeout=5
+                )
+
+        assert result == {123: {1: "member1"}, 456: {}}
+        check_if_alive.assert_called_once_with()
+        get_shard.assert_has_calls([mock.call(123), mock.call(456)])
+        expected_cache = cache if use_cache else None
+        bot._chunker.fetch_members.assert_has_awaits(
+            [
+                mock.call(shard_1, 123, [1, 2], cache=expected_cache, include_presences=True, timeout=5),
+                mock.call(shard_2, 456, [3], cache=expected_cache, include_presences=True, timeout=5),
+            ]
+        )
+
     @pytest.mark.asyncio()
     async def test_set_close_flag(self, bot):
         with mock.patch.object(bot_impl.GatewayBot, "_close") as close:
-            await bot._set_close_flag("Terminated", 15)
+            await bot._set_close_flag("Terminated", 15, True)
 
-        close.assert_awaited_once_with()
+        close.assert_awaited_once_with(keep_sessions=True)
 
     @pytest.mark.asyncio()
     async def test_start_one_shard(self, bot):
@@ -882,10 +1179,17 @@ class TestGatewayBot:
                 assert returned is shard_obj
 
         shard.assert_called_once_with(
+            compression=bot._compression,
             http_settings=bot._http_settings,
             proxy_settings=bot._proxy_settings,
+            dumps=bot._dumps,
             event_manager=bot._event_manager,
             event_factory=bot._event_factory,
+            executor=bot._executor,
+            loads=bot._loads,
+            metrics=bot._metrics,
+            offload_threshold=bot._offload_threshold,
+            session_state=None,
             intents=bot._intents,
             initial_activity=activity,
             initial_is_afk=True,
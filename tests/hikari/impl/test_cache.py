@@ -19,6 +19,7 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import copy
 import datetime
 
 import mock
@@ -29,6 +30,7 @@ from hikari import emojis
 from hikari import guilds
 from hikari import invites
 from hikari import messages
+from hikari import presences
 from hikari import snowflakes
 from hikari import stickers
 from hikari import undefined
@@ -1543,6 +1545,16 @@ class TestCacheImpl:
             2021, 10, 18, 13, 11, 18, 384554, tzinfo=datetime.timezone.utc
         )
 
+    def test__build_member_with_shared_entities(self, cache_impl):
+        cache_impl._settings.shared_entities = True
+        member_data = mock.Mock(cache_utilities.MemberData)
+
+        member = cache_impl._build_member(cache_utilities.RefCell(member_data))
+
+        assert member is member_data.build_shared_entity.return_value
+        member_data.build_shared_entity.assert_called_once_with(cache_impl._app)
+        member_data.build_entity.assert_not_called()
+
     def test_clear_members(self, cache_impl):
         mock_user_1 = cache_utilities.RefCell(mock.Mock(id=snowflakes.Snowflake(2123123)))
         mock_user_2 = cache_utilities.RefCell(mock.Mock(id=snowflakes.Snowflake(212314423)))
@@ -1861,6 +1873,107 @@ class TestCacheImpl:
         }
         cache_impl._build_member.assert_has_calls([mock.call(mock_member_data_1), mock.call(mock_member_data_2)])
 
+    def test_get_members_view_for_guild_with_live_views(self, cache_impl):
+        cache_impl._settings.live_views = True
+        member_data = cache_utilities.RefCell(mock.Mock(cache_utilities.MemberData, has_been_deleted=False))
+        member_store = collections.FreezableDict(
+            {
+                snowflakes.Snowflake(3214321): member_data,
+                snowflakes.Snowflake(9000): cache_utilities.RefCell(
+                    mock.Mock(cache_utilities.MemberData, has_been_deleted=True)
+                ),
+            }
+        )
+        cache_impl._guild_entries = collections.FreezableDict(
+            {snowflakes.Snowflake(42334): cache_utilities.GuildRecord(members=member_store)}
+        )
+        cache_impl._build_member = mock.Mock(side_effect=lambda cell: mock.Mock(guilds.Member))
+        cache_impl._member_version = mock.Mock(side_effect=lambda cell: (cell.object,))
+
+        result = cache_impl.get_members_view_for_guild(StubModel(42334))
+
+        assert isinstance(result, cache_utilities.LiveCacheMappingView)
+        assert list(result) == [snowflakes.Snowflake(3214321)]
+        assert result[snowflakes.Snowflake(3214321)] is result[snowflakes.Snowflake(3214321)]
+        cache_impl._build_member.assert_called_once_with(member_data)
+
+        member_data.object = mock.Mock(cache_utilities.MemberData, has_been_deleted=False)
+        member_store[snowflakes.Snowflake(123)] = cache_utilities.RefCell(
+            mock.Mock(cache_utilities.MemberData, has_been_deleted=False)
+        )
+
+        assert len(result) == 2
+        result[snowflakes.Snowflake(3214321)]
+        assert cache_impl._build_member.call_count == 2
+
+    def test_get_members_view_with_live_views(self, cache_impl):
+        cache_impl._settings.live_views = True
+        member_data = cache_utilities.RefCell(mock.Mock(cache_utilities.MemberData))
+        cache_impl._guild_entries = collections.FreezableDict(
+            {
+                snowflakes.Snowflake(42334): cache_utilities.GuildRecord(
+                    members=collections.FreezableDict({snowflakes.Snowflake(3214321): member_data})
+                ),
+                snowflakes.Snowflake(54234): cache_utilities.GuildRecord(),
+            }
+        )
+        cache_impl._build_member = mock.Mock()
+        cache_impl._member_version = mock.Mock(return_value=())
+
+        result = cache_impl.get_members_view()
+
+        assert list(result) == [snowflakes.Snowflake(42334)]
+        members_view = result[snowflakes.Snowflake(42334)]
+        assert isinstance(members_view, cache_utilities.LiveCacheMappingView)
+        assert members_view[snowflakes.Snowflake(3214321)] is cache_impl._build_member.return_value
+
+    def test__member_version(self, cache_impl):
+        user = mock.Mock(users.User)
+        member_data = mock.Mock(cache_utilities.MemberData, build_dependencies=mock.Mock(return_value=(user,)))
+
+        assert cache_impl._member_version(cache_utilities.RefCell(member_data)) == (member_data, user)
+
+    def test_get_members_view_for_guild_with_live_views_and_columnar_members(self, cache_impl):
+        cache_impl._settings.live_views = True
+        cache_impl._settings.columnar_members = True
+        cache_impl._settings.components = config_api.CacheComponents.MEMBERS
+        member = guilds.Member(
+            guild_id=snowflakes.Snowflake(42334),
+            user=mock.Mock(users.User, id=snowflakes.Snowflake(123)),
+            nickname="nick",
+            role_ids=[],
+            joined_at=datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc),
+            guild_avatar_hash=None,
+            premium_since=None,
+            is_deaf=False,
+            is_mute=False,
+            is_pending=False,
+            raw_communication_disabled_until=None,
+        )
+        cache_impl.set_member(member)
+        view = cache_impl.get_members_view_for_guild(42334)
+
+        with mock.patch.object(
+            cache_utilities.MemberData, "build_entity", autospec=True, side_effect=lambda data, app: object()
+        ) as build_entity:
+            first = view[snowflakes.Snowflake(123)]
+            assert view[snowflakes.Snowflake(123)] is first
+            build_entity.assert_called_once()
+
+            member.nickname = "new nick"
+            cache_impl.set_member(member)
+
+            assert view[snowflakes.Snowflake(123)] is not first
+            assert build_entity.call_count == 2
+
+    def test__presence_version(self, cache_impl):
+        emoji = mock.Mock(emojis.CustomEmoji)
+        presence_data = mock.Mock(
+            cache_utilities.MemberPresenceData, build_dependencies=mock.Mock(return_value=(emoji,))
+        )
+
+        assert cache_impl._presence_version(presence_data) == (presence_data, emoji)
+
     def test_set_member(self, cache_impl):
         mock_user = mock.Mock(users.User, id=snowflakes.Snowflake(645234123))
         mock_user_ref = cache_utilities.RefCell(mock_user)
@@ -1948,6 +2061,196 @@ class TestCacheImpl:
         cache_impl.get_member.assert_has_calls([mock.call(123123, 65234123), mock.call(123123, 65234123)])
         cache_impl.set_member.assert_called_once_with(mock_member)
 
+    def test_set_members_bulk(self, cache_impl):
+        guild_id = snowflakes.Snowflake(67345234)
+        mock_user_1 = mock.Mock(users.User, id=snowflakes.Snowflake(645234123))
+        mock_user_2 = mock.Mock(users.User, id=snowflakes.Snowflake(54123123))
+        mock_user_ref_1 = cache_utilities.RefCell(mock_user_1)
+        mock_user_ref_2 = cache_utilities.RefCell(mock_user_2)
+        member_1 = mock.Mock(guilds.Member, guild_id=guild_id, id=mock_user_1.id, user=mock_user_1)
+        member_2 = mock.Mock(guilds.Member, guild_id=guild_id, id=mock_user_2.id, user=mock_user_2)
+        cached_cell = cache_utilities.RefCell(mock.Mock(cache_utilities.MemberData))
+        cache_impl._guild_entries = collections.FreezableDict(
+            {guild_id: cache_utilities.GuildRecord(members=collections.FreezableDict({mock_user_1.id: cached_cell}))}
+        )
+        cache_impl._set_user = mock.Mock(side_effect=[mock_user_ref_1, mock_user_ref_2])
+        cache_impl._increment_ref_count = mock.Mock()
+        member_data_1 = mock.Mock(user=mock_user_ref_1)
+        member_data_2 = mock.Mock(user=mock_user_ref_2)
+
+        with mock.patch.object(
+            cache_utilities.MemberData, "build_from_entity", side_effect=[member_data_1, member_data_2]
+        ) as build_from_entity:
+            cache_impl.set_members_bulk([member_1, member_2])
+
+        build_from_entity.assert_has_calls(
+            [mock.call(member_1, user=mock_user_ref_1), mock.call(member_2, user=mock_user_ref_2)]
+        )
+        cache_impl._set_user.assert_has_calls([mock.call(mock_user_1), mock.call(mock_user_2)])
+        cache_impl._increment_ref_count.assert_called_once_with(mock_user_ref_2)
+        members = cache_impl._guild_entries[guild_id].members
+        assert members[mock_user_1.id] is cached_cell
+        assert cached_cell.object is member_data_1
+        assert members[mock_user_2.id].object is member_data_2
+
+    def test_set_members_bulk_for_multiple_guilds(self, cache_impl):
+        member_1 = mock.Mock(guilds.Member, guild_id=snowflakes.Snowflake(123), id=snowflakes.Snowflake(1))
+        member_2 = mock.Mock(guilds.Member, guild_id=snowflakes.Snowflake(456), id=snowflakes.Snowflake(2))
+        cache_impl._set_user = mock.Mock()
+
+        with mock.patch.object(cache_utilities.MemberData, "build_from_entity"):
+            cache_impl.set_members_bulk([member_1, member_2])
+
+        assert list(cache_impl._guild_entries[snowflakes.Snowflake(123)].members) == [1]
+        assert list(cache_impl._guild_entries[snowflakes.Snowflake(456)].members) == [2]
+
+    def test_set_members_bulk_when_members_not_enabled(self, cache_impl):
+        cache_impl._settings.components = config_api.CacheComponents.NONE
+        member = mock.Mock(guilds.Member, guild_id=snowflakes.Snowflake(123), id=snowflakes.Snowflake(1))
+
+        cache_impl.set_members_bulk([member])
+
+        assert cache_impl._guild_entries == {}
+
+    def test_members_with_columnar_store(self, cache_impl):
+        cache_impl._settings.columnar_members = True
+        user = users.UserImpl(
+            id=snowflakes.Snowflake(645234123),
+            app=cache_impl._app,
+            discriminator="0001",
+            username="user",
+            avatar_hash=None,
+            banner_hash=None,
+            accent_color=None,
+            is_bot=False,
+            is_system=False,
+            flags=users.UserFlag.NONE,
+        )
+        member = guilds.Member(
+            guild_id=snowflakes.Snowflake(67345234),
+            user=user,
+            nickname="A NICK LOL",
+            role_ids=[snowflakes.Snowflake(65345234)],
+            joined_at=datetime.datetime(2020, 7, 15, 23, 30, 59, 501602, tzinfo=datetime.timezone.utc),
+            premium_since=None,
+            is_deaf=True,
+            guild_avatar_hash=None,
+            is_mute=False,
+            is_pending=undefined.UNDEFINED,
+            raw_communication_disabled_until=None,
+        )
+
+        cache_impl.set_member(member)
+
+        members = cache_impl._guild_entries[snowflakes.Snowflake(67345234)].members
+        assert isinstance(members, cache_utilities.ColumnarMemberStore)
+        assert cache_impl.get_member(67345234, 645234123) == member
+        assert list(cache_impl.get_members_view_for_guild(67345234).values()) == [member]
+
+        assert cache_impl.delete_member(67345234, 645234123) == member
+        assert cache_impl.get_member(67345234, 645234123) is None
+        assert 67345234 not in cache_impl._guild_entries
+
+    def test_garbage_collect_member_with_columnar_store_keeps_deleted_flag(self, cache_impl):
+        guild_record = cache_utilities.GuildRecord(members=cache_utilities.ColumnarMemberStore(snowflakes.Snowflake(1)))
+        member_data = cache_utilities.MemberData(
+            user=cache_utilities.RefCell(mock.Mock(users.User, id=snowflakes.Snowflake(2))),
+            guild_id=snowflakes.Snowflake(1),
+            nickname=None,
+            guild_avatar_hash=None,
+            role_ids=(),
+            joined_at=datetime.datetime(2020, 7, 15, tzinfo=datetime.timezone.utc),
+            premium_since=None,
+            is_deaf=False,
+            is_mute=False,
+            is_pending=False,
+            raw_communication_disabled_until=None,
+        )
+        guild_record.members[snowflakes.Snowflake(2)] = cache_utilities.RefCell(member_data, ref_count=1)
+        cell = guild_record.members[snowflakes.Snowflake(2)]
+
+        assert cache_impl._garbage_collect_member(guild_record, cell, deleting=True) is None
+
+        assert guild_record.members[snowflakes.Snowflake(2)].object.has_been_deleted is True
+
+    def test__create_member_store_without_eviction_policy(self, cache_impl):
+        assert isinstance(cache_impl._create_member_store(snowflakes.Snowflake(1)), collections.FreezableDict)
+
+    def test__create_member_store_with_eviction_policy(self, cache_impl):
+        cache_impl._settings.eviction_policies = {
+            config_api.CacheComponents.MEMBERS: config.CacheEvictionPolicy(max_entries_per_guild=1)
+        }
+        cache_impl._garbage_collect_user = mock.Mock()
+        referenced_member = mock.Mock(ref_count=1)
+        member_1 = mock.Mock(ref_count=0)
+        member_2 = mock.Mock(ref_count=0)
+
+        store = cache_impl._create_member_store(snowflakes.Snowflake(1))
+        store[snowflakes.Snowflake(1)] = referenced_member
+        store[snowflakes.Snowflake(2)] = member_1
+        store[snowflakes.Snowflake(3)] = member_2
+
+        assert isinstance(store, collections.EvictingCacheMap)
+        assert store == {snowflakes.Snowflake(1): referenced_member, snowflakes.Snowflake(3): member_2}
+        cache_impl._garbage_collect_user.assert_called_once_with(member_1.object.user, decrement=1)
+
+    def test__create_presence_store_with_eviction_policy(self, cache_impl):
+        cache_impl._settings.eviction_policies = {
+            config_api.CacheComponents.PRESENCES: config.CacheEvictionPolicy(max_entries_per_guild=1)
+        }
+        cache_impl._remove_presence_assets = mock.Mock()
+        presence_1 = object()
+        presence_2 = object()
+
+        store = cache_impl._create_presence_store()
+        store[snowflakes.Snowflake(1)] = presence_1
+        store[snowflakes.Snowflake(2)] = presence_2
+
+        assert store == {snowflakes.Snowflake(2): presence_2}
+        cache_impl._remove_presence_assets.assert_called_once_with(presence_1)
+
+    def test_set_presences_bulk(self, cache_impl):
+        guild_id = snowflakes.Snowflake(123)
+        presence_1 = mock.Mock(presences.MemberPresence, guild_id=guild_id, user_id=snowflakes.Snowflake(1))
+        presence_2 = mock.Mock(presences.MemberPresence, guild_id=guild_id, user_id=snowflakes.Snowflake(2))
+        presence_data_1 = object()
+        presence_data_2 = object()
+        cache_impl._build_presence_data = mock.Mock(side_effect=[presence_data_1, presence_data_2])
+
+        cache_impl.set_presences_bulk([presence_1, presence_2])
+
+        cache_impl._build_presence_data.assert_has_calls([mock.call(presence_1), mock.call(presence_2)])
+        assert cache_impl._guild_entries[guild_id].presences == {1: presence_data_1, 2: presence_data_2}
+
+    def test_set_presences_bulk_when_presences_not_enabled(self, cache_impl):
+        cache_impl._settings.components = config_api.CacheComponents.NONE
+        cache_impl._build_presence_data = mock.Mock()
+
+        cache_impl.set_presences_bulk([mock.Mock(presences.MemberPresence)])
+
+        cache_impl._build_presence_data.assert_not_called()
+        assert cache_impl._guild_entries == {}
+
+    def test_replace_guild_snapshot_leaves_missing_entities(self, cache_impl):
+        cache_impl.update_guild = mock.Mock()
+        role = mock.Mock(guilds.Role, id=snowflakes.Snowflake(456), guild_id=snowflakes.Snowflake(123))
+        cache_impl.set_role(role)
+
+        cache_impl.replace_guild_snapshot(123, members=[])
+
+        cache_impl.update_guild.assert_not_called()
+        assert list(cache_impl._role_entries) == [456]
+        assert cache_impl._guild_entries[snowflakes.Snowflake(123)].members is None
+
+    def test_replace_guild_snapshot_when_components_not_enabled(self, cache_impl):
+        cache_impl._settings.components = config_api.CacheComponents.NONE
+        role = mock.Mock(guilds.Role, id=snowflakes.Snowflake(456), guild_id=snowflakes.Snowflake(123))
+
+        cache_impl.replace_guild_snapshot(123, channels=[], emojis=[], roles=[role], members=[], presences=[])
+
+        assert cache_impl._guild_entries == {}
+        assert cache_impl._role_entries == {}
+
     @pytest.mark.skip(reason="TODO")
     def test_clear_presences(self, cache_impl):
         ...
@@ -2079,6 +2382,22 @@ class TestCacheImpl:
 
         assert result == mock_user
 
+    def test_get_user_with_shared_entities(self, cache_impl):
+        cache_impl._settings.shared_entities = True
+        mock_user = mock.MagicMock(users.User)
+        cache_impl._user_entries = collections.FreezableDict(
+            {snowflakes.Snowflake(21231234): cache_utilities.RefCell(mock_user)}
+        )
+
+        assert cache_impl.get_user(StubModel(21231234)) is mock_user
+
+    def test_get_role_with_shared_entities(self, cache_impl):
+        cache_impl._settings.shared_entities = True
+        mock_role = mock.Mock(guilds.Role)
+        cache_impl._role_entries = collections.FreezableDict({snowflakes.Snowflake(6543): mock_role})
+
+        assert cache_impl.get_role(StubModel(6543)) is mock_role
+
     def test_get_users_view_for_filled_user_cache(self, cache_impl):
         mock_user_1 = mock.MagicMock(users.User)
         mock_user_2 = mock.MagicMock(users.User)
@@ -2681,6 +3000,23 @@ class TestCacheImpl:
     def test_update_message_for_partial_message(self, cache_impl):
         raise NotImplementedError
 
+    def test_update_message_for_partial_message_replaces_cached_data(self, cache_impl):
+        message = mock.Mock(
+            messages.PartialMessage, id=snowflakes.Snowflake(45312312), mentions=mock.Mock(users=undefined.UNDEFINED)
+        )
+        message_data = mock.Mock(cache_utilities.MessageData)
+        cached_message_data = cache_utilities.RefCell(message_data)
+        cache_impl._message_entries = collections.FreezableDict({snowflakes.Snowflake(45312312): cached_message_data})
+        cache_impl.get_message = mock.Mock(side_effect=(object(), object()))
+
+        with mock.patch.object(copy, "copy") as copy_:
+            cache_impl.update_message(message)
+
+        copy_.assert_called_once_with(message_data)
+        assert cached_message_data.object is copy_.return_value
+        copy_.return_value.update.assert_called_once_with(message, mention_users=undefined.UNDEFINED)
+        message_data.update.assert_not_called()
+
     def test_update_message_for_unknown_partial_message(self, cache_impl):
         message = mock.Mock(messages.PartialMessage, id=snowflakes.Snowflake(2123123123))
         cache_impl.get_message = mock.Mock(side_effect=(None, None))
@@ -0,0 +1,352 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import socket
+
+import mock
+import pytest
+
+from hikari import errors
+from hikari.impl import cache_store
+
+
+@pytest.fixture()
+def server():
+    server = cache_store.CacheStoreServer()
+    server.start()
+    yield server
+    server.close()
+
+
+@pytest.fixture()
+def client(server):
+    client = cache_store.CacheStoreClient(*server.address)
+    yield client
+    client.close()
+
+
+class TestCacheStoreClient:
+    def test_execute(self, client):
+        assert client.execute("PING") == b"PONG"
+        assert client.execute("HSET", "key", "field", b"value", 1, 2) == 2
+        assert client.execute("HGET", "key", "field") == b"value"
+        assert client.execute("HGET", "key", 1) == b"2"
+        assert client.execute("HGET", "key", "missing") is None
+
+    def test_execute_many(self, client):
+        replies = client.execute_many(
+            [
+                ("SADD", "set", "a", "b", "a"),
+                ("SMEMBERS", "set"),
+                ("HINCRBY", "counts", "a", 5),
+                ("HINCRBY", "counts", "a", -2),
+                ("HMGET", "counts", "a", "b"),
+            ]
+        )
+
+        assert replies[0] == 2
+        assert sorted(replies[1]) == [b"a", b"b"]
+        assert replies[2:] == [5, 3, [b"3", None]]
+
+    def test_execute_many_when_empty(self, client):
+        assert client.execute_many([]) == []
+
+    def test_execute_many_when_error_reply_still_runs_all_commands(self, client):
+        with pytest.raises(errors.CacheStoreError, match="WRONGTYPE"):
+            client.execute_many([("SADD", "key", "a"), ("HGET", "key", "a"), ("HSET", "other", "a", "b")])
+
+        assert client.execute("HGET", "other", "a") == b"b"
+
+    def test_execute_when_store_unreachable(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        client = cache_store.CacheStoreClient(port=port, timeout=1)
+
+        with pytest.raises(errors.CacheStoreError, match="Failed to reach the cache store"):
+            client.execute("PING")
+
+        assert client._socket is None
+        assert client._stream is None
+
+    def test_execute_reconnects_after_close(self, client):
+        assert client.execute("PING") == b"PONG"
+
+        client.close()
+
+        assert client._socket is None
+        assert client.execute("PING") == b"PONG"
+
+    def test_transaction(self, client):
+        client.execute("HSET", "counts", "a", 1)
+        build = mock.Mock(return_value=[("HINCRBY", "counts", "a", 1), ("HDEL", "counts", "b")])
+
+        assert client.transaction(["counts"], [("HGET", "counts", "a")], build) == [2, 0]
+
+        build.assert_called_once_with([b"1"])
+
+    def test_transaction_when_nothing_to_execute(self, client):
+        assert client.transaction(["counts"], [("HGET", "counts", "a")], lambda replies: []) == []
+        assert client.execute("PING") == b"PONG"
+
+    def test_transaction_retries_when_watched_key_changes(self, client, server):
+        other_client = cache_store.CacheStoreClient(*server.address)
+        client.execute("HSET", "counts", "a", 1)
+
+        def build(replies):
+            if replies == [b"1"]:
+                other_client.execute("HINCRBY", "counts", "a", 1)
+
+            return [("HSET", "counts", "a", int(replies[0]) * 10)]
+
+        try:
+            assert client.transaction(["counts"], [("HGET", "counts", "a")], build) == [0]
+        finally:
+            other_client.close()
+
+        assert client.execute("HGET", "counts", "a") == b"20"
+
+    def test_transaction_when_error_reply(self, client):
+        client.execute("SADD", "set", "a")
+
+        with pytest.raises(errors.CacheStoreError, match="WRONGTYPE"):
+            client.transaction(["set"], [("HGET", "set", "a")], lambda replies: [])
+
+        assert client._socket is None
+
+    def test_transaction_when_command_cannot_be_queued(self, client):
+        with pytest.raises(errors.CacheStoreError, match="ERR unknown command 'NOPE'"):
+            client.transaction(["key"], [], lambda replies: [("NOPE",)])
+
+        assert client.execute("PING") == b"PONG"
+
+    def test_submit(self, client):
+        client.submit([("HSET", "key", "a", 1)])
+        client.submit([("HSET", "key", "b", 2)])
+
+        assert client.execute("HMGET", "key", "a", "b") == [b"1", b"2"]
+        assert client._writer is None
+
+    def test_submit_when_empty(self, client):
+        client.submit([])
+
+        assert client._writer is None
+
+    def test_submit_batches_consecutive_commands(self, client):
+        client._pending.extend([[("HSET", "key", "a", 1)], [("HSET", "key", "b", 2)]])
+
+        with mock.patch.object(cache_store.CacheStoreClient, "_send", autospec=True, return_value=[1, 1]) as send:
+            client._write_pending()
+
+        send.assert_called_once_with(client, [("HSET", "key", "a", 1), ("HSET", "key", "b", 2)])
+        assert not client._pending
+
+    def test_submit_when_error_reply_logs_error(self, client):
+        with mock.patch.object(cache_store, "_LOGGER") as logger:
+            client.submit([("SADD", "key", "a"), ("HSET", "key", "a", "b")])
+            client.submit([("HSET", "other", "a", "b")])
+            client.flush()
+
+        logger.error.assert_called_once_with("failed to write to the cache store", exc_info=mock.ANY)
+        assert client.execute("HGET", "other", "a") == b"b"
+
+    def test_submit_transaction(self, client):
+        client.execute("HSET", "counts", "a", 1)
+        build = mock.Mock(return_value=[("HINCRBY", "counts", "a", 1)])
+
+        client.submit_transaction(["counts"], [("HGET", "counts", "a")], build)
+
+        assert client.execute("HGET", "counts", "a") == b"2"
+        build.assert_called_once_with([b"1"])
+
+    def test_flush_when_nothing_submitted(self, client):
+        client.flush()
+
+
+class TestCacheStoreServer:
+    @pytest.fixture()
+    def store(self):
+        store = cache_store.CacheStoreServer()
+        yield store
+        store.close()
+
+    def test_start_when_already_running(self, server):
+        with pytest.raises(errors.ComponentStateConflictError):
+            server.start()
+
+    def test_address(self, store):
+        host, port = store.address
+
+        assert host == "127.0.0.1"
+        assert port != 0
+
+    def test_run_unknown_command(self, store):
+        reply = store.run([b"NOPE"])
+
+        assert isinstance(reply, errors.CacheStoreError)
+        assert str(reply) == "ERR unknown command 'NOPE'"
+
+    @pytest.mark.parametrize("command", [[b"HGET", b"key"], [b"PING", b"a"], [b"HSET", b"key", b"field"]])
+    def test_run_with_wrong_number_of_arguments(self, store, command):
+        reply = store.run(command)
+
+        assert isinstance(reply, errors.CacheStoreError)
+        assert str(reply).startswith("ERR wrong number of arguments")
+
+    def test_run_is_case_insensitive(self, store):
+        assert store.run([b"ping"]) == b"PONG"
+
+    def test_run_with_wrong_type(self, store):
+        store.run([b"HSET", b"key", b"field", b"value"])
+
+        reply = store.run([b"SMEMBERS", b"key"])
+
+        assert isinstance(reply, errors.CacheStoreError)
+        assert str(reply).startswith("WRONGTYPE")
+
+    def test_run_hincrby_with_non_integer(self, store):
+        store.run([b"HSET", b"key", b"field", b"value"])
+
+        reply = store.run([b"HINCRBY", b"key", b"field", b"1"])
+
+        assert isinstance(reply, errors.CacheStoreError)
+        assert str(reply) == "ERR value is not an integer or out of range"
+
+    def test_run_drops_empty_entries(self, store):
+        store.run([b"HSET", b"hash", b"field", b"value"])
+        store.run([b"SADD", b"set", b"member"])
+
+        assert store.run([b"HDEL", b"hash", b"field", b"other"]) == 1
+        assert store.run([b"SREM", b"set", b"member"]) == 1
+        assert store._data == {}
+
+    def test_run_hash_commands(self, store):
+        store.run([b"HSET", b"key", b"a", b"1", b"b", b"2"])
+
+        assert store.run([b"HEXISTS", b"key", b"a"]) == 1
+        assert store.run([b"HEXISTS", b"key", b"c"]) == 0
+        assert store.run([b"HLEN", b"key"]) == 2
+        assert store.run([b"HKEYS", b"key"]) == [b"a", b"b"]
+        assert store.run([b"HGETALL", b"key"]) == [b"a", b"1", b"b", b"2"]
+
+    def test_run_delete_and_flushdb(self, store):
+        store.run([b"HSET", b"a", b"field", b"value"])
+        store.run([b"SADD", b"b", b"member"])
+        store.run([b"SADD", b"c", b"member"])
+
+        assert store.run([b"DEL", b"a", b"missing"]) == 1
+        assert store.run([b"FLUSHDB"]) == b"OK"
+        assert store._data == {}
+
+    def test_run_for_connection_transaction(self, store):
+        transaction = cache_store._Transaction()
+
+        assert store._run_for_connection(transaction, [b"MULTI"]) == b"OK"
+        assert store._run_for_connection(transaction, [b"HSET", b"key", b"a", b"1"]) == b"QUEUED"
+        assert store._run_for_connection(transaction, [b"HGET", b"key", b"a"]) == b"QUEUED"
+        assert store._data == {}
+        assert store._run_for_connection(transaction, [b"EXEC"]) == [1, b"1"]
+        assert transaction == cache_store._Transaction()
+
+    def test_run_for_connection_exec_when_watched_key_changed(self, store):
+        transaction = cache_store._Transaction()
+        store._run_for_connection(transaction, [b"WATCH", b"key"])
+        store.run([b"DEL", b"key"])
+        store._run_for_connection(transaction, [b"MULTI"])
+        store._run_for_connection(transaction, [b"HSET", b"key", b"a", b"1"])
+
+        assert store._run_for_connection(transaction, [b"EXEC"]) is None
+        assert store._data == {}
+        assert transaction == cache_store._Transaction()
+
+    def test_run_for_connection_exec_when_other_key_changed(self, store):
+        transaction = cache_store._Transaction()
+        store._run_for_connection(transaction, [b"WATCH", b"key"])
+        store.run([b"HSET", b"other", b"a", b"1"])
+        store._run_for_connection(transaction, [b"MULTI"])
+        store._run_for_connection(transaction, [b"HSET", b"key", b"a", b"1"])
+
+        assert store._run_for_connection(transaction, [b"EXEC"]) == [1]
+
+    def test_run_for_connection_exec_when_command_failed_to_queue(self, store):
+        transaction = cache_store._Transaction()
+        store._run_for_connection(transaction, [b"MULTI"])
+        store._run_for_connection(transaction, [b"HSET", b"key", b"a", b"1"])
+
+        reply = store._run_for_connection(transaction, [b"HGET", b"key"])
+        assert isinstance(reply, errors.CacheStoreError)
+
+        reply = store._run_for_connection(transaction, [b"EXEC"])
+        assert isinstance(reply, errors.CacheStoreError)
+        assert str(reply).startswith("EXECABORT")
+        assert store._data == {}
+
+    def test_run_for_connection_discard(self, store):
+        transaction = cache_store._Transaction()
+        store._run_for_connection(transaction, [b"WATCH", b"key"])
+        store._run_for_connection(transaction, [b"MULTI"])
+        store._run_for_connection(transaction, [b"HSET", b"key", b"a", b"1"])
+
+        assert store._run_for_connection(transaction, [b"DISCARD"]) == b"OK"
+        assert store._data == {}
+        assert transaction == cache_store._Transaction()
+
+    def test_run_for_connection_unwatch(self, store):
+        transaction = cache_store._Transaction()
+        store._run_for_connection(transaction, [b"WATCH", b"key"])
+
+        assert store._run_for_connection(transaction, [b"UNWATCH"]) == b"OK"
+        assert transaction.watched == {}
+
+    @pytest.mark.parametrize(
+        ("commands", "error"),
+        [
+            ([[b"EXEC"]], "ERR EXEC without MULTI"),
+            ([[b"DISCARD"]], "ERR DISCARD without MULTI"),
+            ([[b"MULTI"], [b"MULTI"]], "ERR MULTI calls can not be nested"),
+            ([[b"MULTI"], [b"WATCH", b"key"]], "ERR WATCH inside MULTI is not allowed"),
+            ([[b"WATCH"]], "ERR wrong number of arguments for 'WATCH' command"),
+        ],
+    )
+    def test_run_for_connection_when_misused(self, store, commands, error):
+        transaction = cache_store._Transaction()
+        for command in commands[:-1]:
+            store._run_for_connection(transaction, command)
+
+        reply = store._run_for_connection(transaction, commands[-1])
+
+        assert isinstance(reply, errors.CacheStoreError)
+        assert str(reply) == error
+
+    def test_run_when_transaction_command(self, store):
+        reply = store.run([b"MULTI"])
+
+        assert isinstance(reply, errors.CacheStoreError)
+        assert str(reply) == "ERR unknown command 'MULTI'"
+
+    def test_close_when_not_started(self):
+        store = cache_store.CacheStoreServer()
+
+        with mock.patch.object(store._server, "shutdown") as shutdown:
+            store.close()
+
+        shutdown.assert_not_called()
@@ -0,0 +1,378 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import base64
+import contextlib
+import random
+
+import mock
+import pytest
+
+from hikari import errors
+from hikari.impl import chunker as chunker_impl
+from hikari.internal import time
+
+
+def test_fixed_size_nonce():
+    stack = contextlib.ExitStack()
+    monotonic = stack.enter_context(mock.patch.object(time, "monotonic_ns"))
+    monotonic.return_value.to_bytes = mock.Mock(return_value="foo")
+
+    randbits = stack.enter_context(mock.patch.object(random, "getrandbits"))
+    randbits.return_value.to_bytes = mock.Mock(return_value="bar")
+
+    encode = stack.enter_context(mock.patch.object(base64, "b64encode"))
+    encode.return_value.decode = mock.Mock(return_value="nonce")
+
+    with stack:
+        assert chunker_impl._fixed_size_nonce() == "nonce"
+
+    monotonic.assert_called_once_with()
+    monotonic.return_value.to_bytes.assert_called_once_with(8, "big")
+
+    randbits.assert_called_once_with(92)
+    randbits.return_value.to_bytes.assert_called_once_with(12, "big")
+
+    encode.assert_called_once_with("foobar")
+    encode.return_value.decode.assert_called_once_with("ascii")
+
+
+class TestChunkProgress:
+    @pytest.mark.parametrize(
+        ("chunks_received", "chunk_count", "expected"), [(0, None, False), (1, 2, False), (2, 2, True)]
+    )
+    def test_is_complete(self, chunks_received, chunk_count, expected):
+        progress = chunker_impl.ChunkProgress(
+            guild_id=123,
+            shard_id=0,
+            nonce="0.abc",
+            is_sent=True,
+            chunks_received=chunks_received,
+            chunk_count=chunk_count,
+        )
+
+        assert progress.is_complete is expected
+
+
+def _chunk_event(nonce, chunk_index, chunk_count):
+    return mock.Mock(nonce=nonce, chunk_index=chunk_index, chunk_count=chunk_count)
+
+
+class TestGuildChunker:
+    @pytest.fixture()
+    def shard(self):
+        return mock.Mock(id=3, request_guild_members=mock.AsyncMock())
+
+    @pytest.fixture()
+    def chunker(self):
+        return chunker_impl.GuildChunker()
+
+    @pytest.mark.asyncio()
+    async def test_request(self, chunker, shard):
+        with mock.patch.object(chunker_impl, "_fixed_size_nonce", return_value="abc"):
+            nonce = chunker.request(shard, 123, include_presences=True)
+
+        assert nonce == "3.abc"
+        assert chunker.get_progress(123) == chunker_impl.ChunkProgress(
+            guild_id=123, shard_id=3, nonce="3.abc", is_sent=False, chunks_received=0, chunk_count=None
+        )
+
+        await asyncio.sleep(0)
+
+        shard.request_guild_members.assert_awaited_once_with(123, include_presences=True, nonce="3.abc")
+        assert chunker.get_progress(123).is_sent is True
+        assert chunker.get_pending_count() == 1
+
+    @pytest.mark.asyncio()
+    async def test_request_orders_by_member_count(self, chunker, shard):
+        chunker.request(shard, 1, include_presences=False)
+        chunker.request(shard, 2, include_presences=False, member_count=5000)
+        chunker.request(shard, 3, include_presences=False, member_count=10)
+        chunker.request(shard, 4, include_presences=False, member_count=200)
+
+        await asyncio.sleep(0)
+
+        assert [c.args[0] for c in shard.request_guild_members.await_args_list] == [3, 4, 2, 1]
+
+    @pytest.mark.asyncio()
+    async def test_request_replaces_unsent_request(self, chunker, shard):
+        old_nonce = chunker.request(shard, 123, include_presences=False, member_count=10)
+        new_nonce = chunker.request(shard, 123, include_presences=True, member_count=10)
+
+        await asyncio.sleep(0)
+
+        shard.request_guild_members.assert_awaited_once_with(123, include_presences=True, nonce=new_nonce)
+        chunker.on_chunk(_chunk_event(old_nonce, 0, 1))
+        assert chunker.get_progress(123).chunks_received == 0
+
+    @pytest.mark.asyncio()
+    async def test_request_uses_a_worker_per_shard(self, chunker, shard):
+        other_shard = mock.Mock(id=4, request_guild_members=mock.AsyncMock())
+
+        with mock.patch.object(asyncio, "create_task") as create_task:
+            create_task.return_value.done.return_value = False
+            chunker.request(shard, 1, include_presences=False)
+            chunker.request(shard, 2, include_presences=False)
+            chunker.request(other_shard, 3, include_presences=False)
+
+        assert create_task.call_count == 2
+        assert [call.kwargs["name"] for call in create_task.call_args_list] == ["3 guild chunker", "4 guild chunker"]
+        for call in create_task.call_args_list:
+            call.args[0].close()
+
+    @pytest.mark.asyncio()
+    async def test_prioritize(self, chunker, shard):
+        chunker.request(shard, 1, include_presences=False, member_count=10)
+        chunker.request(shard, 2, include_presences=False, member_count=20)
+        chunker.request(shard, 3, include_presences=False, member_count=30)
+
+        assert chunker.prioritize(3) is True
+        assert chunker.prioritize(2) is True
+        await asyncio.sleep(0)
+
+        assert [c.args[0] for c in shard.request_guild_members.await_args_list] == [2, 3, 1]
+
+    @pytest.mark.asyncio()
+    async def test_prioritize_when_already_sent(self, chunker, shard):
+        chunker.request(shard, 1, include_presences=False)
+        await asyncio.sleep(0)
+
+        assert chunker.prioritize(1) is False
+        assert chunker.prioritize(2) is False
+
+    def test_get_progress_when_not_requested(self, chunker):
+        assert chunker.get_progress(123) is None
+
+    @pytest.mark.asyncio()
+    async def test_on_chunk(self, chunker, shard):
+        nonce = chunker.request(shard, 123, include_presences=False)
+        await asyncio.sleep(0)
+
+        chunker.on_chunk(_chunk_event(nonce, 1, 3))
+        chunker.on_chunk(_chunk_event(nonce, 0, 3))
+
+        progress = chunker.get_progress(123)
+        assert progress.chunks_received == 2
+        assert progress.chunk_count == 3
+        assert progress.is_complete is False
+        assert chunker.get_pending_count() == 1
+
+        chunker.on_chunk(_chunk_event(nonce, 2, 3))
+
+        assert chunker.get_progress(123).is_complete is True
+        assert chunker.get_pending_count() == 0
+
+    @pytest.mark.asyncio()
+    async def test_is_awaiting_chunks(self, chunker, shard):
+        assert chunker.is_awaiting_chunks() is False
+
+        nonce = chunker.request(shard, 123, include_presences=False)
+        assert chunker.is_awaiting_chunks() is True
+
+        chunker.on_chunk(_chunk_event(nonce, 0, 1))
+        assert chunker.is_awaiting_chunks() is False
+
+        chunker._fetches["1.abc"] = object()
+        assert chunker.is_awaiting_chunks() is True
+
+    def test_on_chunk_ignores_unknown_nonces(self, chunker):
+        chunker.on_chunk(_chunk_event(None, 0, 1))
+        chunker.on_chunk(_chunk_event("1.unknown", 0, 1))
+
+        assert chunker.get_pending_count() == 0
+
+    @pytest.mark.asyncio()
+    async def test_wait_until_chunked(self, chunker, shard):
+        waiter = asyncio.ensure_future(chunker.wait_until_chunked(123, timeout=1))
+        await asyncio.sleep(0)
+        nonce = chunker.request(shard, 123, include_presences=False)
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        chunker.on_chunk(_chunk_event(nonce, 0, 1))
+
+        await waiter
+        assert waiter.result() is None
+
+    @pytest.mark.asyncio()
+    async def test_wait_until_chunked_when_already_chunked(self, chunker, shard):
+        nonce = chunker.request(shard, 123, include_presences=False)
+        chunker.on_chunk(_chunk_event(nonce, 0, 1))
+
+        await asyncio.wait_for(chunker.wait_until_chunked(123), timeout=1)
+
+    @pytest.mark.asyncio()
+    async def test_wait_until_chunked_times_out(self, chunker, shard):
+        chunker.request(shard, 123, include_presences=False)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await chunker.wait_until_chunked(123, timeout=0.01)
+
+    @pytest.mark.asyncio()
+    async def test_wait_until_chunked_when_request_fails(self, chunker, shard):
+        error = RuntimeError("oops")
+        shard.request_guild_members.side_effect = error
+        waiter = asyncio.ensure_future(chunker.wait_until_chunked(123, timeout=1))
+        await asyncio.sleep(0)
+
+        with mock.patch.object(chunker_impl, "_LOGGER"):
+            chunker.request(shard, 123, include_presences=False)
+            await asyncio.sleep(0)
+
+        with pytest.raises(RuntimeError) as exc_info:
+            await waiter
+
+        assert exc_info.value is error
+        assert chunker._waiters == {}
+
+    @pytest.mark.asyncio()
+    async def test_wait_until_chunked_when_shard_is_closing(self, chunker, shard):
+        shard.request_guild_members.side_effect = errors.ComponentStateConflictError(reason="closing")
+        waiter_1 = asyncio.ensure_future(chunker.wait_until_chunked(1, timeout=1))
+        waiter_2 = asyncio.ensure_future(chunker.wait_until_chunked(2, timeout=1))
+        await asyncio.sleep(0)
+
+        chunker.request(shard, 1, include_presences=False, member_count=1)
+        chunker.request(shard, 2, include_presences=False, member_count=2)
+        await asyncio.sleep(0)
+
+        with pytest.raises(errors.ComponentStateConflictError):
+            await waiter_1
+
+        with pytest.raises(errors.ComponentStateConflictError):
+            await waiter_2
+
+        assert chunker._waiters == {}
+
+    @pytest.mark.asyncio()
+    async def test_wait_until_chunked_when_closed(self, chunker, shard):
+        chunker.request(shard, 123, include_presences=False)
+        waiter = asyncio.ensure_future(chunker.wait_until_chunked(123, timeout=1))
+        await asyncio.sleep(0)
+
+        chunker.close()
+
+        with pytest.raises(errors.ComponentStateConflictError):
+            await waiter
+
+        assert chunker._waiters == {}
+
+    @pytest.mark.asyncio()
+    async def test_fetch_members(self, chunker, shard):
+        cached_member = object()
+        cache = mock.Mock()
+        cache.get_member.side_effect = lambda guild_id, user_id: cached_member if user_id == 5 else None
+        member_1 = object()
+        member_2 = object()
+        user_ids = list(range(1, 251))
+
+        task = asyncio.ensure_future(
+            chunker.fetch_members(shard, 123, [*user_ids, 1, 2], cache=cache, include_presences=True, timeout=1)
+        )
+        await asyncio.sleep(0)
+
+        calls = shard.request_guild_members.await_args_list
+        assert [call.kwargs["users"] for call in calls] == [
+            [*range(1, 5), *range(6, 102)],
+            list(range(102, 202)),
+            list(range(202, 251)),
+        ]
+        for call in calls:
+            assert call.args == (123,)
+            assert call.kwargs["include_presences"] is True
+
+        nonces = [call.kwargs["nonce"] for call in calls]
+        assert len(set(nonces)) == 3
+        chunker.on_chunk(mock.Mock(nonce=nonces[0], chunk_index=0, chunk_count=1, members={1: member_1}))
+        chunker.on_chunk(mock.Mock(nonce=nonces[1], chunk_index=0, chunk_count=1, members={}))
+        await asyncio.sleep(0)
+        assert not task.done()
+
+        chunker.on_chunk(mock.Mock(nonce=nonces[2], chunk_index=0, chunk_count=1, members={202: member_2}))
+
+        assert await task == {5: cached_member, 1: member_1, 202: member_2}
+        assert chunker._fetches == {}
+
+    @pytest.mark.asyncio()
+    async def test_fetch_members_when_all_cached(self, chunker, shard):
+        member = object()
+        cache = mock.Mock()
+        cache.get_member.return_value = member
+
+        assert await chunker.fetch_members(shard, 123, [1, 2], cache=cache) == {1: member, 2: member}
+
+        shard.request_guild_members.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_fetch_members_times_out(self, chunker, shard):
+        with pytest.raises(asyncio.TimeoutError):
+            await chunker.fetch_members(shard, 123, [1], timeout=0.01)
+
+        assert chunker._fetches == {}
+
+    @pytest.mark.asyncio()
+    async def test_fetch_members_when_closed(self, chunker, shard):
+        task = asyncio.ensure_future(chunker.fetch_members(shard, 123, [1]))
+        await asyncio.sleep(0)
+
+        chunker.close()
+
+        with pytest.raises(errors.ComponentStateConflictError):
+            await task
+
+    @pytest.mark.asyncio()
+    async def test_worker_drops_queue_when_shard_is_closing(self, chunker, shard):
+        shard.request_guild_members.side_effect = errors.ComponentStateConflictError(reason="closing")
+        chunker.request(shard, 1, include_presences=False, member_count=1)
+        chunker.request(shard, 2, include_presences=False, member_count=2)
+
+        await asyncio.sleep(0)
+
+        shard.request_guild_members.assert_awaited_once()
+        assert chunker.get_progress(1) is None
+        assert chunker.get_progress(2) is None
+        assert chunker.get_pending_count() == 0
+
+    @pytest.mark.asyncio()
+    async def test_worker_continues_after_unexpected_error(self, chunker, shard):
+        shard.request_guild_members.side_effect = [RuntimeError("oops"), None]
+        chunker.request(shard, 1, include_presences=False, member_count=1)
+        chunker.request(shard, 2, include_presences=False, member_count=2)
+
+        with mock.patch.object(chunker_impl, "_LOGGER") as logger:
+            await asyncio.sleep(0)
+
+        logger.error.assert_called_once()
+        assert shard.request_guild_members.await_count == 2
+        assert chunker.get_progress(1) is None
+        assert chunker.get_progress(2).is_sent is True
+
+    @pytest.mark.asyncio()
+    async def test_close(self, chunker, shard):
+        chunker.request(shard, 1, include_presences=False)
+
+        chunker.close()
+        await asyncio.sleep(0)
+
+        shard.request_guild_members.assert_not_called()
+        assert chunker.get_progress(1) is None
+        assert chunker.get_pending_count() == 0
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import contextlib
+
+import mock
+import pytest
+
+from hikari import errors
+from hikari.impl import cluster
+from hikari.impl import rest as rest_impl
+from hikari.internal import ux
+
+
+@pytest.mark.parametrize(
+    ("shard_count", "worker_count", "expected"),
+    [
+        (10, 1, [range(0, 10)]),
+        (10, 3, [range(0, 4), range(4, 7), range(7, 10)]),
+        (4, 4, [range(0, 1), range(1, 2), range(2, 3), range(3, 4)]),
+    ],
+)
+def test__split_shard_ids(shard_count, worker_count, expected):
+    assert cluster._split_shard_ids(shard_count, worker_count) == expected
+
+
+class TestIdentifyCoordinator:
+    @pytest.mark.asyncio()
+    async def test_acquire_when_bucket_is_free(self):
+        coordinator = cluster._IdentifyCoordinator(16)
+
+        with mock.patch.object(cluster.time, "monotonic", return_value=100):
+            with mock.patch.object(asyncio, "sleep") as sleep:
+                await coordinator.acquire(17)
+
+        sleep.assert_not_called()
+        assert coordinator._next_allowed == {1: 105}
+
+    @pytest.mark.asyncio()
+    async def test_acquire_when_bucket_was_recently_used(self):
+        coordinator = cluster._IdentifyCoordinator(16)
+        coordinator._next_allowed[1] = 103
+
+        with mock.patch.object(cluster.time, "monotonic", side_effect=[100, 103]):
+            with mock.patch.object(asyncio, "sleep") as sleep:
+                await coordinator.acquire(33)
+
+        sleep.assert_awaited_once_with(3)
+        assert coordinator._next_allowed == {1: 108}
+
+    @pytest.mark.asyncio()
+    async def test_window_gate_round_trip(self):
+        coordinator = cluster._IdentifyCoordinator(16)
+
+        with mock.patch.object(cluster._IdentifyCoordinator, "acquire") as acquire:
+            server = await asyncio.start_server(coordinator.handle_connection, host="127.0.0.1", port=0)
+
+            async with server:
+                host, port = server.sockets[0].getsockname()[:2]
+                await cluster._WindowGate(host, port)(range(16, 19))
+
+        acquire.assert_has_awaits([mock.call(16), mock.call(17), mock.call(18)])
+
+
+class TestWindowGate:
+    @pytest.mark.asyncio()
+    async def test_call_when_connection_closed_early(self):
+        reader = mock.Mock(readline=mock.AsyncMock(return_value=b""))
+        writer = mock.Mock(drain=mock.AsyncMock(), wait_closed=mock.AsyncMock())
+
+        with mock.patch.object(asyncio, "open_connection", return_value=(reader, writer)) as open_connection:
+            with pytest.raises(errors.GatewayError):
+                await cluster._WindowGate("127.0.0.1", 1234)([0, 1])
+
+        open_connection.assert_awaited_once_with("127.0.0.1", 1234)
+        writer.write.assert_called_once_with(b'{"shard_ids":[0,1]}\n')
+        writer.close.assert_called_once_with()
+
+
+def test__run_worker():
+    bot = mock.Mock()
+    bot_factory = mock.Mock(return_value=bot)
+
+    cluster._run_worker(bot_factory, "127.0.0.1", 1234, range(4, 8), 16, {"large_threshold": 100})
+
+    bot.run.assert_called_once_with(
+        shard_ids={4, 5, 6, 7}, shard_count=16, start_window_gate=mock.ANY, large_threshold=100
+    )
+    assert isinstance(bot.run.call_args.kwargs["start_window_gate"], cluster._WindowGate)
+
+
+def test__stop_workers():
+    stopped = mock.Mock(is_alive=mock.Mock(return_value=False))
+    stuck = mock.Mock(is_alive=mock.Mock(side_effect=[True, True]))
+
+    cluster._stop_workers([stopped, stuck])
+
+    stopped.terminate.assert_not_called()
+    stuck.terminate.assert_called_once_with()
+    stuck.join.assert_has_calls([mock.call(cluster._WORKER_SHUTDOWN_TIMEOUT), mock.call()])
+    stuck.kill.assert_called_once_with()
+
+
+class TestClusterManager:
+    @pytest.fixture()
+    def manager(self):
+        with mock.patch.object(ux, "init_logging"):
+            return cluster.ClusterManager("token", mock.Mock(), worker_count=3)
+
+    def test___init___when_worker_count_is_invalid(self):
+        with pytest.raises(ValueError, match="'worker_count' must be greater than 0"):
+            cluster.ClusterManager("token", mock.Mock(), worker_count=0)
+
+    def test_run_when_shard_ids_passed(self, manager):
+        with pytest.raises(TypeError):
+            manager.run(shard_ids={0})
+
+    def test_run_when_start_window_gate_passed(self, manager):
+        with pytest.raises(TypeError):
+            manager.run(start_window_gate=mock.AsyncMock())
+
+    @pytest.mark.asyncio()
+    async def test__fetch_gateway_bot_info(self, manager):
+        rest = mock.Mock(fetch_gateway_bot_info=mock.AsyncMock())
+        rest_app = mock.Mock()
+        rest_app.acquire.return_value.__aenter__ = mock.AsyncMock(return_value=rest)
+        rest_app.acquire.return_value.__aexit__ = mock.AsyncMock(return_value=False)
+
+        with mock.patch.object(rest_impl, "RESTApp", return_value=rest_app):
+            assert await manager._fetch_gateway_bot_info() is rest.fetch_gateway_bot_info.return_value
+
+        rest_app.acquire.assert_called_once_with("token", "Bot")
+
+    @pytest.mark.asyncio()
+    async def test__run_when_session_start_limit_exceeded(self, manager):
+        requirements = mock.Mock(shard_count=10, session_start_limit=mock.Mock(remaining=9))
+
+        with mock.patch.object(cluster.ClusterManager, "_fetch_gateway_bot_info", return_value=requirements):
+            with pytest.raises(errors.GatewayError):
+                await manager._run([], {"ignore_session_start_limit": False})
+
+    @pytest.mark.asyncio()
+    async def test__run(self, manager):
+        requirements = mock.Mock(shard_count=10, session_start_limit=mock.Mock(remaining=10, max_concurrency=1))
+        context = mock.Mock()
+        context.Process.return_value.is_alive.return_value = False
+        processes = []
+
+        stack = contextlib.ExitStack()
+        stack.enter_context(
+            mock.patch.object(cluster.ClusterManager, "_fetch_gateway_bot_info", return_value=requirements)
+        )
+        stack.enter_context(mock.patch.object(cluster.multiprocessing, "get_context", return_value=context))
+        with stack:
+            await manager._run(processes, {"ignore_session_start_limit": False})
+
+        assert processes == [context.Process.return_value] * 3
+        assert [call.kwargs["args"][3] for call in context.Process.call_args_list] == [
+            range(0, 4),
+            range(4, 7),
+            range(7, 10),
+        ]
+        assert context.Process.return_value.start.call_count == 3
@@ -24,6 +24,7 @@ import ssl
 
 import pytest
 
+from hikari.api import config as config_api
 from hikari.impl import config as config_
 
 
@@ -115,3 +116,38 @@ class TestProxySettings:
     def test_all_headers_when_headers_and_auth_are_not_None(self):
         config = config_.ProxySettings(headers={"header1": "header1 info"}, auth="some auth")
         assert config.all_headers == {"header1": "header1 info", config_._PROXY_AUTHENTICATION_HEADER: "some auth"}
+
+
+class TestCacheEvictionPolicy:
+    def test_defaults_to_lru(self):
+        assert config_.CacheEvictionPolicy(ttl=5).strategy is config_api.CacheEvictionStrategy.LRU
+
+    def test_strategy_is_converted(self):
+        assert config_.CacheEvictionPolicy(strategy="lfu", ttl=5).strategy is config_api.CacheEvictionStrategy.LFU
+
+    @pytest.mark.parametrize(
+        "arguments", [{}, {"ttl": 0}, {"ttl": -1}, {"max_entries_per_guild": 0}, {"max_entries_per_guild": -5}]
+    )
+    def test_invalid_arguments(self, arguments):
+        with pytest.raises(ValueError):
+            config_.CacheEvictionPolicy(**arguments)
+
+
+class TestCacheSettings:
+    @pytest.mark.parametrize("component", [config_api.CacheComponents.MEMBERS, config_api.CacheComponents.PRESENCES])
+    def test_eviction_policies(self, component):
+        policy = config_.CacheEvictionPolicy(max_entries_per_guild=10)
+
+        assert config_.CacheSettings(eviction_policies={component: policy}).eviction_policies == {component: policy}
+
+    @pytest.mark.parametrize(
+        "component",
+        [
+            config_api.CacheComponents.MESSAGES,
+            config_api.CacheComponents.NONE,
+            config_api.CacheComponents.MEMBERS | config_api.CacheComponents.PRESENCES,
+        ],
+    )
+    def test_eviction_policies_for_unsupported_component(self, component):
+        with pytest.raises(ValueError, match="can't be given an eviction policy"):
+            config_.CacheSettings(eviction_policies={component: config_.CacheEvictionPolicy(max_entries_per_guild=10)})
@@ -19,9 +19,11 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import copy
 import datetime
 import typing
 
+import attr
 import mock
 import pytest
 
@@ -643,6 +645,10 @@ class TestEntityFactoryImpl:
     def entity_factory_impl(self, mock_app) -> entity_factory.EntityFactoryImpl:
         return entity_factory.EntityFactoryImpl(app=mock_app)
 
+    @pytest.fixture()
+    def lazy_entity_factory_impl(self, mock_app) -> entity_factory.EntityFactoryImpl:
+        return entity_factory.EntityFactoryImpl(app=mock_app, lazy_entities=True)
+
     def test_app(self, entity_factory_impl, mock_app):
         assert entity_factory_impl._app is mock_app
 
@@ -2291,6 +2297,37 @@ class TestEntityFactoryImpl:
 
         assert result == {"channel_id": "4312312", "description": "meow2"}
 
+    def test_deserialize_member_when_lazy(self, entity_factory_impl, lazy_entity_factory_impl, member_payload):
+        member_payload = {**member_payload, "guild_id": "76543325"}
+        expected = entity_factory_impl.deserialize_member(member_payload)
+
+        member = lazy_entity_factory_impl.deserialize_member(member_payload)
+
+        assert isinstance(member, guild_models.Member)
+        assert member == expected
+        assert expected == member
+        for field in attr.fields(guild_models.Member):
+            assert getattr(member, field.name) == getattr(expected, field.name), field.name
+
+    def test_deserialize_member_when_lazy_compares_attrs_fields(
+        self, entity_factory_impl, lazy_entity_factory_impl, member_payload
+    ):
+        expected = entity_factory_impl.deserialize_member({**member_payload, "nick": "other"}, guild_id=1)
+
+        member = lazy_entity_factory_impl.deserialize_member(member_payload, guild_id=snowflakes.Snowflake(1))
+
+        assert member != expected
+        assert expected != member
+        assert member != object()
+
+    def test_deserialize_member_when_lazy_with_passed_user(self, lazy_entity_factory_impl, member_payload):
+        user = object()
+
+        member = lazy_entity_factory_impl.deserialize_member(member_payload, user=user, guild_id=snowflakes.Snowflake(1))
+
+        assert member.user is user
+        assert member.role_ids == [11111, 22222, 33333, 44444, 1]
+
     def test_deserialize_member(self, entity_factory_impl, mock_app, member_payload, user_payload):
         member_payload = {**member_payload, "guild_id": "76543325"}
         member = entity_factory_impl.deserialize_member(member_payload)
@@ -4933,6 +4970,40 @@ class TestEntityFactoryImpl:
         assert message.referenced_message is None
         assert message.member is None
 
+    def test_deserialize_message_when_lazy(self, entity_factory_impl, lazy_entity_factory_impl, message_payload):
+        expected = entity_factory_impl.deserialize_message(message_payload)
+
+        message = lazy_entity_factory_impl.deserialize_message(message_payload)
+
+        assert isinstance(message, message_models.Message)
+        assert message == expected
+        assert expected == message
+        assert hash(message) == hash(expected)
+        assert message != attr.evolve(expected, id=snowflakes.Snowflake(1))
+        assert message.content == "some info"
+        with pytest.raises(AttributeError):
+            object.__getattribute__(message, "embeds")
+
+        for field in attr.fields(message_models.Message):
+            if field.name != "mentions":
+                assert getattr(message, field.name) == getattr(expected, field.name), field.name
+
+        assert message.mentions._message is message
+        assert message.mentions.users == expected.mentions.users
+        assert message.mentions.role_ids == expected.mentions.role_ids
+        assert message.mentions.channels == expected.mentions.channels
+        assert message.mentions.everyone == expected.mentions.everyone
+        assert message.referenced_message is message.referenced_message
+
+    def test_deserialize_message_when_lazy_and_copied(self, lazy_entity_factory_impl, message_payload):
+        message = lazy_entity_factory_impl.deserialize_message(message_payload)
+
+        copied = copy.copy(message)
+
+        assert copied is not message
+        assert copied.embeds == message.embeds
+        assert copied.timestamp == message.timestamp
+
     def test_deserialize_message_deserializes_old_stickers_field(self, entity_factory_impl, message_payload):
         message_payload["stickers"] = message_payload["sticker_items"]
         del message_payload["sticker_items"]
@@ -5010,6 +5081,21 @@ class TestEntityFactoryImpl:
         assert activity.buttons == ["owo", "no"]
         assert isinstance(presence, presence_models.MemberPresence)
 
+    def test_deserialize_member_presence_when_lazy(
+        self, entity_factory_impl, lazy_entity_factory_impl, member_presence_payload
+    ):
+        expected = entity_factory_impl.deserialize_member_presence(member_presence_payload)
+
+        presence = lazy_entity_factory_impl.deserialize_member_presence(member_presence_payload)
+
+        assert isinstance(presence, presence_models.MemberPresence)
+        assert presence == expected
+        assert expected == presence
+        assert hash(presence) == hash(expected)
+        assert presence != attr.evolve(expected, user_id=snowflakes.Snowflake(1))
+        for field in attr.fields(presence_models.MemberPresence):
+            assert getattr(presence, field.name) == getattr(expected, field.name), field.name
+
     def test_deserialize_member_presence_with_unset_fields(
         self, entity_factory_impl, user_payload, presence_activity_payload
     ):
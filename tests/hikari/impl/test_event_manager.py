@@ -21,72 +21,27 @@
 # SOFTWARE.
 
 import asyncio
-import base64
-import contextlib
-import random
 
 import mock
 import pytest
 
 from hikari import channels
-from hikari import errors
 from hikari import intents
 from hikari import presences
+from hikari.api import config as api_config
 from hikari.api import event_factory as event_factory_
 from hikari.events import guild_events
+from hikari.impl import chunker as chunker_
 from hikari.impl import config
 from hikari.impl import event_manager
-from hikari.internal import time
 from tests.hikari import hikari_test_helpers
 
 
-def test_fixed_size_nonce():
-    stack = contextlib.ExitStack()
-    monotonic = stack.enter_context(mock.patch.object(time, "monotonic_ns"))
-    monotonic.return_value.to_bytes = mock.Mock(return_value="foo")
-
-    randbits = stack.enter_context(mock.patch.object(random, "getrandbits"))
-    randbits.return_value.to_bytes = mock.Mock(return_value="bar")
-
-    encode = stack.enter_context(mock.patch.object(base64, "b64encode"))
-    encode.return_value.decode = mock.Mock(return_value="nonce")
-
-    with stack:
-        assert event_manager._fixed_size_nonce() == "nonce"
-
-    monotonic.assert_called_once_with()
-    monotonic.return_value.to_bytes.assert_called_once_with(8, "big")
-
-    randbits.assert_called_once_with(92)
-    randbits.return_value.to_bytes.assert_called_once_with(12, "big")
-
-    encode.assert_called_once_with("foobar")
-    encode.return_value.decode.assert_called_once_with("ascii")
-
-
 @pytest.fixture()
 def shard():
     return mock.Mock(id=987)
 
 
-@pytest.mark.asyncio()
-async def test__request_guild_members(shard):
-    shard.request_guild_members = mock.AsyncMock()
-
-    await event_manager._request_guild_members(shard, 123, include_presences=True, nonce="okokok")
-
-    shard.request_guild_members.assert_awaited_once_with(123, include_presences=True, nonce="okokok")
-
-
-@pytest.mark.asyncio()
-async def test__request_guild_members_handles_state_conflict_error(shard):
-    shard.request_guild_members = mock.AsyncMock(side_effect=errors.ComponentStateConflictError(reason="OK"))
-
-    await event_manager._request_guild_members(shard, 123, include_presences=True, nonce="okokok")
-
-    shard.request_guild_members.assert_awaited_once_with(123, include_presences=True, nonce="okokok")
-
-
 class TestEventManagerImpl:
     @pytest.fixture()
     def entity_factory(self):
@@ -99,7 +54,9 @@ class TestEventManagerImpl:
     @pytest.fixture()
     def event_manager_impl(self, entity_factory, event_factory):
         obj = hikari_test_helpers.mock_class_namespace(event_manager.EventManagerImpl, slots_=False)(
-            entity_factory, event_factory, intents.Intents.ALL, cache=mock.Mock(settings=config.CacheSettings())
+            entity_factory, event_factory, intents.Intents.ALL,
+            cache=mock.Mock(settings=config.CacheSettings()),
+            chunker=mock.Mock(),
         )
 
         obj.dispatch = mock.AsyncMock()
@@ -108,7 +65,7 @@ class TestEventManagerImpl:
     @pytest.fixture()
     def stateless_event_manager_impl(self, event_factory, entity_factory):
         obj = hikari_test_helpers.mock_class_namespace(event_manager.EventManagerImpl, slots_=False)(
-            entity_factory, event_factory, intents.Intents.ALL, cache=None
+            entity_factory, event_factory, intents.Intents.ALL, cache=None, chunker=mock.Mock()
         )
 
         obj.dispatch = mock.AsyncMock()
@@ -245,8 +202,7 @@ class TestEventManagerImpl:
         event_manager_impl._cache_enabled_for = mock.Mock(return_value=False)
         event_manager_impl._enabled_for_event = mock.Mock(return_value=True)
 
-        with mock.patch.object(event_manager, "_request_guild_members") as request_guild_members:
-            await event_manager_impl.on_guild_create(shard, payload)
+        await event_manager_impl.on_guild_create(shard, payload)
 
         if unavailable:
             event_manager_impl._enabled_for_event.assert_called_once_with(guild_events.GuildAvailableEvent)
@@ -257,20 +213,17 @@ class TestEventManagerImpl:
             event_factory.deserialize_guild_join_event.assert_called_once_with(shard, payload)
             event = event_factory.deserialize_guild_join_event.return_value
 
-        event_manager_impl._cache.update_guild.assert_not_called()
-        event_manager_impl._cache.clear_guild_channels_for_guild.assert_not_called()
-        event_manager_impl._cache.set_guild_channel.assert_not_called()
-        event_manager_impl._cache.clear_emojis_for_guild.assert_not_called()
-        event_manager_impl._cache.set_emoji.assert_not_called()
-        event_manager_impl._cache.clear_roles_for_guild.assert_not_called()
-        event_manager_impl._cache.set_role.assert_not_called()
-        event_manager_impl._cache.clear_members_for_guild.assert_not_called()
-        event_manager_impl._cache.set_member.assert_not_called()
-        event_manager_impl._cache.clear_presences_for_guild.assert_not_called()
-        event_manager_impl._cache.set_presence.assert_not_called()
-        event_manager_impl._cache.clear_voice_states_for_guild.assert_not_called()
-        event_manager_impl._cache.set_voice_state.assert_not_called()
-        request_guild_members.assert_not_called()
+        event_manager_impl._cache.replace_guild_snapshot.assert_called_once_with(
+            event.guild.id,
+            gateway_guild=None,
+            channels=None,
+            emojis=None,
+            roles=None,
+            members=None,
+            presences=None,
+            voice_states=None,
+        )
+        event_manager_impl._chunker.request.assert_not_called()
 
         event_manager_impl.dispatch.assert_awaited_once_with(event)
 
@@ -284,8 +237,7 @@ class TestEventManagerImpl:
         event_manager_impl._cache_enabled_for = mock.Mock(return_value=False)
         event_manager_impl._enabled_for_event = mock.Mock(return_value=False)
 
-        with mock.patch.object(event_manager, "_request_guild_members") as request_guild_members:
-            await event_manager_impl.on_guild_create(shard, payload)
+        await event_manager_impl.on_guild_create(shard, payload)
 
         if unavailable:
             event_manager_impl._enabled_for_event.assert_called_once_with(guild_events.GuildAvailableEvent)
@@ -295,20 +247,17 @@ class TestEventManagerImpl:
         event_factory.deserialize_guild_join_event.assert_not_called()
         event_factory.deserialize_guild_available_event.assert_not_called()
         entity_factory.deserialize_gateway_guild.assert_called_once_with(payload)
-        event_manager_impl._cache.update_guild.assert_not_called()
-        event_manager_impl._cache.clear_guild_channels_for_guild.assert_not_called()
-        event_manager_impl._cache.set_guild_channel.assert_not_called()
-        event_manager_impl._cache.clear_emojis_for_guild.assert_not_called()
-        event_manager_impl._cache.set_emoji.assert_not_called()
-        event_manager_impl._cache.clear_roles_for_guild.assert_not_called()
-        event_manager_impl._cache.set_role.assert_not_called()
-        event_manager_impl._cache.clear_members_for_guild.assert_not_called()
-        event_manager_impl._cache.set_member.assert_not_called()
-        event_manager_impl._cache.clear_presences_for_guild.assert_not_called()
-        event_manager_impl._cache.set_presence.assert_not_called()
-        event_manager_impl._cache.clear_voice_states_for_guild.assert_not_called()
-        event_manager_impl._cache.set_voice_state.assert_not_called()
-        request_guild_members.assert_not_called()
+        event_manager_impl._cache.replace_guild_snapshot.assert_called_once_with(
+            entity_factory.deserialize_gateway_guild.return_value.id,
+            gateway_guild=None,
+            channels=None,
+            emojis=None,
+            roles=None,
+            members=None,
+            presences=None,
+            voice_states=None,
+        )
+        event_manager_impl._chunker.request.assert_not_called()
 
         event_manager_impl.dispatch.assert_not_called()
 
@@ -329,8 +278,7 @@ class TestEventManagerImpl:
         gateway_guild.presences.return_value = {1: "presence1", 2: "presence2"}
         gateway_guild.members.return_value = {1: "member1", 2: "member2"}
 
-        with mock.patch.object(event_manager, "_request_guild_members") as request_guild_members:
-            await event_manager_impl.on_guild_create(shard, payload)
+        await event_manager_impl.on_guild_create(shard, payload)
 
         if unavailable:
             event_manager_impl._enabled_for_event.assert_called_once_with(guild_events.GuildAvailableEvent)
@@ -340,20 +288,24 @@ class TestEventManagerImpl:
         event_factory.deserialize_guild_join_event.assert_not_called()
         event_factory.deserialize_guild_available_event.assert_not_called()
         entity_factory.deserialize_gateway_guild.assert_called_once_with(payload)
-        event_manager_impl._cache.update_guild.assert_called_once_with(gateway_guild.guild.return_value)
-        event_manager_impl._cache.clear_guild_channels_for_guild.assert_called_once_with(gateway_guild.id)
-        event_manager_impl._cache.set_guild_channel.assert_has_calls([mock.call("channel1"), mock.call("channel2")])
-        event_manager_impl._cache.clear_emojis_for_guild.assert_called_once_with(gateway_guild.id)
-        event_manager_impl._cache.set_emoji.assert_has_calls([mock.call("emoji1"), mock.call("emoji2")])
-        event_manager_impl._cache.clear_roles_for_guild.assert_called_once_with(gateway_guild.id)
-        event_manager_impl._cache.set_role.assert_has_calls([mock.call("role1"), mock.call("role2")])
-        event_manager_impl._cache.clear_members_for_guild.assert_called_once_with(gateway_guild.id)
-        event_manager_impl._cache.set_member.assert_has_calls([mock.call("member1"), mock.call("member2")])
-        event_manager_impl._cache.clear_presences_for_guild.assert_called_once_with(gateway_guild.id)
-        event_manager_impl._cache.set_presence.assert_has_calls([mock.call("presence1"), mock.call("presence2")])
-        event_manager_impl._cache.clear_voice_states_for_guild.assert_called_once_with(gateway_guild.id)
-        event_manager_impl._cache.set_voice_state.assert_has_calls([mock.call("voice1"), mock.call("voice2")])
-        request_guild_members.assert_not_called()
+        event_manager_impl._cache.replace_guild_snapshot.assert_called_once_with(
+            gateway_guild.id,
+            gateway_guild=gateway_guild.guild.return_value,
+            channels=mock.ANY,
+            emojis=mock.ANY,
+            roles=mock.ANY,
+            members=mock.ANY,
+            presences=mock.ANY,
+            voice_states=mock.ANY,
+        )
+        snapshot = event_manager_impl._cache.replace_guild_snapshot.call_args.kwargs
+        assert list(snapshot["channels"]) == ["channel1", "channel2"]
+        assert list(snapshot["emojis"]) == ["emoji1", "emoji2"]
+        assert list(snapshot["roles"]) == ["role1", "role2"]
+        assert list(snapshot["members"]) == ["member1", "member2"]
+        assert list(snapshot["presences"]) == ["presence1", "presence2"]
+        assert list(snapshot["voice_states"]) == ["voice1", "voice2"]
+        event_manager_impl._chunker.request.assert_not_called()
 
         event_manager_impl.dispatch.assert_not_called()
 
@@ -370,8 +322,7 @@ class TestEventManagerImpl:
         stateless_event_manager_impl._cache_enabled_for = mock.Mock(return_value=True)
         stateless_event_manager_impl._enabled_for_event = mock.Mock(return_value=False)
 
-        with mock.patch.object(event_manager, "_request_guild_members") as request_guild_members:
-            await stateless_event_manager_impl.on_guild_create(shard, payload)
+        await stateless_event_manager_impl.on_guild_create(shard, payload)
 
         if unavailable:
             stateless_event_manager_impl._enabled_for_event.assert_called_once_with(guild_events.GuildAvailableEvent)
@@ -380,7 +331,7 @@ class TestEventManagerImpl:
 
         event_factory.deserialize_guild_join_event.assert_not_called()
         event_factory.deserialize_guild_available_event.assert_not_called()
-        request_guild_members.assert_not_called()
+        stateless_event_manager_impl._chunker.request.assert_not_called()
 
         stateless_event_manager_impl.dispatch.assert_not_called()
 
@@ -396,16 +347,11 @@ class TestEventManagerImpl:
         stateless_event_manager_impl._intents = intents.Intents.GUILD_MEMBERS
         stateless_event_manager_impl._cache_enabled_for = mock.Mock(return_value=True)
         stateless_event_manager_impl._enabled_for_event = mock.Mock(return_value=False)
-        mock_request_guild_members = mock.Mock()
 
-        with mock.patch.object(asyncio, "create_task") as create_task:
-            with mock.patch.object(event_manager, "_fixed_size_nonce", return_value="abc"):
-                with mock.patch.object(event_manager, "_request_guild_members", new=mock_request_guild_members):
-                    await stateless_event_manager_impl.on_guild_create(shard, {"id": 456, "large": False})
+        await stateless_event_manager_impl.on_guild_create(shard, {"id": 456, "large": False, "member_count": 42})
 
-        mock_request_guild_members.assert_called_once_with(shard, 456, include_presences=False, nonce="123.abc")
-        create_task.assert_called_once_with(
-            mock_request_guild_members.return_value, name="123:456 guild create members request"
+        stateless_event_manager_impl._chunker.request.assert_called_once_with(
+            shard, 456, include_presences=False, member_count=42
         )
 
     @pytest.mark.asyncio()
@@ -424,16 +370,12 @@ class TestEventManagerImpl:
         mock_event.guild.id = 456
         event_factory.deserialize_guild_join_event.return_value = mock_event
 
-        mock_request_guild_members = mock.Mock()
+        stateless_event_manager_impl._chunker.request.return_value = "123.abc"
 
-        with mock.patch.object(asyncio, "create_task") as create_task:
-            with mock.patch.object(event_manager, "_fixed_size_nonce", return_value="abc"):
-                with mock.patch.object(event_manager, "_request_guild_members", new=mock_request_guild_members):
-                    await stateless_event_manager_impl.on_guild_create(shard, {"large": True})
+        await stateless_event_manager_impl.on_guild_create(shard, {"large": True})
 
-        mock_request_guild_members.assert_called_once_with(shard, 456, include_presences=False, nonce="123.abc")
-        create_task.assert_called_once_with(
-            mock_request_guild_members.return_value, name="123:456 guild create members request"
+        stateless_event_manager_impl._chunker.request.assert_called_once_with(
+            shard, 456, include_presences=False, member_count=None
         )
         assert mock_event.chunk_nonce == "123.abc"
         stateless_event_manager_impl.dispatch.assert_awaited_once_with(mock_event)
@@ -456,10 +398,9 @@ class TestEventManagerImpl:
         stateless_event_manager_impl._enabled_for_event = mock.Mock(return_value=enabled_for_event)
         stateless_event_manager_impl._auto_chunk_members = False
 
-        with mock.patch.object(event_manager, "_request_guild_members") as request_guild_members:
-            await stateless_event_manager_impl.on_guild_create(shard, {"id": 456, "large": large})
+        await stateless_event_manager_impl.on_guild_create(shard, {"id": 456, "large": large})
 
-        request_guild_members.assert_not_called()
+        stateless_event_manager_impl._chunker.request.assert_not_called()
 
     @pytest.mark.asyncio()
     async def test_on_guild_update_when_stateless(
@@ -503,6 +444,218 @@ class TestEventManagerImpl:
         event_factory.deserialize_guild_update_event.assert_called_once_with(shard, payload, old_guild=old_guild)
         event_manager_impl.dispatch.assert_awaited_once_with(event)
 
+    def test_consume_raw_event_when_offloading_guild_create(self, event_manager_impl, shard, event_factory):
+        event_manager_impl._offload_member_threshold = 2
+        event_manager_impl._enabled_for_event = mock.Mock(return_value=True)
+        event_manager_impl._offload_guild_create = mock.Mock()
+        event_manager_impl.dispatch = mock.Mock()
+        payload = {"id": "123", "members": [{}, {}]}
+
+        with mock.patch.object(asyncio, "create_task") as create_task:
+            event_manager_impl.consume_raw_event("GUILD_CREATE", shard, payload)
+
+        event_manager_impl.dispatch.assert_called_once_with(
+            event_factory.deserialize_shard_payload_event.return_value
+        )
+        event_factory.deserialize_shard_payload_event.assert_called_once_with(shard, payload, name="GUILD_CREATE")
+        assert event_manager_impl._deferred_dispatches == {987: []}
+        event_manager_impl._offload_guild_create.assert_called_once_with(shard, payload)
+        create_task.assert_called_once_with(
+            event_manager_impl._offload_guild_create.return_value, name="dispatch GUILD_CREATE"
+        )
+
+    @pytest.mark.parametrize(
+        ("threshold", "event_name"), [(None, "GUILD_CREATE"), (3, "GUILD_CREATE"), (2, "GUILD_UPDATE")]
+    )
+    def test_consume_raw_event_when_not_offloading(self, event_manager_impl, shard, threshold, event_name):
+        event_manager_impl._offload_member_threshold = threshold
+        event_manager_impl._offload_guild_create = mock.Mock()
+        payload = {"id": "123", "members": [{}, {}]}
+
+        with mock.patch.object(event_manager.event_manager_base.EventManagerBase, "consume_raw_event") as consume:
+            event_manager_impl.consume_raw_event(event_name, shard, payload)
+
+        consume.assert_called_once_with(event_name, shard, payload)
+        event_manager_impl._offload_guild_create.assert_not_called()
+        assert event_manager_impl._deferred_dispatches == {}
+
+    @pytest.mark.parametrize(
+        ("coalesce_windows", "message"),
+        [({"MESSAGE_CREATE": 0.5}, "MESSAGE_CREATE events cannot be coalesced"), ({"typing_start": 0}, "greater")],
+    )
+    def test___init___when_coalesce_windows_invalid(self, entity_factory, event_factory, coalesce_windows, message):
+        with pytest.raises(ValueError, match=message):
+            event_manager.EventManagerImpl(
+                entity_factory, event_factory, intents.Intents.ALL, coalesce_windows=coalesce_windows
+            )
+
+    def test___init___normalizes_coalesce_windows(self, entity_factory, event_factory):
+        manager = event_manager.EventManagerImpl(
+            entity_factory, event_factory, intents.Intents.ALL, coalesce_windows={"presence_update": 0.5}
+        )
+
+        assert manager._coalesce_windows == {"PRESENCE_UPDATE": 0.5}
+
+    @pytest.mark.asyncio()
+    async def test_consume_raw_event_when_coalescing(self, event_manager_impl, shard):
+        event_manager_impl._coalesce_windows = {"PRESENCE_UPDATE": 0.5}
+        payload_1 = {"guild_id": "123", "user": {"id": "456"}, "status": "online"}
+        payload_2 = {"guild_id": "123", "user": {"id": "456"}, "status": "idle"}
+        payload_3 = {"guild_id": "123", "user": {"id": "789"}, "status": "dnd"}
+        loop = mock.Mock()
+
+        with mock.patch.object(event_manager.event_manager_base.EventManagerBase, "consume_raw_event") as consume:
+            with mock.patch.object(asyncio, "get_running_loop", return_value=loop):
+                event_manager_impl.consume_raw_event("PRESENCE_UPDATE", shard, payload_1)
+                event_manager_impl.consume_raw_event("PRESENCE_UPDATE", shard, payload_2)
+                event_manager_impl.consume_raw_event("PRESENCE_UPDATE", shard, payload_3)
+
+            consume.assert_not_called()
+            key_1 = ("PRESENCE_UPDATE", 987, ("123", "456"))
+            key_2 = ("PRESENCE_UPDATE", 987, ("123", "789"))
+            assert loop.call_later.call_args_list == [
+                mock.call(0.5, event_manager_impl._flush_coalesced, key_1),
+                mock.call(0.5, event_manager_impl._flush_coalesced, key_2),
+            ]
+
+            event_manager_impl._flush_coalesced(key_1)
+            event_manager_impl._flush_coalesced(key_2)
+
+        assert consume.call_args_list == [
+            mock.call("PRESENCE_UPDATE", shard, payload_2),
+            mock.call("PRESENCE_UPDATE", shard, payload_3),
+        ]
+        assert event_manager_impl._coalesced == {}
+
+    @pytest.mark.asyncio()
+    async def test_consume_raw_event_when_coalescing_and_key_missing(self, event_manager_impl, shard):
+        event_manager_impl._coalesce_windows = {"TYPING_START": 0.5}
+        payload = {"user_id": "456"}
+
+        with mock.patch.object(event_manager.event_manager_base.EventManagerBase, "consume_raw_event") as consume:
+            event_manager_impl.consume_raw_event("TYPING_START", shard, payload)
+
+        consume.assert_called_once_with("TYPING_START", shard, payload)
+        assert event_manager_impl._coalesced == {}
+
+    @pytest.mark.asyncio()
+    @hikari_test_helpers.timeout()
+    async def test_consume_raw_event_when_coalescing_flushes_after_window(self, event_manager_impl, shard):
+        event_manager_impl._coalesce_windows = {"TYPING_START": 0.01}
+        payload = {"channel_id": "123", "user_id": "456"}
+
+        with mock.patch.object(event_manager.event_manager_base.EventManagerBase, "consume_raw_event") as consume:
+            event_manager_impl.consume_raw_event("TYPING_START", shard, payload)
+            await asyncio.sleep(0.05)
+
+        consume.assert_called_once_with("TYPING_START", shard, payload)
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(
+        ("event_name", "payload"),
+        [
+            ("GUILD_MEMBER_REMOVE", {"guild_id": "123", "user": {"id": "456"}}),
+            ("GUILD_DELETE", {"id": "123"}),
+        ],
+    )
+    async def test_consume_raw_event_discards_stale_coalesced_payloads(
+        self, event_manager_impl, shard, event_name, payload
+    ):
+        event_manager_impl._coalesce_windows = {"PRESENCE_UPDATE": 0.5, "GUILD_MEMBER_UPDATE": 0.5, "TYPING_START": 0.5}
+        member_update = {"guild_id": "123", "user": {"id": "456"}}
+        other_guild_update = {"guild_id": "321", "user": {"id": "456"}}
+        typing_start = {"channel_id": "123", "user_id": "456"}
+        loop = mock.Mock()
+
+        with mock.patch.object(event_manager.event_manager_base.EventManagerBase, "consume_raw_event") as consume:
+            with mock.patch.object(asyncio, "get_running_loop", return_value=loop):
+                event_manager_impl.consume_raw_event("PRESENCE_UPDATE", shard, member_update)
+                event_manager_impl.consume_raw_event("GUILD_MEMBER_UPDATE", shard, member_update)
+                event_manager_impl.consume_raw_event("GUILD_MEMBER_UPDATE", shard, other_guild_update)
+                event_manager_impl.consume_raw_event("TYPING_START", shard, typing_start)
+                event_manager_impl.consume_raw_event(event_name, shard, payload)
+
+        consume.assert_called_once_with(event_name, shard, payload)
+        assert list(event_manager_impl._coalesced) == [
+            ("GUILD_MEMBER_UPDATE", 987, ("321", "456")),
+            ("TYPING_START", 987, ("123", "456")),
+        ]
+        assert loop.call_later.return_value.cancel.call_count == 2
+
+    @pytest.mark.asyncio()
+    async def test_consume_raw_event_keeps_coalesced_payloads_when_guild_unavailable(self, event_manager_impl, shard):
+        event_manager_impl._coalesce_windows = {"PRESENCE_UPDATE": 0.5}
+        loop = mock.Mock()
+
+        with mock.patch.object(event_manager.event_manager_base.EventManagerBase, "consume_raw_event"):
+            with mock.patch.object(asyncio, "get_running_loop", return_value=loop):
+                event_manager_impl.consume_raw_event("PRESENCE_UPDATE", shard, {"guild_id": "123", "user": {"id": "4"}})
+                event_manager_impl.consume_raw_event("GUILD_DELETE", shard, {"id": "123", "unavailable": True})
+
+        assert list(event_manager_impl._coalesced) == [("PRESENCE_UPDATE", 987, ("123", "4"))]
+        loop.call_later.return_value.cancel.assert_not_called()
+
+    @pytest.mark.asyncio()
+    @hikari_test_helpers.timeout()
+    async def test_close_discards_coalesced_payloads(self, event_manager_impl, shard):
+        event_manager_impl._coalesce_windows = {"TYPING_START": 0.01}
+
+        with mock.patch.object(event_manager.event_manager_base.EventManagerBase, "consume_raw_event") as consume:
+            event_manager_impl.consume_raw_event("TYPING_START", shard, {"channel_id": "123", "user_id": "456"})
+            event_manager_impl.close()
+            await asyncio.sleep(0.05)
+
+        consume.assert_not_called()
+        assert event_manager_impl._coalesced == {}
+
+    @pytest.mark.asyncio()
+    async def test__offload_guild_create(self, event_manager_impl, shard):
+        executor = object()
+        event_manager_impl._executor = executor
+        event_manager_impl._deferred_dispatches = {987: [("GUILD_UPDATE", {})]}
+        manager = mock.Mock(_handle_guild_create=mock.AsyncMock())
+        event_manager_impl._handle_guild_create = manager._handle_guild_create
+        event_manager_impl._resume_dispatches = manager._resume_dispatches
+        loop = mock.Mock(run_in_executor=mock.AsyncMock(return_value=("event", "gd")))
+        payload = {"id": "123"}
+
+        with mock.patch.object(asyncio, "get_running_loop", return_value=loop):
+            with mock.patch.object(event_manager_impl, "_enabled_for_event", return_value=True) as enabled_for_event:
+                await event_manager_impl._offload_guild_create(shard, payload)
+
+        # Whether the event is enabled must be checked on the event loop, as it fills the dispatch tables.
+        enabled_for_event.assert_called_once_with(guild_events.GuildJoinEvent)
+        loop.run_in_executor.assert_awaited_once_with(
+            executor, event_manager_impl._deserialize_guild_create, shard, payload, True
+        )
+        # The held back events must only be consumed once the guild has been cached.
+        assert manager.mock_calls == [
+            mock.call._handle_guild_create(shard, payload, ("event", "gd")),
+            mock.call._resume_dispatches(shard),
+        ]
+
+    @pytest.mark.asyncio()
+    async def test__offload_guild_create_resumes_dispatches_on_error(self, event_manager_impl, shard, event_loop):
+        error_handler = mock.Mock()
+        event_loop.set_exception_handler(error_handler)
+        error = RuntimeError("bork")
+        event_manager_impl._handle_guild_create = mock.AsyncMock()
+        event_manager_impl._resume_dispatches = mock.Mock()
+        event_manager_impl._deserialize_guild_create = mock.Mock(side_effect=error)
+
+        await event_manager_impl._offload_guild_create(shard, {"id": "123"})
+
+        event_manager_impl._resume_dispatches.assert_called_once_with(shard)
+        event_manager_impl._handle_guild_create.assert_not_called()
+        error_handler.assert_called_once_with(
+            event_loop,
+            {
+                "message": "Exception occurred in raw event dispatch conduit",
+                "exception": error,
+                "task": asyncio.current_task(),
+            },
+        )
+
     @pytest.mark.asyncio()
     async def test_on_guild_update_all_cache_components_and_not_dispatching(
         self, event_manager_impl, shard, event_factory, entity_factory
@@ -809,9 +962,12 @@ class TestEventManagerImpl:
 
         await event_manager_impl.on_guild_members_chunk(shard, payload)
 
-        event_manager_impl._cache.set_member.assert_called_once_with(123)
-        event_manager_impl._cache.set_presence.assert_called_once_with(456)
+        event_manager_impl._cache.set_members_bulk.assert_called_once_with(mock.ANY)
+        assert list(event_manager_impl._cache.set_members_bulk.call_args.args[0]) == [123]
+        event_manager_impl._cache.set_presences_bulk.assert_called_once_with(mock.ANY)
+        assert list(event_manager_impl._cache.set_presences_bulk.call_args.args[0]) == [456]
         event_factory.deserialize_guild_member_chunk_event.assert_called_once_with(shard, payload)
+        event_manager_impl._chunker.on_chunk.assert_called_once_with(event)
         event_manager_impl.dispatch.assert_awaited_once_with(event)
 
     @pytest.mark.asyncio()
@@ -825,6 +981,31 @@ class TestEventManagerImpl:
             event_factory.deserialize_guild_member_chunk_event.return_value
         )
 
+    @pytest.mark.asyncio()
+    async def test_guild_members_chunk_enabled_while_chunker_is_waiting(self, entity_factory, event_factory, shard):
+        cache = mock.Mock(settings=config.CacheSettings(components=api_config.CacheComponents.GUILDS))
+        chunker = chunker_.GuildChunker()
+        manager = event_manager.EventManagerImpl(
+            entity_factory, event_factory, intents.Intents.ALL, cache=cache, chunker=chunker
+        )
+        member = object()
+        shard.request_guild_members = mock.AsyncMock()
+
+        assert manager.is_raw_event_enabled("GUILD_MEMBERS_CHUNK") is False
+
+        task = asyncio.ensure_future(chunker.fetch_members(shard, 123, [456], timeout=1))
+        await asyncio.sleep(0)
+        assert manager.is_raw_event_enabled("GUILD_MEMBERS_CHUNK") is True
+
+        nonce = shard.request_guild_members.await_args.kwargs["nonce"]
+        event_factory.deserialize_guild_member_chunk_event.return_value = mock.Mock(
+            nonce=nonce, chunk_index=0, chunk_count=1, members={456: member}, presences={}
+        )
+        manager.consume_raw_event("GUILD_MEMBERS_CHUNK", shard, {})
+
+        assert await task == {456: member}
+        assert manager.is_raw_event_enabled("GUILD_MEMBERS_CHUNK") is False
+
     @pytest.mark.asyncio()
     async def test_on_guild_role_create_stateful(self, event_manager_impl, shard, event_factory):
         payload = {}
@@ -37,11 +37,13 @@ from hikari import errors
 from hikari import intents
 from hikari import iterators
 from hikari.api import config
+from hikari.api import event_manager as event_manager_api
 from hikari.events import base_events
 from hikari.events import member_events
 from hikari.events import shard_events
 from hikari.impl import event_manager_base
 from hikari.internal import reflect
+from hikari.internal import time
 from tests.hikari import hikari_test_helpers
 
 
@@ -161,6 +163,65 @@ class TestEventStream:
             assert await stream.next() is not mock_event
             assert await stream.next() is mock_event
 
+    @pytest.mark.parametrize("overflow", ["drop_oldest", event_manager_api.StreamOverflowPolicy.DROP_OLDEST])
+    def test___init___when_overflow_policy_requires_limit(self, mock_app, overflow):
+        with pytest.raises(ValueError, match="A limit must be set"):
+            event_manager_base.EventStream(mock_app, base_events.Event, timeout=None, overflow=overflow)
+
+    def test___init___when_overflow_policy_unknown(self, mock_app):
+        with pytest.raises(ValueError, match="'block' is not a valid overflow policy"):
+            event_manager_base.EventStream(mock_app, base_events.Event, timeout=None, limit=1, overflow="block")
+
+    @pytest.mark.parametrize(("high_water_mark", "on_high_water_mark"), [(5, None), (None, mock.Mock())])
+    def test___init___when_only_one_high_water_mark_argument(self, mock_app, high_water_mark, on_high_water_mark):
+        with pytest.raises(ValueError, match="must be passed together"):
+            event_manager_base.EventStream(
+                mock_app,
+                base_events.Event,
+                timeout=None,
+                high_water_mark=high_water_mark,
+                on_high_water_mark=on_high_water_mark,
+            )
+
+    @hikari_test_helpers.timeout()
+    @pytest.mark.asyncio()
+    async def test__listener_when_queue_full_and_drop_oldest(self, mock_app):
+        stream = event_manager_base.EventStream(
+            mock_app, base_events.Event, timeout=None, limit=2, overflow="drop_oldest"
+        )
+        mock_event_1 = object()
+        mock_event_2 = object()
+        mock_event_3 = object()
+
+        with stream:
+            await stream._listener(mock_event_1)
+            await stream._listener(mock_event_2)
+            await stream._listener(mock_event_3)
+
+            assert list(stream._queue) == [mock_event_2, mock_event_3]
+
+    @hikari_test_helpers.timeout()
+    @pytest.mark.asyncio()
+    async def test__listener_calls_on_high_water_mark_once_until_drained(self, mock_app):
+        on_high_water_mark = mock.Mock()
+        stream = event_manager_base.EventStream(
+            mock_app, base_events.Event, timeout=None, high_water_mark=2, on_high_water_mark=on_high_water_mark
+        )
+
+        with stream:
+            await stream._listener(object())
+            on_high_water_mark.assert_not_called()
+
+            await stream._listener(object())
+            await stream._listener(object())
+            on_high_water_mark.assert_called_once_with(stream)
+
+            await stream.next()
+            await stream.next()
+            await stream._listener(object())
+
+            assert on_high_water_mark.call_count == 2
+
     @pytest.mark.asyncio()
     @hikari_test_helpers.timeout()
     async def test___anext___when_stream_closed(self):
@@ -406,6 +467,14 @@ class TestConsumer:
         consumer.waiter_group_count = waiter_group_count
 
         assert consumer.is_enabled is expected_result
+        assert consumer.is_deserializing is expected_result
+
+    def test_is_enabled_when_only_raw_listeners(self):
+        consumer = event_manager_base._Consumer(object(), 123, False)
+        consumer.raw_listeners.append(object())
+
+        assert consumer.is_enabled is True
+        assert consumer.is_deserializing is False
 
 
 class TestEventManagerBase:
@@ -499,14 +568,14 @@ class TestEventManagerBase:
         assert on_bat_consumer.waiter_group_count == 0
 
     def test__enabled_for_event_when_listener_registered(self, event_manager):
-        event_manager._listeners = {shard_events.ShardStateEvent: [], shard_events.MemberChunkEvent: []}
+        event_manager._listeners = {shard_events.ShardStateEvent: [object()], shard_events.MemberChunkEvent: [object()]}
         event_manager._waiters = {}
 
         assert event_manager._enabled_for_event(shard_events.ShardStateEvent) is True
 
     def test__enabled_for_event_when_waiter_registered(self, event_manager):
         event_manager._listeners = {}
-        event_manager._waiters = {shard_events.ShardStateEvent: [], shard_events.MemberChunkEvent: []}
+        event_manager._waiters = {shard_events.ShardStateEvent: {object()}, shard_events.MemberChunkEvent: {object()}}
 
         assert event_manager._enabled_for_event(shard_events.ShardStateEvent) is True
 
@@ -516,6 +585,28 @@ class TestEventManagerBase:
 
         assert event_manager._enabled_for_event(shard_events.ShardStateEvent) is False
 
+    def test_is_raw_event_enabled_when_unknown_event(self, event_manager):
+        assert event_manager.is_raw_event_enabled("UNEXISTING_EVENT") is True
+
+    @pytest.mark.parametrize(
+        ("is_enabled", "payload_event_enabled", "expected"),
+        [(True, False, True), (False, True, True), (False, False, False)],
+    )
+    def test_is_raw_event_enabled(self, event_manager, is_enabled, payload_event_enabled, expected):
+        event_manager._consumers = {"existing_event": mock.Mock(is_enabled=is_enabled)}
+        event_manager._enabled_for_event = mock.Mock(return_value=payload_event_enabled)
+
+        assert event_manager.is_raw_event_enabled("EXISTING_EVENT") is expected
+
+    def test_is_raw_event_enabled_when_consumer_required(self, event_manager):
+        event_manager._consumers = {"existing_event": mock.Mock(is_enabled=False)}
+        event_manager._enabled_for_event = mock.Mock(return_value=False)
+        event_manager._is_consumer_required = mock.Mock(return_value=True)
+
+        assert event_manager.is_raw_event_enabled("EXISTING_EVENT") is True
+
+        event_manager._is_consumer_required.assert_called_once_with(event_manager._consumers["existing_event"])
+
     @pytest.mark.asyncio()
     async def test_consume_raw_event_when_KeyError(self, event_manager):
         event_manager._enabled_for_event = mock.Mock(return_value=True)
@@ -584,6 +675,73 @@ class TestEventManagerBase:
         event_manager._event_factory.deserialize_shard_payload_event.vassert_not_called()
         event_manager._enabled_for_event.assert_called_once_with(shard_events.ShardPayloadEvent)
 
+    @pytest.mark.asyncio()
+    async def test_consume_raw_event_when_collecting_metrics(self, event_manager):
+        event_manager._enabled_for_event = mock.Mock(return_value=False)
+        event_manager._handle_timed_dispatch = mock.Mock()
+        event_manager._metrics = object()
+        on_existing_event = object()
+        event_manager._consumers = {"existing_event": on_existing_event}
+        shard = object()
+        payload = {"berp": "baz"}
+
+        with mock.patch("asyncio.create_task") as create_task:
+            event_manager.consume_raw_event("EXISTING_EVENT", shard, payload)
+
+        event_manager._handle_timed_dispatch.assert_called_once_with(
+            "EXISTING_EVENT", on_existing_event, shard, {"berp": "baz"}
+        )
+        create_task.assert_called_once_with(
+            event_manager._handle_timed_dispatch.return_value, name="dispatch EXISTING_EVENT"
+        )
+
+    @pytest.mark.asyncio()
+    async def test__handle_timed_dispatch(self, event_manager):
+        event_manager._metrics = mock.Mock()
+        event_manager._handle_dispatch = mock.AsyncMock()
+        consumer = object()
+        shard = mock.Mock(id=4)
+        payload = {"berp": "baz"}
+
+        with mock.patch.object(time, "monotonic", side_effect=[20, 20.5]):
+            await event_manager._handle_timed_dispatch("EXISTING_EVENT", consumer, shard, payload)
+
+        event_manager._handle_dispatch.assert_awaited_once_with(consumer, shard, payload)
+        event_manager._metrics.on_event_dispatched.assert_called_once_with(4, "EXISTING_EVENT", 0.5)
+
+    def test_consume_raw_event_when_deferred(self, event_manager):
+        event_manager._enabled_for_event = mock.Mock()
+        shard = mock.Mock(id=123)
+        event_manager._defer_dispatches(shard)
+
+        with mock.patch("asyncio.create_task") as create_task:
+            event_manager.consume_raw_event("EXISTING_EVENT", shard, {"berp": "baz"})
+
+        assert event_manager._deferred_dispatches == {123: [("EXISTING_EVENT", {"berp": "baz"})]}
+        create_task.assert_not_called()
+        event_manager._enabled_for_event.assert_not_called()
+
+    def test__resume_dispatches(self, event_manager):
+        shard = mock.Mock(id=123)
+        event_manager._deferred_dispatches = {
+            123: [("EXISTING_EVENT", {"berp": "baz"}), ("UNEXISTING_EVENT", {"id": "1"}), ("OTHER_EVENT", {})],
+            456: [("EXISTING_EVENT", {})],
+        }
+
+        with mock.patch.object(
+            type(event_manager), "consume_raw_event", side_effect=[None, LookupError, None]
+        ) as consume_raw_event:
+            event_manager._resume_dispatches(shard)
+
+        consume_raw_event.assert_has_calls(
+            [
+                mock.call("EXISTING_EVENT", shard, {"berp": "baz"}),
+                mock.call("UNEXISTING_EVENT", shard, {"id": "1"}),
+                mock.call("OTHER_EVENT", shard, {}),
+            ]
+        )
+        assert event_manager._deferred_dispatches == {456: [("EXISTING_EVENT", {})]}
+
     @pytest.mark.asyncio()
     async def test_handle_dispatch_invokes_callback(self, event_manager, event_loop):
         event_manager._enabled_for_consumer = mock.Mock(return_value=True)
@@ -615,7 +773,7 @@ class TestEventManagerBase:
     async def test_handle_dispatch_handles_exceptions(self, event_manager, event_loop):
         event_manager._enabled_for_consumer = mock.Mock(return_value=True)
         exc = Exception("aaaa!")
-        consumer = mock.Mock(callback=mock.AsyncMock(side_effect=exc))
+        consumer = mock.Mock(callback=mock.AsyncMock(side_effect=exc), raw_listeners=[])
         error_handler = mock.MagicMock()
         event_loop.set_exception_handler(error_handler)
         shard = object()
@@ -683,6 +841,188 @@ class TestEventManagerBase:
         event_manager._check_event.assert_called_once_with(member_events.MemberCreateEvent, 2)
         event_manager._increment_listener_group_count.assert_not_called()
 
+    def test_subscribe_with_execution_options(self, event_manager):
+        async def test():
+            ...
+
+        event_manager._check_event = mock.Mock()
+
+        event_manager.subscribe(
+            member_events.MemberCreateEvent, test, max_concurrency=2, ordered_by="guild_id", timeout=10
+        )
+
+        limiter = event_manager._listener_limiters[test]
+        assert limiter.max_concurrency == 2
+        assert limiter.key_getter(mock.Mock(guild_id=123)) == 123
+        assert limiter.timeout == 10
+
+    def test_subscribe_without_execution_options(self, event_manager):
+        async def test():
+            ...
+
+        event_manager._check_event = mock.Mock()
+
+        event_manager.subscribe(member_events.MemberCreateEvent, test)
+
+        assert event_manager._listener_limiters == {}
+
+    def test_subscribe_without_execution_options_after_unsubscribing(self, event_manager):
+        async def test():
+            ...
+
+        event_manager._check_event = mock.Mock()
+        event_manager.subscribe(member_events.MemberCreateEvent, test, max_concurrency=1)
+        event_manager.unsubscribe(member_events.MemberCreateEvent, test)
+
+        event_manager.subscribe(member_events.MemberCreateEvent, test)
+
+        assert event_manager._listener_limiters == {}
+
+    def test_subscribe_with_execution_options_shares_limiter_between_event_types(self, event_manager):
+        async def test():
+            ...
+
+        event_manager._check_event = mock.Mock()
+
+        event_manager.subscribe(member_events.MemberEvent, test, max_concurrency=1, ordered_by="guild_id")
+        event_manager.subscribe(member_events.MemberCreateEvent, test, max_concurrency=1, ordered_by="guild_id")
+        event_manager.subscribe(member_events.MemberDeleteEvent, test, max_concurrency=1, ordered_by="guild_id")
+
+        limiter = event_manager._listener_limiters[test]
+        assert event_manager._get_dispatch_table(member_events.MemberCreateEvent)[0] == (
+            (test, limiter),
+            (test, limiter),
+        )
+        assert event_manager._get_dispatch_table(member_events.MemberDeleteEvent)[0] == (
+            (test, limiter),
+            (test, limiter),
+        )
+
+    @pytest.mark.parametrize(
+        ("first_kwargs", "second_kwargs", "message"),
+        [
+            ({"max_concurrency": 1}, {"max_concurrency": 2}, "already subscribed with different"),
+            ({"ordered_by": "guild_id"}, {"ordered_by": "user_id"}, "already subscribed with different"),
+            ({"timeout": 1}, {}, "already subscribed with different"),
+            ({}, {"timeout": 1}, "already subscribed without"),
+        ],
+    )
+    def test_subscribe_with_conflicting_execution_options(self, event_manager, first_kwargs, second_kwargs, message):
+        async def test():
+            ...
+
+        event_manager._check_event = mock.Mock()
+        event_manager.subscribe(member_events.MemberCreateEvent, test, **first_kwargs)
+
+        with pytest.raises(ValueError, match=message):
+            event_manager.subscribe(member_events.MemberDeleteEvent, test, **second_kwargs)
+
+        assert member_events.MemberDeleteEvent not in event_manager._listeners
+
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [({"max_concurrency": 0}, "max_concurrency must be"), ({"timeout": 0}, "timeout must be")],
+    )
+    def test_subscribe_with_invalid_execution_options(self, event_manager, kwargs, message):
+        async def test():
+            ...
+
+        with pytest.raises(ValueError, match=message):
+            event_manager.subscribe(member_events.MemberCreateEvent, test, **kwargs)
+
+        assert member_events.MemberCreateEvent not in event_manager._listeners
+
+    @pytest.mark.asyncio()
+    @hikari_test_helpers.timeout()
+    async def test__invoke_callback_with_max_concurrency(self, event_manager):
+        running = 0
+        max_running = 0
+
+        async def test(event):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        event_manager._check_event = mock.Mock()
+        event_manager.subscribe(member_events.MemberCreateEvent, test, max_concurrency=2)
+        limiter = event_manager._listener_limiters[test]
+
+        await asyncio.gather(*(event_manager._invoke_callback(test, limiter, object()) for _ in range(5)))
+
+        assert max_running == 2
+
+    @pytest.mark.asyncio()
+    @hikari_test_helpers.timeout()
+    async def test__invoke_callback_with_ordered_by(self, event_manager):
+        calls = []
+
+        async def test(event):
+            calls.append(("start", event.guild_id, event.n))
+            # Let the event with the shorter delay try to overtake the other one.
+            await asyncio.sleep(event.delay)
+            calls.append(("end", event.guild_id, event.n))
+
+        event_manager._check_event = mock.Mock()
+        event_manager.subscribe(member_events.MemberCreateEvent, test, ordered_by=lambda event: event.guild_id)
+        limiter = event_manager._listener_limiters[test]
+        events = [
+            mock.Mock(guild_id=1, n=1, delay=0.02),
+            mock.Mock(guild_id=2, n=2, delay=0),
+            mock.Mock(guild_id=1, n=3, delay=0),
+        ]
+
+        await asyncio.gather(*(event_manager._invoke_callback(test, limiter, event) for event in events))
+
+        assert calls == [
+            ("start", 1, 1),
+            ("start", 2, 2),
+            ("end", 2, 2),
+            ("end", 1, 1),
+            ("start", 1, 3),
+            ("end", 1, 3),
+        ]
+        assert limiter.key_locks == {}
+
+    @pytest.mark.asyncio()
+    @hikari_test_helpers.timeout()
+    async def test__invoke_callback_with_ordered_by_when_key_not_resolved(self, event_manager):
+        called = False
+
+        async def test(event):
+            nonlocal called
+            called = True
+
+        event_manager._check_event = mock.Mock()
+        event_manager.subscribe(member_events.MemberCreateEvent, test, ordered_by="guild_id")
+        limiter = event_manager._listener_limiters[test]
+
+        await event_manager._invoke_callback(test, limiter, object())
+
+        assert called is True
+        assert limiter.key_locks == {}
+
+    @pytest.mark.asyncio()
+    @hikari_test_helpers.timeout()
+    async def test__invoke_callback_with_timeout(self, event_manager):
+        async def test(event):
+            await asyncio.sleep(10)
+
+        event_manager._check_event = mock.Mock()
+        event_manager.subscribe(member_events.MemberCreateEvent, test, timeout=0.01)
+        limiter = event_manager._listener_limiters[test]
+        event_manager.dispatch = mock.AsyncMock()
+        event_manager.get_listeners = mock.Mock(return_value=[])
+        event = object()
+
+        with mock.patch.object(base_events, "ExceptionEvent") as exception_event:
+            await event_manager._invoke_callback(test, limiter, event)
+
+        event_manager.dispatch.assert_awaited_once_with(exception_event.return_value)
+        exception_event.assert_called_once_with(exception=mock.ANY, failed_event=event, failed_callback=test)
+        assert isinstance(exception_event.call_args.kwargs["exception"], asyncio.TimeoutError)
+
     @pytest.mark.parametrize("obj", ["test", event_manager_base.EventManagerBase])
     def test__check_event_when_event_type_does_not_subclass_Event(self, event_manager, obj):
         with pytest.raises(TypeError, match=r"'event_type' is a non-Event type"):
@@ -727,6 +1067,98 @@ class TestEventManagerBase:
             stacklevel=3,
         )
 
+    def test_subscribe_raw(self, event_manager):
+        async def callback(shard, payload):
+            ...
+
+        event_manager.subscribe_raw("EXISTING_EVENT", callback)
+
+        assert event_manager._consumers["existing_event"].raw_listeners == [callback]
+        assert event_manager.get_raw_listeners("existing_event") == [callback]
+
+    def test_subscribe_raw_when_unknown_event(self, event_manager):
+        async def callback(shard, payload):
+            ...
+
+        with pytest.raises(LookupError):
+            event_manager.subscribe_raw("UNEXISTING_EVENT", callback)
+
+    def test_subscribe_raw_when_not_coroutine_function(self, event_manager):
+        with pytest.raises(TypeError, match=r"Cannot subscribe a non-coroutine function callback"):
+            event_manager.subscribe_raw("EXISTING_EVENT", lambda shard, payload: None)
+
+    def test_unsubscribe_raw(self, event_manager):
+        async def callback(shard, payload):
+            ...
+
+        async def other_callback(shard, payload):
+            ...
+
+        event_manager._consumers["existing_event"].raw_listeners.extend((callback, other_callback))
+
+        event_manager.unsubscribe_raw("EXISTING_EVENT", callback)
+        event_manager.unsubscribe_raw("EXISTING_EVENT", callback)
+        event_manager.unsubscribe_raw("UNEXISTING_EVENT", callback)
+
+        assert event_manager._consumers["existing_event"].raw_listeners == [other_callback]
+
+    def test_get_raw_listeners_when_unknown_event(self, event_manager):
+        assert event_manager.get_raw_listeners("UNEXISTING_EVENT") == []
+
+    @pytest.mark.asyncio()
+    async def test_handle_dispatch_when_only_raw_listeners(self, event_manager, event_loop):
+        error_handler = mock.Mock()
+        event_loop.set_exception_handler(error_handler)
+        exc = Exception("aaaa!")
+        raw_listener_1 = mock.AsyncMock(side_effect=exc)
+        raw_listener_2 = mock.AsyncMock()
+        consumer = event_manager_base._Consumer(mock.AsyncMock(), 123, False)
+        consumer.raw_listeners.extend((raw_listener_1, raw_listener_2))
+        shard = object()
+        pl = {"foo": "bar"}
+
+        with mock.patch.object(asyncio, "current_task") as current_task:
+            await event_manager._handle_dispatch(consumer, shard, pl)
+
+        raw_listener_1.assert_awaited_once_with(shard, pl)
+        raw_listener_2.assert_awaited_once_with(shard, pl)
+        consumer.callback.assert_not_called()
+        error_handler.assert_called_once_with(
+            event_loop,
+            {
+                "message": "Exception occurred in raw event listener",
+                "exception": exc,
+                "task": current_task.return_value,
+            },
+        )
+
+    @pytest.mark.asyncio()
+    async def test_handle_dispatch_invokes_when_consumer_required(self, event_manager):
+        raw_listener = mock.AsyncMock()
+        consumer = event_manager_base._Consumer(mock.AsyncMock(), 123, False)
+        consumer.raw_listeners.append(raw_listener)
+        event_manager._is_consumer_required = mock.Mock(return_value=True)
+        shard = object()
+        pl = {"foo": "bar"}
+
+        await event_manager._handle_dispatch(consumer, shard, pl)
+
+        raw_listener.assert_awaited_once_with(shard, pl)
+        consumer.callback.assert_awaited_once_with(shard, pl)
+
+    @pytest.mark.asyncio()
+    async def test_handle_dispatch_with_raw_listeners_and_deserializing(self, event_manager):
+        raw_listener = mock.AsyncMock()
+        consumer = event_manager_base._Consumer(mock.AsyncMock(), 123, True)
+        consumer.raw_listeners.append(raw_listener)
+        shard = object()
+        pl = {"foo": "bar"}
+
+        await event_manager._handle_dispatch(consumer, shard, pl)
+
+        raw_listener.assert_awaited_once_with(shard, pl)
+        consumer.callback.assert_awaited_once_with(shard, pl)
+
     def test_get_listeners_when_not_event(self, event_manager):
         event_manager._listeners = {}
 
@@ -762,6 +1194,168 @@ class TestEventManagerBase:
 
         assert event_manager.get_listeners(member_events.MemberEvent, polymorphic=False) == ["coroutine0"]
 
+    @pytest.mark.asyncio()
+    async def test_dispatch_when_no_listeners(self, event_manager):
+        event = member_events.MemberCreateEvent(shard=object(), member=mock.Mock())
+
+        future = event_manager.dispatch(event)
+
+        assert future.done()
+
+    @pytest.mark.asyncio()
+    async def test_dispatch_when_one_listener(self, event_manager):
+        listener = mock.AsyncMock()
+        event_manager._listeners = {member_events.MemberCreateEvent: [listener]}
+        event = member_events.MemberCreateEvent(shard=object(), member=mock.Mock())
+
+        with mock.patch.object(asyncio, "gather") as gather:
+            future = event_manager.dispatch(event)
+            await future
+
+        gather.assert_not_called()
+        assert isinstance(future, asyncio.Task)
+        listener.assert_awaited_once_with(event)
+
+    @pytest.mark.asyncio()
+    async def test_dispatch_when_many_listeners(self, event_manager):
+        listener_1 = mock.AsyncMock()
+        listener_2 = mock.AsyncMock()
+        event_manager._listeners = {member_events.MemberCreateEvent: [listener_1], base_events.Event: [listener_2]}
+        event = member_events.MemberCreateEvent(shard=object(), member=mock.Mock())
+
+        await event_manager.dispatch(event)
+
+        listener_1.assert_awaited_once_with(event)
+        listener_2.assert_awaited_once_with(event)
+
+    @pytest.mark.asyncio()
+    async def test_wait_for_with_attrs(self, event_manager):
+        event_manager._check_event = mock.Mock()
+        shard = object()
+        member = mock.Mock(guild_id=123, user=mock.Mock(id=456))
+        other_member = mock.Mock(guild_id=123, user=mock.Mock(id=789))
+        event = member_events.MemberCreateEvent(shard=shard, member=member)
+
+        task = asyncio.create_task(
+            event_manager.wait_for(member_events.MemberEvent, timeout=5, guild_id=123, user_id=456)
+        )
+        await asyncio.sleep(0)
+
+        index = event_manager._keyed_waiters[member_events.MemberEvent][("guild_id", "user_id")]
+        assert list(index.waiters) == [(123, 456)]
+        assert event_manager._consumers["existing_event"].waiter_group_count == 1
+
+        event_manager.dispatch(member_events.MemberCreateEvent(shard=shard, member=other_member))
+        assert not task.done()
+
+        event_manager.dispatch(event)
+
+        assert await task is event
+        assert event_manager._keyed_waiters == {}
+
+    @pytest.mark.asyncio()
+    async def test_wait_for_with_attrs_and_predicate(self, event_manager):
+        event_manager._check_event = mock.Mock()
+        shard = object()
+        first_event = member_events.MemberCreateEvent(shard=shard, member=mock.Mock(guild_id=123, user=mock.Mock(id=1)))
+        second_event = member_events.MemberCreateEvent(shard=shard, member=mock.Mock(guild_id=123, user=mock.Mock(id=2)))
+
+        task = asyncio.create_task(
+            event_manager.wait_for(
+                member_events.MemberCreateEvent, timeout=5, predicate=lambda e: e.user_id == 2, guild_id=123
+            )
+        )
+        await asyncio.sleep(0)
+
+        event_manager.dispatch(first_event)
+        event_manager.dispatch(second_event)
+
+        assert await task is second_event
+
+    @pytest.mark.asyncio()
+    async def test_wait_for_with_nested_attrs_ignores_events_without_attribute(self, event_manager):
+        event_manager._check_event = mock.Mock()
+        shard = object()
+        event = member_events.MemberCreateEvent(shard=shard, member=mock.Mock(user=mock.Mock(username="davfsa")))
+
+        task = asyncio.create_task(
+            event_manager.wait_for(base_events.Event, timeout=5, **{"member.user.username": "davfsa"})
+        )
+        await asyncio.sleep(0)
+
+        event_manager.dispatch(shard_events.ShardConnectedEvent(app=mock.Mock(), shard=shard))
+        event_manager.dispatch(event)
+
+        assert await task is event
+
+    @pytest.mark.asyncio()
+    async def test_wait_for_with_attrs_when_timeout(self, event_manager):
+        event_manager._check_event = mock.Mock()
+        event_manager._increment_waiter_group_count = mock.Mock()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await event_manager.wait_for(member_events.MemberCreateEvent, timeout=0.01, guild_id=123)
+
+        assert event_manager._keyed_waiters == {}
+        assert event_manager._increment_waiter_group_count.call_args_list == [
+            mock.call(member_events.MemberCreateEvent, 1),
+            mock.call(member_events.MemberCreateEvent, -1),
+        ]
+
+    def test__get_dispatch_table(self, event_manager):
+        waiter_set = {object()}
+        event_manager._listeners = {
+            base_events.Event: ["coroutine0"],
+            member_events.MemberEvent: ["coroutine1"],
+            member_events.MemberUpdateEvent: ["hidden"],
+        }
+        event_manager._waiters = {member_events.MemberCreateEvent: waiter_set, member_events.MemberEvent: set()}
+
+        table = event_manager._get_dispatch_table(member_events.MemberCreateEvent)
+
+        assert table == (
+            (("coroutine1", None), ("coroutine0", None)),
+            ((member_events.MemberCreateEvent, waiter_set),),
+            (),
+        )
+        assert event_manager._get_dispatch_table(member_events.MemberCreateEvent) is table
+
+    def test__get_dispatch_table_is_invalidated_on_subscribe(self, event_manager):
+        async def test(event):
+            ...
+
+        event_manager._check_event = mock.Mock()
+        event_manager._get_dispatch_table(member_events.MemberCreateEvent)
+
+        event_manager.subscribe(member_events.MemberEvent, test)
+
+        assert event_manager._get_dispatch_table(member_events.MemberCreateEvent) == (((test, None),), (), ())
+
+    def test__get_dispatch_table_is_invalidated_on_unsubscribe(self, event_manager):
+        async def test(event):
+            ...
+
+        event_manager._check_event = mock.Mock()
+        event_manager.subscribe(member_events.MemberEvent, test)
+        event_manager._get_dispatch_table(member_events.MemberCreateEvent)
+
+        event_manager.unsubscribe(member_events.MemberEvent, test)
+
+        assert event_manager._get_dispatch_table(member_events.MemberCreateEvent) == ((), (), ())
+
+    def test__get_dispatch_table_is_invalidated_on_waiter_group_change(self, event_manager):
+        waiter_set = {object()}
+        event_manager._get_dispatch_table(member_events.MemberCreateEvent)
+        event_manager._waiters[member_events.MemberEvent] = waiter_set
+
+        event_manager._increment_waiter_group_count(member_events.MemberEvent, 1)
+
+        assert event_manager._get_dispatch_table(member_events.MemberCreateEvent) == (
+            (),
+            ((member_events.MemberEvent, waiter_set),),
+            (),
+        )
+
     def test_unsubscribe_when_event_type_not_in_listeners(self, event_manager):
         async def test():
             ...
@@ -807,6 +1401,31 @@ class TestEventManagerBase:
         assert event_manager._listeners == {member_events.MemberDeleteEvent: [test]}
         event_manager._increment_listener_group_count.assert_called_once_with(member_events.MemberCreateEvent, -1)
 
+    def test_unsubscribe_keeps_execution_options_for_other_event_types(self, event_manager):
+        async def test():
+            ...
+
+        limiter = object()
+        event_manager._increment_listener_group_count = mock.Mock()
+        event_manager._listeners = {member_events.MemberCreateEvent: [test], member_events.MemberDeleteEvent: [test]}
+        event_manager._listener_limiters = {test: limiter}
+
+        event_manager.unsubscribe(member_events.MemberCreateEvent, test)
+
+        assert event_manager._listener_limiters == {test: limiter}
+
+    def test_unsubscribe_removes_execution_options_when_last_subscription(self, event_manager):
+        async def test():
+            ...
+
+        event_manager._increment_listener_group_count = mock.Mock()
+        event_manager._listeners = {member_events.MemberCreateEvent: [test]}
+        event_manager._listener_limiters = {test: object()}
+
+        event_manager.unsubscribe(member_events.MemberCreateEvent, test)
+
+        assert event_manager._listener_limiters == {}
+
     def test_listen_when_no_params(self, event_manager):
         with pytest.raises(TypeError):
 
@@ -848,7 +1467,7 @@ class TestEventManagerBase:
                 ...
 
         resolve_signature.assert_not_called()
-        subscribe.assert_called_once_with(member_events.MemberCreateEvent, test, _nested=1)
+        subscribe.assert_called_once_with(member_events.MemberCreateEvent, test, max_concurrency=None, ordered_by=None, timeout=None, _nested=1)
 
     def test_listen_when_multiple_params_provided_in_decorator(self, event_manager):
         stack = contextlib.ExitStack()
@@ -866,8 +1485,8 @@ class TestEventManagerBase:
         resolve_signature.assert_not_called()
         subscribe.assert_has_calls(
             [
-                mock.call(member_events.MemberCreateEvent, test, _nested=1),
-                mock.call(member_events.MemberDeleteEvent, test, _nested=1),
+                mock.call(member_events.MemberCreateEvent, test, max_concurrency=None, ordered_by=None, timeout=None, _nested=1),
+                mock.call(member_events.MemberDeleteEvent, test, max_concurrency=None, ordered_by=None, timeout=None, _nested=1),
             ]
         )
 
@@ -878,7 +1497,7 @@ class TestEventManagerBase:
             async def test(event: member_events.MemberCreateEvent):
                 ...
 
-        subscribe.assert_called_once_with(member_events.MemberCreateEvent, test, _nested=1)
+        subscribe.assert_called_once_with(member_events.MemberCreateEvent, test, max_concurrency=None, ordered_by=None, timeout=None, _nested=1)
 
     def test_listen_when_multiple_params_provided_as_typing_union_in_typehint(self, event_manager):
         with mock.patch.object(event_manager_base.EventManagerBase, "subscribe") as subscribe:
@@ -890,8 +1509,8 @@ class TestEventManagerBase:
         assert subscribe.call_count == 2
         subscribe.assert_has_calls(
             [
-                mock.call(member_events.MemberCreateEvent, test, _nested=1),
-                mock.call(member_events.MemberDeleteEvent, test, _nested=1),
+                mock.call(member_events.MemberCreateEvent, test, max_concurrency=None, ordered_by=None, timeout=None, _nested=1),
+                mock.call(member_events.MemberDeleteEvent, test, max_concurrency=None, ordered_by=None, timeout=None, _nested=1),
             ]
         )
 
@@ -906,8 +1525,8 @@ class TestEventManagerBase:
         assert subscribe.call_count == 2
         subscribe.assert_has_calls(
             [
-                mock.call(member_events.MemberCreateEvent, test, _nested=1),
-                mock.call(member_events.MemberDeleteEvent, test, _nested=1),
+                mock.call(member_events.MemberCreateEvent, test, max_concurrency=None, ordered_by=None, timeout=None, _nested=1),
+                mock.call(member_events.MemberDeleteEvent, test, max_concurrency=None, ordered_by=None, timeout=None, _nested=1),
             ]
         )
 
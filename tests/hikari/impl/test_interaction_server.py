@@ -21,6 +21,7 @@
 # SOFTWARE.
 import asyncio
 import contextlib
+import json
 import re
 import threading
 
@@ -588,6 +589,28 @@ class TestInteractionServer:
         assert result.payload == b'{"ok": "No boomer"}'
         assert result.status_code == 200
 
+    @pytest.mark.asyncio()
+    async def test_on_interaction_when_dumps_returns_str(
+        self,
+        mock_interaction_server: interaction_server_impl.InteractionServer,
+        mock_entity_factory: entity_factory_impl.EntityFactoryImpl,
+        public_key: bytes,
+        valid_edd25519: bytes,
+    ):
+        mock_interaction_server._public_key = nacl.signing.VerifyKey(public_key)
+        mock_interaction_server._dumps = json.dumps
+        mock_entity_factory.deserialize_interaction.return_value = base_interactions.PartialInteraction(
+            app=None, id=123, application_id=541324, type=2, token="ok", version=1
+        )
+        mock_builder = mock.Mock(build=mock.Mock(return_value=({"ok": "No boomer"}, [])))
+        mock_listener = mock.AsyncMock(return_value=mock_builder)
+        mock_interaction_server.set_listener(base_interactions.PartialInteraction, mock_listener)
+
+        result = await mock_interaction_server.on_interaction(*valid_edd25519)
+
+        assert result.payload == b'{"ok": "No boomer"}'
+        assert result.status_code == 200
+
     @pytest.mark.asyncio()
     async def test_on_interaction_calls__fetch_public_key(
         self, mock_interaction_server: interaction_server_impl.InteractionServer
@@ -25,6 +25,7 @@ import datetime
 import http
 import warnings
 
+import aiohttp
 import mock
 import pytest
 
@@ -374,8 +375,10 @@ class TestRESTApp:
     @pytest.fixture()
     def rest_app(self):
         return hikari_test_helpers.mock_class_namespace(rest.RESTApp, slots_=False)(
+            dumps=mock.Mock(),
             executor=None,
             http_settings=mock.Mock(spec_set=config.HTTPSettings),
+            loads=mock.Mock(),
             max_rate_limit=float("inf"),
             max_retries=0,
             proxy_settings=mock.Mock(spec_set=config.ProxySettings),
@@ -407,9 +410,11 @@ class TestRESTApp:
 
         mock_client.assert_called_once_with(
             cache=None,
+            dumps=rest_app._dumps,
             entity_factory=mock_entity_factory.return_value,
             executor=rest_app._executor,
             http_settings=rest_app._http_settings,
+            loads=rest_app._loads,
             max_rate_limit=float("inf"),
             max_retries=0,
             proxy_settings=rest_app._proxy_settings,
@@ -433,9 +438,11 @@ class TestRESTApp:
 
         mock_client.assert_called_once_with(
             cache=None,
+            dumps=rest_app._dumps,
             entity_factory=mock_entity_factory.return_value,
             executor=rest_app._executor,
             http_settings=rest_app._http_settings,
+            loads=rest_app._loads,
             max_rate_limit=float("inf"),
             max_retries=0,
             proxy_settings=rest_app._proxy_settings,
@@ -1522,6 +1529,24 @@ class TestRESTClientImplAsync:
         assert kwargs["data"] is mock_form.build.return_value
         assert live_attributes.still_alive.call_count == 3
 
+    @hikari_test_helpers.timeout()
+    async def test__request_encodes_json_body_with_dumps(self, rest_client, exit_exception, live_attributes):
+        route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
+        mock_session = mock.AsyncMock(request=mock.AsyncMock(side_effect=exit_exception))
+        live_attributes.buckets.is_started = True
+        live_attributes.client_session = mock_session
+        rest_client._token = None
+        rest_client._dumps = mock.Mock(return_value=b'{"some":"data"}')
+
+        with pytest.raises(exit_exception):
+            await rest_client._request(route, json={"some": "data"})
+
+        _, kwargs = mock_session.request.call_args_list[0]
+        rest_client._dumps.assert_called_once_with({"some": "data"})
+        assert isinstance(kwargs["data"], aiohttp.BytesPayload)
+        assert kwargs["data"]._value == b'{"some":"data"}'
+        assert kwargs["data"].content_type == "application/json"
+
     @hikari_test_helpers.timeout()
     async def test__request_url_encodes_reason_header(self, rest_client, exit_exception, live_attributes):
         route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
@@ -1714,8 +1739,10 @@ class TestRESTClientImplAsync:
         live_attributes.buckets.is_started = True
         live_attributes.client_session = mock_session
         rest_client._parse_ratelimits = mock.AsyncMock()
+        rest_client._loads = mock.Mock(return_value={"something": None})
 
         assert (await rest_client._request(route)) == {"something": None}
+        rest_client._loads.assert_called_once_with('{"something": null}')
 
         assert live_attributes.still_alive.call_count == 3
 
@@ -2367,7 +2394,7 @@ class TestRESTClientImplAsync:
         )
         mock_form.add_field.assert_called_once_with(
             "payload_json",
-            '{"testing": "ensure_in_test", "message_reference": {"message_id": "987654321"}}',
+            b'{"testing":"ensure_in_test","message_reference":{"message_id":"987654321"}}',
             content_type="application/json",
         )
         rest_client._request.assert_awaited_once_with(expected_route, form_builder=mock_form)
@@ -2486,7 +2513,7 @@ class TestRESTClientImplAsync:
             edit=True,
         )
         mock_form.add_field.assert_called_once_with(
-            "payload_json", '{"testing": "ensure_in_test"}', content_type="application/json"
+            "payload_json", b'{"testing":"ensure_in_test"}', content_type="application/json"
         )
         rest_client._request.assert_awaited_once_with(expected_route, form_builder=mock_form)
         rest_client._entity_factory.deserialize_message.assert_called_once_with({"message_id": 123})
@@ -2907,7 +2934,7 @@ class TestRESTClientImplAsync:
         )
         mock_form.add_field.assert_called_once_with(
             "payload_json",
-            '{"testing": "ensure_in_test", "username": "davfsa", "avatar_url": "https://website.com/davfsa_logo"}',
+            b'{"testing":"ensure_in_test","username":"davfsa","avatar_url":"https://website.com/davfsa_logo"}',
             content_type="application/json",
         )
         rest_client._request.assert_awaited_once_with(
@@ -3033,7 +3060,7 @@ class TestRESTClientImplAsync:
             edit=True,
         )
         mock_form.add_field.assert_called_once_with(
-            "payload_json", '{"testing": "ensure_in_test"}', content_type="application/json"
+            "payload_json", b'{"testing":"ensure_in_test"}', content_type="application/json"
         )
         rest_client._request.assert_awaited_once_with(expected_route, form_builder=mock_form, no_auth=True)
         rest_client._entity_factory.deserialize_message.assert_called_once_with({"message_id": 123})
@@ -5037,7 +5064,7 @@ class TestRESTClientImplAsync:
             role_mentions=[1234],
         )
         mock_form.add_field.assert_called_once_with(
-            "payload_json", '{"type": 1, "data": {"testing": "ensure_in_test"}}', content_type="application/json"
+            "payload_json", b'{"type":1,"data":{"testing":"ensure_in_test"}}', content_type="application/json"
         )
         rest_client._request.assert_awaited_once_with(expected_route, form_builder=mock_form, no_auth=True)
 
@@ -5136,7 +5163,7 @@ class TestRESTClientImplAsync:
             edit=True,
         )
         mock_form.add_field.assert_called_once_with(
-            "payload_json", '{"testing": "ensure_in_test"}', content_type="application/json"
+            "payload_json", b'{"testing":"ensure_in_test"}', content_type="application/json"
         )
         rest_client._request.assert_awaited_once_with(expected_route, form_builder=mock_form, no_auth=True)
         rest_client._entity_factory.deserialize_message.assert_called_once_with({"message_id": 123})
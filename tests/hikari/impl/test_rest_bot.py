@@ -34,6 +34,7 @@ from hikari.impl import interaction_server as interaction_server_impl
 from hikari.impl import rest as rest_impl
 from hikari.impl import rest_bot as rest_bot_impl
 from hikari.internal import aio
+from hikari.internal import data_binding
 from hikari.internal import ux
 from tests.hikari import hikari_test_helpers
 
@@ -98,6 +99,8 @@ class TestRESTBot:
     ):
         cls = hikari_test_helpers.mock_class_namespace(rest_bot_impl.RESTBot, print_banner=mock.Mock())
         mock_executor = object()
+        mock_dumps = object()
+        mock_loads = object()
 
         stack = contextlib.ExitStack()
         stack.enter_context(mock.patch.object(ux, "init_logging"))
@@ -117,9 +120,11 @@ class TestRESTBot:
                 b"2123123123123132",
                 allow_color=False,
                 banner="a banner",
+                dumps=mock_dumps,
                 executor=mock_executor,
                 force_color=True,
                 http_settings=mock_http_settings,
+                loads=mock_loads,
                 logs="ERROR",
                 max_rate_limit=32123123,
                 max_retries=0,
@@ -131,9 +136,11 @@ class TestRESTBot:
             entity_factory_impl.EntityFactoryImpl.assert_called_once_with(result)
             rest_impl.RESTClientImpl.assert_called_once_with(
                 cache=None,
+                dumps=mock_dumps,
                 entity_factory=mock_entity_factory,
                 executor=mock_executor,
                 http_settings=mock_http_settings,
+                loads=mock_loads,
                 max_rate_limit=32123123,
                 max_retries=0,
                 proxy_settings=mock_proxy_settings,
@@ -142,7 +149,11 @@ class TestRESTBot:
                 token_type="token_type",
             )
             interaction_server_impl.InteractionServer.assert_called_once_with(
-                entity_factory=mock_entity_factory, public_key=b"2123123123123132", rest_client=mock_rest_client
+                dumps=mock_dumps,
+                entity_factory=mock_entity_factory,
+                loads=mock_loads,
+                public_key=b"2123123123123132",
+                rest_client=mock_rest_client,
             )
 
         result.print_banner.assert_called_once_with("a banner", False, True)
@@ -165,7 +176,11 @@ class TestRESTBot:
             result = cls("token", "token_type", "6f66646f646f646f6f")
 
             interaction_server_impl.InteractionServer.assert_called_once_with(
-                entity_factory=result.entity_factory, public_key=b"ofdododoo", rest_client=result.rest
+                dumps=data_binding.default_json_dumps,
+                entity_factory=result.entity_factory,
+                loads=data_binding.default_json_loads,
+                public_key=b"ofdododoo",
+                rest_client=result.rest,
             )
 
     def test___init___strips_token(self):
@@ -183,9 +198,11 @@ class TestRESTBot:
 
         rest_client.assert_called_once_with(
             cache=None,
+            dumps=data_binding.default_json_dumps,
             entity_factory=result.entity_factory,
             executor=None,
             http_settings=http_settings.return_value,
+            loads=data_binding.default_json_loads,
             max_rate_limit=300.0,
             max_retries=3,
             proxy_settings=proxy_settings.return_value,
@@ -209,9 +226,11 @@ class TestRESTBot:
 
             rest_impl.RESTClientImpl.assert_called_once_with(
                 cache=None,
+                dumps=data_binding.default_json_dumps,
                 entity_factory=result.entity_factory,
                 executor=None,
                 http_settings=config.HTTPSettings.return_value,
+                loads=data_binding.default_json_loads,
                 max_rate_limit=300.0,
                 max_retries=3,
                 proxy_settings=config.ProxySettings.return_value,
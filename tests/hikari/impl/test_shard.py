@@ -24,6 +24,8 @@ import contextlib
 import datetime
 import platform
 import re
+import sys
+import zlib
 
 import aiohttp
 import mock
@@ -34,8 +36,10 @@ from hikari import errors
 from hikari import intents
 from hikari import presences
 from hikari import undefined
+from hikari.api import shard as gateway_shard
 from hikari.impl import config
 from hikari.impl import shard
+from hikari.internal import etf
 from hikari.internal import time
 from tests.hikari import client_session_stub
 from tests.hikari import hikari_test_helpers
@@ -73,6 +77,46 @@ class StubResponse:
         self.extra = extra
 
 
+class TestZlibStreamDecompressor:
+    def test_feed(self):
+        compressor = zlib.compressobj()
+        decompressor = shard._ZlibStreamDecompressor()
+
+        for data in (b'{"op": 10}', b'{"op": 11}'):
+            payload = compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+            assert decompressor.feed(payload[:3]) is None
+            assert decompressor.feed(payload[3:]) == data
+
+
+@pytest.mark.parametrize(
+    ("compression", "expected_type"),
+    [
+        (None, shard._PassthroughDecompressor),
+        ("transport_zlib_stream", shard._ZlibStreamDecompressor),
+        ("transport_zstd_stream", shard._ZstdStreamDecompressor),
+    ],
+)
+def test__create_decompressor(compression, expected_type):
+    if expected_type is shard._ZstdStreamDecompressor:
+        pytest.importorskip("zstandard")
+
+    assert isinstance(shard._create_decompressor(compression), expected_type)
+
+
+@pytest.mark.parametrize(
+    ("pl", "expected"),
+    [
+        ('{"t":"PRESENCE_UPDATE","s":42,"op":0,"d":{"t":"no"}}', ("PRESENCE_UPDATE", 42)),
+        (b'{"t":"TYPING_START","s":7,"op":0,"d":{}}', ("TYPING_START", 7)),
+        (b'{"t":null,"s":null,"op":11,"d":null}', None),
+        (b'{"op":0,"d":{"t":"A","s":1},"t":"READY","s":1}', None),
+    ],
+)
+def test__peek_dispatch(pl, expected):
+    assert shard._peek_dispatch(pl) == expected
+
+
 class TestGatewayTransport:
     @pytest.fixture()
     def transport_impl(self):
@@ -80,6 +124,11 @@ class TestGatewayTransport:
             transport = shard._GatewayTransport()
             transport.logger = mock.Mock(isEnabledFor=mock.Mock(return_value=True))
             transport.log_filterer = mock.Mock()
+            transport.data_format = "json"
+            transport.offload_threshold = None
+            transport.executor = None
+            transport.metrics = None
+            transport.shard_id = 0
             yield transport
 
     def test__init__calls_super(self):
@@ -129,18 +178,173 @@ class TestGatewayTransport:
         transport_impl._receive_and_check.assert_awaited_once_with(69)
         mock_loads.assert_called_once_with("{'json_response': null}")
 
+    @pytest.mark.asyncio()
+    async def test_receive_json_when_bytes(self, transport_impl):
+        transport_impl._receive_and_check = mock.AsyncMock(return_value=b'{"json_response": null}')
+        mock_loads = mock.Mock(return_value={"json_response": None})
+
+        assert await transport_impl.receive_json(loads=mock_loads, timeout=69) == {"json_response": None}
+
+        transport_impl.log_filterer.assert_called_once_with('{"json_response": null}')
+        mock_loads.assert_called_once_with(b'{"json_response": null}')
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize("trace", [True, False])
+    async def test_receive_json_when_etf(self, transport_impl, trace):
+        transport_impl.data_format = "etf"
+        transport_impl._receive_and_check = mock.AsyncMock(return_value=b"\x83t\x00\x00\x00\x00")
+        transport_impl.logger.isEnabledFor.return_value = trace
+        mock_loads = mock.Mock(return_value={"etf_response": None})
+
+        assert await transport_impl.receive_json(loads=mock_loads, timeout=69) == {"etf_response": None}
+
+        transport_impl._receive_and_check.assert_awaited_once_with(69)
+        mock_loads.assert_called_once_with(b"\x83t\x00\x00\x00\x00")
+        if trace:
+            transport_impl.log_filterer.assert_called_once_with('{"etf_response": null}')
+        else:
+            transport_impl.log_filterer.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_receive_json_when_above_offload_threshold_decodes_on_event_loop(self, transport_impl):
+        transport_impl.offload_threshold = 10
+        transport_impl.executor = object()
+        transport_impl._receive_and_check = mock.AsyncMock(return_value=b'{"json_response": null}')
+        mock_loads = mock.Mock(return_value={"json_response": None})
+
+        with mock.patch.object(asyncio, "get_running_loop") as get_running_loop:
+            assert await transport_impl.receive_json(loads=mock_loads, timeout=69) == {"json_response": None}
+
+        get_running_loop.assert_not_called()
+        mock_loads.assert_called_once_with(b'{"json_response": null}')
+
+    @pytest.mark.asyncio()
+    async def test_receive_json_reports_decode_time(self, transport_impl):
+        transport_impl.metrics = mock.Mock()
+        transport_impl.shard_id = 2
+        transport_impl._receive_and_check = mock.AsyncMock(return_value=b'{"json_response": null}')
+        mock_loads = mock.Mock(return_value={"json_response": None})
+
+        with mock.patch.object(time, "monotonic", side_effect=[10, 10.25]):
+            assert await transport_impl.receive_json(loads=mock_loads, timeout=69) == {"json_response": None}
+
+        transport_impl.metrics.on_payload_decoded.assert_called_once_with(2, 0.25)
+
+    @pytest.mark.asyncio()
+    async def test_receive_json_when_event_filtered_out(self, transport_impl):
+        transport_impl._receive_and_check = mock.AsyncMock(return_value=b'{"t":"TYPING_START","s":7,"op":0,"d":{}}')
+        event_filter = mock.Mock(return_value=False)
+        mock_loads = mock.Mock()
+
+        result = await transport_impl.receive_json(loads=mock_loads, timeout=69, event_filter=event_filter)
+
+        assert result == shard._SkippedDispatch("TYPING_START", 7)
+        event_filter.assert_called_once_with("TYPING_START")
+        mock_loads.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_receive_json_when_event_not_filtered_out(self, transport_impl):
+        transport_impl._receive_and_check = mock.AsyncMock(return_value=b'{"t":"TYPING_START","s":7,"op":0,"d":{}}')
+        event_filter = mock.Mock(return_value=True)
+        mock_loads = mock.Mock(return_value={"json_response": None})
+
+        result = await transport_impl.receive_json(loads=mock_loads, timeout=69, event_filter=event_filter)
+
+        assert result == {"json_response": None}
+        event_filter.assert_called_once_with("TYPING_START")
+        mock_loads.assert_called_once_with(b'{"t":"TYPING_START","s":7,"op":0,"d":{}}')
+
+    @pytest.mark.asyncio()
+    async def test_receive_json_when_dispatch_peeked_reports_hit(self, transport_impl):
+        transport_impl.metrics = mock.Mock()
+        transport_impl.shard_id = 2
+        transport_impl._receive_and_check = mock.AsyncMock(return_value=b'{"t":"TYPING_START","s":7,"op":0,"d":{}}')
+        event_filter = mock.Mock(return_value=False)
+
+        result = await transport_impl.receive_json(loads=mock.Mock(), timeout=69, event_filter=event_filter)
+
+        assert result == shard._SkippedDispatch("TYPING_START", 7)
+        transport_impl.metrics.on_dispatch_peeked.assert_called_once_with(2, True)
+
+    @pytest.mark.asyncio()
+    async def test_receive_json_when_dispatch_reordered_decodes_and_reports_miss(self, transport_impl):
+        transport_impl.metrics = mock.Mock()
+        transport_impl.shard_id = 2
+        transport_impl._receive_and_check = mock.AsyncMock(return_value=b'{"op":0,"d":{},"t":"TYPING_START","s":7}')
+        event_filter = mock.Mock(return_value=False)
+        mock_loads = mock.Mock(return_value={"op": 0, "d": {}, "t": "TYPING_START", "s": 7})
+
+        result = await transport_impl.receive_json(loads=mock_loads, timeout=69, event_filter=event_filter)
+
+        assert result == {"op": 0, "d": {}, "t": "TYPING_START", "s": 7}
+        event_filter.assert_not_called()
+        mock_loads.assert_called_once_with(b'{"op":0,"d":{},"t":"TYPING_START","s":7}')
+        transport_impl.metrics.on_dispatch_peeked.assert_called_once_with(2, False)
+
+    @pytest.mark.asyncio()
+    async def test_receive_json_when_not_dispatch_does_not_report_peek(self, transport_impl):
+        transport_impl.metrics = mock.Mock()
+        transport_impl._receive_and_check = mock.AsyncMock(return_value=b'{"op":11,"d":null}')
+        mock_loads = mock.Mock(return_value={"op": 11, "d": None})
+
+        result = await transport_impl.receive_json(loads=mock_loads, timeout=69, event_filter=mock.Mock())
+
+        assert result == {"op": 11, "d": None}
+        transport_impl.metrics.on_dispatch_peeked.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_receive_json_when_etf_does_not_filter_events(self, transport_impl):
+        transport_impl.data_format = "etf"
+        transport_impl._receive_and_check = mock.AsyncMock(return_value=b'{"t":"TYPING_START","s":7,"op":0,"d":{}}')
+        event_filter = mock.Mock(return_value=False)
+        mock_loads = mock.Mock(return_value={"etf_response": None})
+
+        result = await transport_impl.receive_json(loads=mock_loads, timeout=69, event_filter=event_filter)
+
+        assert result == {"etf_response": None}
+        event_filter.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_receive_json_when_below_offload_threshold(self, transport_impl):
+        transport_impl.offload_threshold = 100
+        transport_impl._receive_and_check = mock.AsyncMock(return_value=b'{"json_response": null}')
+        mock_loads = mock.Mock(return_value={"json_response": None})
+
+        with mock.patch.object(asyncio, "get_running_loop") as get_running_loop:
+            assert await transport_impl.receive_json(loads=mock_loads, timeout=69) == {"json_response": None}
+
+        get_running_loop.assert_not_called()
+        mock_loads.assert_called_once_with(b'{"json_response": null}')
+
     @pytest.mark.asyncio()
     @pytest.mark.parametrize("trace", [True, False])
     async def test_send_json(self, transport_impl, trace):
         transport_impl.send_str = mock.AsyncMock()
         transport_impl.logger.isEnabledFor.return_value = trace
-        mock_dumps = mock.Mock(return_value="{'json_send': null}")
+        mock_dumps = mock.Mock(return_value=b"{'json_send': null}")
 
         await transport_impl.send_json({"json_send": None}, 420, dumps=mock_dumps)
 
         transport_impl.send_str.assert_awaited_once_with("{'json_send': null}", 420)
         mock_dumps.assert_called_once_with({"json_send": None})
 
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize("trace", [True, False])
+    async def test_send_json_when_etf(self, transport_impl, trace):
+        transport_impl.data_format = "etf"
+        transport_impl.send_bytes = mock.AsyncMock()
+        transport_impl.send_str = mock.AsyncMock()
+        transport_impl.logger.isEnabledFor.return_value = trace
+        mock_dumps = mock.Mock(return_value=b"\x83t\x00\x00\x00\x00")
+
+        await transport_impl.send_json({"etf_send": None}, 420, dumps=mock_dumps)
+
+        transport_impl.send_bytes.assert_awaited_once_with(b"\x83t\x00\x00\x00\x00", 420)
+        transport_impl.send_str.assert_not_called()
+        mock_dumps.assert_called_once_with({"etf_send": None})
+        if trace:
+            transport_impl.log_filterer.assert_called_once_with('{"etf_send": null}')
+
     @pytest.mark.asyncio()
     @pytest.mark.parametrize(
         "code",
@@ -210,24 +414,26 @@ class TestGatewayTransport:
     async def test__receive_and_check_when_message_type_is_BINARY(self, transport_impl):
         response = StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"some initial data")
         transport_impl.receive = mock.AsyncMock(return_value=response)
-        transport_impl._receive_and_check_complete_zlib_package = mock.AsyncMock()
+        transport_impl.decompressor = mock.Mock(feed=mock.Mock(return_value=None))
+        transport_impl._receive_and_check_complete_package = mock.AsyncMock()
 
         result = await transport_impl._receive_and_check(10)
 
-        assert result is transport_impl._receive_and_check_complete_zlib_package.return_value
+        assert result is transport_impl._receive_and_check_complete_package.return_value
         transport_impl.receive.assert_awaited_once_with(10)
-        transport_impl._receive_and_check_complete_zlib_package.assert_awaited_once_with(b"some initial data", 10)
+        transport_impl.decompressor.feed.assert_called_once_with(b"some initial data")
+        transport_impl._receive_and_check_complete_package.assert_awaited_once_with(10)
 
     @pytest.mark.asyncio()
     async def test__receive_and_check_when_message_type_is_BINARY_and_the_full_payload(self, transport_impl):
         response = StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"some initial data\x00\x00\xff\xff")
         transport_impl.receive = mock.AsyncMock(return_value=response)
-        transport_impl.zlib = mock.Mock(decompress=mock.Mock(return_value=b"aaaaaaaaaaaaaaaaaa"))
+        transport_impl.decompressor = mock.Mock(feed=mock.Mock(return_value=b"aaaaaaaaaaaaaaaaaa"))
 
-        assert await transport_impl._receive_and_check(10) == "aaaaaaaaaaaaaaaaaa"
+        assert await transport_impl._receive_and_check(10) == b"aaaaaaaaaaaaaaaaaa"
 
         transport_impl.receive.assert_awaited_once_with(10)
-        transport_impl.zlib.decompress.assert_called_once_with(response.data)
+        transport_impl.decompressor.feed.assert_called_once_with(response.data)
 
     @pytest.mark.asyncio()
     async def test__receive_and_check_when_message_type_is_TEXT(self, transport_impl):
@@ -253,44 +459,111 @@ class TestGatewayTransport:
         transport_impl._handle_other_message.assert_called_once_with(transport_impl.receive.return_value)
 
     @pytest.mark.asyncio()
-    async def test__receive_and_check_complete_zlib_package_when_TEXT(self, transport_impl):
+    async def test__receive_and_check_complete_package_when_TEXT(self, transport_impl):
         response = StubResponse(type=aiohttp.WSMsgType.TEXT, data="not binary")
         transport_impl.receive = mock.AsyncMock(return_value=response)
+        transport_impl.decompressor = mock.Mock()
 
         with pytest.raises(errors.GatewayError, match="Unexpected message type received TEXT, expected BINARY"):
-            await transport_impl._receive_and_check_complete_zlib_package(b"some", 10)
+            await transport_impl._receive_and_check_complete_package(10)
 
         transport_impl.receive.assert_awaited_with(10)
+        transport_impl.decompressor.feed.assert_not_called()
 
     @pytest.mark.asyncio()
-    async def test__receive_and_check_complete_zlib_package_for_unexpected_message_type(self, transport_impl):
+    async def test__receive_and_check_complete_package_for_unexpected_message_type(self, transport_impl):
         mock_exception = errors.GatewayError("aye")
         response = StubResponse(type=aiohttp.WSMsgType.CLOSE)
         transport_impl.receive = mock.AsyncMock(return_value=response)
         transport_impl._handle_other_message = mock.Mock(side_effect=mock_exception)
+        transport_impl.decompressor = mock.Mock()
 
         with pytest.raises(errors.GatewayError) as exc_info:
-            await transport_impl._receive_and_check_complete_zlib_package(b"some", 10)
+            await transport_impl._receive_and_check_complete_package(10)
 
         assert exc_info.value is mock_exception
         transport_impl.receive.assert_awaited_with(10)
         transport_impl._handle_other_message.assert_called_once_with(response)
 
     @pytest.mark.asyncio()
-    async def test__receive_and_check_complete_zlib_package(self, transport_impl):
+    async def test__receive_and_check_complete_package(self, transport_impl):
         response1 = StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"more")
         response2 = StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"data")
-        response3 = StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"\x00\x00\xff\xff")
+        transport_impl.receive = mock.AsyncMock(side_effect=[response1, response2])
+        transport_impl.decompressor = mock.Mock(feed=mock.Mock(side_effect=[None, b"decoded utf-8 encoded"]))
+
+        assert await transport_impl._receive_and_check_complete_package(10) == b"decoded utf-8 encoded"
+
+        transport_impl.receive.assert_has_awaits([mock.call(10), mock.call(10)])
+        transport_impl.decompressor.feed.assert_has_calls([mock.call(b"more"), mock.call(b"data")])
+
+    @pytest.mark.asyncio()
+    async def test__receive_and_check_with_zlib_stream_when_suffix_is_split(self, transport_impl):
+        compressor = zlib.compressobj()
+        payload = compressor.compress(b'{"op": 11, "d": null}') + compressor.flush(zlib.Z_SYNC_FLUSH)
+        assert payload.endswith(shard._ZLIB_SUFFIX)
+        response1 = StubResponse(type=aiohttp.WSMsgType.BINARY, data=payload[:5])
+        response2 = StubResponse(type=aiohttp.WSMsgType.BINARY, data=payload[5:-2])
+        response3 = StubResponse(type=aiohttp.WSMsgType.BINARY, data=payload[-2:])
         transport_impl.receive = mock.AsyncMock(side_effect=[response1, response2, response3])
-        transport_impl.zlib = mock.Mock(decompress=mock.Mock(return_value=b"decoded utf-8 encoded bytes"))
+        transport_impl.decompressor = shard._ZlibStreamDecompressor()
 
-        assert (
-            await transport_impl._receive_and_check_complete_zlib_package(b"some", 10) == "decoded utf-8 encoded bytes"
-        )
+        assert await transport_impl._receive_and_check(10) == b'{"op": 11, "d": null}'
 
         assert transport_impl.receive.call_count == 3
-        transport_impl.receive.assert_has_awaits([mock.call(10), mock.call(10), mock.call(10)])
-        transport_impl.zlib.decompress.assert_called_once_with(bytearray(b"somemoredata\x00\x00\xff\xff"))
+
+    @pytest.mark.asyncio()
+    async def test__receive_and_check_with_zstd_stream(self, transport_impl):
+        zstandard = pytest.importorskip("zstandard")
+        compressor = zstandard.ZstdCompressor().compressobj()
+        payloads = []
+        for data in (b'{"op": 10, "d": {"heartbeat_interval": 41250}}', b'{"op": 11, "d": null}'):
+            payloads.append(compressor.compress(data) + compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK))
+
+        transport_impl.receive = mock.AsyncMock(
+            side_effect=[StubResponse(type=aiohttp.WSMsgType.BINARY, data=payload) for payload in payloads]
+        )
+        transport_impl.decompressor = shard._ZstdStreamDecompressor()
+
+        assert await transport_impl._receive_and_check(10) == b'{"op": 10, "d": {"heartbeat_interval": 41250}}'
+        assert await transport_impl._receive_and_check(10) == b'{"op": 11, "d": null}'
+
+    @pytest.mark.asyncio()
+    async def test__receive_and_check_reports_metrics(self, transport_impl):
+        transport_impl.metrics = mock.Mock()
+        transport_impl.shard_id = 2
+        transport_impl.receive = mock.AsyncMock(
+            side_effect=[
+                StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"part"),
+                StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"end"),
+                StubResponse(type=aiohttp.WSMsgType.TEXT, data="text"),
+            ]
+        )
+        transport_impl.decompressor = mock.Mock(feed=mock.Mock(side_effect=[None, b"inflated"]))
+
+        assert await transport_impl._receive_and_check(10) == b"inflated"
+        assert await transport_impl._receive_and_check(10) == "text"
+
+        transport_impl.metrics.on_frame_received.assert_has_calls(
+            [mock.call(2, 4), mock.call(2, 3), mock.call(2, 4)]
+        )
+        transport_impl.metrics.on_payload_inflated.assert_called_once_with(2, 8)
+
+    @pytest.mark.asyncio()
+    async def test__receive_and_check_when_offloaded(self, transport_impl):
+        transport_impl.offload_threshold = 4
+        transport_impl.executor = object()
+        transport_impl.receive = mock.AsyncMock(return_value=StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"large"))
+        transport_impl.decompressor = mock.Mock()
+        loop = mock.Mock(run_in_executor=mock.AsyncMock(return_value=b"inflated"))
+
+        with mock.patch.object(asyncio, "get_running_loop", return_value=loop):
+            assert await transport_impl._receive_and_check(10) == b"inflated"
+
+        loop.run_in_executor.assert_awaited_once_with(
+            transport_impl.executor, transport_impl.decompressor.feed, b"large"
+        )
+        transport_impl.decompressor.feed.assert_not_called()
 
     @pytest.mark.asyncio()
     async def test_connect_yields_websocket(self, http_settings, proxy_settings):
@@ -318,6 +591,12 @@ class TestGatewayTransport:
 
         with stack:
             async with shard._GatewayTransport.connect(
+                compression=None,
+                data_format="json",
+                executor=None,
+                offload_threshold=None,
+                metrics=None,
+                shard_id=0,
                 http_settings=http_settings,
                 proxy_settings=proxy_settings,
                 logger=logger,
@@ -325,6 +604,8 @@ class TestGatewayTransport:
                 log_filterer=log_filterer,
             ) as ws:
                 assert ws.logger is logger
+                assert ws.data_format == "json"
+                assert isinstance(ws.decompressor, shard._PassthroughDecompressor)
 
         tcp_connector.assert_called_once_with(
             limit=1,
@@ -385,6 +666,12 @@ class TestGatewayTransport:
 
         with stack:
             async with shard._GatewayTransport.connect(
+                compression=None,
+                data_format="json",
+                executor=None,
+                offload_threshold=None,
+                metrics=None,
+                shard_id=0,
                 http_settings=http_settings,
                 proxy_settings=proxy_settings,
                 logger=logger,
@@ -426,6 +713,12 @@ class TestGatewayTransport:
 
         with stack:
             async with shard._GatewayTransport.connect(
+                compression=None,
+                data_format="json",
+                executor=None,
+                offload_threshold=None,
+                metrics=None,
+                shard_id=0,
                 http_settings=http_settings,
                 proxy_settings=proxy_settings,
                 logger=logger,
@@ -467,6 +760,12 @@ class TestGatewayTransport:
 
         with stack:
             async with shard._GatewayTransport.connect(
+                compression=None,
+                data_format="json",
+                executor=None,
+                offload_threshold=None,
+                metrics=None,
+                shard_id=0,
                 http_settings=http_settings,
                 proxy_settings=proxy_settings,
                 logger=logger,
@@ -507,6 +806,12 @@ class TestGatewayTransport:
 
         with stack:
             async with shard._GatewayTransport.connect(
+                compression=None,
+                data_format="json",
+                executor=None,
+                offload_threshold=None,
+                metrics=None,
+                shard_id=0,
                 http_settings=http_settings,
                 proxy_settings=proxy_settings,
                 logger=logger,
@@ -551,6 +856,12 @@ class TestGatewayTransport:
 
         with stack:
             async with shard._GatewayTransport.connect(
+                compression=None,
+                data_format="json",
+                executor=None,
+                offload_threshold=None,
+                metrics=None,
+                shard_id=0,
                 http_settings=http_settings,
                 proxy_settings=proxy_settings,
                 logger=logger,
@@ -578,6 +889,12 @@ class TestGatewayTransport:
 
         with stack:
             async with shard._GatewayTransport.connect(
+                compression=None,
+                data_format="json",
+                executor=None,
+                offload_threshold=None,
+                metrics=None,
+                shard_id=0,
                 http_settings=http_settings,
                 proxy_settings=proxy_settings,
                 logger=logger,
@@ -627,26 +944,130 @@ class TestGatewayShardImpl:
             intents=intents.Intents.ALL,
             url="wss://gaytewhuy.discord.meh",
             data_format="json",
+            executor=None,
+            offload_threshold=None,
+            metrics=None,
+            shard_id=0,
             compression=compression,
             token="12345",
         )
 
         assert g._url == f"wss://gaytewhuy.discord.meh?{expect}"
 
-    def test_using_etf_is_unsupported(self, http_settings, proxy_settings):
-        with pytest.raises(NotImplementedError, match="Unsupported gateway data format: etf"):
+    def test__init__sets_url_is_correct_json_with_zstd_stream(self, http_settings, proxy_settings):
+        pytest.importorskip("zstandard")
+        g = shard.GatewayShardImpl(
+            event_manager=mock.Mock(),
+            event_factory=mock.Mock(),
+            http_settings=http_settings,
+            proxy_settings=proxy_settings,
+            intents=intents.Intents.ALL,
+            url="wss://gaytewhuy.discord.meh",
+            data_format="json",
+            executor=None,
+            offload_threshold=None,
+            metrics=None,
+            shard_id=0,
+            compression="transport_zstd_stream",
+            token="12345",
+        )
+
+        assert g._url == f"wss://gaytewhuy.discord.meh?v={shard._VERSION}&encoding=json&compress=zstd-stream"
+        assert g._compression == "transport_zstd_stream"
+
+    def test__init__when_zstd_stream_and_zstandard_not_installed(self, http_settings, proxy_settings):
+        with mock.patch.dict(sys.modules, {"zstandard": None}):
+            with pytest.raises(RuntimeError, match=r"hikari\[speedups\]"):
+                shard.GatewayShardImpl(
+                    event_manager=mock.Mock(),
+                    event_factory=mock.Mock(),
+                    http_settings=http_settings,
+                    proxy_settings=proxy_settings,
+                    intents=intents.Intents.ALL,
+                    url="wss://gaytewhuy.discord.meh",
+                    data_format="json",
+                    executor=None,
+                    offload_threshold=None,
+                    metrics=None,
+                    shard_id=0,
+                    compression="transport_zstd_stream",
+                    token="12345",
+                )
+
+    def test__init__when_etf(self, http_settings, proxy_settings):
+        g = shard.GatewayShardImpl(
+            event_manager=mock.Mock(),
+            event_factory=mock.Mock(),
+            http_settings=http_settings,
+            proxy_settings=proxy_settings,
+            token=mock.Mock(),
+            url="wss://gaytewhuy.discord.meh",
+            intents=intents.Intents.ALL,
+            data_format="etf",
+            dumps=mock.Mock(),
+            loads=mock.Mock(),
+            compression=None,
+        )
+
+        assert g._url == f"wss://gaytewhuy.discord.meh?v={shard._VERSION}&encoding=etf"
+        assert g._data_format == "etf"
+        assert g._dumps is etf.dumps
+        assert g._loads is etf.loads
+
+    def test_using_unknown_data_format_is_unsupported(self, http_settings, proxy_settings):
+        with pytest.raises(NotImplementedError, match="Unsupported gateway data format: xml"):
             shard.GatewayShardImpl(
                 event_manager=mock.Mock(),
                 event_factory=mock.Mock(),
                 http_settings=http_settings,
                 proxy_settings=proxy_settings,
                 token=mock.Mock(),
-                url="wss://erlpack-is-broken-lol.discord.meh",
+                url="wss://xml-is-broken-lol.discord.meh",
                 intents=intents.Intents.ALL,
-                data_format="etf",
+                data_format="xml",
                 compression="testing",
             )
 
+    def test__init__with_session_state(self, http_settings, proxy_settings):
+        session_state = gateway_shard.GatewaySessionState(
+            shard_id=2, shard_count=4, session_id="abc", seq=42, resume_url="wss://resume.discord.gg"
+        )
+
+        g = shard.GatewayShardImpl(
+            event_manager=mock.Mock(),
+            event_factory=mock.Mock(),
+            http_settings=http_settings,
+            proxy_settings=proxy_settings,
+            token=mock.Mock(),
+            url="wss://gaytewhuy.discord.meh",
+            intents=intents.Intents.ALL,
+            session_state=session_state,
+            shard_id=2,
+            shard_count=4,
+        )
+
+        assert g._session_id == "abc"
+        assert g._seq == 42
+        assert g._resume_gateway_url == "wss://resume.discord.gg"
+        assert g.session_state == session_state
+
+    def test__init__when_session_state_is_for_other_shard(self, http_settings, proxy_settings):
+        session_state = gateway_shard.GatewaySessionState(shard_id=2, shard_count=4, session_id="abc", seq=42)
+
+        with pytest.raises(ValueError, match=r"Session state for shard 2 \(of 4\) cannot be used by shard 2 \(of 8\)"):
+            shard.GatewayShardImpl(
+                event_manager=mock.Mock(),
+                event_factory=mock.Mock(),
+                http_settings=http_settings,
+                proxy_settings=proxy_settings,
+                token=mock.Mock(),
+                url="wss://gaytewhuy.discord.meh",
+                intents=intents.Intents.ALL,
+                session_state=session_state,
+                shard_id=2,
+                shard_count=8,
+            )
+
     def test_heartbeat_latency_property(self, client):
         client._heartbeat_latency = 420
         assert client.heartbeat_latency == 420
@@ -671,6 +1092,39 @@ class TestGatewayShardImpl:
         client._shard_count = 69
         assert client.shard_count == 69
 
+    @pytest.mark.parametrize(("session_id", "seq"), [(None, 10), ("abc", None)])
+    def test_session_state_property_when_no_session(self, client, session_id, seq):
+        client._session_id = session_id
+        client._seq = seq
+
+        assert client.session_state is None
+
+    def test_session_state_property(self, client):
+        client._shard_id = 1
+        client._shard_count = 2
+        client._session_id = "abc"
+        client._seq = 10
+        client._resume_gateway_url = "wss://resume.discord.gg"
+
+        assert client.session_state == gateway_shard.GatewaySessionState(
+            shard_id=1, shard_count=2, session_id="abc", seq=10, resume_url="wss://resume.discord.gg"
+        )
+
+    @pytest.mark.parametrize(("seq", "resume_url"), [(None, "wss://resume.discord.gg"), (10, None)])
+    def test__get_connect_url_when_not_resuming(self, client, seq, resume_url):
+        client._url = "wss://gateway.discord.gg?v=8&encoding=json"
+        client._seq = seq
+        client._resume_gateway_url = resume_url
+
+        assert client._get_connect_url() == "wss://gateway.discord.gg?v=8&encoding=json"
+
+    def test__get_connect_url_when_resuming(self, client):
+        client._url = "wss://gateway.discord.gg?v=8&encoding=json"
+        client._seq = 10
+        client._resume_gateway_url = "wss://resume.discord.gg"
+
+        assert client._get_connect_url() == "wss://resume.discord.gg?v=8&encoding=json"
+
     def test_shard__check_if_alive_when_not_alive(self, client):
         with mock.patch.object(shard.GatewayShardImpl, "is_alive", new=False):
             with pytest.raises(errors.ComponentStateConflictError):
@@ -708,6 +1162,7 @@ class TestGatewayShardImpl:
                 {"id": "789"},
             ],
             "v": 8,
+            "resume_gateway_url": "wss://resume.discord.gg",
         }
 
         client._dispatch(
@@ -718,6 +1173,7 @@ class TestGatewayShardImpl:
 
         assert client._seq == 10
         assert client._session_id == 101
+        assert client._resume_gateway_url == "wss://resume.discord.gg"
         assert client._user_id == 123
         client._logger.info.assert_called_once_with(
             "shard is ready: %s guilds, %s (%s), session %r on v%s gateway",
@@ -734,19 +1190,19 @@ class TestGatewayShardImpl:
             pl,
         )
 
-    def test__dipatch_when_RESUME(self, client):
+    def test__dipatch_when_RESUMED(self, client):
         client._seq = 0
         client._session_id = 123
         client._logger = mock.Mock()
         client._handshake_completed = mock.Mock()
         client._event_manager = mock.Mock()
 
-        client._dispatch("RESUME", 10, {})
+        client._dispatch("RESUMED", 10, {})
 
         assert client._seq == 10
         client._logger.info.assert_called_once_with("shard has resumed [session:%s, seq:%s]", 123, 10)
         client._handshake_completed.set.assert_called_once_with()
-        client._event_manager.consume_raw_event.assert_called_once_with("RESUME", client, {})
+        client._event_manager.consume_raw_event.assert_called_once_with("RESUMED", client, {})
 
     def test__dipatch(self, client):
         client._logger = mock.Mock()
@@ -867,6 +1323,20 @@ class TestGatewayShardImplAsync:
         client._total_rate_limit.close.assert_called_once_with()
         client._closed_event.wait.assert_awaited_once_with()
 
+    async def test_close_when_keeping_session(self, client):
+        client._check_if_alive = mock.Mock()
+        client._closing_event = mock.Mock(is_set=mock.Mock(return_value=False))
+        client._closed_event = mock.Mock(wait=mock.AsyncMock())
+        client._ws = mock.Mock(send_close=mock.AsyncMock())
+        client._chunking_rate_limit = mock.Mock()
+        client._total_rate_limit = mock.Mock()
+
+        await client.close(keep_session=True)
+
+        assert client._keep_session is True
+        client._closing_event.set.assert_called_once_with()
+        client._ws.send_close.assert_awaited_once_with(code=shard._RESUME_CLOSE_CODE, message=b"shard restarting")
+
     async def test_close_when_closing_event_not_set_and_ws_is_None(self, client):
         client._check_if_alive = mock.Mock()
         client._closing_event = mock.Mock(is_set=mock.Mock(return_value=False))
@@ -1077,6 +1547,35 @@ class TestGatewayShardImplAsync:
 
         client._send_json.assert_awaited_once_with({"op": 4, "d": payload})
 
+    @pytest.mark.parametrize("name", ["READY", "RESUMED"])
+    async def test__is_dispatch_wanted_for_handshake_events(self, client, name):
+        client._event_manager = mock.Mock(is_raw_event_enabled=mock.Mock(return_value=False))
+
+        assert client._is_dispatch_wanted(name) is True
+
+    @pytest.mark.parametrize("enabled", [True, False])
+    async def test__is_dispatch_wanted(self, client, enabled):
+        client._event_manager = mock.Mock(is_raw_event_enabled=mock.Mock(return_value=enabled))
+
+        assert client._is_dispatch_wanted("TYPING_START") is enabled
+
+        client._event_manager.is_raw_event_enabled.assert_called_once_with("TYPING_START")
+
+    async def test__poll_events_when_dispatch_skipped(self, client):
+        client._seq = 5
+        client._dispatch = mock.Mock()
+        client._logger = mock.Mock()
+        ws = mock.Mock(receive_json=mock.AsyncMock(return_value=shard._SkippedDispatch("TYPING_START", 6)))
+        client._get_ws = mock.Mock(return_value=ws)
+
+        assert await client._poll_events() is None
+
+        assert client._seq == 6
+        client._dispatch.assert_not_called()
+        ws.receive_json.assert_awaited_once_with(
+            loads=client._loads, timeout=5, event_filter=client._is_dispatch_wanted
+        )
+
     async def test__dispatch_for_unknown_event(self, client):
         client._logger = mock.Mock()
         client._handshake_completed = mock.Mock()
@@ -1140,6 +1639,22 @@ class TestGatewayShardImplAsync:
 
         wait_for.assert_awaited_with(client._closing_event.wait(), timeout=20)
 
+    @hikari_test_helpers.timeout()
+    async def test__heartbeat_reports_event_loop_lag(self, client):
+        client._last_heartbeat_sent = 5
+        client._logger = mock.Mock()
+        client._metrics = mock.Mock()
+        client._shard_id = 3
+        client._closing_event = mock.Mock(is_set=mock.Mock(return_value=False))
+        client._closed_event = mock.Mock(is_set=mock.Mock(return_value=False))
+        client._send_heartbeat = mock.AsyncMock()
+
+        with mock.patch.object(time, "monotonic", side_effect=[10, 10, 30.5, 30.5, 50]):
+            with mock.patch.object(asyncio, "wait_for", side_effect=[asyncio.TimeoutError, None]):
+                assert await client._heartbeat(20) is False
+
+        client._metrics.on_event_loop_lag.assert_called_once_with(3, 0.5)
+
     @hikari_test_helpers.timeout()
     async def test__heartbeat_when_zombie(self, client):
         client._last_heartbeat_sent = 10
@@ -0,0 +1,632 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import io
+import pickle
+
+import mock
+import pytest
+
+from hikari import errors
+from hikari import messages
+from hikari import snowflakes
+from hikari.api import config as config_api
+from hikari.impl import cache_store
+from hikari.impl import config
+from hikari.impl import entity_factory
+from hikari.impl import shared_cache
+from hikari.internal import cache as cache_utility
+
+USER_PAYLOAD = {"id": "115590097100865541", "username": "nyaa", "discriminator": "6127", "avatar": None}
+OTHER_USER_PAYLOAD = {"id": "115590097100865542", "username": "meow", "discriminator": "1234", "avatar": None}
+GUILD_PAYLOAD = {
+    "id": "3",
+    "name": "guild",
+    "icon": None,
+    "splash": None,
+    "discovery_splash": None,
+    "owner_id": "1",
+    "afk_channel_id": None,
+    "afk_timeout": 60,
+    "verification_level": 0,
+    "default_message_notifications": 0,
+    "explicit_content_filter": 0,
+    "roles": [],
+    "emojis": [],
+    "features": [],
+    "mfa_level": 0,
+    "application_id": None,
+    "system_channel_id": None,
+    "system_channel_flags": 0,
+    "rules_channel_id": None,
+    "vanity_url_code": None,
+    "description": None,
+    "banner": None,
+    "premium_tier": 0,
+    "preferred_locale": "en-US",
+    "public_updates_channel_id": None,
+    "nsfw_level": 0,
+    "joined_at": "2020-01-01T00:00:00+00:00",
+    "large": False,
+    "member_count": 5,
+    "channels": [],
+    "members": [],
+    "presences": [],
+    "voice_states": [],
+    "threads": [],
+    "stickers": [],
+}
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = cache_store.CacheStoreServer()
+    server.start()
+    yield server
+    server.close()
+
+
+@pytest.fixture()
+def app():
+    return mock.Mock()
+
+
+@pytest.fixture()
+def factory(app):
+    return entity_factory.EntityFactoryImpl(app)
+
+
+@pytest.fixture()
+def cache_settings():
+    return config.CacheSettings()
+
+
+@pytest.fixture()
+def store(server):
+    store = cache_store.CacheStoreClient(*server.address)
+    store.execute("FLUSHDB")
+    yield store
+    store.close()
+
+
+@pytest.fixture()
+def cache(app, cache_settings, store):
+    return shared_cache.SharedCacheImpl(app, cache_settings, store, prefix="test")
+
+
+def _make_guild(factory, **overrides):
+    return factory.deserialize_gateway_guild({**GUILD_PAYLOAD, **overrides}).guild()
+
+
+def _make_member(factory, user=None, guild_id=3, nickname=None):
+    return factory.deserialize_member(
+        {
+            "user": user or USER_PAYLOAD,
+            "nick": nickname,
+            "roles": ["2"],
+            "joined_at": "2020-01-01T00:00:00+00:00",
+            "deaf": False,
+            "mute": False,
+        },
+        guild_id=snowflakes.Snowflake(guild_id),
+    )
+
+
+def _make_channel(factory, channel_id, position, channel_type=0, guild_id=3):
+    return factory.deserialize_channel(
+        {
+            "id": str(channel_id),
+            "type": channel_type,
+            "guild_id": str(guild_id),
+            "name": "channel",
+            "position": position,
+            "permission_overwrites": [],
+            "nsfw": False,
+            "parent_id": None,
+            "topic": None,
+            "last_message_id": None,
+            "rate_limit_per_user": 0,
+            "bitrate": 64000,
+            "user_limit": 0,
+            "rtc_region": None,
+        }
+    )
+
+
+def _make_role(factory, role_id, guild_id=3):
+    return factory.deserialize_role(
+        {
+            "id": str(role_id),
+            "name": "role",
+            "color": 0,
+            "hoist": False,
+            "position": 1,
+            "permissions": "0",
+            "managed": False,
+            "mentionable": False,
+        },
+        guild_id=snowflakes.Snowflake(guild_id),
+    )
+
+
+def _make_emoji(factory, emoji_id, user=None, guild_id=3):
+    payload = {"id": str(emoji_id), "name": "emoji", "animated": False, "available": True, "roles": []}
+    payload.update(require_colons=True, managed=False)
+    if user:
+        payload["user"] = user
+
+    return factory.deserialize_known_custom_emoji(payload, guild_id=snowflakes.Snowflake(guild_id))
+
+
+def _make_invite(factory, code, channel_id, guild_id=3):
+    return factory.deserialize_invite_with_metadata(
+        {
+            "code": code,
+            "guild": {
+                "id": str(guild_id),
+                "name": "guild",
+                "splash": None,
+                "banner": None,
+                "icon": None,
+                "features": [],
+                "description": None,
+                "verification_level": 0,
+                "vanity_url_code": None,
+                "nsfw_level": 0,
+            },
+            "channel": {"id": str(channel_id), "name": "channel", "type": 0},
+            "inviter": USER_PAYLOAD,
+            "uses": 0,
+            "max_uses": 0,
+            "max_age": 0,
+            "temporary": False,
+            "created_at": "2020-01-01T00:00:00+00:00",
+        }
+    )
+
+
+def _make_presence(factory, user=None, guild_id=3, status="online"):
+    return factory.deserialize_member_presence(
+        {
+            "user": {"id": (user or USER_PAYLOAD)["id"]},
+            "guild_id": str(guild_id),
+            "status": status,
+            "activities": [],
+            "client_status": {},
+        }
+    )
+
+
+def _make_voice_state(factory, member, channel_id):
+    return factory.deserialize_voice_state(
+        {
+            "guild_id": str(member.guild_id),
+            "channel_id": str(channel_id),
+            "user_id": str(member.id),
+            "session_id": "session",
+            "deaf": False,
+            "mute": False,
+            "self_deaf": False,
+            "self_mute": False,
+            "self_video": False,
+            "suppress": False,
+            "request_to_speak_timestamp": None,
+        },
+        member=member,
+    )
+
+
+def _make_message(factory, message_id, content="hi", guild_id=3):
+    return factory.deserialize_message(
+        {
+            "id": str(message_id),
+            "channel_id": "11",
+            "guild_id": str(guild_id),
+            "author": USER_PAYLOAD,
+            "member": {"roles": [], "joined_at": "2020-01-01T00:00:00+00:00", "deaf": False, "mute": False},
+            "content": content,
+            "timestamp": "2020-01-01T00:00:00+00:00",
+            "edited_timestamp": None,
+            "tts": False,
+            "mention_everyone": False,
+            "mentions": [OTHER_USER_PAYLOAD],
+            "mention_roles": [],
+            "attachments": [],
+            "embeds": [],
+            "pinned": False,
+            "type": 0,
+            "flags": 0,
+        }
+    )
+
+
+class TestEntityUnpickler:
+    def test_loads_entities_with_app(self, cache, app, factory):
+        member = _make_member(factory)
+
+        loaded = cache._build(cache._dump(cache_utility.MemberData.build_from_entity(member)))
+
+        assert loaded == member
+        assert loaded.app is app
+
+    def test_rejects_disallowed_globals(self, cache):
+        with pytest.raises(pickle.UnpicklingError, match="posix.system|os.system"):
+            cache._load(pickle.dumps(__import__("os").system))
+
+    def test_rejects_callables_from_allowed_modules(self, cache):
+        with pytest.raises(pickle.UnpicklingError, match="can't be loaded from the cache store"):
+            cache._load(pickle.dumps(shared_cache._as_dict))
+
+    def test_rejects_dotted_names(self, cache):
+        # STACK_GLOBAL for "hikari.internal.cache" "datetime.datetime" with an empty tuple REDUCEd, as protocol 4
+        # would otherwise resolve the dotted name through the module's attributes.
+        data = pickle.PROTO + b"\x04" + pickle.SHORT_BINUNICODE + b"\x15hikari.internal.cache"
+        data += pickle.SHORT_BINUNICODE + b"\x11datetime.datetime" + pickle.STACK_GLOBAL
+        data += pickle.EMPTY_TUPLE + pickle.REDUCE + pickle.STOP
+
+        with pytest.raises(pickle.UnpicklingError, match="can't be loaded from the cache store"):
+            cache._load(data)
+
+    @pytest.mark.parametrize(
+        ("module", "name"),
+        [
+            ("hikari.files", "File"),
+            ("hikari.impl.cache_store", "CacheStoreServer"),
+            ("hikari.snowflakes", "Unique"),
+            ("hikari.guilds", "Snowflake"),
+            ("hikari.nope", "Nope"),
+        ],
+    )
+    def test_rejects_types_which_are_not_entity_data(self, cache, module, name):
+        unpickler = shared_cache._EntityUnpickler(io.BytesIO(), cache._app)
+
+        with pytest.raises(pickle.UnpicklingError, match="can't be loaded from the cache store"):
+            unpickler.find_class(module, name)
+
+    def test_rejects_unknown_persistent_id(self, cache):
+        class Pickler(pickle.Pickler):
+            def persistent_id(self, obj):
+                return "nope" if obj == 1 else None
+
+        buffer = io.BytesIO()
+        Pickler(buffer).dump([1])
+
+        with pytest.raises(pickle.UnpicklingError, match="Unknown persistent ID 'nope'"):
+            cache._load(buffer.getvalue())
+
+
+class TestSharedCacheImpl:
+    def test_settings(self, cache, cache_settings):
+        assert cache.settings is cache_settings
+
+    def test_set_and_get_guild(self, cache, factory):
+        guild = _make_guild(factory)
+
+        cache.set_guild(guild)
+
+        assert cache.get_guild(3) == guild
+        assert cache.get_available_guild(3) == guild
+        assert cache.get_unavailable_guild(3) is None
+        assert dict(cache.get_guilds_view()) == {3: guild}
+        assert dict(cache.get_available_guilds_view()) == {3: guild}
+        assert dict(cache.get_unavailable_guilds_view()) == {}
+
+    def test_set_guild_availability(self, cache, factory):
+        guild = _make_guild(factory)
+        cache.set_guild(guild)
+
+        cache.set_guild_availability(3, False)
+
+        assert cache.get_available_guild(3) is None
+        assert cache.get_unavailable_guild(3) == guild
+        assert dict(cache.get_unavailable_guilds_view()) == {3: guild}
+
+    def test_update_guild_keeps_gateway_only_fields(self, cache, factory):
+        cache.set_guild(_make_guild(factory))
+
+        old, new = cache.update_guild(_make_guild(factory, name="renamed", member_count=10))
+
+        assert old.name == "guild"
+        assert new.name == "renamed"
+        assert new.member_count == 5
+
+    def test_delete_guild(self, cache, factory):
+        guild = _make_guild(factory)
+        cache.set_guild(guild)
+
+        assert cache.delete_guild(3) == guild
+        assert cache.get_guild(3) is None
+        assert cache.delete_guild(3) is None
+
+    def test_guild_channels(self, cache, factory):
+        text_channel = _make_channel(factory, 20, 2)
+        other_text_channel = _make_channel(factory, 21, 1)
+        voice_channel = _make_channel(factory, 22, 0, channel_type=2)
+        for channel in (text_channel, other_text_channel, voice_channel):
+            cache.set_guild_channel(channel)
+
+        assert cache.get_guild_channel(20) == text_channel
+        assert list(cache.get_guild_channels_view_for_guild(3)) == [21, 20, 22]
+        assert cache.delete_guild_channel(21) == other_text_channel
+        assert dict(cache.get_guild_channels_view()) == {20: text_channel, 22: voice_channel}
+        assert dict(cache.clear_guild_channels_for_guild(3)) == {20: text_channel, 22: voice_channel}
+        assert dict(cache.get_guild_channels_view()) == {}
+
+    def test_roles(self, cache, factory):
+        role = _make_role(factory, 30)
+        other_role = _make_role(factory, 31, guild_id=4)
+        cache.set_role(role)
+        cache.set_role(other_role)
+
+        assert cache.get_role(30) == role
+        assert dict(cache.get_roles_view_for_guild(4)) == {31: other_role}
+        assert dict(cache.clear_roles_for_guild(3)) == {30: role}
+        assert dict(cache.get_roles_view()) == {31: other_role}
+
+    def test_emojis_share_users_with_members(self, cache, factory):
+        emoji = _make_emoji(factory, 40, user=USER_PAYLOAD)
+        cache.set_member(_make_member(factory))
+        cache.set_emoji(emoji)
+
+        assert cache.get_emoji(40) == emoji
+        assert cache.get_emoji(40).user == emoji.user
+        assert dict(cache.get_emojis_view_for_guild(3)) == {40: emoji}
+        assert cache.delete_emoji(40) == emoji
+        assert cache.get_emoji(40) is None
+
+    def test_invites(self, cache, factory):
+        invite = _make_invite(factory, "abc", 20)
+        other_invite = _make_invite(factory, "def", 21)
+        cache.set_invite(invite)
+        cache.set_invite(other_invite)
+
+        assert cache.get_invite("abc") == invite
+        assert dict(cache.get_invites_view_for_channel(3, 21)) == {"def": other_invite}
+        assert dict(cache.get_invites_view_for_guild(3)) == {"abc": invite, "def": other_invite}
+        assert dict(cache.clear_invites_for_channel(3, 20)) == {"abc": invite}
+        assert dict(cache.get_invites_view()) == {"def": other_invite}
+
+    def test_me(self, cache, factory):
+        me = factory.deserialize_my_user({**USER_PAYLOAD, "mfa_enabled": False, "flags": 0})
+
+        cache.set_me(me)
+
+        assert cache.get_me() == me
+        assert cache.delete_me() == me
+        assert cache.get_me() is None
+
+    def test_members_share_users(self, cache, factory):
+        member = _make_member(factory)
+        other_member = _make_member(factory, guild_id=4, nickname="nick")
+
+        cache.set_members_bulk([member, other_member])
+
+        assert cache.get_member(3, member.id) == member
+        assert cache.get_member(4, member.id).nickname == "nick"
+        assert dict(cache.get_users_view()) == {member.id: member.user}
+        assert cache._store.execute("HGET", cache._key("user_refs"), member.id) == b"2"
+
+        cache.delete_member(3, member.id)
+        assert cache.get_user(member.id) == member.user
+
+        cache.delete_member(4, member.id)
+        assert cache.get_user(member.id) is None
+
+    def test_set_member_when_already_cached_does_not_add_user_ref(self, cache, factory):
+        member = _make_member(factory)
+
+        cache.set_member(member)
+        cache.set_member(member)
+
+        assert cache._store.execute("HGET", cache._key("user_refs"), member.id) == b"1"
+
+    def test_set_members_bulk_with_duplicates_adds_one_user_ref(self, cache, factory):
+        member = _make_member(factory)
+
+        cache.set_members_bulk([member, _make_member(factory, nickname="nick")])
+
+        assert cache._store.execute("HGET", cache._key("user_refs"), member.id) == b"1"
+        assert cache.get_member(3, member.id).nickname == "nick"
+
+    def test_members_view_when_user_missing(self, cache, factory):
+        member = _make_member(factory)
+        cache.set_member(member)
+        cache._store.execute("HDEL", cache._key("users"), member.id)
+
+        with pytest.raises(errors.CacheStoreError, match=f"user of cached member {member.id} is missing"):
+            cache.get_members_view_for_guild(3)
+
+        with pytest.raises(errors.CacheStoreError, match=f"user of cached member {member.id} is missing"):
+            cache.get_members_view()
+
+    def test_release_users_when_user_refs_change_concurrently(self, cache, app, cache_settings, server, store, factory):
+        member = _make_member(factory)
+        cache.set_member(member)
+        other_store = cache_store.CacheStoreClient(*server.address)
+        other_cache = shared_cache.SharedCacheImpl(app, cache_settings, other_store, prefix="test")
+
+        def transaction(keys, reads, build):
+            def concurrent_build(replies):
+                # Another process adds the user's member to a third guild after the ref counts were read.
+                if not other_cache.get_member(5, member.id):
+                    other_cache.set_member(_make_member(factory, guild_id=5))
+
+                return build(replies)
+
+            return store.transaction(keys, reads, concurrent_build)
+
+        cache._store = mock.Mock(wraps=store, transaction=transaction)
+        try:
+            cache.delete_member(3, member.id)
+        finally:
+            cache._store = store
+            other_store.close()
+
+        assert cache._store.execute("HGET", cache._key("user_refs"), member.id) == b"1"
+        assert cache.get_member(5, member.id) == _make_member(factory, guild_id=5)
+
+        cache.delete_member(5, member.id)
+        assert cache.get_user(member.id) is None
+
+    def test_update_member(self, cache, factory):
+        cache.set_member(_make_member(factory))
+
+        old, new = cache.update_member(_make_member(factory, nickname="nick"))
+
+        assert old.nickname is None
+        assert new.nickname == "nick"
+        assert cache.get_member(3, new.id).nickname == "nick"
+
+    def test_clear_members_for_guild(self, cache, factory):
+        member = _make_member(factory)
+        other_member = _make_member(factory, user=OTHER_USER_PAYLOAD)
+        cache.set_members_bulk([member, other_member])
+
+        assert dict(cache.clear_members_for_guild(3)) == {member.id: member, other_member.id: other_member}
+        assert dict(cache.get_members_view()) == {}
+        assert dict(cache.get_users_view()) == {}
+
+    def test_presences(self, cache, factory):
+        presence = _make_presence(factory)
+        other_presence = _make_presence(factory, user=OTHER_USER_PAYLOAD, status="idle")
+
+        cache.set_presences_bulk([presence, other_presence])
+
+        assert cache.get_presence(3, presence.user_id) == presence
+        assert dict(cache.get_presences_view_for_guild(3)) == {
+            presence.user_id: presence,
+            other_presence.user_id: other_presence,
+        }
+        assert cache.delete_presence(3, presence.user_id) == presence
+        assert dict(cache.get_presences_view()) == {3: {other_presence.user_id: other_presence}}
+
+    def test_voice_states(self, cache, factory):
+        member = _make_member(factory)
+        other_member = _make_member(factory, user=OTHER_USER_PAYLOAD)
+        voice_state = _make_voice_state(factory, member, 20)
+        other_voice_state = _make_voice_state(factory, other_member, 21)
+        cache.set_members_bulk([member, other_member])
+        cache.set_voice_state(voice_state)
+        cache.set_voice_state(other_voice_state)
+
+        assert cache.get_voice_state(3, member.id) == voice_state
+        assert dict(cache.get_voice_states_view_for_channel(3, 21)) == {other_member.id: other_voice_state}
+        assert dict(cache.clear_voice_states_for_channel(3, 20)) == {member.id: voice_state}
+        assert dict(cache.get_voice_states_view_for_guild(3)) == {other_member.id: other_voice_state}
+
+    def test_messages(self, cache, factory):
+        message = _make_message(factory, 10)
+
+        cache.set_message(message)
+        result = cache.get_message(10)
+
+        assert result == message
+        assert result.content == "hi"
+        assert result.author == message.author
+        assert result.member == message.member
+        assert result.mentions.users == message.mentions.users
+
+    def test_set_message_trims_oldest_messages(self, cache, cache_settings, factory):
+        cache_settings.max_messages = 2
+
+        for message_id in (12, 10, 11):
+            cache.set_message(_make_message(factory, message_id))
+
+        assert sorted(cache.get_messages_view()) == [11, 12]
+
+    def test_update_message_with_partial_message(self, cache, factory):
+        cache.set_message(_make_message(factory, 10))
+        partial = factory.deserialize_partial_message({"id": "10", "channel_id": "11", "content": "edited"})
+
+        old, new = cache.update_message(partial)
+
+        assert old.content == "hi"
+        assert new.content == "edited"
+        assert cache.get_message(10).content == "edited"
+
+    def test_update_message_when_partial_message_not_cached(self, cache):
+        partial = mock.Mock(messages.PartialMessage, id=snowflakes.Snowflake(10))
+
+        assert cache.update_message(partial) == (None, None)
+
+    def test_dm_channel_ids(self, cache):
+        cache.set_dm_channel_id(1, 100)
+        cache.set_dm_channel_id(2, 200)
+
+        assert cache.get_dm_channel_id(1) == 100
+        assert cache.delete_dm_channel_id(1) == 100
+        assert dict(cache.get_dm_channel_ids_view()) == {2: 200}
+
+    def test_clear(self, cache, factory, server):
+        cache.set_guild(_make_guild(factory))
+        cache.set_member(_make_member(factory))
+        cache.set_message(_make_message(factory, 10))
+        cache.set_dm_channel_id(1, 100)
+
+        cache.clear()
+
+        assert server._data == {}
+
+    def test_prefix_separates_caches(self, cache, app, cache_settings, store, factory):
+        other_cache = shared_cache.SharedCacheImpl(app, cache_settings, store, prefix="other")
+
+        cache.set_guild(_make_guild(factory))
+
+        assert other_cache.get_guild(3) is None
+
+    def test_components_disabled(self, app, store, factory):
+        cache = shared_cache.SharedCacheImpl(
+            app, config.CacheSettings(components=config_api.CacheComponents.NONE), store
+        )
+
+        cache.set_guild(_make_guild(factory))
+        cache.set_member(_make_member(factory))
+
+        assert cache.get_guild(3) is None
+        assert cache.get_member(3, 115590097100865541) is None
+        assert dict(cache.get_guilds_view()) == {}
+        assert store.execute("HGETALL", "hikari:guilds") == []
+
+    def test_store_errors_are_raised(self, app, cache_settings):
+        store = mock.Mock(cache_store.CacheStoreClient)
+        store.execute.side_effect = errors.CacheStoreError("Failed to reach the cache store")
+        cache = shared_cache.SharedCacheImpl(app, cache_settings, store)
+
+        with pytest.raises(errors.CacheStoreError):
+            cache.get_guild(3)
+
+    def test_writes_are_submitted(self, app, cache_settings):
+        store = mock.Mock(cache_store.CacheStoreClient)
+        cache = shared_cache.SharedCacheImpl(app, cache_settings, store)
+
+        cache.set_dm_channel_id(1, 2)
+
+        store.submit.assert_called_once_with((("HSET", "hikari:dm_channels", 1, 2),))
+        store.execute.assert_not_called()
+        store.execute_many.assert_not_called()
+
+    def test_flush(self, app, cache_settings):
+        store = mock.Mock(cache_store.CacheStoreClient)
+        cache = shared_cache.SharedCacheImpl(app, cache_settings, store)
+
+        cache.flush()
+
+        store.flush.assert_called_once_with()
@@ -0,0 +1,452 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import copy
+import datetime
+
+import mock
+import pytest
+
+from hikari import snowflakes
+from hikari import undefined
+from hikari import users
+from hikari.internal import cache
+
+
+def _member_data(user_id=123, **kwargs):
+    fields = {
+        "user": cache.RefCell(mock.Mock(users.User, id=snowflakes.Snowflake(user_id))),
+        "guild_id": snowflakes.Snowflake(456),
+        "nickname": "nick",
+        "guild_avatar_hash": "hash",
+        "role_ids": (snowflakes.Snowflake(1), snowflakes.Snowflake(2)),
+        "joined_at": datetime.datetime(2020, 7, 15, 23, 30, 59, 501602, tzinfo=datetime.timezone.utc),
+        "premium_since": None,
+        "is_deaf": True,
+        "is_mute": False,
+        "is_pending": undefined.UNDEFINED,
+        "raw_communication_disabled_until": datetime.datetime(
+            2021, 10, 18, 13, 11, 18, 384554, tzinfo=datetime.timezone.utc
+        ),
+    }
+    fields.update(kwargs)
+    return cache.MemberData(**fields)
+
+
+class TestColumnarMemberStore:
+    @pytest.fixture()
+    def store(self):
+        return cache.ColumnarMemberStore(snowflakes.Snowflake(456))
+
+    def test_set_and_get(self, store):
+        data = _member_data()
+
+        store[snowflakes.Snowflake(123)] = cache.RefCell(data, ref_count=2)
+
+        cell = store[snowflakes.Snowflake(123)]
+        assert isinstance(cell, cache.RefCell)
+        assert cell.object == data
+        assert cell.object is not data
+        assert cell.ref_count == 2
+        assert len(store) == 1
+        assert list(store) == [123]
+
+    @pytest.mark.parametrize("value", [undefined.UNDEFINED, True, False])
+    def test_tri_state_flags(self, store, value):
+        data = _member_data(is_deaf=value, is_mute=value, is_pending=value, has_been_deleted=True)
+
+        store[snowflakes.Snowflake(123)] = cache.RefCell(data)
+
+        result = store[snowflakes.Snowflake(123)].object
+        assert result.is_deaf is value
+        assert result.is_mute is value
+        assert result.is_pending is value
+        assert result.has_been_deleted is True
+
+    def test_naive_timestamps_are_treated_as_utc(self, store):
+        data = _member_data(joined_at=datetime.datetime(2020, 1, 1), raw_communication_disabled_until=None)
+
+        store[snowflakes.Snowflake(123)] = cache.RefCell(data)
+
+        result = store[snowflakes.Snowflake(123)].object
+        assert result.joined_at == datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+        assert result.raw_communication_disabled_until is None
+
+    def test_role_ids_are_shared(self, store):
+        store[snowflakes.Snowflake(1)] = cache.RefCell(_member_data(1, role_ids=[snowflakes.Snowflake(5)]))
+        store[snowflakes.Snowflake(2)] = cache.RefCell(_member_data(2, role_ids=(snowflakes.Snowflake(5),)))
+
+        first = store[snowflakes.Snowflake(1)].object.role_ids
+        assert first == (5,)
+        assert first is store[snowflakes.Snowflake(2)].object.role_ids
+
+    def test_cell_writes_to_row(self, store):
+        store[snowflakes.Snowflake(123)] = cache.RefCell(_member_data())
+        cell = store[snowflakes.Snowflake(123)]
+        new_data = _member_data(nickname="new nick")
+
+        cell.object = new_data
+        cell.ref_count += 3
+
+        assert store[snowflakes.Snowflake(123)].object.nickname == "new nick"
+        assert store[snowflakes.Snowflake(123)].ref_count == 3
+
+    def test_setitem_with_own_cell_is_noop(self, store):
+        store[snowflakes.Snowflake(123)] = cache.RefCell(_member_data(), ref_count=1)
+        cell = store[snowflakes.Snowflake(123)]
+
+        store[snowflakes.Snowflake(123)] = cell
+
+        assert len(store) == 1
+        assert store[snowflakes.Snowflake(123)].ref_count == 1
+
+    def test_delitem_moves_last_row(self, store):
+        for user_id in (1, 2, 3):
+            store[snowflakes.Snowflake(user_id)] = cache.RefCell(
+                _member_data(user_id, nickname=str(user_id)), ref_count=user_id
+            )
+
+        del store[snowflakes.Snowflake(1)]
+
+        assert sorted(store) == [2, 3]
+        assert store[snowflakes.Snowflake(2)].object.nickname == "2"
+        assert store[snowflakes.Snowflake(3)].object.nickname == "3"
+        assert store[snowflakes.Snowflake(3)].ref_count == 3
+
+        del store[snowflakes.Snowflake(3)]
+
+        assert list(store) == [2]
+        assert store[snowflakes.Snowflake(2)].ref_count == 2
+
+    def test_missing_keys(self, store):
+        with pytest.raises(KeyError):
+            store[snowflakes.Snowflake(123)]
+
+        with pytest.raises(KeyError):
+            del store[snowflakes.Snowflake(123)]
+
+        assert store.get(snowflakes.Snowflake(123)) is None
+        assert snowflakes.Snowflake(123) not in store
+
+    def test_freeze(self, store):
+        data = _member_data()
+        store[snowflakes.Snowflake(123)] = cache.RefCell(data)
+
+        frozen = store.freeze()
+        del store[snowflakes.Snowflake(123)]
+
+        assert isinstance(frozen, dict)
+        assert list(frozen) == [123]
+
+    def test_copy(self, store):
+        store[snowflakes.Snowflake(123)] = cache.RefCell(_member_data())
+
+        result = store.copy()
+        result[snowflakes.Snowflake(123)].object = _member_data(nickname="other")
+        result[snowflakes.Snowflake(321)] = cache.RefCell(_member_data(321))
+
+        assert isinstance(result, cache.ColumnarMemberStore)
+        assert store[snowflakes.Snowflake(123)].object.nickname == "nick"
+        assert list(store) == [123]
+        assert sorted(result) == [123, 321]
+
+    def test_clear(self, store):
+        store[snowflakes.Snowflake(123)] = cache.RefCell(_member_data())
+
+        store.clear()
+
+        assert len(store) == 0
+        store[snowflakes.Snowflake(123)] = cache.RefCell(_member_data())
+        assert list(store) == [123]
+
+    def test_cell_copy(self, store):
+        data = _member_data()
+        store[snowflakes.Snowflake(123)] = cache.RefCell(data)
+
+        assert store[snowflakes.Snowflake(123)].copy() == copy.copy(data)
+
+    def test_getitem_returns_same_cell_while_in_use(self, store):
+        store[snowflakes.Snowflake(123)] = cache.RefCell(_member_data())
+
+        assert store[snowflakes.Snowflake(123)] is store[snowflakes.Snowflake(123)]
+
+    def test_removed_cells_keep_their_contents(self, store):
+        store[snowflakes.Snowflake(123)] = cache.RefCell(_member_data(), ref_count=1)
+        store[snowflakes.Snowflake(321)] = cache.RefCell(_member_data(321), ref_count=4)
+        cell = store[snowflakes.Snowflake(123)]
+        other_cell = store[snowflakes.Snowflake(321)]
+
+        del store[snowflakes.Snowflake(123)]
+        cell.ref_count -= 1
+        store.clear()
+
+        assert cell.object == _member_data(user=cell.object.user)
+        assert cell.ref_count == 0
+        assert other_cell.object.user.object.id == 321
+        assert other_cell.ref_count == 4
+
+    def test_get_member_version_is_stable_until_row_is_written(self, store):
+        store[snowflakes.Snowflake(123)] = cache.RefCell(_member_data())
+        store[snowflakes.Snowflake(321)] = cache.RefCell(_member_data(321))
+        version = cache.get_member_version(store[snowflakes.Snowflake(123)])
+
+        assert version[1] is store[snowflakes.Snowflake(123)].object.user.object
+        assert cache._is_same(version, cache.get_member_version(store[snowflakes.Snowflake(123)]))
+
+        store[snowflakes.Snowflake(321)].object = _member_data(321, nickname="other")
+        del store[snowflakes.Snowflake(321)]
+        assert cache._is_same(version, cache.get_member_version(store[snowflakes.Snowflake(123)]))
+
+        store[snowflakes.Snowflake(123)].object = _member_data(nickname="new nick")
+        assert not cache._is_same(version, cache.get_member_version(store[snowflakes.Snowflake(123)]))
+
+    def test_get_member_version_when_user_replaced(self, store):
+        user = cache.RefCell(mock.Mock(users.User, id=snowflakes.Snowflake(123)))
+        store[snowflakes.Snowflake(123)] = cache.RefCell(_member_data(user=user))
+        version = cache.get_member_version(store[snowflakes.Snowflake(123)])
+
+        user.object = mock.Mock(users.User, id=snowflakes.Snowflake(123))
+
+        assert not cache._is_same(version, cache.get_member_version(store[snowflakes.Snowflake(123)]))
+
+    def test_get_member_version_when_detached(self, store):
+        store[snowflakes.Snowflake(123)] = cache.RefCell(_member_data())
+        cell = store[snowflakes.Snowflake(123)]
+
+        del store[snowflakes.Snowflake(123)]
+
+        assert cache._is_same(cache.get_member_version(cell), (cell.object, cell.object.user.object))
+
+
+def test_get_member_version():
+    data = _member_data()
+
+    assert cache.get_member_version(cache.RefCell(data)) == (data, data.user.object)
+
+
+class TestLiveCacheMappingView:
+    @pytest.fixture()
+    def entries(self):
+        return {1: cache.RefCell("a"), 2: cache.RefCell("b"), 3: cache.RefCell("c")}
+
+    @pytest.fixture()
+    def builder(self):
+        return mock.Mock(side_effect=lambda cell: [cell.object])
+
+    @pytest.fixture()
+    def view(self, entries, builder):
+        return cache.LiveCacheMappingView(entries, builder=builder, version=lambda cell: (cell.object,))
+
+    def test_getitem_reuses_built_entity(self, view, builder, entries):
+        result = view[1]
+
+        assert result == ["a"]
+        assert view[1] is result
+        builder.assert_called_once_with(entries[1])
+
+    def test_getitem_rebuilds_when_version_changes(self, view, builder, entries):
+        result = view[1]
+        entries[1].object = "d"
+
+        new_result = view[1]
+
+        assert new_result == ["d"]
+        assert new_result is not result
+        assert builder.call_count == 2
+
+    def test_getitem_compares_versions_by_identity(self, entries, builder):
+        equal_object = mock.Mock(__eq__=lambda self, other: True)
+        view = cache.LiveCacheMappingView(entries, builder=builder, version=lambda _: (equal_object,))
+        view[1]
+
+        equal_object = mock.Mock(__eq__=lambda self, other: True)
+        view[1]
+
+        assert builder.call_count == 2
+
+    def test_getitem_for_unknown_key(self, view):
+        with pytest.raises(KeyError):
+            view[4]
+
+    def test_reflects_changes_to_entries(self, view, entries):
+        assert len(view) == 3
+
+        entries[4] = cache.RefCell("d")
+        del entries[1]
+
+        assert len(view) == 3
+        assert list(view) == [2, 3, 4]
+        assert 1 not in view
+        assert view[4] == ["d"]
+
+    def test_with_predicate(self, entries, builder):
+        view = cache.LiveCacheMappingView(
+            entries, builder=builder, version=lambda cell: (cell.object,), predicate=lambda cell: cell.object != "b"
+        )
+
+        assert list(view) == [1, 3]
+        assert len(view) == 2
+        assert 1 in view
+        assert 2 not in view
+        assert 4 not in view
+
+        with pytest.raises(KeyError):
+            view[2]
+
+    def test_get_item_at(self, view):
+        assert view.get_item_at(1) == ["b"]
+        assert view.get_item_at(slice(0, 2)) == (["a"], ["b"])
+
+    @pytest.mark.asyncio()
+    async def test_iterator(self, view):
+        assert await view.iterator() == [["a"], ["b"], ["c"]]
+
+    def test_snapshot(self, entries, builder):
+        view = cache.LiveCacheMappingView(
+            entries, builder=builder, version=lambda cell: (cell.object,), predicate=lambda cell: cell.object != "b"
+        )
+
+        snapshot = view.snapshot()
+        entries[4] = cache.RefCell("d")
+
+        assert isinstance(snapshot, cache.CacheMappingView)
+        assert dict(snapshot) == {1: ["a"], 3: ["c"]}
+
+
+class TestCache3DMappingView:
+    def test_snapshot(self):
+        entries = {1: cache.RefCell("a")}
+        live_view = cache.LiveCacheMappingView(
+            entries, builder=lambda cell: cell.object, version=lambda cell: (cell.object,)
+        )
+        view = cache.Cache3DMappingView({5: live_view, 6: cache.CacheMappingView({2: "b"})})
+
+        snapshot = view.snapshot()
+        entries[3] = cache.RefCell("c")
+
+        assert isinstance(snapshot, cache.Cache3DMappingView)
+        assert snapshot == {5: {1: "a"}, 6: {2: "b"}}
+        assert view == {5: {1: "a", 3: "c"}, 6: {2: "b"}}
+
+
+class TestMemoisedData:
+    def test_build_shared_entity_reuses_entity(self):
+        data = _member_data()
+
+        entity = data.build_shared_entity(mock.Mock())
+
+        assert data.build_shared_entity(mock.Mock()) is entity
+        assert entity.nickname == "nick"
+
+    def test_build_shared_entity_rebuilds_when_dependency_replaced(self):
+        data = _member_data()
+        entity = data.build_shared_entity(mock.Mock())
+
+        data.user.object = mock.Mock(users.User, id=snowflakes.Snowflake(123))
+        new_entity = data.build_shared_entity(mock.Mock())
+
+        assert new_entity is not entity
+        assert data.build_shared_entity(mock.Mock()) is new_entity
+
+    def test_built_entity_is_not_compared(self):
+        data = _member_data()
+        other_data = copy.copy(data)
+
+        data.build_shared_entity(mock.Mock())
+
+        assert data == other_data
+
+
+class TestMemberPresenceData:
+    def test_build_dependencies(self):
+        emoji = mock.Mock()
+        data = cache.MemberPresenceData(
+            user_id=snowflakes.Snowflake(123),
+            guild_id=snowflakes.Snowflake(456),
+            visible_status="online",
+            activities=(
+                mock.Mock(cache.RichActivityData, emoji=cache.RefCell(emoji)),
+                mock.Mock(cache.RichActivityData, emoji="🤔"),
+                mock.Mock(cache.RichActivityData, emoji=None),
+            ),
+            client_status=mock.Mock(),
+        )
+
+        assert data.build_dependencies() == (emoji,)
+
+
+class TestMessageData:
+    def test_build_dependencies(self):
+        author = mock.Mock()
+        member_data = _member_data()
+        mention_user = mock.Mock()
+        referenced_author = mock.Mock()
+        referenced_message = mock.Mock(
+            cache.MessageData, build_dependencies=mock.Mock(return_value=(referenced_author,))
+        )
+        interaction_user = mock.Mock()
+        data = mock.Mock(
+            cache.MessageData,
+            author=cache.RefCell(author),
+            member=cache.RefCell(member_data),
+            mentions=mock.Mock(users={snowflakes.Snowflake(1): cache.RefCell(mention_user)}),
+            referenced_message=cache.RefCell(referenced_message),
+            interaction=mock.Mock(user=cache.RefCell(interaction_user)),
+        )
+
+        assert cache.MessageData.build_dependencies(data) == (
+            author,
+            member_data,
+            member_data.user.object,
+            mention_user,
+            referenced_message,
+            referenced_author,
+            interaction_user,
+        )
+
+    def test_build_dependencies_for_minimal_message(self):
+        author = mock.Mock()
+        data = mock.Mock(
+            cache.MessageData,
+            author=cache.RefCell(author),
+            member=None,
+            mentions=mock.Mock(users=undefined.UNDEFINED),
+            referenced_message=None,
+            interaction=None,
+        )
+
+        assert cache.MessageData.build_dependencies(data) == (author,)
+
+    def test_update_clears_built_entity(self):
+        data = mock.Mock(cache.MessageData, _built=((), object()))
+        message = mock.Mock(
+            content=undefined.UNDEFINED,
+            edited_timestamp=undefined.UNDEFINED,
+            is_pinned=undefined.UNDEFINED,
+            attachments=undefined.UNDEFINED,
+            embeds=undefined.UNDEFINED,
+            components=undefined.UNDEFINED,
+        )
+
+        cache.MessageData.update(data, message)
+
+        assert data._built is None
+        data.mentions.update.assert_called_once_with(message.mentions, users=undefined.UNDEFINED)
@@ -27,6 +27,7 @@ import mock
 import pytest
 
 from hikari.internal import collections
+from hikari.internal import time
 
 
 class TestFreezableDict:
@@ -161,6 +162,155 @@ class TestLimitedCapacityCacheMap:
         expire_callback.assert_has_calls((mock.call("no"), mock.call("lslsl")))
 
 
+class TestEvictingCacheMap:
+    def test___init___with_existing_entries(self):
+        mock_map = collections.EvictingCacheMap(collections.FreezableDict({"a": 1, "b": 2}), max_entries=5)
+
+        assert list(mock_map) == ["a", "b"]
+        assert mock_map == {"a": 1, "b": 2}
+
+    def test_evicts_least_recently_used(self):
+        on_expire = mock.Mock()
+        mock_map = collections.EvictingCacheMap(collections.FreezableDict(), max_entries=2, on_expire=on_expire)
+        mock_map["a"] = 1
+        mock_map["b"] = 2
+        assert mock_map["a"] == 1
+
+        mock_map["c"] = 3
+
+        assert mock_map == {"a": 1, "c": 3}
+        on_expire.assert_called_once_with(2)
+
+    def test_contains_doesnt_count_as_use(self):
+        mock_map = collections.EvictingCacheMap(collections.FreezableDict(), max_entries=2)
+        mock_map["a"] = 1
+        mock_map["b"] = 2
+        assert "a" in mock_map
+
+        mock_map["c"] = 3
+
+        assert mock_map == {"b": 2, "c": 3}
+
+    def test_evicts_least_frequently_used(self):
+        mock_map = collections.EvictingCacheMap(
+            collections.FreezableDict(), max_entries=3, least_frequently_used=True
+        )
+        mock_map["a"] = 1
+        mock_map["b"] = 2
+        mock_map["c"] = 3
+        mock_map["a"]
+        mock_map["a"]
+        mock_map["c"]
+
+        mock_map["d"] = 4
+
+        assert mock_map == {"a": 1, "c": 3, "d": 4}
+
+    def test_least_frequently_used_only_compares_sample(self):
+        mock_map = collections.EvictingCacheMap(
+            collections.FreezableDict(), max_entries=7, least_frequently_used=True
+        )
+        for i in range(7):
+            mock_map[i] = i
+            if i < 5:
+                mock_map[i]
+
+        mock_map[7] = 7
+
+        assert 0 not in mock_map
+        assert 5 in mock_map
+        assert 6 in mock_map
+
+    def test_evicts_expired_entries(self):
+        on_expire = mock.Mock()
+        mock_map = collections.EvictingCacheMap(collections.FreezableDict(), ttl=10, on_expire=on_expire)
+
+        with mock.patch.object(time, "monotonic", return_value=100):
+            mock_map["a"] = 1
+            mock_map["b"] = 2
+
+        with mock.patch.object(time, "monotonic", return_value=105):
+            assert mock_map["a"] == 1
+
+        with mock.patch.object(time, "monotonic", return_value=111):
+            mock_map["c"] = 3
+
+        assert mock_map == {"a": 1, "c": 3}
+        on_expire.assert_called_once_with(2)
+
+    def test_pinned_entries_are_not_evicted(self):
+        on_expire = mock.Mock()
+        mock_map = collections.EvictingCacheMap(
+            collections.FreezableDict(), max_entries=1, on_expire=on_expire, is_pinned=lambda value: value == 1
+        )
+        mock_map["a"] = 1
+
+        mock_map["b"] = 2
+        mock_map["c"] = 3
+
+        assert mock_map == {"a": 1, "c": 3}
+        on_expire.assert_called_once_with(2)
+
+    def test_pinned_expired_entries_are_kept(self):
+        mock_map = collections.EvictingCacheMap(collections.FreezableDict(), ttl=10, is_pinned=lambda value: True)
+
+        with mock.patch.object(time, "monotonic", return_value=100):
+            mock_map["a"] = 1
+
+        with mock.patch.object(time, "monotonic", return_value=200):
+            mock_map["b"] = 2
+
+        assert mock_map == {"a": 1, "b": 2}
+
+    def test_doesnt_loop_forever_when_all_entries_pinned(self):
+        mock_map = collections.EvictingCacheMap(collections.FreezableDict(), max_entries=1, is_pinned=lambda _: True)
+
+        mock_map["a"] = 1
+        mock_map["b"] = 2
+
+        assert mock_map == {"a": 1, "b": 2}
+
+    def test___delitem__(self):
+        mock_map = collections.EvictingCacheMap(collections.FreezableDict(), max_entries=2, least_frequently_used=True)
+        mock_map["a"] = 1
+        mock_map["a"]
+
+        del mock_map["a"]
+
+        assert "a" not in mock_map
+        assert mock_map._hits == {}
+        assert mock_map._data == {}
+
+    def test_clear(self):
+        mock_map = collections.EvictingCacheMap(collections.FreezableDict({"a": 1}), max_entries=2)
+
+        mock_map.clear()
+
+        assert len(mock_map) == 0
+        assert mock_map._data == {}
+
+    def test_copy(self):
+        mock_map = collections.EvictingCacheMap(collections.FreezableDict(), max_entries=2)
+        mock_map["a"] = 1
+        mock_map["b"] = 2
+
+        result = mock_map.copy()
+        result["a"]
+        result["c"] = 3
+
+        assert isinstance(result, collections.EvictingCacheMap)
+        assert result == {"a": 1, "c": 3}
+        assert mock_map == {"a": 1, "b": 2}
+
+    def test_freeze(self):
+        mock_map = collections.EvictingCacheMap(collections.FreezableDict({"a": 1}), max_entries=2)
+
+        result = mock_map.freeze()
+
+        assert isinstance(result, dict)
+        assert result == {"a": 1}
+
+
 class TestSnowflakeSet:
     def test_init_creates_empty_array(self):
         # given
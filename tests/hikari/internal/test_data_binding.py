@@ -19,7 +19,9 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import contextlib
 import typing
+import warnings
 
 import aiohttp
 import attr
@@ -83,6 +85,20 @@ class TestURLEncodedFormBuilder:
         )
 
 
+    @pytest.mark.asyncio()
+    async def test_build_with_bytes_field(self, form_builder):
+        form_builder.add_field("payload_json", b'{"content":"hi"}', content_type="application/json")
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            form = await form_builder.build(contextlib.AsyncExitStack())
+            writer = form()
+
+        (part, _, _), = writer._parts
+        assert part.headers["Content-Type"] == "application/json"
+        assert part.headers["Content-Disposition"] == 'form-data; name="payload_json"'
+
+
 class TestStringMapBuilder:
     def test_is_mapping(self):
         assert isinstance(data_binding.StringMapBuilder(), typing.Mapping)
@@ -290,3 +306,16 @@ class TestJSONObjectBuilder:
         builder = data_binding.JSONObjectBuilder()
         builder.put_snowflake_array("test", undefined.UNDEFINED)
         assert builder == {}
+
+
+class TestDefaultJSON:
+    def test_default_json_dumps(self):
+        assert data_binding.default_json_dumps({"a": [1, "b", None, True]}) == b'{"a":[1,"b",null,true]}'
+
+    @pytest.mark.parametrize("payload", ['{"a": [1, "b", null, true]}', b'{"a": [1, "b", null, true]}'])
+    def test_default_json_loads(self, payload):
+        assert data_binding.default_json_loads(payload) == {"a": [1, "b", None, True]}
+
+    def test_default_json_loads_when_invalid(self):
+        with pytest.raises(data_binding.JSONDecodeError):
+            data_binding.default_json_loads(b"{invalid")
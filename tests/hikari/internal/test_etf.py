@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import zlib
+
+import pytest
+
+from hikari.internal import etf
+
+
+class TestLoads:
+    def test_dispatch_payload(self):
+        payload = (
+            b"\x83t\x00\x00\x00\x04"
+            b"w\x02opa\x00"
+            b"w\x01sa\x2a"
+            b"w\x01tw\x0eMESSAGE_CREATE"
+            b"w\x01dt\x00\x00\x00\x04"
+            b"m\x00\x00\x00\x02idn\x08\x00\x07\x00\x02\xc1Z\x06q\x02"
+            b"m\x00\x00\x00\x07contentm\x00\x00\x00\x06h\xc3\xa9llo"
+            b"m\x00\x00\x00\x06pinnedw\x05false"
+            b"m\x00\x00\x00\x10edited_timestampw\x03nil"
+        )
+
+        assert etf.loads(payload) == {
+            "op": 0,
+            "s": 42,
+            "t": "MESSAGE_CREATE",
+            "d": {"id": 175928847299117063, "content": "héllo", "pinned": False, "edited_timestamp": None},
+        }
+
+    @pytest.mark.parametrize(
+        ("payload", "expected"),
+        [
+            (b"\x83a\xff", 255),
+            (b"\x83b\xff\xff\xff\xfe", -2),
+            (b"\x83n\x02\x01\x00\x01", -256),
+            (b"\x83o\x00\x00\x00\x01\x00\x05", 5),
+            (b"\x83F?\xf8\x00\x00\x00\x00\x00\x00", 1.5),
+            (b"\x83c2.50000000000000000000e+00" + b"\x00" * 5, 2.5),
+            (b"\x83d\x00\x04true", True),
+            (b"\x83s\x04null", None),
+            (b"\x83v\x00\x05READY", "READY"),
+            (b"\x83j", []),
+            (b"\x83k\x00\x03\x01\x02\x03", [1, 2, 3]),
+            (b"\x83l\x00\x00\x00\x02a\x01a\x02j", [1, 2]),
+            (b"\x83h\x02a\x01a\x02", [1, 2]),
+            (b"\x83i\x00\x00\x00\x01a\x01", [1]),
+        ],
+    )
+    def test_terms(self, payload, expected):
+        assert etf.loads(payload) == expected
+
+    def test_compressed_payload(self):
+        term = b"m\x00\x00\x00\x05hello"
+        payload = b"\x83P" + len(term).to_bytes(4, "big") + zlib.compress(term)
+
+        assert etf.loads(payload) == "hello"
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            "\x83j",
+            b"",
+            b"\x84j",
+            b"\x83m\x00\x00\x00\x05hel",
+            b"\x83jj",
+            b"\x83M\x00\x00\x00\x01\x01\xff",
+        ],
+    )
+    def test_invalid_payload(self, payload):
+        with pytest.raises(etf.ETFDecodeError):
+            etf.loads(payload)
+
+
+class TestDumps:
+    @pytest.mark.parametrize(
+        ("obj", "expected"),
+        [
+            (None, b"\x83w\x03nil"),
+            (True, b"\x83w\x04true"),
+            (False, b"\x83w\x05false"),
+            (255, b"\x83a\xff"),
+            (-2, b"\x83b\xff\xff\xff\xfe"),
+            (175928847299117063, b"\x83n\x08\x00\x07\x00\x02\xc1Z\x06q\x02"),
+            (-(2**32), b"\x83n\x05\x01\x00\x00\x00\x00\x01"),
+            (1.5, b"\x83F?\xf8\x00\x00\x00\x00\x00\x00"),
+            ("héllo", b"\x83m\x00\x00\x00\x06h\xc3\xa9llo"),
+            ([], b"\x83j"),
+            ((1, 2), b"\x83l\x00\x00\x00\x02a\x01a\x02j"),
+            ({"op": 1}, b"\x83t\x00\x00\x00\x01m\x00\x00\x00\x02opa\x01"),
+        ],
+    )
+    def test_terms(self, obj, expected):
+        assert etf.dumps(obj) == expected
+
+    def test_unsupported_type(self):
+        with pytest.raises(TypeError, match="Cannot encode object of type object as ETF"):
+            etf.dumps({"d": object()})
+
+    def test_round_trip(self):
+        obj = {
+            "op": 2,
+            "d": {
+                "token": "some.token",
+                "intents": 32767,
+                "shard": [0, 1],
+                "presence": {"since": None, "afk": False, "activities": [], "status": "online"},
+                "big": 2**2100,
+            },
+        }
+
+        assert etf.loads(etf.dumps(obj)) == obj
@@ -169,3 +169,12 @@ class TestMissingIntentError:
 
     def test_str(self, error):
         assert str(error) == "You are missing the following intent(s): GUILD_BANS, GUILD_EMOJIS"
+
+
+class TestCacheStoreError:
+    @pytest.fixture()
+    def error(self):
+        return errors.CacheStoreError("some reason")
+
+    def test_str(self, error):
+        assert str(error) == "some reason"